@@ -0,0 +1,225 @@
+"""
+The ``mege-idex`` command.
+
+``build`` runs a design into ``runs/<design>_run_<run id>``, on the build
+server when one is listening and in this process otherwise. ``serve`` starts
+the build server, which keeps OCC and shellforgepy loaded between builds;
+``stop`` shuts it down. ``batch`` exports (and slices) the plates of a batch
+manifest, see ``produce/batch_export.py``. ``layout`` runs a builder of a
+design in a dry run (see ``construct/dry_run.py``) and prints the bounds of
+its parts. ``bom`` runs a builder in a dry run and prints the purchased parts
+it uses (see ``produce/bom.py``).
+
+Usage:
+    mege-idex serve &
+    mege-idex build x_axis --production
+    mege-idex build path/to/design.py --local
+    mege-idex stop
+    mege-idex batch x_axis_kits.json --slice
+    mege-idex layout x_axis create_x_axis --preview x_axis_layout.stl
+    mege-idex bom x_axis --csv x_axis_bom.csv
+"""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+from mege_ender_3v3ke_idex import __version__
+from mege_ender_3v3ke_idex.construct.dry_run import (
+    dry_run,
+    layout_report,
+    write_preview,
+)
+from mege_ender_3v3ke_idex.produce.batch_export import Batch, run_batch
+from mege_ender_3v3ke_idex.produce.bom import collect_bom
+from mege_ender_3v3ke_idex.produce.build_server import (
+    DEFAULT_RUNS_DIR_NAME,
+    LOG_FORMAT,
+    BuildServerError,
+    build_design,
+    build_on_server,
+    load_design,
+    ping,
+    send_request,
+    serve,
+    socket_path,
+)
+from mege_ender_3v3ke_idex.produce.slice_queue import SlicerSettings
+
+_logger = logging.getLogger(__name__)
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(
+        prog="mege-idex", description="Build the Ender 3V3 KE IDEX designs"
+    )
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"mege-ender-3v3ke-idex {__version__}",
+    )
+    parser.add_argument(
+        "--socket",
+        default=None,
+        help=f"Build server socket, default {socket_path()}",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        dest="loglevel",
+        help="set loglevel to DEBUG",
+        action="store_const",
+        const=logging.DEBUG,
+        default=logging.INFO,
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="Build a design")
+    build.add_argument(
+        "design", help="Design name (e.g. x_axis), module path or .py file"
+    )
+    build.add_argument(
+        "--production",
+        action="store_true",
+        default=None,
+        help="Arrange the parts for printing",
+    )
+    build.add_argument("--runs-dir", default=None, help="Default ./runs")
+    build.add_argument("--run-id", default=None, help="Default the current time")
+    build.add_argument(
+        "--local",
+        action="store_true",
+        help="Build in this process even if a build server is listening",
+    )
+
+    batch = commands.add_parser("batch", help="Export the plates of a batch manifest")
+    batch.add_argument("manifest", type=Path, help="Batch manifest JSON file")
+    batch.add_argument(
+        "--output-dir", type=Path, default=None, help="Default ./runs/<name>_batch"
+    )
+    batch.add_argument(
+        "--slice", action="store_true", help="Slice the plates with OrcaSlicer"
+    )
+    batch.add_argument(
+        "--max-workers", type=int, default=None, help="Concurrent slicer processes"
+    )
+    batch.add_argument("--config", default=None, help="shellforgepy config file")
+
+    layout = commands.add_parser(
+        "layout", help="Print part bounds from a dry run, without booleans"
+    )
+    layout.add_argument(
+        "design", help="Design name (e.g. x_axis), module path or .py file"
+    )
+    layout.add_argument(
+        "builder", nargs="?", default="create_parts", help="Default create_parts"
+    )
+    layout.add_argument("--json", action="store_true", help="Print JSON")
+    layout.add_argument(
+        "--preview", type=Path, default=None, help="Write the proxies as STL"
+    )
+
+    bom = commands.add_parser("bom", help="Print the bill of materials from a dry run")
+    bom.add_argument(
+        "design", help="Design name (e.g. x_axis), module path or .py file"
+    )
+    bom.add_argument(
+        "builder", nargs="?", default="create_parts", help="Default create_parts"
+    )
+    bom.add_argument("--json", action="store_true", help="Print JSON")
+    bom.add_argument("--csv", type=Path, default=None, help="Write the items as CSV")
+
+    commands.add_parser("serve", help="Keep a build server running")
+    commands.add_parser("stop", help="Stop the build server")
+    return parser.parse_args(args)
+
+
+def _build(args):
+    build_kwargs = dict(
+        production=args.production, runs_dir=args.runs_dir, run_id=args.run_id
+    )
+    if not args.local and ping(args.socket) is not None:
+        result = build_on_server(args.design, args.socket, **build_kwargs)
+        sys.stderr.write(result.log)
+    else:
+        result = build_design(args.design, **build_kwargs)
+    _logger.info(f"Built {args.design} in {result.seconds:.1f} s")
+    print(result.run_directory)
+
+
+def _batch(args):
+    batch = Batch.from_file(args.manifest)
+    manifest = run_batch(
+        batch,
+        args.output_dir or Path(DEFAULT_RUNS_DIR_NAME) / f"{batch.name}_batch",
+        slicer_settings=(
+            SlicerSettings.from_workflow_config(args.config) if args.slice else None
+        ),
+        max_workers=args.max_workers,
+    )
+    for printer in manifest["printers"].values():
+        for plate in printer["plates"]:
+            print(plate["files"][".stl"])
+
+
+def _load_builder(args):
+    design = load_design(args.design)
+    builder = getattr(design, args.builder, None)
+    if builder is None:
+        raise BuildServerError(f"{args.design} has no builder {args.builder}")
+    return design, builder
+
+
+def _layout(args):
+    design, builder = _load_builder(args)
+    with dry_run(design):
+        result = builder()
+    report = layout_report(result, name=args.builder)
+    print(json.dumps(report.to_dict(), indent=2) if args.json else report)
+    if args.preview is not None:
+        _logger.info(f"Wrote {write_preview(result, args.preview)}")
+
+
+def _bom(args):
+    design, builder = _load_builder(args)
+    with collect_bom() as bom, dry_run(design):
+        builder()
+    print(json.dumps(bom.to_dict(), indent=2) if args.json else bom)
+    if args.csv is not None:
+        _logger.info(f"Wrote {bom.write_csv(args.csv)}")
+
+
+def main(args):
+    args = parse_args(args)
+    logging.basicConfig(level=args.loglevel, format=LOG_FORMAT)
+
+    try:
+        if args.command == "build":
+            _build(args)
+        elif args.command == "batch":
+            _batch(args)
+        elif args.command == "layout":
+            _layout(args)
+        elif args.command == "bom":
+            _bom(args)
+        elif args.command == "serve":
+            serve(args.socket)
+        elif args.command == "stop":
+            if ping(args.socket) is None:
+                _logger.info("No build server is running")
+            else:
+                send_request({"command": "stop"}, args.socket)
+    except BuildServerError as error:
+        _logger.error(str(error))
+        return 1
+    return 0
+
+
+def run():
+    sys.exit(main(sys.argv[1:]))
+
+
+if __name__ == "__main__":
+    run()
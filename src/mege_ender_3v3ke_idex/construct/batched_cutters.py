@@ -0,0 +1,129 @@
+"""
+Batched cutter application for LeaderFollowersCuttersPart composites.
+
+``LeaderFollowersCuttersPart.use_as_cutter_on`` cuts the target once per
+cutter. For composites with several cutters (a NEMA motor has body, front
+boss, axle and mount holes) this means one boolean per cutter and per target.
+
+Composites flagged with ``enable_batched_cutters`` are instead applied by
+merging the cutters that actually touch the target (bounding-box pre-filter)
+into a single tool and doing one cut. The merged tool is cached per composite
+instance, so a motor cutting several plates only merges its cutters once.
+
+Usage:
+    motor = enable_batched_cutters(create_nema_composite())
+    plate = use_as_cutter_on(motor, plate)
+"""
+
+import logging
+import weakref
+
+from shellforgepy.simple import PartCollector, get_bounding_box
+
+_logger = logging.getLogger(__name__)
+
+BATCHED_CUTTERS_KEY = "batched_cutters"
+
+# composite -> (cutters tuple, cutter bounding boxes, {index tuple: merged tool})
+_merged_cutter_cache = weakref.WeakKeyDictionary()
+
+
+def enable_batched_cutters(composite):
+    """Mark a composite so that ``use_as_cutter_on`` applies its cutters in one cut."""
+    composite.additional_data[BATCHED_CUTTERS_KEY] = True
+    return composite
+
+
+def uses_batched_cutters(composite):
+    """Return True if the composite was marked with ``enable_batched_cutters``."""
+    return bool(composite.additional_data.get(BATCHED_CUTTERS_KEY, False))
+
+
+def _bounding_boxes_overlap(bb_a, bb_b, tolerance=1e-6):
+    (a_min, a_max), (b_min, b_max) = bb_a, bb_b
+    return all(
+        a_min[axis] <= b_max[axis] + tolerance
+        and b_min[axis] <= a_max[axis] + tolerance
+        for axis in range(3)
+    )
+
+
+def _get_cache_entry(composite):
+    cutters = tuple(composite.cutters)
+    entry = _merged_cutter_cache.get(composite)
+
+    # Transformations replace the cutter objects, so identity tells us
+    # whether the cached tools still describe the composite's cutters.
+    if (
+        entry is None
+        or len(entry[0]) != len(cutters)
+        or any(cached is not current for cached, current in zip(entry[0], cutters))
+    ):
+        entry = (cutters, [get_bounding_box(c) for c in cutters], {})
+        _merged_cutter_cache[composite] = entry
+
+    return entry
+
+
+def get_merged_cutter(composite, cutter_indices=None):
+    """Return the cutters of ``composite`` fused into a single, cached tool.
+
+    Args:
+        composite: LeaderFollowersCuttersPart whose cutters are merged
+        cutter_indices: Optional subset of cutter indices, defaults to all cutters
+
+    Returns:
+        The merged cutter, or None if there is nothing to merge
+    """
+
+    cutters, _, merged_by_indices = _get_cache_entry(composite)
+    if cutter_indices is None:
+        cutter_indices = range(len(cutters))
+    key = tuple(sorted(cutter_indices))
+
+    if not key:
+        return None
+
+    if key not in merged_by_indices:
+        merged = PartCollector()
+        for idx in key:
+            merged = merged.fuse(cutters[idx])
+        merged_by_indices[key] = merged
+
+    return merged_by_indices[key]
+
+
+def get_cutter_indices_overlapping(composite, part):
+    """Return the indices of the cutters whose bounding box overlaps ``part``."""
+
+    _, cutter_bounding_boxes, _ = _get_cache_entry(composite)
+    part_bb = get_bounding_box(part)
+
+    return [
+        idx
+        for idx, cutter_bb in enumerate(cutter_bounding_boxes)
+        if _bounding_boxes_overlap(cutter_bb, part_bb)
+    ]
+
+
+def use_as_cutter_on(composite, part):
+    """Apply all cutters of ``composite`` to ``part``.
+
+    Composites marked with ``enable_batched_cutters`` are applied with a single
+    cut using the merged, bounding-box filtered cutters. All other composites
+    fall back to ``LeaderFollowersCuttersPart.use_as_cutter_on``.
+    """
+
+    if not uses_batched_cutters(composite):
+        return composite.use_as_cutter_on(part)
+
+    cutter_indices = get_cutter_indices_overlapping(composite, part)
+    _logger.debug(
+        f"Batched cut with {len(cutter_indices)} of {len(composite.cutters)} cutters"
+    )
+
+    merged_cutter = get_merged_cutter(composite, cutter_indices)
+    if merged_cutter is None:
+        return part
+
+    return part.cut(merged_cutter)
@@ -0,0 +1,92 @@
+"""
+Fusing parts that only touch, with OCC's glue option.
+
+Cages, plates and flanges are built from boxes placed face to face. The
+general fuse intersects every face of one operand with every face of the
+others, although touching operands only share coplanar face pieces. With the
+glue option (``BOPAlgo_GlueShift``) OCC skips the face/face intersection and
+only splits the shared faces, which is valid as long as no two operands
+overlap in volume. Glued results keep the seams of the shared faces, so
+``fuse_touching`` unifies same-domain faces afterwards, which also leaves
+fewer faces for the booleans and exports that follow.
+
+Whether two operands may be glued is decided from their bounding boxes: if
+the boxes are disjoint or only meet in a plane (overlap thinner than
+``CONTACT_TOLERANCE`` along some axis), the solids cannot overlap in volume.
+Operands are grouped greedily so that no two operands of a group overlap,
+each group is glued in one boolean and the groups are joined with one
+general fuse. Composites and adapters other than CadQuery fall back to
+``fuse_all``.
+
+Usage:
+    cage = fuse_touching(base, back_wall, side_wall, front_wall, top_plate)
+"""
+
+import logging
+
+from mege_ender_3v3ke_idex.construct.fuse_tree import fuse_all
+
+_logger = logging.getLogger(__name__)
+
+# mm, bounds overlapping less than this along some axis only touch
+CONTACT_TOLERANCE = 1e-4
+
+
+def _bounds(part):
+    box = part.BoundingBox()
+    return (box.xmin, box.ymin, box.zmin), (box.xmax, box.ymax, box.zmax)
+
+
+def bounds_only_touch(a, b, tolerance=CONTACT_TOLERANCE):
+    """Whether the bounds ``a`` and ``b`` ((min, max) corners) share no volume."""
+
+    (a_min, a_max), (b_min, b_max) = a, b
+    return any(
+        min(a_max[axis], b_max[axis]) - max(a_min[axis], b_min[axis]) <= tolerance
+        for axis in range(3)
+    )
+
+
+def contact_groups(bounds, tolerance=CONTACT_TOLERANCE):
+    """Indices of ``bounds`` grouped so that no two in a group share volume."""
+
+    groups = []
+    for i, part_bounds in enumerate(bounds):
+        for group in groups:
+            if all(bounds_only_touch(part_bounds, bounds[j], tolerance) for j in group):
+                group.append(i)
+                break
+        else:
+            groups.append([i])
+    return groups
+
+
+def fuse_touching(*parts, unify=True):
+    """All ``parts`` fused, gluing those that only touch.
+
+    Args:
+        unify: Merge coplanar faces and collinear edges of the result
+    """
+
+    try:
+        import cadquery as cq
+    except ImportError:  # FreeCAD adapter
+        cq = None
+
+    if cq is None or not all(isinstance(part, cq.Shape) for part in parts):
+        return fuse_all(parts)
+    if len(parts) == 1:
+        return parts[0]
+
+    groups = contact_groups([_bounds(part) for part in parts])
+    _logger.debug(f"Fusing {len(parts)} parts in contact groups {groups}")
+    glued = [
+        (
+            parts[group[0]].fuse(*(parts[i] for i in group[1:]), glue=True)
+            if len(group) > 1
+            else parts[group[0]]
+        )
+        for group in groups
+    ]
+    fused = glued[0].fuse(*glued[1:]) if len(glued) > 1 else glued[0]
+    return fused.clean() if unify else fused
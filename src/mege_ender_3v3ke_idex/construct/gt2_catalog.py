@@ -0,0 +1,245 @@
+"""
+Catalog of GT2 pulleys and idlers.
+
+``create_gt2_pulley`` cuts one groove per tooth, a 40 tooth pulley takes
+about a second, and every builder placing a pulley or idler used to rebuild
+it. The catalog builds each variant (kind, tooth count, bore, belt width)
+once, keeps it in memory and persists it as BREP on disk, so later builds
+load it in milliseconds. Callers get a copy they are free to transform.
+
+Disk entries are keyed by the variant, the GT2 dimensions and the source of
+the builder, so changing either rebuilds them. The first catalog use loads
+all persisted entries; ``warm_catalog`` builds the common variants up front.
+
+Dimensions (pitch diameter, flange diameter, size) come analytically from
+``GT2WheelSpec``, without building the part or asking OCC for a bounding box.
+The builders are only imported when a variant is built, so dimension queries
+do not load a CAD backend.
+
+Usage:
+    idler = gt2_idler(16, bore_diameter=3)
+    GT2WheelSpec(IDLER, 16, bore_diameter=3).size
+    python -m mege_ender_3v3ke_idex.construct.gt2_catalog  # warm the common variants
+"""
+
+import hashlib
+import inspect
+import logging
+import math
+import os
+import tempfile
+from dataclasses import dataclass
+from itertools import product
+from pathlib import Path
+
+from mege_ender_3v3ke_idex.designs import gt2_dimensions
+from mege_ender_3v3ke_idex.geometry.fingerprint import brep_bytes, shape_from_brep_bytes
+from mege_ender_3v3ke_idex.produce import bom
+from mege_ender_3v3ke_idex.produce.bom import add_bom_item
+
+_logger = logging.getLogger(__name__)
+
+PULLEY = "pulley"
+IDLER = "idler"
+
+PULLEY_TOP_DISK_THICKNESS = 1.5
+PULLEY_BOTTOM_DISK_THICKNESS = 5
+IDLER_END_DISK_THICKNESS = 0.8
+
+COMMON_TOOTH_COUNTS = (16, 20, 36, 40)
+COMMON_BORE_DIAMETERS = (3, 5)
+
+CATALOG_DIR_ENV_VAR = "MEGE_IDEX_GT2_CATALOG_DIR"
+DEFAULT_CATALOG_DIR = Path.home() / ".cache" / "mege_ender_3v3ke_idex" / "gt2_catalog"
+
+
+@dataclass(frozen=True)
+class GT2WheelSpec:
+    """One pulley or idler variant, dimensions in mm."""
+
+    kind: str  # PULLEY or IDLER
+    num_teeth: int
+    bore_diameter: float = None  # None for a solid pulley
+    belt_width: float = gt2_dimensions.gt2_width
+
+    def __post_init__(self):
+        if self.kind not in (PULLEY, IDLER):
+            raise ValueError(f"Unknown GT2 wheel kind {self.kind!r}")
+        if self.kind == IDLER and not self.bore_diameter:
+            raise ValueError("Idlers need a bore diameter")
+
+    @property
+    def pitch_diameter(self):
+        return self.num_teeth * gt2_dimensions.gt2_pitch / math.pi
+
+    @property
+    def pitch_radius(self):
+        return self.pitch_diameter / 2
+
+    @property
+    def flange_diameter(self):
+        return self.pitch_diameter
+
+    @property
+    def core_diameter(self):
+        """Diameter the belt rests on, the tooth tips of a pulley."""
+
+        if self.kind == PULLEY:
+            return (
+                self.pitch_diameter
+                - gt2_dimensions.gt2_thickness
+                + gt2_dimensions.gt2_teeth_thickness
+            )
+        return self.pitch_diameter - gt2_dimensions.gt2_thickness
+
+    @property
+    def flange_thicknesses(self):
+        """(bottom, top) flange thickness."""
+
+        if self.kind == PULLEY:
+            return PULLEY_BOTTOM_DISK_THICKNESS, PULLEY_TOP_DISK_THICKNESS
+        return IDLER_END_DISK_THICKNESS, IDLER_END_DISK_THICKNESS
+
+    @property
+    def bounding_box(self):
+        """(min, max) corner of the part as built, the belt zone starts at z=0."""
+
+        bottom, top = self.flange_thicknesses
+        radius = self.flange_diameter / 2
+        return (-radius, -radius, -bottom), (radius, radius, self.belt_width + top)
+
+    @property
+    def size(self):
+        (x0, y0, z0), (x1, y1, z1) = self.bounding_box
+        return x1 - x0, y1 - y0, z1 - z0
+
+    def build(self):
+        from mege_ender_3v3ke_idex.designs import gt2belt
+
+        if self.kind == PULLEY:
+            return gt2belt.create_gt2_pulley(
+                num_teeth=self.num_teeth,
+                belt_width=self.belt_width,
+                top_disk_thickness=PULLEY_TOP_DISK_THICKNESS,
+                bottom_disk_thickness=PULLEY_BOTTOM_DISK_THICKNESS,
+                bore_diameter=self.bore_diameter,
+            )
+        return gt2belt.create_gt2_idler(
+            num_teeth=self.num_teeth,
+            belt_width=self.belt_width,
+            shaft_diameter=self.bore_diameter,
+            end_disk_thickness=IDLER_END_DISK_THICKNESS,
+        )
+
+    def cache_key(self):
+        from mege_ender_3v3ke_idex.designs import gt2belt
+
+        builder = (
+            gt2belt.create_gt2_pulley
+            if self.kind == PULLEY
+            else gt2belt.create_gt2_idler
+        )
+        dimensions = (
+            gt2belt.gt2_pitch,
+            gt2belt.gt2_thickness,
+            gt2belt.gt2_teeth_thickness,
+            gt2belt.BIG_THING,
+        )
+        hasher = hashlib.sha256(repr((self, dimensions)).encode("utf-8"))
+        hasher.update(inspect.getsource(builder).encode("utf-8"))
+        return hasher.hexdigest()
+
+    @property
+    def file_name(self):
+        bore = f"{self.bore_diameter:g}mm" if self.bore_diameter else "solid"
+        return (
+            f"{self.kind}_{self.num_teeth}t_{bore}_{self.belt_width:g}w_"
+            f"{self.cache_key()[:16]}.brep"
+        )
+
+
+COMMON_VARIANTS = tuple(
+    GT2WheelSpec(kind, num_teeth, bore)
+    for kind, num_teeth, bore in product(
+        (PULLEY, IDLER), COMMON_TOOTH_COUNTS, COMMON_BORE_DIAMETERS
+    )
+)
+
+# (catalog dir, spec) -> shape, filled from disk on first use
+_catalog = {}
+_loaded_from_disk = set()
+
+
+def catalog_dir():
+    return Path(os.environ.get(CATALOG_DIR_ENV_VAR, DEFAULT_CATALOG_DIR)).expanduser()
+
+
+def _load_persisted(directory):
+    if directory in _loaded_from_disk:
+        return
+    _loaded_from_disk.add(directory)
+
+    file_names = {spec.file_name: spec for spec in COMMON_VARIANTS}
+    for path in directory.glob("*.brep") if directory.is_dir() else ():
+        spec = file_names.get(path.name)
+        if spec is not None and (directory, spec) not in _catalog:
+            _catalog[directory, spec] = shape_from_brep_bytes(path.read_bytes())
+
+
+def _persist(directory, spec, shape):
+    directory.mkdir(parents=True, exist_ok=True)
+    # write and rename, so concurrent builds never read a partial file
+    handle, temp_path = tempfile.mkstemp(dir=directory, suffix=".brep.tmp")
+    with os.fdopen(handle, "wb") as temp_file:
+        temp_file.write(brep_bytes(shape))
+    os.replace(temp_path, directory / spec.file_name)
+
+
+def get_gt2_wheel(spec):
+    """The part of a catalog variant, built on the first request ever."""
+
+    directory = catalog_dir()
+    _load_persisted(directory)
+
+    shape = _catalog.get((directory, spec))
+    if shape is None:
+        path = directory / spec.file_name
+        if path.exists():
+            shape = shape_from_brep_bytes(path.read_bytes())
+        else:
+            _logger.info(f"Building {spec.file_name} for the GT2 catalog")
+            shape = spec.build()
+            _persist(directory, spec, shape)
+        _catalog[directory, spec] = shape
+
+    return shape.copy()
+
+
+def gt2_pulley(num_teeth=20, bore_diameter=5, belt_width=gt2_dimensions.gt2_width):
+    add_bom_item(bom.PULLEY, f"GT2 {num_teeth}T pulley, {bore_diameter:g} mm bore")
+    return get_gt2_wheel(GT2WheelSpec(PULLEY, num_teeth, bore_diameter, belt_width))
+
+
+def gt2_idler(num_teeth=20, bore_diameter=3, belt_width=gt2_dimensions.gt2_width):
+    add_bom_item(bom.IDLER, f"GT2 {num_teeth}T idler, {bore_diameter:g} mm bore")
+    return get_gt2_wheel(GT2WheelSpec(IDLER, num_teeth, bore_diameter, belt_width))
+
+
+def warm_catalog(variants=COMMON_VARIANTS):
+    """Build and persist all ``variants`` that are not on disk yet."""
+
+    for spec in variants:
+        get_gt2_wheel(spec)
+    _logger.info(f"GT2 catalog in {catalog_dir()} holds {len(variants)} variants")
+
+
+def clear_memory_cache():
+    """Forget the in-memory catalog, the disk entries stay."""
+
+    _catalog.clear()
+    _loaded_from_disk.clear()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    warm_catalog()
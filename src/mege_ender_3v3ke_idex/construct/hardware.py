@@ -0,0 +1,179 @@
+"""
+Screws, nuts and heat-set inserts, with their cutters, built once per spec.
+
+Builders look up ``MScrew.from_size`` and ``m_screws_table`` for every
+head, clearance hole and insert pocket, and build a nut, screw or nut pocket
+cutter for every idler axle, tensioner and mount screw, although a printer
+uses a handful of distinct sizes. The library builds each item once per
+spec (kind and arguments) and keeps it in memory. Callers get an instance:
+with the CadQuery adapter a shape sharing the cached geometry, so placing it
+costs no rebuild, otherwise a copy. Composite cutters (nut pockets) are
+copied, their transforms work in place.
+
+Dimensions come from ``screw_dimensions`` and ``insert_dimensions``, which
+read the screw table once per size and do not load a CAD backend.
+
+Usage:
+    screw = cylinder_screw("M3", length=12)
+    hole = clearance_hole_cutter("M3", length=BIG_THING)
+    pocket = nut_pocket_cutter("M3", bottom_cutter_length=3, top_cutter_length=100)
+    screw_dimensions("M3").cylinder_head_height
+"""
+
+import logging
+from functools import lru_cache
+
+from mege_ender_3v3ke_idex.produce import bom
+from mege_ender_3v3ke_idex.produce.bom import add_bom_item
+
+_logger = logging.getLogger(__name__)
+
+_hardware = {}
+
+
+@lru_cache(maxsize=None)
+def screw_dimensions(size):
+    """The ``MScrew`` of ``size``, read from the screw table once."""
+
+    from shellforgepy.geometry.m_screws import MScrew
+
+    return MScrew.from_size(size)
+
+
+def insert_dimensions(size):
+    """(hole diameter, length) of the heat-set insert for ``size``."""
+
+    dimensions = screw_dimensions(size)
+    if dimensions.thread_inset_hole_diameter is None:
+        raise ValueError(f"No heat-set insert dimensions for {size}")
+    return dimensions.thread_inset_hole_diameter, dimensions.thread_inset_length
+
+
+def _instance(part):
+    try:
+        import cadquery as cq
+    except ImportError:  # FreeCAD adapter
+        cq = None
+
+    if cq is not None and isinstance(part, cq.Shape):
+        return part.moved(cq.Location())
+    return part.copy()
+
+
+def _get(key, build):
+    part = _hardware.get(key)
+    if part is None:
+        _logger.debug(f"Building hardware {key}")
+        part = build()
+        _hardware[key] = part
+    return _instance(part)
+
+
+def cylinder_screw(size, length):
+    """A cylinder head screw, the head on top of the shaft from z=0 to z=length."""
+
+    from shellforgepy.simple import create_cylinder_screw
+
+    add_bom_item(bom.SCREW, f"{size}x{length:g} cylinder screw")
+    return _get(
+        ("cylinder_screw", size, float(length)),
+        lambda: create_cylinder_screw(size, length=length),
+    )
+
+
+def nut(size, height=None, slack=None, no_hole=False):
+    """A hex nut, ``slack`` widens it across the corners for pockets."""
+
+    from shellforgepy.simple import create_nut
+
+    add_bom_item(bom.NUT, f"{size} hex nut")
+    return _get(
+        ("nut", size, height, slack, no_hole),
+        lambda: create_nut(size, height=height, slack=slack, no_hole=no_hole),
+    )
+
+
+def heat_set_insert(size):
+    """A heat-set insert as a sleeve filling its pocket, axis along Z."""
+
+    from shellforgepy.simple import create_cylinder
+
+    def build():
+        diameter, length = insert_dimensions(size)
+        sleeve = create_cylinder(diameter / 2, length)
+        return sleeve.cut(create_cylinder(float(size[1:]) / 2, length))
+
+    return _get(("heat_set_insert", size), build)
+
+
+def clearance_hole_cutter(size, length, clearance=0.0):
+    """A normal clearance hole, ``clearance`` added to the radius."""
+
+    from shellforgepy.simple import create_cylinder
+
+    radius = screw_dimensions(size).clearance_hole_normal / 2 + clearance
+    return _get(
+        ("clearance_hole", size, float(length), float(clearance)),
+        lambda: create_cylinder(radius, length),
+    )
+
+
+def screw_head_cutter(size, clearance=0.0):
+    """A cylinder head pocket, ``clearance`` around and above and below the head."""
+
+    from shellforgepy.simple import create_cylinder
+
+    dimensions = screw_dimensions(size)
+    return _get(
+        ("screw_head", size, float(clearance)),
+        lambda: create_cylinder(
+            dimensions.cylinder_head_diameter / 2 + clearance,
+            dimensions.cylinder_head_height + 2 * clearance,
+        ),
+    )
+
+
+def insert_pocket_cutter(size, slack=0.0, max_length=None):
+    """A heat-set insert pocket, ``slack`` added to radius and depth.
+
+    ``max_length`` caps the depth, for inserts going into thin walls.
+    """
+
+    from shellforgepy.simple import create_cylinder
+
+    add_bom_item(bom.INSERT, f"{size} heat-set insert")
+    diameter, length = insert_dimensions(size)
+    length = length + slack
+    if max_length is not None:
+        length = min(max_length, length)
+    return _get(
+        ("insert_pocket", size, float(slack), float(length)),
+        lambda: create_cylinder(diameter / 2 + slack, length),
+    )
+
+
+def nut_pocket_cutter(size, bottom_cutter_length=3, top_cutter_length=100, slack=0.3):
+    """``create_hidden_nut_pocket_cutter`` of shellforgepy, built once per spec."""
+
+    from shellforgepy.simple import create_hidden_nut_pocket_cutter
+
+    add_bom_item(bom.NUT, f"{size} hex nut")
+    return _get(
+        (
+            "nut_pocket",
+            size,
+            float(bottom_cutter_length),
+            float(top_cutter_length),
+            float(slack),
+        ),
+        lambda: create_hidden_nut_pocket_cutter(
+            size,
+            bottom_cutter_length=bottom_cutter_length,
+            top_cutter_length=top_cutter_length,
+            slack=slack,
+        ),
+    )
+
+
+def clear_hardware_cache():
+    _hardware.clear()
@@ -0,0 +1,73 @@
+"""
+Extrusion of large planar outlines.
+
+``create_extruded_polygon`` goes through a CadQuery workplane, which sorts
+and checks the edges of a polyline in quadratic time. A belt outline with a
+few thousand points takes minutes that way, and a loop with a hole needs an
+extra boolean on top. With the CadQuery adapter, ``extrude_outline`` builds
+the wires and the face directly and extrudes once; other adapters fall back
+to ``create_extruded_polygon`` and a cut per hole.
+
+Usage:
+    ring = extrude_outline(outer_points, height=6, holes=[inner_points])
+"""
+
+import logging
+
+import numpy as np
+from shellforgepy.simple import create_extruded_polygon, get_adapter_id
+
+_logger = logging.getLogger(__name__)
+
+
+def _extrude_cadquery(outer, holes, height):
+    import cadquery as cq
+    from OCP.BRepBuilderAPI import BRepBuilderAPI_MakeFace, BRepBuilderAPI_MakePolygon
+    from OCP.gp import gp_Pnt
+    from OCP.TopoDS import TopoDS
+
+    def polygon(points):
+        builder = BRepBuilderAPI_MakePolygon()
+        for x, y in points:
+            builder.Add(gp_Pnt(float(x), float(y), 0.0))
+        builder.Close()
+        return builder.Wire()
+
+    face_builder = BRepBuilderAPI_MakeFace(polygon(outer), True)
+    for hole in holes:
+        face_builder.Add(TopoDS.Wire_s(polygon(hole)))
+    face = cq.Face(face_builder.Face())
+    return cq.Solid.extrudeLinear(face, cq.Vector(0, 0, height))
+
+
+def _oriented(points, counterclockwise):
+    points = np.asarray(points, dtype=float)
+    x, y = points[:, 0], points[:, 1]
+    signed_area = np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1))
+    return points if (signed_area > 0) == counterclockwise else points[::-1]
+
+
+def extrude_outline(outer, height, holes=()):
+    """Extrude a closed outline in the XY plane from z=0 to z=height.
+
+    Args:
+        outer: (x, y) points of the outer boundary, without repeating the first
+        height: Extrusion height
+        holes: Point sequences of inner boundaries
+
+    Both may be given in either orientation.
+    """
+
+    outer = _oriented(outer, counterclockwise=True)
+    holes = [_oriented(hole, counterclockwise=False) for hole in holes]
+
+    if get_adapter_id() == "cadquery":
+        return _extrude_cadquery(outer, holes, height)
+
+    _logger.debug(f"Extruding {len(outer)} points through create_extruded_polygon")
+    solid = create_extruded_polygon([tuple(point) for point in outer], height)
+    for hole in holes:
+        solid = solid.cut(
+            create_extruded_polygon([tuple(point) for point in hole], height)
+        )
+    return solid
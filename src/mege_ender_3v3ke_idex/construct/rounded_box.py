@@ -0,0 +1,162 @@
+"""
+Boxes with rounded vertical edges, without a 3D fillet.
+
+``create_filleted_box`` builds a box and fillets the selected edges, one of
+the slowest OCC operations, and the filleted solid makes the following
+booleans heavier too. All filleted boxes of the printer only round vertical
+edges, so the same solid is a rounded rectangle extruded once along Z.
+``create_rounded_box`` takes the arguments of ``create_filleted_box``,
+selects the edges with the same ``fillets_at``/``no_fillets_at`` rules and
+builds the outline from lines and arcs. Selections that include a
+horizontal edge, and adapters other than CadQuery, fall back to
+``create_filleted_box``.
+
+Boxes are cached in memory by dimensions, radius and rounded corners.
+Callers get a copy they are free to transform.
+
+Usage:
+    plate = create_rounded_box(42, 5, 3, 2, no_fillets_at=[Alignment.BOTTOM, Alignment.TOP])
+"""
+
+import logging
+import math
+from itertools import product
+
+_logger = logging.getLogger(__name__)
+
+_boxes = {}
+
+
+def _edge_is_at(bounds, alignment, size):
+    """Whether an edge spanning ``bounds`` lies on the box face ``alignment``."""
+
+    from shellforgepy.simple import Alignment
+
+    faces = {
+        Alignment.LEFT: (0, 0),
+        Alignment.RIGHT: (0, size[0]),
+        Alignment.FRONT: (1, 0),
+        Alignment.BACK: (1, size[1]),
+        Alignment.BOTTOM: (2, 0),
+        Alignment.TOP: (2, size[2]),
+    }
+    if alignment not in faces:
+        return False
+    axis, position = faces[alignment]
+    return all(abs(bound[axis] - position) < 1e-3 for bound in bounds)
+
+
+def _box_edges(length, width, height):
+    """The 12 edges of the box as (start, end) corners."""
+
+    size = (length, width, height)
+    corners = list(product((0, length), (0, width), (0, height)))
+    return [
+        (a, b)
+        for a, b in product(corners, repeat=2)
+        if a < b and sum(p != q for p, q in zip(a, b)) == 1
+    ], size
+
+
+def _selected_edges(length, width, height, fillets_at, no_fillets_at):
+    """Edges ``create_filleted_box`` would fillet."""
+
+    edges, size = _box_edges(length, width, height)
+
+    def at_one_of(edge, alignments):
+        return any(_edge_is_at(edge, alignment, size) for alignment in alignments)
+
+    return [
+        edge
+        for edge in edges
+        if (fillets_at is None or at_one_of(edge, fillets_at))
+        and not (no_fillets_at is not None and at_one_of(edge, no_fillets_at))
+    ]
+
+
+def _rounded_rectangle(length, width, corners, radius):
+    """Closed outline of the rectangle with ``corners`` (x, y) rounded."""
+
+    import cadquery as cq
+
+    # counterclockwise, each corner with the directions of its two sides
+    outline = [
+        ((0, 0), (0, -1), (1, 0)),
+        ((length, 0), (1, 0), (0, 1)),
+        ((length, width), (0, 1), (-1, 0)),
+        ((0, width), (-1, 0), (0, -1)),
+    ]
+    points = []  # (start, end, arc midpoint or None) around the corners
+    for (x, y), (ix, iy), (ox, oy) in outline:
+        if (x, y) not in corners:
+            points.append(((x, y), (x, y), None))
+            continue
+        start = (x - ix * radius, y - iy * radius)
+        end = (x + ox * radius, y + oy * radius)
+        center_x, center_y = start[0] + ox * radius, start[1] + oy * radius
+        diagonal = radius / math.sqrt(2)
+        middle = (center_x + (ix - ox) * diagonal, center_y + (iy - oy) * diagonal)
+        points.append((start, end, middle))
+
+    def vector(point):
+        return cq.Vector(point[0], point[1], 0)
+
+    edges = []
+    for i, (start, end, middle) in enumerate(points):
+        if middle is not None:
+            edges.append(
+                cq.Edge.makeThreePointArc(vector(start), vector(middle), vector(end))
+            )
+        next_start = points[(i + 1) % len(points)][0]
+        edges.append(cq.Edge.makeLine(vector(end), vector(next_start)))
+    return cq.Wire.assembleEdges(edges)
+
+
+def _build(length, width, height, fillet_radius, fillets_at, no_fillets_at):
+    from shellforgepy.simple import create_box, create_filleted_box, get_adapter_id
+
+    edges = _selected_edges(length, width, height, fillets_at, no_fillets_at)
+    if not edges:
+        return create_box(length, width, height)
+
+    vertical = all(a[:2] == b[:2] for a, b in edges)
+    if get_adapter_id() != "cadquery" or not vertical:
+        _logger.debug("Rounded box falls back to create_filleted_box")
+        return create_filleted_box(
+            length, width, height, fillet_radius, fillets_at, no_fillets_at
+        )
+
+    import cadquery as cq
+
+    corners = {a[:2] for a, _ in edges}
+    outline = _rounded_rectangle(length, width, corners, fillet_radius)
+    return cq.Solid.extrudeLinear(
+        cq.Face.makeFromWires(outline), cq.Vector(0, 0, height)
+    )
+
+
+def create_rounded_box(
+    length, width, height, fillet_radius, fillets_at=None, no_fillets_at=None
+):
+    """Same as ``create_filleted_box``, with vertical edges rounded in 2D.
+
+    The box spans (0, 0, 0) to (length, width, height).
+    """
+
+    key = (
+        float(length),
+        float(width),
+        float(height),
+        float(fillet_radius),
+        None if fillets_at is None else frozenset(fillets_at),
+        None if no_fillets_at is None else frozenset(no_fillets_at),
+    )
+    box = _boxes.get(key)
+    if box is None:
+        box = _build(length, width, height, fillet_radius, fillets_at, no_fillets_at)
+        _boxes[key] = box
+    return box.copy()
+
+
+def clear_rounded_box_cache():
+    _boxes.clear()
@@ -0,0 +1,163 @@
+"""
+Rigid placements that share geometry instead of copying it.
+
+shellforgepy's ``translate``, ``rotate`` and ``align`` copy the shape and
+then transform the copy, which rebuilds every face. Builders move the same
+solid through long chains of aligns and translations before it meets a
+boolean, so a shape with many faces is copied several times for nothing.
+
+A ``Placement`` is a rigid transform kept as a 4x4 matrix. Placements compose
+by matrix product (``then``) without touching geometry. Applying one to a
+cadquery shape only changes its location, so the result shares its TShape
+with the input, and bounding boxes (thus further aligns) read the location.
+OCC booleans are slower on located operands, so ``bake`` applies the location
+to the geometry in one copy at the end of a chain, before the shape goes into
+booleans. Composites (``LeaderFollowersCuttersPart``) and other adapters fall
+back to shellforgepy's copying transforms.
+
+Usage:
+    base = shared_align(base, mount_plate, Alignment.CENTER)
+    base = bake(shared_align(base, profile, Alignment.STACK_BACK))
+    turn_and_lift = shared_rotate(90, axis=(0, 1, 0)).then(shared_translate(0, 0, 5))
+    axle = turn_and_lift(axle)
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+def rotation_matrix(angle, axis):
+    """Rotation by ``angle`` degrees about ``axis`` (Rodrigues)."""
+
+    axis = np.asarray(axis, dtype=float)
+    axis = axis / np.linalg.norm(axis)
+    x, y, z = axis
+    cross = np.array([[0, -z, y], [z, 0, -x], [-y, x, 0]])
+    radians = np.radians(angle)
+    return np.eye(3) + np.sin(radians) * cross + (1 - np.cos(radians)) * cross @ cross
+
+
+@dataclass(frozen=True, eq=False)
+class Placement:
+    """A rigid transform, callable on parts like ``translate(...)``."""
+
+    matrix: np.ndarray
+    # the elementary transforms, replayed for parts without a location
+    steps: tuple = ()
+
+    @classmethod
+    def identity(cls):
+        return cls(np.eye(4))
+
+    @classmethod
+    def translation(cls, x, y, z):
+        matrix = np.eye(4)
+        matrix[:3, 3] = (x, y, z)
+        return cls(matrix, (("translate", (x, y, z)),))
+
+    @classmethod
+    def rotation(cls, angle, center=None, axis=None):
+        center = np.zeros(3) if center is None else np.asarray(center, float)
+        axis = (0.0, 0.0, 1.0) if axis is None else axis
+        rotation = rotation_matrix(angle, axis)
+        matrix = np.eye(4)
+        matrix[:3, :3] = rotation
+        matrix[:3, 3] = center - rotation @ center
+        return cls(matrix, (("rotate", (angle, tuple(center), tuple(axis))),))
+
+    def then(self, other):
+        """``other`` applied after this placement."""
+        return Placement(other.matrix @ self.matrix, self.steps + other.steps)
+
+    def apply_to_points(self, points):
+        points = np.asarray(points, dtype=float)
+        return points @ self.matrix[:3, :3].T + self.matrix[:3, 3]
+
+    def __call__(self, part):
+        try:
+            import cadquery as cq
+            from OCP.gp import gp_Trsf
+        except ImportError:  # FreeCAD adapter
+            cq = None
+
+        if cq is not None and isinstance(part, cq.Shape):
+            trsf = gp_Trsf()
+            trsf.SetValues(*(float(v) for v in self.matrix[:3].ravel()))
+            return part.moved(cq.Location(trsf))
+
+        from shellforgepy.simple import rotate, translate
+
+        for kind, arguments in self.steps:
+            if kind == "translate":
+                part = translate(*arguments)(part)
+            else:
+                angle, center, axis = arguments
+                part = rotate(angle, center=center, axis=axis)(part)
+        return part
+
+
+def bake(part):
+    """``part`` with its location applied to the geometry, in one copy.
+
+    Booleans on located operands measured about a quarter slower.
+    """
+
+    try:
+        import cadquery as cq
+        from OCP.BRepBuilderAPI import BRepBuilderAPI_Transform
+        from OCP.TopLoc import TopLoc_Location
+    except ImportError:  # FreeCAD adapter
+        return part
+
+    if not isinstance(part, cq.Shape) or part.wrapped.Location().IsIdentity():
+        return part
+    unplaced = part.wrapped.Located(TopLoc_Location())
+    transform = part.wrapped.Location().Transformation()
+    return part.__class__(BRepBuilderAPI_Transform(unplaced, transform, True).Shape())
+
+
+def shared_translate(x, y, z):
+    return Placement.translation(x, y, z)
+
+
+def shared_rotate(angle, center=None, axis=None):
+    return Placement.rotation(angle, center=center, axis=axis)
+
+
+def alignment_translation(part, to, alignment, axes=None, stack_gap=0):
+    """The (x, y, z) by which ``align`` moves ``part``, from the bounding boxes."""
+
+    from shellforgepy.simple import Alignment, get_bounding_box
+
+    minimum, maximum = (np.array(corner, float) for corner in get_bounding_box(part))
+    if to is None:
+        if alignment != Alignment.CENTER:
+            raise ValueError("Without 'to' only CENTER alignment is supported")
+        to_minimum = to_maximum = np.zeros(3)
+    else:
+        to_minimum, to_maximum = (
+            np.array(corner, float) for corner in get_bounding_box(to)
+        )
+
+    vector = np.zeros(3)
+    if alignment == Alignment.CENTER:
+        vector = (to_maximum + to_minimum) / 2 - (maximum + minimum) / 2
+    else:
+        axis, sign = alignment.axis, alignment.sign
+        if sign > 0:
+            vector[axis] = to_maximum[axis] - maximum[axis]
+        else:
+            vector[axis] = to_minimum[axis] - minimum[axis]
+        if alignment.stack_alignment == alignment:  # beyond the face of ``to``
+            vector[axis] += sign * (maximum[axis] - minimum[axis] + stack_gap)
+    if axes is not None:
+        vector[[i for i in range(3) if i not in axes]] = 0
+    return vector
+
+
+def shared_align(part, to, alignment, axes=None, stack_gap=0):
+    """``align`` without copying ``part``."""
+
+    translation = alignment_translation(part, to, alignment, axes, stack_gap)
+    return shared_translate(*(float(value) for value in translation))(part)
@@ -0,0 +1,170 @@
+"""
+Symmetric sides of an assembly, built once and derived for the other side.
+
+Left and right halves of an assembly are often rigid images of each other:
+the left motor stack of the X axis is the right one turned by 180° about the
+Y axis through the center of the axis profiles. ``build_symmetric_pair``
+builds the canonical side and derives the other one with a
+``SymmetryTransform`` (a rotation or a mirror), which costs a copy and a
+placement per shape instead of the whole boolean chain. Build results may be
+shapes or tuples, lists and dicts of them; other values (names, numbers) are
+kept as they are.
+
+With ``verify=True`` the derived side is also built directly and every shape
+is compared with ``shapes_match``, so a builder is checked once when it
+changes instead of trusting that each of its steps is symmetric.
+
+The purchased parts of the canonical side are counted again for the derived
+side in the active ``collect_bom``; the verifying build is not counted.
+
+Usage:
+    stacks = build_symmetric_pair(
+        lambda side: _create_motor_stack(side, lower, top, params),
+        canonical=Alignment.RIGHT,
+        derived=Alignment.LEFT,
+        transform=SymmetryTransform.rotation(180, axis=(0, 1, 0), center=center),
+    )
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from mege_ender_3v3ke_idex.produce.bom import add_bom, collect_bom, suppress_bom
+
+_logger = logging.getLogger(__name__)
+
+_SCALAR_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+class SymmetryError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class SymmetryTransform:
+    """A rotation about ``axis`` through ``center``, or a mirror at a plane."""
+
+    kind: str  # "rotation" or "mirror"
+    angle: float = 0.0
+    axis: Tuple[float, float, float] = (0, 0, 1)
+    center: Tuple[float, float, float] = (0, 0, 0)
+    normal: Optional[Tuple[float, float, float]] = None
+
+    @classmethod
+    def rotation(cls, angle, axis, center=(0, 0, 0)):
+        return cls("rotation", angle=angle, axis=tuple(axis), center=tuple(center))
+
+    @classmethod
+    def mirror(cls, normal, point=(0, 0, 0)):
+        """Mirror at the plane through ``point`` with ``normal``.
+
+        Mirrored shapes have the opposite handedness, screw threads and
+        other chiral features are not equivalent to a direct build.
+        """
+        return cls("mirror", normal=tuple(normal), center=tuple(point))
+
+    def __call__(self, part):
+        from shellforgepy.simple import mirror, rotate
+
+        if self.kind == "mirror":
+            return mirror(normal=self.normal, point=self.center)(part)
+        return rotate(self.angle, center=self.center, axis=self.axis)(part)
+
+
+def derive_symmetric(result, transform):
+    """``result`` with ``transform`` applied to every shape in it."""
+
+    if isinstance(result, _SCALAR_TYPES):
+        return result
+    if isinstance(result, tuple):
+        return tuple(derive_symmetric(item, transform) for item in result)
+    if isinstance(result, list):
+        return [derive_symmetric(item, transform) for item in result]
+    if isinstance(result, dict):
+        return {key: derive_symmetric(v, transform) for key, v in result.items()}
+    return transform(result)
+
+
+def shapes_match(a, b, tolerance=1e-3, volume_tolerance=1e-6):
+    """Whether ``a`` and ``b`` occupy the same space.
+
+    Bounding boxes must agree within ``tolerance`` (mm), and the volume of
+    the symmetric difference must be at most ``volume_tolerance`` times the
+    volume of ``a``.
+    """
+
+    from shellforgepy.simple import get_bounding_box, get_volume
+
+    box_a, box_b = get_bounding_box(a), get_bounding_box(b)
+    if any(
+        abs(p - q) > tolerance
+        for corner_a, corner_b in zip(box_a, box_b)
+        for p, q in zip(corner_a, corner_b)
+    ):
+        return False
+    difference = get_volume(a.cut(b)) + get_volume(b.cut(a))
+    return difference <= volume_tolerance * max(get_volume(a), tolerance**3)
+
+
+def _compare(direct, derived, path, tolerance):
+    if isinstance(direct, _SCALAR_TYPES):
+        if direct != derived:
+            raise SymmetryError(f"{path}: {derived!r} derived, {direct!r} built")
+    elif isinstance(direct, (tuple, list)):
+        if len(direct) != len(derived):
+            raise SymmetryError(
+                f"{path}: {len(derived)} items derived, {len(direct)} built"
+            )
+        for i, (a, b) in enumerate(zip(direct, derived)):
+            _compare(a, b, f"{path}[{i}]", tolerance)
+    elif isinstance(direct, dict):
+        if direct.keys() != derived.keys():
+            raise SymmetryError(f"{path}: derived keys differ from the built ones")
+        for key in direct:
+            _compare(direct[key], derived[key], f"{path}[{key!r}]", tolerance)
+    elif not shapes_match(direct, derived, tolerance):
+        raise SymmetryError(f"{path}: derived shape differs from the built one")
+
+
+def build_symmetric_pair(
+    build_side,
+    canonical,
+    derived,
+    transform,
+    *,
+    verify=False,
+    tolerance=1e-3,
+):
+    """``{canonical: build_side(canonical), derived: <its transformed result>}``.
+
+    Args:
+        build_side: Builds one side, called with ``canonical`` (and ``derived``
+            when verifying)
+        transform: Maps the canonical side onto the derived one
+        verify: Also build the derived side directly and compare
+
+    Raises:
+        SymmetryError: If ``verify`` and the derived side differs from the
+            direct build
+    """
+
+    started = time.perf_counter()
+    with collect_bom() as canonical_items:
+        canonical_result = build_side(canonical)
+    add_bom(canonical_items)
+    built = time.perf_counter()
+    derived_result = derive_symmetric(canonical_result, transform)
+    _logger.debug(
+        f"Built {canonical} in {built - started:.2f} s, derived {derived} in "
+        f"{time.perf_counter() - built:.2f} s"
+    )
+
+    if verify:
+        with suppress_bom():
+            direct_result = build_side(derived)
+        _compare(direct_result, derived_result, str(derived), tolerance)
+        _logger.info(f"{derived} derived from {canonical} matches a direct build")
+
+    return {canonical: canonical_result, derived: derived_result}
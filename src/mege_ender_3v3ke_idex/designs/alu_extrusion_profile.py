@@ -9,10 +9,19 @@ Usage:
 
 import logging
 import os
-from enum import Enum
 
-from mege_3devops.process_data.mender3.process_data_04_high_speed import *
-from poemai_utils.enum_utils import add_enum_attrs
+from mege_ender_3v3ke_idex.construct.fuse_tree import TreeCollector
+from mege_ender_3v3ke_idex.construct.rounded_box import create_rounded_box
+from mege_ender_3v3ke_idex.construct.simplify import simplify
+from mege_ender_3v3ke_idex.designs.alu_extrusion_profile_types import (
+    ExtrusionProfileType,
+)
+from mege_ender_3v3ke_idex.produce import bom
+from mege_ender_3v3ke_idex.produce.bom import add_bom_item
+from mege_ender_3v3ke_idex.produce.incremental_export import (
+    arrange_and_export_incremental,
+)
+from mege_ender_3v3ke_idex.produce.process_profiles import PETGCF_04_HS
 from shellforgepy.simple import *
 
 _logger = logging.getLogger(__name__)
@@ -20,99 +29,7 @@ _logger = logging.getLogger(__name__)
 # Production mode from environment variable
 PROD = os.environ.get("SHELLFORGEPY_PRODUCTION", "0") == "1"
 
-PROCESS_DATA = PROCESS_DATA_PETGCF_04_HS
-
-
-class ExtrusionProfileType(Enum):
-    PROFILE_2020 = "2020"
-
-    # “Most common” 4040 in Europe/industrial catalogs:
-    # 40x40 with ONE slot per face, slot size 8 (often called “slot 8 / Nut 8”).
-    PROFILE_4040 = "4040"
-
-    # Special / less common (but exists): 4040 with TWO slots per face (20 mm pitch tiled style)
-    PROFILE_4040_2SLOT = "4040_2slot"
-
-
-def add_enum_attrs(enum_to_attrs: dict):
-    for enum_member, attrs in enum_to_attrs.items():
-        for k, v in attrs.items():
-            setattr(enum_member, k, v)
-
-
-add_enum_attrs(
-    {
-        # ---------------------------------------------------------------------
-        # 20-series: 2020 (slot ~6, “Nut 5” ecosystem)
-        # ---------------------------------------------------------------------
-        ExtrusionProfileType.PROFILE_2020: {
-            "family": "20-series",
-            "size_mm": (20.0, 20.0),
-            "grid_pitch_mm": 20.0,
-            "slots_per_side": 1,
-            "slot_centers_from_profile_center_mm": [0.0],
-            "slot_type": "T-slot",
-            "slot_series": 6,  # informal: “slot 6”
-            # Practical, vendor-agnostic values (good for modelling brackets/T-nuts)
-            "slot_opening_width_mm": 6.2,
-            "slot_inner_width_mm": 11.0,
-            "slot_depth_mm": 6.2,
-            "slot_corner_radius_mm": 1.2,
-            # Hardware assumptions (typical)
-            "nominal_hardware": "M5",
-            "center_bore_diameter_mm": 4.2,  # tap drill for M5 (if you model tapping)
-            "corner_radius_mm": 1.5,
-            "recommended_clearance_mm": 0.2,
-        },
-        # ---------------------------------------------------------------------
-        # 40-series: 4040 “slot 8” style (as in your drawing)
-        # ONE slot per face, centered; opening ~8 mm; center bore ~Ø6.8; outer corner R4
-        # ---------------------------------------------------------------------
-        ExtrusionProfileType.PROFILE_4040: {
-            "family": "40-series",
-            "size_mm": (40.0, 40.0),
-            "grid_pitch_mm": 40.0,  # the natural grid unit for this family is 40
-            "slots_per_side": 1,
-            "slot_centers_from_profile_center_mm": [0.0],
-            "slot_type": "T-slot",
-            "slot_series": 8,  # informal: “slot 8 / Nut 8”
-            # Values aligned with the common 40x40 slot-8 geometry (good modelling start)
-            "slot_opening_width_mm": 8.0,  # your drawing explicitly shows 8
-            "slot_inner_width_mm": 14.0,  # typical cavity behind an 8mm mouth
-            "slot_depth_mm": 8.0,  # typical depth for slot-8 profiles
-            "slot_corner_radius_mm": 1.5,
-            # Hardware assumptions (slot 8 commonly uses M6 / M8 depending on nut type;
-            # M6 is the “typical” light-duty assumption, M8 exists for heavier hardware)
-            "nominal_hardware": "M6",
-            # Your drawing shows Ø6.80 center hole (often for M8 tap drill-ish / or clearance-ish
-            # depending on profile system). Keep as modelling default.
-            "center_bore_diameter_mm": 6.8,
-            "corner_radius_mm": 4.0,  # your drawing shows R4
-            "recommended_clearance_mm": 0.2,
-        },
-        # ---------------------------------------------------------------------
-        # 4040 “tiled 20mm grid” variant (two slots per face) — special case
-        # This is the one you had before; keep it as an explicit alternative.
-        # ---------------------------------------------------------------------
-        ExtrusionProfileType.PROFILE_4040_2SLOT: {
-            "family": "40-series",
-            "size_mm": (40.0, 40.0),
-            "grid_pitch_mm": 20.0,  # tiled 20mm pitch
-            "slots_per_side": 2,
-            "slot_centers_from_profile_center_mm": [-10.0, +10.0],
-            "slot_type": "T-slot",
-            "slot_series": 6,  # often these are literally two 20-series-style slots
-            "slot_opening_width_mm": 6.2,
-            "slot_inner_width_mm": 11.0,
-            "slot_depth_mm": 6.2,
-            "slot_corner_radius_mm": 1.2,
-            "nominal_hardware": "M5",
-            "center_bore_diameter_mm": None,
-            "corner_radius_mm": 2.0,
-            "recommended_clearance_mm": 0.2,
-        },
-    }
-)
+PROCESS_DATA = PETGCF_04_HS
 
 
 DEFAULT_EXTRUSION_LENGTH_MM = 120.0
@@ -159,8 +76,9 @@ def create_alu_extrusion_profile(
 ):
     profile = extrusion_profile_type
     size_x_mm, size_y_mm = profile.size_mm
+    add_bom_item(bom.PROFILE, f"{profile.value} profile, {length_mm:g} mm")
 
-    body = create_filleted_box(
+    body = create_rounded_box(
         size_x_mm,
         size_y_mm,
         length_mm,
@@ -176,7 +94,7 @@ def create_alu_extrusion_profile(
 
     body = align(body, None, Alignment.CENTER)
 
-    slot_cutters = PartCollector()
+    slot_cutters = TreeCollector()
     for i in range(4):
 
         slot_cutter = create_t_slot_cutter(
@@ -197,7 +115,7 @@ def create_alu_extrusion_profile(
             slot_cutter_instance = rotate(90 * i)(slot_cutter_instance)
             slot_cutters = slot_cutters.fuse(slot_cutter_instance)
 
-    body = body.cut(slot_cutters)
+    body = body.cut(slot_cutters.part)
     if profile.center_bore_diameter_mm is not None:
 
         center_bore_cutter = create_cylinder(
@@ -207,7 +125,7 @@ def create_alu_extrusion_profile(
         center_bore_cutter = align(center_bore_cutter, body, Alignment.CENTER)
         body = body.cut(center_bore_cutter)
 
-    return body
+    return simplify(body, "create_alu_extrusion_profile", profile.value)
 
 
 def creeate_demo_parts(parts: PartList):
@@ -237,7 +155,7 @@ def main():
         )
         parts.add(part, "alu_extrusion_profile_2020_30mm", flip=False)
 
-    arrange_and_export(
+    arrange_and_export_incremental(
         parts.as_list(),
         script_file=__file__,
         prod=PROD,
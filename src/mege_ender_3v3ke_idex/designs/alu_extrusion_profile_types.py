@@ -0,0 +1,105 @@
+"""
+Aluminium extrusion profile types.
+
+The dimensions of every supported T-slot profile as attributes of
+``ExtrusionProfileType``. Kept apart from the ``alu_extrusion_profile``
+builders, so parameter sets and catalogs can use the profile dimensions
+without importing a CAD backend.
+
+Usage:
+    ExtrusionProfileType.PROFILE_2020.grid_pitch_mm
+"""
+
+from enum import Enum
+
+
+class ExtrusionProfileType(Enum):
+    PROFILE_2020 = "2020"
+
+    # “Most common” 4040 in Europe/industrial catalogs:
+    # 40x40 with ONE slot per face, slot size 8 (often called “slot 8 / Nut 8”).
+    PROFILE_4040 = "4040"
+
+    # Special / less common (but exists): 4040 with TWO slots per face (20 mm pitch tiled style)
+    PROFILE_4040_2SLOT = "4040_2slot"
+
+
+def add_enum_attrs(enum_to_attrs: dict):
+    for enum_member, attrs in enum_to_attrs.items():
+        for k, v in attrs.items():
+            setattr(enum_member, k, v)
+
+
+add_enum_attrs(
+    {
+        # ---------------------------------------------------------------------
+        # 20-series: 2020 (slot ~6, “Nut 5” ecosystem)
+        # ---------------------------------------------------------------------
+        ExtrusionProfileType.PROFILE_2020: {
+            "family": "20-series",
+            "size_mm": (20.0, 20.0),
+            "grid_pitch_mm": 20.0,
+            "slots_per_side": 1,
+            "slot_centers_from_profile_center_mm": [0.0],
+            "slot_type": "T-slot",
+            "slot_series": 6,  # informal: “slot 6”
+            # Practical, vendor-agnostic values (good for modelling brackets/T-nuts)
+            "slot_opening_width_mm": 6.2,
+            "slot_inner_width_mm": 11.0,
+            "slot_depth_mm": 6.2,
+            "slot_corner_radius_mm": 1.2,
+            # Hardware assumptions (typical)
+            "nominal_hardware": "M5",
+            "center_bore_diameter_mm": 4.2,  # tap drill for M5 (if you model tapping)
+            "corner_radius_mm": 1.5,
+            "recommended_clearance_mm": 0.2,
+        },
+        # ---------------------------------------------------------------------
+        # 40-series: 4040 “slot 8” style (as in your drawing)
+        # ONE slot per face, centered; opening ~8 mm; center bore ~Ø6.8; outer corner R4
+        # ---------------------------------------------------------------------
+        ExtrusionProfileType.PROFILE_4040: {
+            "family": "40-series",
+            "size_mm": (40.0, 40.0),
+            "grid_pitch_mm": 40.0,  # the natural grid unit for this family is 40
+            "slots_per_side": 1,
+            "slot_centers_from_profile_center_mm": [0.0],
+            "slot_type": "T-slot",
+            "slot_series": 8,  # informal: “slot 8 / Nut 8”
+            # Values aligned with the common 40x40 slot-8 geometry (good modelling start)
+            "slot_opening_width_mm": 8.0,  # your drawing explicitly shows 8
+            "slot_inner_width_mm": 14.0,  # typical cavity behind an 8mm mouth
+            "slot_depth_mm": 8.0,  # typical depth for slot-8 profiles
+            "slot_corner_radius_mm": 1.5,
+            # Hardware assumptions (slot 8 commonly uses M6 / M8 depending on nut type;
+            # M6 is the “typical” light-duty assumption, M8 exists for heavier hardware)
+            "nominal_hardware": "M6",
+            # Your drawing shows Ø6.80 center hole (often for M8 tap drill-ish / or clearance-ish
+            # depending on profile system). Keep as modelling default.
+            "center_bore_diameter_mm": 6.8,
+            "corner_radius_mm": 4.0,  # your drawing shows R4
+            "recommended_clearance_mm": 0.2,
+        },
+        # ---------------------------------------------------------------------
+        # 4040 “tiled 20mm grid” variant (two slots per face) — special case
+        # This is the one you had before; keep it as an explicit alternative.
+        # ---------------------------------------------------------------------
+        ExtrusionProfileType.PROFILE_4040_2SLOT: {
+            "family": "40-series",
+            "size_mm": (40.0, 40.0),
+            "grid_pitch_mm": 20.0,  # tiled 20mm pitch
+            "slots_per_side": 2,
+            "slot_centers_from_profile_center_mm": [-10.0, +10.0],
+            "slot_type": "T-slot",
+            "slot_series": 6,  # often these are literally two 20-series-style slots
+            "slot_opening_width_mm": 6.2,
+            "slot_inner_width_mm": 11.0,
+            "slot_depth_mm": 6.2,
+            "slot_corner_radius_mm": 1.2,
+            "nominal_hardware": "M5",
+            "center_bore_diameter_mm": None,
+            "corner_radius_mm": 2.0,
+            "recommended_clearance_mm": 0.2,
+        },
+    }
+)
@@ -13,6 +13,9 @@ import tempfile
 import zipfile
 from pathlib import Path
 
+from mege_ender_3v3ke_idex.produce.incremental_export import (
+    arrange_and_export_incremental,
+)
 from shellforgepy.simple import *
 
 _logger = logging.getLogger(__name__)
@@ -57,7 +60,7 @@ def main():
     parts.add(part, "extruder", flip=False)
 
     # Arrange and export
-    arrange_and_export(
+    arrange_and_export_incremental(
         parts.as_list(),
         script_file=__file__,
         prod=PROD,
@@ -0,0 +1,213 @@
+"""
+Fit Test Coupons
+
+Builds parameter sweeps of fit-test coupons in parallel and packs all of them,
+labelled with their parameter values, onto one plate.
+
+Usage:
+    cd <project_root> && ./run.sh path/to/fit_test_coupons.py
+    # or with production mode:
+    cd <project_root> && SHELLFORGEPY_PRODUCTION=1 ./run.sh path/to/fit_test_coupons.py
+    # or packed onto as many plates as needed:
+    cd <project_root> && SHELLFORGEPY_PRODUCTION=1 PACK_PLATES=1 ./run.sh path/to/fit_test_coupons.py
+"""
+
+import logging
+import os
+
+from mege_ender_3v3ke_idex.construct.hardware import nut
+from mege_ender_3v3ke_idex.designs.alu_extrusion_profile import (
+    create_alu_extrusion_profile,
+)
+from mege_ender_3v3ke_idex.designs.alu_extrusion_profile_types import (
+    ExtrusionProfileType,
+)
+from mege_ender_3v3ke_idex.designs.x_axis import (
+    create_idler_endcap,
+    create_motor_with_mount,
+)
+from mege_ender_3v3ke_idex.designs.x_axis_params import (
+    DEFAULT_X_AXIS_PARAMS,
+    XAxisParams,
+)
+from mege_ender_3v3ke_idex.produce.incremental_export import (
+    arrange_and_export_incremental,
+)
+from mege_ender_3v3ke_idex.produce.process_profiles import PETGCF_04_HS
+from mege_ender_3v3ke_idex.produce.sweep import add_sweep_to_parts, run_sweep
+from shellforgepy.simple import *
+
+_logger = logging.getLogger(__name__)
+
+# Production mode from environment variable
+PROD = os.environ.get("SHELLFORGEPY_PRODUCTION", "0") == "1"
+
+PROCESS_DATA = PETGCF_04_HS
+
+COUPONS = "mege_ender_3v3ke_idex.designs.fit_test_coupons"
+
+
+def create_motor_mount_coupon(params: XAxisParams = DEFAULT_X_AXIS_PARAMS):
+    """The motor mount plate of the X axis, with its boss and axle cutout."""
+
+    _, mount_plate = create_motor_with_mount(params)
+    return mount_plate
+
+
+def create_axle_nut_coupon(params: XAxisParams = DEFAULT_X_AXIS_PARAMS):
+    """A block with the idler axle hole and nut pocket of the motor mount plate."""
+
+    block = create_box(14, 14, params.axle_screw_nut_hole_depth + 2)
+
+    axle_cutter = create_cylinder(
+        params.idler_mount_axle_diameter / 2 + params.idler_mount_axle_clearance,
+        100,
+    )
+    axle_cutter = align(axle_cutter, block, Alignment.CENTER)
+
+    nut_cutter = nut(
+        params.axle_screw_size,
+        height=params.axle_screw_nut_hole_depth,
+        slack=params.axle_screw_nut_slack,
+    )
+    nut_cutter = rotate(30)(nut_cutter)
+    nut_cutter = align(nut_cutter, block, Alignment.CENTER)
+    nut_cutter = align(nut_cutter, block, Alignment.TOP)
+
+    return block.cut(axle_cutter).cut(nut_cutter)
+
+
+def create_endcap_coupon(params: XAxisParams = DEFAULT_X_AXIS_PARAMS):
+    """The idler endcap on a short 2020 profile, the profile itself not kept."""
+
+    profile = create_alu_extrusion_profile(
+        ExtrusionProfileType.PROFILE_2020, length_mm=40
+    )
+    profile = rotate(90, axis=(0, 1, 0))(profile)
+    return create_idler_endcap(profile, params=params)
+
+
+COUPON_SWEEPS = {
+    "idler_cage": {
+        "builder_ref": "mege_ender_3v3ke_idex.designs.x_axis:create_idler_cage",
+        "parameter_grid": {
+            "inset_cutter_hole_slack": [0.2, 0.3, 0.4],
+            "idler_mount_axle_clearance": [0.1, 0.2],
+        },
+        "builder_kwargs": {
+            "cage_back_wall": 4,
+            "cage_wall": 2,
+            "cage_top_bottom_thickness": 4,
+            "cage_overlength": 6,
+            "idler_tooth_count": 20,
+            "idler_clearance": 0.5,
+        },
+        "memoize": ("gt2_idler",),
+        "prod_rotation_angle": 90,
+        "prod_rotation_axis": (1, 0, 0),
+        "color": (0.95, 0.82, 0.2),
+    },
+    "alu_extrusion_profile": {
+        "builder_ref": "mege_ender_3v3ke_idex.designs.alu_extrusion_profile:create_alu_extrusion_profile",
+        "parameter_grid": {
+            "extrusion_profile_type": [
+                ExtrusionProfileType.PROFILE_2020,
+                ExtrusionProfileType.PROFILE_4040,
+            ],
+        },
+        "builder_kwargs": {"length_mm": 20},
+        "memoize": (),
+        "prod_rotation_angle": None,
+        "prod_rotation_axis": None,
+        "color": (0.3, 0.5, 0.9),
+    },
+    "motor_mount": {
+        "builder_ref": f"{COUPONS}:create_motor_mount_coupon",
+        "parameter_grid": {"motor_mount_boss_clearance": [0.4, 0.6, 0.8]},
+        "builder_kwargs": {},
+        "memoize": (),
+        "prod_rotation_angle": None,
+        "prod_rotation_axis": None,
+        "color": (0.6, 0.8, 0.4),
+    },
+    "axle_nut": {
+        "builder_ref": f"{COUPONS}:create_axle_nut_coupon",
+        "parameter_grid": {"axle_screw_nut_slack": [0.2, 0.3, 0.4, 0.5]},
+        "builder_kwargs": {},
+        "memoize": (),
+        "prod_rotation_angle": None,
+        "prod_rotation_axis": None,
+        "color": (0.8, 0.4, 0.3),
+    },
+    "endcap": {
+        "builder_ref": f"{COUPONS}:create_endcap_coupon",
+        "parameter_grid": {"endcap_profile_clearance": [0.1, 0.2, 0.3]},
+        "builder_kwargs": {},
+        "memoize": (),
+        "prod_rotation_angle": None,
+        "prod_rotation_axis": None,
+        "color": (0.5, 0.5, 0.8),
+    },
+}
+
+
+def create_fit_test_coupons(parts: PartList, sweep_names=None, max_workers=None):
+    """Run the configured coupon sweeps and add the labelled coupons to ``parts``."""
+
+    row_y = 0.0
+    for sweep_name, sweep in COUPON_SWEEPS.items():
+        if sweep_names is not None and sweep_name not in sweep_names:
+            continue
+
+        results = run_sweep(
+            sweep["builder_ref"],
+            sweep["parameter_grid"],
+            builder_kwargs=sweep["builder_kwargs"],
+            memoize=sweep["memoize"],
+            max_workers=max_workers,
+        )
+
+        coupons = add_sweep_to_parts(
+            parts,
+            results,
+            sweep_name,
+            origin=(0.0, row_y),
+            prod_rotation_angle=sweep["prod_rotation_angle"],
+            prod_rotation_axis=sweep["prod_rotation_axis"],
+            color=sweep["color"],
+        )
+
+        # next sweep gets its own row in the (non-production) preview
+        row_y = max(get_bounding_box(coupon)[1][1] for coupon in coupons) + 10.0
+
+
+def create_parts():
+    """The coupons of the sweeps in ``FIT_TEST_SWEEPS`` (default all)."""
+
+    parts = PartList()
+    sweep_names = os.environ.get("FIT_TEST_SWEEPS")
+    create_fit_test_coupons(
+        parts,
+        sweep_names=sweep_names.split(",") if sweep_names else None,
+    )
+    return parts
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    parts = create_parts()
+
+    arrange_and_export_incremental(
+        parts.as_list(),
+        script_file=__file__,
+        prod=PROD,
+        process_data=PROCESS_DATA,
+        prod_gap=4,
+        pack_plates=os.environ.get("PACK_PLATES", "0") == "1",
+    )
+
+    _logger.info("fit_test_coupons created successfully!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""
+GT2 belt dimensions.
+
+The belt profile and pitch in mm, and the pitch radius of a GT2 pulley or
+idler, importable without a CAD backend. The belt, pulley and idler builders
+live in ``gt2belt``.
+
+Usage:
+    gt2_pitch_radius(20)
+"""
+
+import math
+
+gt2_pitch = 2.0
+gt2_thickness = 1.38
+gt2_teeth_thickness = 0.75
+gt2_width = 6.0
+gt2_tooth_radius = 0.555
+gt2_tooth_bend_offset = 0.4
+gt2_tooth_side_radius = 1.0
+gt2_tooth_inter_radius = 0.15
+
+
+def gt2_pitch_radius(num_teeth):
+    """Pitch radius of a GT2 pulley or idler, the belt's pitch line wraps it here."""
+    return num_teeth * gt2_pitch / (2 * math.pi)
@@ -7,10 +7,31 @@ Usage:
     cd <project_root> && SHELLFORGEPY_PRODUCTION=1 ./run.sh path/to/gt2belt.py
 """
 
+import functools
 import logging
 import math
 import os
 
+import numpy as np
+from mege_ender_3v3ke_idex.construct.planar_extrusion import extrude_outline
+from mege_ender_3v3ke_idex.designs.gt2_dimensions import (
+    gt2_pitch,
+    gt2_pitch_radius,
+    gt2_teeth_thickness,
+    gt2_thickness,
+    gt2_tooth_radius,
+    gt2_width,
+)
+from mege_ender_3v3ke_idex.geometry.belt_path import (
+    BeltWheel,
+    PitchLine,
+    solve_belt_path,
+)
+from mege_ender_3v3ke_idex.produce import bom
+from mege_ender_3v3ke_idex.produce.bom import add_bom_item
+from mege_ender_3v3ke_idex.produce.incremental_export import (
+    arrange_and_export_incremental,
+)
 from shellforgepy.simple import *
 
 _logger = logging.getLogger(__name__)
@@ -28,38 +49,38 @@ PROCESS_DATA = {
 }
 
 BIG_THING = 500
-gt2_pitch = 2.0
-gt2_thickness = 1.38
-gt2_teeth_thickness = 0.75
-gt2_width = 6.0
-gt2_tooth_radius = 0.555
-gt2_tooth_bend_offset = 0.4
-gt2_tooth_side_radius = 1.0
-gt2_tooth_inter_radius = 0.15
 
 
-def creae_gt2_tooth():
+@functools.lru_cache(maxsize=None)
+def gt2_tooth_profile(samples=17):
+    """One tooth of the belt's toothed face as a 2D curve, built once.
 
-    tooth_half = create_cylinder(gt2_tooth_radius, gt2_width, angle=180)
-    tooth_half = rotate(90)(tooth_half)
-    tooth_half = translate(0, gt2_tooth_radius, 0)(tooth_half)
+    Points are (u, height): ``u`` along the pitch line from the tooth center,
+    ``height`` from the tooth tip towards the belt back. The tooth is a disk
+    of ``gt2_tooth_radius`` resting on the land at ``gt2_teeth_thickness``.
+    """
 
-    belt = create_box(gt2_pitch / 2, gt2_thickness - gt2_teeth_thickness, gt2_width)
-    belt = translate(-gt2_pitch / 2, 0, 0)(belt)
-    belt = translate(0, gt2_teeth_thickness, 0)(belt)
-
-    retval = belt.fuse(tooth_half)
-    mirrored = mirror((1, 0, 0))(retval)
-    mirrored = align(mirrored, retval, Alignment.STACK_LEFT)
-    retval = retval.fuse(mirrored)
-
-    return retval
+    land = gt2_teeth_thickness
+    alpha = math.asin((land - gt2_tooth_radius) / gt2_tooth_radius)
+    angles = np.linspace(math.pi - alpha, 2 * math.pi + alpha, samples)
+    profile = np.column_stack(
+        [
+            gt2_tooth_radius * np.cos(angles),
+            gt2_tooth_radius * (1 + np.sin(angles)),
+        ]
+    )
+    profile.flags.writeable = False
+    return profile
 
 
 def create_gt2_pulley(
-    num_teeth=20, belt_width=6, top_disk_thickness=1.5, bottom_disk_thickness=5
+    num_teeth=20,
+    belt_width=6,
+    top_disk_thickness=1.5,
+    bottom_disk_thickness=5,
+    bore_diameter=None,
 ):
-    """Create a simple GT2 pulley model."""
+    """Create a simple GT2 pulley model, solid unless a bore diameter is given."""
     outer_diameter = (
         (num_teeth * gt2_pitch) / math.pi - gt2_thickness + gt2_teeth_thickness
     )
@@ -82,6 +103,11 @@ def create_gt2_pulley(
     bottom_disk = align(bottom_disk, pulley, Alignment.STACK_BOTTOM)
     pulley = pulley.fuse(bottom_disk)
 
+    if bore_diameter:
+        bore = create_cylinder(bore_diameter / 2, BIG_THING)
+        bore = align(bore, pulley, Alignment.CENTER)
+        pulley = pulley.cut(bore)
+
     return pulley
 
 
@@ -111,48 +137,129 @@ def create_gt2_idler(
 
 
 def create_gt2belt(num_teeth=100):
-    """Create the gt2belt part."""
+    """Create a straight belt along +x, tooth tips at y=0, from z=0 to z=width."""
+
+    return create_gt2belt_along_path(
+        solve_belt_path(
+            [
+                BeltWheel((0, gt2_thickness / 2), 0),
+                BeltWheel((num_teeth * gt2_pitch, gt2_thickness / 2), 0),
+            ],
+            pitch=gt2_pitch,
+            closed=False,
+        )
+    )
 
-    retval = PartCollector()
 
-    for i in range(num_teeth):
-        tooth = creae_gt2_tooth()
-        tooth = translate(i * gt2_pitch, 0, 0)(tooth)
-        retval = retval.fuse(tooth)
+def create_gt2belt_loop(num_teeth=20, angle=180):
+    """Create a belt section of ``num_teeth`` teeth bent over ``angle`` degrees.
+
+    The teeth face the center, so the section wraps a pulley centered at the
+    origin, starting at +x and turning clockwise.
+    """
+
+    wrap = math.radians(angle)
+    pitch_radius = num_teeth * gt2_pitch / wrap
+    pitch_line = PitchLine(
+        starts=np.array([[pitch_radius, 0.0]]),
+        start_normals=np.array([[1.0, 0.0]]),
+        lengths=np.array([num_teeth * gt2_pitch]),
+        curvatures=np.array([-1 / pitch_radius]),
+        closed=False,
+    )
+    return create_gt2belt_along_path(pitch_line)
+
+
+def _toothed_face(pitch_line):
+    """The toothed face of a belt, the tooth profile placed along the pitch line."""
+
+    length = pitch_line.length
+    if pitch_line.closed:
+        # a loop holds whole teeth, spread the rounding over all of them
+        tooth_count = max(round(length / gt2_pitch), 1)
+        pitch = length / tooth_count
+    else:
+        tooth_count = math.ceil(length / gt2_pitch)
+        pitch = gt2_pitch
+
+    profile = np.concatenate([[[-pitch / 2, gt2_teeth_thickness]], gt2_tooth_profile()])
+    positions = (
+        (np.arange(tooth_count)[:, None] + 0.5) * pitch + profile[None, :, 0]
+    ).ravel()
+    heights = np.tile(profile[:, 1], tooth_count)
+    if not pitch_line.closed:
+        inside = (positions > 0) & (positions < length)
+        positions = np.concatenate([[0.0], positions[inside], [length]])
+        heights = np.concatenate(
+            [[gt2_teeth_thickness], heights[inside], [gt2_teeth_thickness]]
+        )
+
+    points, normals = pitch_line.sample(positions)
+    return points + (heights - gt2_thickness / 2)[:, None] * normals
+
+
+def create_gt2belt_along_path(
+    path, width=gt2_width, with_teeth=True, chord_tolerance=0.05
+):
+    """Create a belt following a BeltPath or PitchLine.
 
-    return retval
+    The belt's cross section, including the tooth profile, is swept along
+    the pitch line by extruding its outline once, in the XY plane from z=0
+    to z=width, so the cost does not grow with wrap angles or tooth counts.
+    The pitch line runs through the middle of the belt, which is how
+    ``create_gt2_idler`` sizes its core. The teeth are on the right side of
+    the walking direction, facing the wheels wrapped clockwise.
+    """
 
+    pitch_line = path.pitch_line() if hasattr(path, "pitch_line") else path
+    add_bom_item(bom.BELT, f"GT2 belt {width:g} mm, {pitch_line.length:.0f} mm")
+    back = pitch_line.outline(gt2_thickness / 2, chord_tolerance)
+    if with_teeth:
+        face = _toothed_face(pitch_line)
+    else:
+        face = pitch_line.outline(-gt2_thickness / 2, chord_tolerance)
 
-def create_gt2belt_loop(num_teeth=20, angle=180):
-    """Create the gt2belt part."""
-
-    outer_belt_length = gt2_pitch * num_teeth
-    belt_outer_radius = outer_belt_length / (2 * math.pi) * 360 / angle
-    belt_loop = create_ring(
-        outer_radius=belt_outer_radius,
-        inner_radius=belt_outer_radius - gt2_thickness,
-        angle=angle,
-    )
+    if not pitch_line.closed:
+        return extrude_outline(np.concatenate([back, face[::-1]]), width)
 
-    tooth_cutter = create_cylinder(
-        gt2_tooth_radius + gt2_tooth_bend_offset, gt2_width, angle=angle
-    )
+    # the outline that encloses the other one is the outer boundary
+    if np.ptp(back[:, 0]) < np.ptp(face[:, 0]):
+        back, face = face, back
+    return extrude_outline(back, width, holes=[face])
 
 
 def main():
     logging.basicConfig(level=logging.INFO)
     parts = PartList()
 
-    # part = create_gt2belt(num_teeth=100)
-    # parts.add(part, "belt", flip=False)
+    part = create_gt2belt(num_teeth=100)
+    parts.add(part, "belt", flip=False, skip_in_production=True)
+
+    belt_section = create_gt2belt_loop(num_teeth=20, angle=180)
+    belt_section = translate(0, -50, 0)(belt_section)
+    parts.add(
+        belt_section, "belt_section_20t_180deg", flip=False, skip_in_production=True
+    )
 
     pulley = create_gt2_pulley(num_teeth=20, belt_width=gt2_width)
 
     pulley = translate(0, 50, 0)(pulley)
     parts.add(pulley, "pulley_20t", flip=False)
 
+    belt_path = solve_belt_path(
+        [
+            BeltWheel((0, 50), gt2_pitch_radius(20), clockwise=True, name="pulley"),
+            BeltWheel((100, 50), gt2_pitch_radius(20), clockwise=True, name="idler"),
+        ],
+        pitch=gt2_pitch,
+    )
+    _logger.info(f"Demo belt: {belt_path.summary()}")
+    belt = create_gt2belt_along_path(belt_path)
+    belt = align(belt, pulley, Alignment.CENTER, axes=[2])
+    parts.add(belt, "belt_loop", flip=False, skip_in_production=True)
+
     # Arrange and export
-    arrange_and_export(
+    arrange_and_export_incremental(
         parts.as_list(),
         script_file=__file__,
         prod=PROD,
@@ -10,6 +10,9 @@ Usage:
 import logging
 import os
 
+from mege_ender_3v3ke_idex.produce.incremental_export import (
+    arrange_and_export_incremental,
+)
 from shellforgepy.simple import *
 
 _logger = logging.getLogger(__name__)
@@ -58,7 +61,7 @@ def main():
     parts.add(part, "jury_rigged_z_carriage", flip=False)
 
     # Arrange and export
-    arrange_and_export(
+    arrange_and_export_incremental(
         parts.as_list(),
         script_file=__file__,
         prod=PROD,
@@ -9,10 +9,19 @@ Usage:
 
 import logging
 import os
-from enum import Enum
 from typing import Optional
 
-from poemai_utils.enum_utils import add_enum_attrs
+from mege_ender_3v3ke_idex.construct.batched_cutters import (
+    enable_batched_cutters,
+    use_as_cutter_on,
+)
+from mege_ender_3v3ke_idex.construct.fuse_tree import TreeCollector
+from mege_ender_3v3ke_idex.designs.nema_sizes import NemaSizes
+from mege_ender_3v3ke_idex.produce import bom
+from mege_ender_3v3ke_idex.produce.bom import add_bom_item
+from mege_ender_3v3ke_idex.produce.incremental_export import (
+    arrange_and_export_incremental,
+)
 from shellforgepy.construct.leader_followers_cutters_part import (
     LeaderFollowersCuttersPart,
 )
@@ -33,115 +42,6 @@ PROCESS_DATA = {
     },
 }
 
-from enum import Enum
-
-
-class NemaSizes(Enum):
-    NEMA14 = "NEMA14"
-    NEMA17 = "NEMA17"
-    NEMA23 = "NEMA23"
-    NEMA34 = "NEMA34"
-
-
-add_enum_attrs(
-    {
-        # ---------------------------------------------------------------------
-        # NEMA 14 (35mm class)
-        # ---------------------------------------------------------------------
-        NemaSizes.NEMA14: {
-            "size_mm": 35.0,  # face size (approx)
-            "hole_dist_mm": 26.0,  # common NEMA14 hole spacing
-            "screw_size": "M3",
-            "clearance_diameter_mm": 3.2,  # bracket clearance for M3
-            "tap_drill_diameter_mm": 2.5,  # tap drill for M3
-            "hole_depth_mm": 4.0,  # typical usable thread depth
-            "axle_diameter_mm": 5.0,  # common, but some are 4mm
-            "axle_diameter_variants_mm": [4.0, 5.0],
-            "axle_length_mm": 20.0,  # typical exposed shaft length
-            "thick_mm": 28.0,  # common "short" motor
-            "thick_variants_mm": [20.0, 28.0, 34.0, 40.0],
-            # optional CAD helpers / typical coupler sizes
-            "coupler_length_mm": 20.0,
-            "coupler_diameter_mm": 15.0,
-            "connector_length_mm": 16.15,
-            "connector_thick_mm": 11.5,
-            # optional front boss / pilot (often present, varies widely)
-            "pilot_diameter_mm": 22.0,
-            "pilot_depth_mm": 1.5,
-            "disc_thick_mm": 1.5,
-        },
-        # ---------------------------------------------------------------------
-        # NEMA 17 (42mm class)
-        # ---------------------------------------------------------------------
-        NemaSizes.NEMA17: {
-            "size_mm": 42.3,  # common nominal face size
-            "hole_dist_mm": 31.0,  # very common NEMA17 hole spacing
-            "screw_size": "M3",
-            "clearance_diameter_mm": 3.2,  # bracket clearance for M3
-            "tap_drill_diameter_mm": 2.5,  # tap drill for M3
-            "hole_depth_mm": 4.5,  # typical; many motors are 4.5-5mm
-            "axle_diameter_mm": 5.0,  # very common
-            "axle_diameter_variants_mm": [5.0],
-            "axle_length_mm": 24.0,  # very common
-            "thick_mm": 40.0,  # common "mid" length
-            "thick_variants_mm": [20.0, 28.0, 34.0, 40.0, 48.0, 60.0],
-            "coupler_length_mm": 25.0,
-            "coupler_diameter_mm": 18.0,
-            "connector_length_mm": 16.15,
-            "connector_thick_mm": 11.5,
-            "pilot_diameter_mm": 22.0,
-            "pilot_depth_mm": 2.0,
-            "disc_thick_mm": 2.0,
-        },
-        # ---------------------------------------------------------------------
-        # NEMA 23 (57mm class)
-        # ---------------------------------------------------------------------
-        NemaSizes.NEMA23: {
-            "size_mm": 56.4,  # nominal NEMA23 face ~2.23 in = 56.6mm (varies by vendor)
-            "hole_dist_mm": 47.14,  # common hole spacing used in many CAD tables (1.856 in)
-            "screw_size": "M5",
-            "clearance_diameter_mm": 5.5,  # bracket clearance for M5
-            "tap_drill_diameter_mm": 4.2,  # tap drill for M5
-            "hole_depth_mm": 6.0,  # typical usable depth
-            "axle_diameter_mm": 6.35,  # 1/4" is common; some are 8mm
-            "axle_diameter_variants_mm": [6.35, 8.0],
-            "axle_length_mm": 20.0,
-            "thick_mm": 56.0,  # common "short-ish" NEMA23
-            "thick_variants_mm": [41.0, 56.0, 76.0, 100.0],
-            "coupler_length_mm": 30.0,
-            "coupler_diameter_mm": 22.0,
-            "connector_length_mm": 16.15,
-            "connector_thick_mm": 11.5,
-            "pilot_diameter_mm": 38.1,  # 1.5" pilot is common; varies
-            "pilot_depth_mm": 2.0,
-            "disc_thick_mm": 2.0,
-        },
-        # ---------------------------------------------------------------------
-        # NEMA 34 (86mm class)
-        # ---------------------------------------------------------------------
-        NemaSizes.NEMA34: {
-            "size_mm": 86.0,  # nominal NEMA34 face ~3.4 in = 86.4mm
-            "hole_dist_mm": 69.85,  # common hole spacing (2.75 in)
-            "screw_size": "M6",
-            "clearance_diameter_mm": 6.6,  # bracket clearance for M6
-            "tap_drill_diameter_mm": 5.0,  # tap drill for M6
-            "hole_depth_mm": 8.0,  # typical usable depth
-            "axle_diameter_mm": 14.0,  # common; also 12.7mm (1/2") variants exist
-            "axle_diameter_variants_mm": [12.7, 14.0],
-            "axle_length_mm": 32.0,
-            "thick_mm": 66.0,  # common
-            "thick_variants_mm": [66.0, 96.0, 126.0],
-            "coupler_length_mm": 35.0,
-            "coupler_diameter_mm": 28.0,
-            "connector_length_mm": 16.15,
-            "connector_thick_mm": 11.5,
-            "pilot_diameter_mm": 73.0,  # varies a lot; treat as rough
-            "pilot_depth_mm": 2.5,
-            "disc_thick_mm": 2.5,
-        },
-    }
-)
-
 
 def create_nema_screw_holes(
     nema: NemaSizes = NemaSizes.NEMA17,
@@ -157,7 +57,7 @@ def create_nema_screw_holes(
     align_to_top: bool = False,
 ):
     """Create the front-face mounting screw holes for a NEMA motor."""
-    holes = PartCollector()
+    holes = TreeCollector()
 
     resolved_hole_dist = hole_dist if hole_dist is not None else nema.hole_dist_mm
     if resolved_hole_dist is None:
@@ -202,7 +102,7 @@ def create_nema_screw_holes(
             hole = translate(x, y, hole_start_z)(hole)
             holes = holes.fuse(hole)
 
-    return holes
+    return holes.part
 
 
 def create_nema_motor(
@@ -248,14 +148,14 @@ def create_nema_motor(
         raise ValueError(f"{nema.value} missing hole spacing")
 
     # Build and cut tap holes into the box
-    tap_holes = PartCollector()
+    tap_holes = TreeCollector()
     offset = hole_dist / 2.0
     for x in (-offset, offset):
         for y in (-offset, offset):
             hole = create_cylinder(core_diameter / 2.0, hole_depth)
             hole = translate(x, y, 0)(hole)
             tap_holes.fuse(hole)
-    tap_holes_part = tap_holes.part if tap_holes.part is not None else tap_holes
+    tap_holes_part = tap_holes.part
     tap_holes_part = align(tap_holes_part, body_box, Alignment.CENTER)
     tap_holes_part = align(
         tap_holes_part, body_box, Alignment.STACK_TOP, stack_gap=-hole_depth
@@ -339,6 +239,8 @@ def create_nema_composite(
 ):
     """Build a LeaderFollowersCuttersPart for a NEMA motor with aligned parts and cutters."""
 
+    add_bom_item(bom.MOTOR, f"{nema.value} {nema.size_mm:g} mm stepper motor")
+
     body_thick = nema.thick_mm
     disc_thick = (
         nema.disc_thick_mm
@@ -405,8 +307,8 @@ def create_nema_composite(
     clear_diam += 2.0 * mount_hole_clearance
     clear_height = body_thick + mount_hole_back_extension
 
-    tap_holes = PartCollector()
-    mount_holes = PartCollector()
+    tap_holes = TreeCollector()
+    mount_holes = TreeCollector()
     offset = hole_dist / 2.0
     for x in (-offset, offset):
         for y in (-offset, offset):
@@ -419,6 +321,7 @@ def create_nema_composite(
 
             mount_holes = mount_holes.fuse(mount)
 
+    tap_holes, mount_holes = tap_holes.part, mount_holes.part
     tap_holes = align(tap_holes, body_box, Alignment.CENTER)
     tap_holes = align(tap_holes, body_box, Alignment.STACK_TOP, stack_gap=-core_height)
     body_box = body_box.cut(tap_holes)
@@ -448,7 +351,7 @@ def create_nema_composite(
     cutters = [body_cutter, disc_cutter, axle_cutter, mount_holes]
     cutter_names = ["body", "front_boss", "axle", "mount_holes"]
 
-    return LeaderFollowersCuttersPart(
+    composite = LeaderFollowersCuttersPart(
         leader=leader,
         followers=followers,
         cutters=cutters,
@@ -466,6 +369,9 @@ def create_nema_composite(
         },
     )
 
+    # All four cutters go into the mount plate, merge them into a single cut
+    return enable_batched_cutters(composite)
+
 
 def create_nema_motors(
     plate_size: float = 120.0,
@@ -530,7 +436,7 @@ def create_nema_motors(
     plate = align(plate, demo_motor.get_leader_as_part(), Alignment.CENTER)
     plate = align(plate, demo_motor.get_leader_as_part(), Alignment.TOP)
 
-    plate_with_cuts = demo_motor.use_as_cutter_on(plate)
+    plate_with_cuts = use_as_cutter_on(demo_motor, plate)
 
     plate_with_cuts = plate_with_cuts.fuse(demo_motor.leaders_followers_fused())
 
@@ -549,7 +455,7 @@ def main():
     parts.add(plate_with_cuts, "demo_plate_cut", flip=False)
 
     # Arrange and export
-    arrange_and_export(
+    arrange_and_export_incremental(
         parts.as_list(),
         script_file=__file__,
         prod=PROD,
@@ -0,0 +1,121 @@
+"""
+NEMA stepper motor sizes.
+
+Face size, screw pattern, body lengths and shaft dimensions of the NEMA
+frame sizes as attributes of ``NemaSizes``, importable without a CAD
+backend. The motor builders live in ``nema_motors``.
+
+Usage:
+    NemaSizes.NEMA17.hole_dist_mm
+"""
+
+from enum import Enum
+
+from poemai_utils.enum_utils import add_enum_attrs
+
+
+class NemaSizes(Enum):
+    NEMA14 = "NEMA14"
+    NEMA17 = "NEMA17"
+    NEMA23 = "NEMA23"
+    NEMA34 = "NEMA34"
+
+
+add_enum_attrs(
+    {
+        # ---------------------------------------------------------------------
+        # NEMA 14 (35mm class)
+        # ---------------------------------------------------------------------
+        NemaSizes.NEMA14: {
+            "size_mm": 35.0,  # face size (approx)
+            "hole_dist_mm": 26.0,  # common NEMA14 hole spacing
+            "screw_size": "M3",
+            "clearance_diameter_mm": 3.2,  # bracket clearance for M3
+            "tap_drill_diameter_mm": 2.5,  # tap drill for M3
+            "hole_depth_mm": 4.0,  # typical usable thread depth
+            "axle_diameter_mm": 5.0,  # common, but some are 4mm
+            "axle_diameter_variants_mm": [4.0, 5.0],
+            "axle_length_mm": 20.0,  # typical exposed shaft length
+            "thick_mm": 28.0,  # common "short" motor
+            "thick_variants_mm": [20.0, 28.0, 34.0, 40.0],
+            # optional CAD helpers / typical coupler sizes
+            "coupler_length_mm": 20.0,
+            "coupler_diameter_mm": 15.0,
+            "connector_length_mm": 16.15,
+            "connector_thick_mm": 11.5,
+            # optional front boss / pilot (often present, varies widely)
+            "pilot_diameter_mm": 22.0,
+            "pilot_depth_mm": 1.5,
+            "disc_thick_mm": 1.5,
+        },
+        # ---------------------------------------------------------------------
+        # NEMA 17 (42mm class)
+        # ---------------------------------------------------------------------
+        NemaSizes.NEMA17: {
+            "size_mm": 42.3,  # common nominal face size
+            "hole_dist_mm": 31.0,  # very common NEMA17 hole spacing
+            "screw_size": "M3",
+            "clearance_diameter_mm": 3.2,  # bracket clearance for M3
+            "tap_drill_diameter_mm": 2.5,  # tap drill for M3
+            "hole_depth_mm": 4.5,  # typical; many motors are 4.5-5mm
+            "axle_diameter_mm": 5.0,  # very common
+            "axle_diameter_variants_mm": [5.0],
+            "axle_length_mm": 24.0,  # very common
+            "thick_mm": 40.0,  # common "mid" length
+            "thick_variants_mm": [20.0, 28.0, 34.0, 40.0, 48.0, 60.0],
+            "coupler_length_mm": 25.0,
+            "coupler_diameter_mm": 18.0,
+            "connector_length_mm": 16.15,
+            "connector_thick_mm": 11.5,
+            "pilot_diameter_mm": 22.0,
+            "pilot_depth_mm": 2.0,
+            "disc_thick_mm": 2.0,
+        },
+        # ---------------------------------------------------------------------
+        # NEMA 23 (57mm class)
+        # ---------------------------------------------------------------------
+        NemaSizes.NEMA23: {
+            "size_mm": 56.4,  # nominal NEMA23 face ~2.23 in = 56.6mm (varies by vendor)
+            "hole_dist_mm": 47.14,  # common hole spacing used in many CAD tables (1.856 in)
+            "screw_size": "M5",
+            "clearance_diameter_mm": 5.5,  # bracket clearance for M5
+            "tap_drill_diameter_mm": 4.2,  # tap drill for M5
+            "hole_depth_mm": 6.0,  # typical usable depth
+            "axle_diameter_mm": 6.35,  # 1/4" is common; some are 8mm
+            "axle_diameter_variants_mm": [6.35, 8.0],
+            "axle_length_mm": 20.0,
+            "thick_mm": 56.0,  # common "short-ish" NEMA23
+            "thick_variants_mm": [41.0, 56.0, 76.0, 100.0],
+            "coupler_length_mm": 30.0,
+            "coupler_diameter_mm": 22.0,
+            "connector_length_mm": 16.15,
+            "connector_thick_mm": 11.5,
+            "pilot_diameter_mm": 38.1,  # 1.5" pilot is common; varies
+            "pilot_depth_mm": 2.0,
+            "disc_thick_mm": 2.0,
+        },
+        # ---------------------------------------------------------------------
+        # NEMA 34 (86mm class)
+        # ---------------------------------------------------------------------
+        NemaSizes.NEMA34: {
+            "size_mm": 86.0,  # nominal NEMA34 face ~3.4 in = 86.4mm
+            "hole_dist_mm": 69.85,  # common hole spacing (2.75 in)
+            "screw_size": "M6",
+            "clearance_diameter_mm": 6.6,  # bracket clearance for M6
+            "tap_drill_diameter_mm": 5.0,  # tap drill for M6
+            "hole_depth_mm": 8.0,  # typical usable depth
+            "axle_diameter_mm": 14.0,  # common; also 12.7mm (1/2") variants exist
+            "axle_diameter_variants_mm": [12.7, 14.0],
+            "axle_length_mm": 32.0,
+            "thick_mm": 66.0,  # common
+            "thick_variants_mm": [66.0, 96.0, 126.0],
+            "coupler_length_mm": 35.0,
+            "coupler_diameter_mm": 28.0,
+            "connector_length_mm": 16.15,
+            "connector_thick_mm": 11.5,
+            "pilot_diameter_mm": 73.0,  # varies a lot; treat as rough
+            "pilot_depth_mm": 2.5,
+            "disc_thick_mm": 2.5,
+        },
+    }
+)
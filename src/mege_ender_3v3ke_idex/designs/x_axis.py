@@ -5,35 +5,86 @@ Usage:
     cd <project_root> && ./run.sh path/to/x_axis.py
     # or with production mode:
     cd <project_root> && SHELLFORGEPY_PRODUCTION=1 ./run.sh path/to/x_axis.py
+    # or packed onto as many plates as needed:
+    cd <project_root> && SHELLFORGEPY_PRODUCTION=1 PACK_PLATES=1 ./run.sh path/to/x_axis.py
+    # or with the single-wall PLA draft process profile:
+    cd <project_root> && X_AXIS_PROCESS_PROFILE=single_wall_draft ./run.sh path/to/x_axis.py
+    # or checking the derived left motor stack against a direct build:
+    cd <project_root> && X_AXIS_VERIFY_SYMMETRY=1 ./run.sh path/to/x_axis.py
 """
 
-import copy
 import logging
 import os
 from collections import defaultdict
 from pathlib import Path
 
-from mege_3devops.process_data.mender3.process_data_04_high_speed import (
-    PROCESS_DATA_PETGCF_04_HS,
+from mege_ender_3v3ke_idex.construct.batched_cutters import (
+    enable_batched_cutters,
+    use_as_cutter_on,
 )
-from mege_3devops.process_data.mender3.process_data_08_high_speed import (
-    PROCESS_DATA_PLA_08_HS,
+from mege_ender_3v3ke_idex.construct.dry_run import is_dry_run
+from mege_ender_3v3ke_idex.construct.fuse_tree import TreeCollector
+from mege_ender_3v3ke_idex.construct.glue_fuse import fuse_touching
+from mege_ender_3v3ke_idex.construct.gt2_catalog import (
+    IDLER,
+    GT2WheelSpec,
+    gt2_idler,
+    gt2_pulley,
 )
-from mege_3devops.process_data.mender3.process_data_utils import (
-    augment_with_layer_height,
+from mege_ender_3v3ke_idex.construct.hardware import (
+    clearance_hole_cutter,
+    cylinder_screw,
+    insert_pocket_cutter,
+    nut,
+    nut_pocket_cutter,
+    screw_dimensions,
+    screw_head_cutter,
+)
+from mege_ender_3v3ke_idex.construct.rounded_box import create_rounded_box
+from mege_ender_3v3ke_idex.construct.shared_placement import (
+    bake,
+    shared_align,
+    shared_rotate,
+    shared_translate,
+)
+from mege_ender_3v3ke_idex.construct.simplify import simplify
+from mege_ender_3v3ke_idex.construct.symmetry import (
+    SymmetryTransform,
+    build_symmetric_pair,
 )
 from mege_ender_3v3ke_idex.designs.alu_extrusion_profile import (
-    ExtrusionProfileType,
     create_alu_extrusion_profile,
 )
-from mege_ender_3v3ke_idex.designs.gt2belt import create_gt2_idler, create_gt2_pulley
+from mege_ender_3v3ke_idex.designs.alu_extrusion_profile_types import (
+    ExtrusionProfileType,
+)
+from mege_ender_3v3ke_idex.designs.gt2_dimensions import (
+    gt2_pitch,
+    gt2_pitch_radius,
+    gt2_thickness,
+)
+from mege_ender_3v3ke_idex.designs.gt2belt import create_gt2belt_along_path
 from mege_ender_3v3ke_idex.designs.nema_motors import create_nema_composite
+from mege_ender_3v3ke_idex.designs.x_axis_params import (
+    DEFAULT_X_AXIS_PARAMS,
+    XAxisParams,
+)
+from mege_ender_3v3ke_idex.geometry.belt_path import BeltWheel, solve_belt_path
+from mege_ender_3v3ke_idex.geometry.clearance import ClearanceRule, check_clearances
+from mege_ender_3v3ke_idex.produce import bom
+from mege_ender_3v3ke_idex.produce.bom import add_bom_item, suppress_bom
+from mege_ender_3v3ke_idex.produce.incremental_export import (
+    arrange_and_export_incremental,
+)
+from mege_ender_3v3ke_idex.produce.process_profiles import PETGCF_04_HS, PLA_08_HS
 from shellforgepy.simple import *
 
 _logger = logging.getLogger(__name__)
 
 # Production mode from environment variable
 PROD = os.environ.get("SHELLFORGEPY_PRODUCTION", "0") == "1"
+# build the left motor stack directly too and compare it with the derived one
+VERIFY_SYMMETRY = os.environ.get("X_AXIS_VERIFY_SYMMETRY", "0") == "1"
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 
@@ -41,209 +92,122 @@ EXTUDER_STEP_PATH = PROJECT_ROOT / "resources" / "creality_sprite.step.zip"
 
 BIG_THING = 500
 
-
-PROCESS_DATA = copy.deepcopy(PROCESS_DATA_PLA_08_HS)
-
-
-PROCESS_DATA["process_overrides"].update(
-    {
-        # ============================================================
-        # SINGLE-WALL INTENT
-        # ============================================================
-        "wall_loops": "1",
-        # Make thickness == line width everywhere that could interfere
-        "line_width": "0.90",
-        "outer_wall_line_width": "0.90",
-        "inner_wall_line_width": "0.90",
-        "thin_wall_line_width": "0.90",
-        "top_surface_line_width": "0.90",
-        "gap_fill_line_width": "0.90",
-        # If you truly want a pure shell, consider enabling these:
-        "bottom_shell_layers": "1",
-        "top_shell_layers": "1",
-        # ============================================================
-        # LAYER HEIGHT — tuned to ~30 mm³/s at outer wall speed
-        # ============================================================
-        "adaptive_layer_height": "0",
-        "layer_height": "0.42",
-        "min_layer_height": "0.42",
-        "max_layer_height": "0.42",
-        # First layer: slightly fatter for adhesion (not too squished)
-        "initial_layer_print_height": "0.32",
-        "initial_layer_line_width": "1.00",
-        # ============================================================
-        # SPEEDS — volumetric-flow limited
-        # With 0.90*0.42=0.378 mm²:
-        # 80 mm/s => ~30.2 mm³/s
-        # ============================================================
-        "outer_wall_speed": "70",
-        "external_perimeter_speed": "70",
-        # First layer slower for stick
-        "initial_layer_speed": "45",
-        "initial_layer_infill_speed": "60",
-        # Keep other paths consistent (not too relevant for pure shell)
-        "inner_wall_speed": "150",
-        "solid_infill_speed": "180",
-        "sparse_infill_speed": "180",
-        # Avoid slicer "gap fill" games for single-wall shells
-        "gap_fill_speed": "180",
-        "gap_infill_speed": "180",
-        # ============================================================
-        # ACCEL / JERK — tall shell stability (avoid ringing/wobble)
-        # ============================================================
-        "outer_wall_acceleration": "3000",
-        "outer_wall_jerk": "6",
-        # ============================================================
-        # FLOW LIMIT — enforce the regime we designed for
-        # ============================================================
-        "filament_max_volumetric_speed": "30",
-        # ============================================================
-        # TEMPERATURE — you need more than 205C at ~30 mm³/s
-        # ============================================================
-        "nozzle_temperature": "230",
-        "nozzle_temperature_initial_layer": "235",
-        # ============================================================
-        # COOLING — not 100% (helps layer welding on thick beads)
-        # ============================================================
-        "fan_min_speed": "70",
-        "fan_max_speed": "70",
-        "overhang_fan_speed": "70",
-        "fan_cooling_layer_time": "8",
-        "min_layer_time": "4",
-        "slow_down_for_layer_cooling": "0",
-        # ============================================================
-        # BED / ADHESION — keep as you already do (75/75 is fine)
-        # ============================================================
-        "brim_width": "4",
-        "brim_type": "no_brim",  # "outer_and_inner",
-        "elefant_foot_compensation": "0.10",
-        # ============================================================
-        # RETRACTION — big nozzle needs a bit more, but keep it sane
-        # ============================================================
-        "filament_retraction_length": "1.2",
-        "filament_retraction_speed": "40",
-        "filament_deretraction_speed": "35",
-        # ============================================================
-        # OPTIONAL: pressure advance (keep modest for fat beads)
-        # ============================================================
-        "enable_pressure_advance": "1",
-        "pressure_advance": "0.015",
-        # ============================================================
-        # OVERHANG / BRIDGE — disable overhang slowdown for draft mode
-        # Let it print at full 70 mm/s outer_wall_speed throughout.
-        # Only slow down for true bridges (extreme overhangs >115mm).
-        # ============================================================
-        "overhang_1_4_speed": "0",  # Disabled
-        "overhang_2_4_speed": "0",  # Disabled - was causing ugly 55-100mm zone
-        "overhang_3_4_speed": "0",  # Disabled
-        "overhang_4_4_speed": "0",  # Disabled
-        "bridge_speed": "35",  # Keep bridges slow when detected
-        "enable_support": "0",
-        "support_threshold_angle": "23",
-    }
-)
-
-
-PROCESS_DATA = augment_with_layer_height(PROCESS_DATA, layer_height_factor=0.9)
-
-
-PROCESS_DATA = copy.deepcopy(PROCESS_DATA_PETGCF_04_HS)
-
-
-motor_size = 42.3
-axis_profile_length = 500
-rail_length = 450
-axis_profile_pitch = 40
-motor_y_offset = 11
-
-z_axis_guide_distance = 256
-
-motor_x_offset = z_axis_guide_distance / 2 - 60
-x_axis_motor_axle_length = 14
-
-idler_gap = 2
-
-
-motor_mount_plate_size = 50
-motor_mount_plate_depth = motor_size + motor_y_offset
-
-motor_mount_plate_thickness = 6
-motor_mount_plate_fillet_radius = 2
-motor_mount_axle_clearance = 0.3
-motor_mount_boss_clearance = 0.6
-motor_mount_boss_clearance_z = 4
-
-idler_mount_diameter = 4
-idler_mount_thickness = 1
-idler_mount_axle_clearance = 0.1
-idler_mount_axle_diameter = MScrew.from_size("M3").clearance_hole_normal
-axle_screw_size = "M3"
-axcle_screw_nut_hole_depth = 4
-axle_screw_nut_slack = 0.4
-
-mount_shield_width = 17
-mount_shield_depth = 6
-mount_shield_fillet_radius = 1
-mount_shield_oversize_z = 0
-
-mount_plate_connector_length = (
-    z_axis_guide_distance - 2 * motor_x_offset - motor_size + 8
-)
-mount_plate_connector_depth = 20
-
-mount_plate_link_width = mount_plate_connector_length * 0.8
-mount_plate_connector_link_thickness = 6
-
-flange_thickness = 5
-flange_depth = 15
-bevel_depth = flange_depth * 0.8
-idler_screw_size = "M3"
-idler_screw_head_clearance = 0.3
-mount_flange_screw_hole_inset = 10
-
-idler_cage_back_wall = 4
-idler_cage_wall = 2
-idler_cage_top_bottom_thickness = 4
-idler_cage_overlength = 6
-idler_cage_clearance = 0.5
-idler_cage_extra_screw_length = 6
-idler_cage_idler_tooth_count = 20
-
-axis_holder_width = mount_plate_connector_length
-axis_holder_depth = ExtrusionProfileType.PROFILE_2020.grid_pitch_mm + flange_depth
-axis_holder_thickness = 6
-axis_holder_fillet_radius = 1
-counter_flange_mount_screw_size = "M3"
-counter_flange_mount_screw_length = 14
-
-nut_cutter_offset_z = 2
-
-
-link_screw_size = "M5"
-link_screw_length = 20
-
-link_flange_thickness = 7
-link_flange_depth = 12
-
-
-endcap_wall = 3
-endcap_clearance = 0.8
-endcap_holder_thickness = 4
-endcap_holder_length = 10
-endcap_fillet_radius = 2
-endcap_idler_tooth_count = 20
-endcap_profile_overlap = 7
-endcap_profile_clearance = 0.2
-endcap_axle_screw_length = 25
-endcap_axle_screw_size = "M3"
-inset_cutter_hole_slack = 0.3
-endcap_tensioner_length = 25
-endcap_tensioner_slit_width = 0.4
-endcap_idler_clearance = 1.5
-endcap_belt_clearance = 2.6
-
-
-def create_z_axis():
+# height of the mid-plane ribbons standing in for the belt runs in clearance checks
+BELT_LANE_HEIGHT = 0.2
+
+
+# Single-wall draft shells in PLA with a 0.8 nozzle
+SINGLE_WALL_DRAFT_OVERRIDES = {
+    # ============================================================
+    # SINGLE-WALL INTENT
+    # ============================================================
+    "wall_loops": "1",
+    # Make thickness == line width everywhere that could interfere
+    "line_width": "0.90",
+    "outer_wall_line_width": "0.90",
+    "inner_wall_line_width": "0.90",
+    "thin_wall_line_width": "0.90",
+    "top_surface_line_width": "0.90",
+    "gap_fill_line_width": "0.90",
+    # If you truly want a pure shell, consider enabling these:
+    "bottom_shell_layers": "1",
+    "top_shell_layers": "1",
+    # ============================================================
+    # LAYER HEIGHT — tuned to ~30 mm³/s at outer wall speed
+    # ============================================================
+    "adaptive_layer_height": "0",
+    "layer_height": "0.42",
+    "min_layer_height": "0.42",
+    "max_layer_height": "0.42",
+    # First layer: slightly fatter for adhesion (not too squished)
+    "initial_layer_print_height": "0.32",
+    "initial_layer_line_width": "1.00",
+    # ============================================================
+    # SPEEDS — volumetric-flow limited
+    # With 0.90*0.42=0.378 mm²:
+    # 80 mm/s => ~30.2 mm³/s
+    # ============================================================
+    "outer_wall_speed": "70",
+    "external_perimeter_speed": "70",
+    # First layer slower for stick
+    "initial_layer_speed": "45",
+    "initial_layer_infill_speed": "60",
+    # Keep other paths consistent (not too relevant for pure shell)
+    "inner_wall_speed": "150",
+    "solid_infill_speed": "180",
+    "sparse_infill_speed": "180",
+    # Avoid slicer "gap fill" games for single-wall shells
+    "gap_fill_speed": "180",
+    "gap_infill_speed": "180",
+    # ============================================================
+    # ACCEL / JERK — tall shell stability (avoid ringing/wobble)
+    # ============================================================
+    "outer_wall_acceleration": "3000",
+    "outer_wall_jerk": "6",
+    # ============================================================
+    # FLOW LIMIT — enforce the regime we designed for
+    # ============================================================
+    "filament_max_volumetric_speed": "30",
+    # ============================================================
+    # TEMPERATURE — you need more than 205C at ~30 mm³/s
+    # ============================================================
+    "nozzle_temperature": "230",
+    "nozzle_temperature_initial_layer": "235",
+    # ============================================================
+    # COOLING — not 100% (helps layer welding on thick beads)
+    # ============================================================
+    "fan_min_speed": "70",
+    "fan_max_speed": "70",
+    "overhang_fan_speed": "70",
+    "fan_cooling_layer_time": "8",
+    "min_layer_time": "4",
+    "slow_down_for_layer_cooling": "0",
+    # ============================================================
+    # BED / ADHESION — keep as you already do (75/75 is fine)
+    # ============================================================
+    "brim_width": "4",
+    "brim_type": "no_brim",  # "outer_and_inner",
+    "elefant_foot_compensation": "0.10",
+    # ============================================================
+    # RETRACTION — big nozzle needs a bit more, but keep it sane
+    # ============================================================
+    "filament_retraction_length": "1.2",
+    "filament_retraction_speed": "40",
+    "filament_deretraction_speed": "35",
+    # ============================================================
+    # OPTIONAL: pressure advance (keep modest for fat beads)
+    # ============================================================
+    "enable_pressure_advance": "1",
+    "pressure_advance": "0.015",
+    # ============================================================
+    # OVERHANG / BRIDGE — disable overhang slowdown for draft mode
+    # Let it print at full 70 mm/s outer_wall_speed throughout.
+    # Only slow down for true bridges (extreme overhangs >115mm).
+    # ============================================================
+    "overhang_1_4_speed": "0",  # Disabled
+    "overhang_2_4_speed": "0",  # Disabled - was causing ugly 55-100mm zone
+    "overhang_3_4_speed": "0",  # Disabled
+    "overhang_4_4_speed": "0",  # Disabled
+    "bridge_speed": "35",  # Keep bridges slow when detected
+    "enable_support": "0",
+    "support_threshold_angle": "23",
+}
+
+PROCESS_PROFILES = {
+    # the mount plates are structural, they print in PETG-CF by default
+    "petgcf": PETGCF_04_HS,
+    "single_wall_draft": PLA_08_HS.with_overrides(
+        SINGLE_WALL_DRAFT_OVERRIDES
+    ).with_transform(
+        "mege_3devops.process_data.mender3.process_data_utils:augment_with_layer_height",
+        layer_height_factor=0.9,
+    ),
+}
+
+PROCESS_PROFILE = PROCESS_PROFILES[os.environ.get("X_AXIS_PROCESS_PROFILE", "petgcf")]
+
+
+def create_z_axis(params: XAxisParams = DEFAULT_X_AXIS_PARAMS):
     """Create the x_axis part."""
 
     # # resources/ender3top_only.step
@@ -261,7 +225,7 @@ def create_z_axis():
     guide1 = create_box(guide_width, guide_thickness, guide_length)
     guide2 = create_box(guide_width, guide_thickness, guide_length)
     guide2 = align(
-        guide2, guide1, Alignment.STACK_RIGHT, stack_gap=z_axis_guide_distance
+        guide2, guide1, Alignment.STACK_RIGHT, stack_gap=params.z_axis_guide_distance
     )
 
     z_guides = guide1.fuse(guide2)
@@ -276,6 +240,8 @@ def create_z_axis():
 def create_mgn12h_carriage():
     """Create the MGN12H carriage part."""
 
+    add_bom_item(bom.CARRIAGE, "MGN12H carriage")
+
     width = 27
     length = 45.4
     screw_hole_pitch = 20
@@ -286,14 +252,14 @@ def create_mgn12h_carriage():
 
     carriage = create_box(length, width, height)
 
-    holes = PartCollector()
+    holes = TreeCollector()
     for x in [-screw_hole_pitch / 2, screw_hole_pitch / 2]:
         for y in [-width / 2 + 4, width / 2 - 4]:
             hole = create_cylinder(screw_hole_diameter / 2, height)
             hole = translate(x, y, 0)(hole)
             holes = holes.fuse(hole)
 
-    holes = align(holes, carriage, Alignment.CENTER)
+    holes = align(holes.part, carriage, Alignment.CENTER)
     holes = align(holes, carriage, Alignment.STACK_TOP, stack_gap=-screw_hole_depth)
 
     carriage = carriage.cut(holes)
@@ -306,6 +272,8 @@ def create_mgn12h_carriage():
 def create_mgn12h_rail(length_mm: float):
     """Create the MGN12H rail part."""
 
+    add_bom_item(bom.RAIL, f"MGN12 rail, {length_mm:g} mm")
+
     width = 12
     height = 8.5
     hole_pitch = 40
@@ -317,7 +285,7 @@ def create_mgn12h_rail(length_mm: float):
 
     num_holes = int(length_mm // hole_pitch)
 
-    holes = PartCollector()
+    holes = TreeCollector()
     for i in range(num_holes):
         x = i * hole_pitch
         # Top hole
@@ -332,36 +300,38 @@ def create_mgn12h_rail(length_mm: float):
         bottom_hole = align(bottom_hole, rail, Alignment.BOTTOM)
         holes = holes.fuse(bottom_hole)
 
-    holes = align(holes, rail, Alignment.CENTER, axes=[0, 1])
+    holes = align(holes.part, rail, Alignment.CENTER, axes=[0, 1])
 
     rail = rail.cut(holes)
 
     return rail
 
 
-def create_motor_with_mount():
+def create_motor_with_mount(params: XAxisParams = DEFAULT_X_AXIS_PARAMS):
 
     motor = create_nema_composite(
-        axle_length=x_axis_motor_axle_length,
-        axle_clearance=motor_mount_axle_clearance,
-        boss_clearance=motor_mount_boss_clearance,
-        boss_clearance_z=motor_mount_boss_clearance_z,
+        axle_length=params.x_axis_motor_axle_length,
+        axle_clearance=params.motor_mount_axle_clearance,
+        boss_clearance=params.motor_mount_boss_clearance,
+        boss_clearance_z=params.motor_mount_boss_clearance_z,
     )
 
-    mount_plate = create_filleted_box(
-        motor_mount_plate_size,
-        motor_mount_plate_depth,
-        motor_mount_plate_thickness,
-        motor_mount_plate_fillet_radius,
+    mount_plate = create_rounded_box(
+        params.motor_mount_plate_size,
+        params.motor_mount_plate_depth,
+        params.motor_mount_plate_thickness,
+        params.motor_mount_plate_fillet_radius,
         no_fillets_at=[Alignment.BOTTOM, Alignment.TOP],
     )
 
-    mount_plate = align(mount_plate, motor, Alignment.CENTER)
-    mount_plate = align(mount_plate, motor, Alignment.STACK_TOP)
-    mount_plate = align(mount_plate, motor, Alignment.BACK)
-    mount_plate = translate(0, 0, -2.2)(mount_plate)
+    mount_plate = shared_align(mount_plate, motor, Alignment.CENTER)
+    mount_plate = shared_align(mount_plate, motor, Alignment.STACK_TOP)
+    mount_plate = shared_align(mount_plate, motor, Alignment.BACK)
+    mount_plate = shared_translate(0, 0, -2.2)(mount_plate)
+    mount_plate = bake(mount_plate)
 
-    mount_plate = motor.use_as_cutter_on(mount_plate)
+    mount_plate = use_as_cutter_on(motor, mount_plate)
+    mount_plate = simplify(mount_plate, "create_motor_with_mount", "mount_plate")
 
     return motor, mount_plate
 
@@ -373,6 +343,7 @@ def create_idlers_for_motor(
     mount_plate,
     mount_plate_limit_cutter,
     vertical_alignment,
+    params: XAxisParams = DEFAULT_X_AXIS_PARAMS,
 ):
     """Build idlers, their bases, and return updated mount plate for one motor side.
 
@@ -386,32 +357,38 @@ def create_idlers_for_motor(
     idler_axle_cutters = []
     for idler_alignment in (Alignment.LEFT, Alignment.RIGHT):
 
-        idler = create_gt2_idler(num_teeth=16)
+        idler = gt2_idler(
+            num_teeth=params.motor_idler_tooth_count,
+            bore_diameter=params.idler_bore_diameter,
+        )
 
-        idler = align(
+        idler = shared_align(
             idler,
             pulley,
             vertical_alignment,
         )
-        idler = align(idler, motor.leader, idler_alignment)
-        idler = align(
-            idler, profile_to_align, Alignment.STACK_BACK, stack_gap=idler_gap
+        idler = shared_align(idler, motor.leader, idler_alignment)
+        idler = shared_align(
+            idler, profile_to_align, Alignment.STACK_BACK, stack_gap=params.idler_gap
         )
+        idler = bake(idler)
         idlers = idlers.fuse(idler)
 
         idler_axle_cutter = create_cylinder(
-            idler_mount_axle_diameter / 2 + idler_mount_axle_clearance, 100
+            params.idler_mount_axle_diameter / 2 + params.idler_mount_axle_clearance,
+            100,
         )
         idler_axle_cutter = align(idler_axle_cutter, idler, Alignment.CENTER)
         mount_plate = mount_plate.cut(idler_axle_cutter)
 
-        idler_mount_base = create_cylinder(idler_mount_diameter / 2, 100)
-        idler_mount_base = align(idler_mount_base, idler, Alignment.CENTER)
-        idler_mount_base = align(
+        idler_mount_base = create_cylinder(params.idler_mount_diameter / 2, 100)
+        idler_mount_base = shared_align(idler_mount_base, idler, Alignment.CENTER)
+        idler_mount_base = shared_align(
             idler_mount_base,
             idler,
             vertical_alignment.opposite.stack_alignment,
         )
+        idler_mount_base = bake(idler_mount_base)
 
         idler_mount_base = idler_mount_base.cut(mount_plate_limit_cutter)
 
@@ -420,31 +397,33 @@ def create_idlers_for_motor(
             idler_mount_base_size[0], BIG_THING, idler_mount_base_size[2] * 0.6
         )
 
-        idler_mount_pillar = align(
+        idler_mount_pillar = shared_align(
             idler_mount_pillar, idler_mount_base, Alignment.CENTER
         )
-        idler_mount_pillar = align(
+        idler_mount_pillar = shared_align(
             idler_mount_pillar,
             idler_mount_base,
             vertical_alignment.opposite,
         )
-        idler_mount_pillar = align(
+        idler_mount_pillar = shared_align(
             idler_mount_pillar,
             idler_mount_base,
             Alignment.STACK_FRONT,
-            stack_gap=-idler_mount_diameter / 2,
+            stack_gap=-params.idler_mount_diameter / 2,
         )
+        idler_mount_pillar = bake(idler_mount_pillar)
 
         idler_mount_pillar_cutter = create_box(BIG_THING, BIG_THING, BIG_THING)
-        idler_mount_pillar_cutter = align(
+        idler_mount_pillar_cutter = shared_align(
             idler_mount_pillar_cutter, mount_plate, Alignment.CENTER
         )
-        idler_mount_pillar_cutter = align(
+        idler_mount_pillar_cutter = shared_align(
             idler_mount_pillar_cutter, mount_plate, Alignment.CENTER
         )
-        idler_mount_pillar_cutter = align(
+        idler_mount_pillar_cutter = shared_align(
             idler_mount_pillar_cutter, mount_plate, Alignment.STACK_FRONT
         )
+        idler_mount_pillar_cutter = bake(idler_mount_pillar_cutter)
 
         idler_mount_pillar = idler_mount_pillar.cut(idler_mount_pillar_cutter)
 
@@ -454,25 +433,28 @@ def create_idlers_for_motor(
 
         idler_mount_bases = idler_mount_bases.fuse(idler_mount_base)
 
-        idler_screw_nut_cutter = create_nut(
-            axle_screw_size,
-            height=axcle_screw_nut_hole_depth,
-            slack=axle_screw_nut_slack,
+        idler_screw_nut_cutter = nut(
+            params.axle_screw_size,
+            height=params.axle_screw_nut_hole_depth,
+            slack=params.axle_screw_nut_slack,
+        )
+        idler_screw_nut_cutter = shared_rotate(30)(idler_screw_nut_cutter)
+        idler_screw_nut_cutter = shared_align(
+            idler_screw_nut_cutter, idler, Alignment.CENTER
         )
-        idler_screw_nut_cutter = rotate(30)(idler_screw_nut_cutter)
-        idler_screw_nut_cutter = align(idler_screw_nut_cutter, idler, Alignment.CENTER)
-        idler_screw_nut_cutter = align(
+        idler_screw_nut_cutter = shared_align(
             idler_screw_nut_cutter,
             mount_plate,
             vertical_alignment.opposite,
         )
+        idler_screw_nut_cutter = bake(idler_screw_nut_cutter)
         mount_plate = mount_plate.cut(idler_screw_nut_cutter)
         idler_axle_cutters.append(idler_axle_cutter)
 
     return idlers, idler_mount_bases, mount_plate, idler_axle_cutters
 
 
-def _create_motor_stack(side, lower_axis_profile, top_axis_profile):
+def _create_motor_stack(side, lower_axis_profile, top_axis_profile, params):
     """Build one motor + mount assembly (idler bases, shield, connector) for a side."""
 
     vertical_aligment_map = {
@@ -482,7 +464,7 @@ def _create_motor_stack(side, lower_axis_profile, top_axis_profile):
 
     vertical_alignment = vertical_aligment_map[side]
 
-    motor, mount_plate = create_motor_with_mount()
+    motor, mount_plate = create_motor_with_mount(params)
     motor.add_named_follower(mount_plate, "mount_plate")
 
     if side == Alignment.LEFT:
@@ -499,26 +481,31 @@ def _create_motor_stack(side, lower_axis_profile, top_axis_profile):
         profile_to_align,
         Alignment.STACK_TOP if side == Alignment.LEFT else Alignment.STACK_BOTTOM,
     )
-    motor.translate((side.sign * motor_x_offset, motor_y_offset, 0))
+    motor.translate((side.sign * params.motor_x_offset, params.motor_y_offset, 0))
 
     axle = motor.get_follower_part_by_name("axle")
     mount_plate = motor.get_follower_part_by_name("mount_plate")
 
-    pulley = create_gt2_pulley(num_teeth=20, belt_width=6)
+    pulley = gt2_pulley(
+        num_teeth=params.motor_pulley_tooth_count,
+        bore_diameter=params.motor_pulley_bore_diameter,
+    )
     if side == Alignment.LEFT:
         pulley = rotate(180, axis=(0, 1, 0))(pulley)
-    pulley = align(pulley, axle, Alignment.CENTER)
-    pulley = align(pulley, axle, vertical_alignment)
+    pulley = shared_align(pulley, axle, Alignment.CENTER)
+    pulley = shared_align(pulley, axle, vertical_alignment)
+    pulley = bake(pulley)
 
     mount_plate_limit_cutter = create_box(BIG_THING, BIG_THING, BIG_THING)
-    mount_plate_limit_cutter = align(
+    mount_plate_limit_cutter = shared_align(
         mount_plate_limit_cutter, mount_plate, Alignment.CENTER
     )
-    mount_plate_limit_cutter = align(
+    mount_plate_limit_cutter = shared_align(
         mount_plate_limit_cutter,
         mount_plate,
         vertical_alignment,
     )
+    mount_plate_limit_cutter = bake(mount_plate_limit_cutter)
 
     idlers, idler_mount_bases, mount_plate, idler_axle_cutters = (
         create_idlers_for_motor(
@@ -528,48 +515,53 @@ def _create_motor_stack(side, lower_axis_profile, top_axis_profile):
             mount_plate=mount_plate,
             mount_plate_limit_cutter=mount_plate_limit_cutter,
             vertical_alignment=vertical_alignment,
+            params=params,
         )
     )
 
-    mount_shield = create_filleted_box(
-        mount_shield_width,
-        mount_shield_depth,
+    mount_shield = create_rounded_box(
+        params.mount_shield_width,
+        params.mount_shield_depth,
         BIG_THING,
-        mount_shield_fillet_radius,
+        params.mount_shield_fillet_radius,
         no_fillets_at=[Alignment.FRONT, Alignment.TOP, Alignment.BOTTOM],
     )
 
-    mount_shield = align(mount_shield, mount_plate, Alignment.CENTER)
-    mount_shield = align(mount_shield, mount_plate, Alignment.FRONT)
-    mount_shield = align(
+    mount_shield = shared_align(mount_shield, mount_plate, Alignment.CENTER)
+    mount_shield = shared_align(mount_shield, mount_plate, Alignment.FRONT)
+    mount_shield = shared_align(
         mount_shield,
         profile_to_align,
         vertical_alignment,
     )
-    mount_shield = translate(0, 0, side.sign * mount_shield_oversize_z)(mount_shield)
+    mount_shield = shared_translate(0, 0, side.sign * params.mount_shield_oversize_z)(
+        mount_shield
+    )
+    mount_shield = bake(mount_shield)
     mount_shield = mount_shield.cut(mount_plate_limit_cutter)
 
     mount_shield_mount_screw_hole_cutter = create_cylinder(
-        MScrew.from_size("M5").clearance_hole_normal / 2,
+        screw_dimensions("M5").clearance_hole_normal / 2,
         BIG_THING,
         direction=(0, 1, 0),
     )
-    mount_shield_mount_screw_hole_cutter = align(
+    mount_shield_mount_screw_hole_cutter = shared_align(
         mount_shield_mount_screw_hole_cutter, mount_shield, Alignment.CENTER
     )
-    mount_shield_mount_screw_hole_cutter = align(
+    mount_shield_mount_screw_hole_cutter = shared_align(
         mount_shield_mount_screw_hole_cutter,
         profile_to_align,
         Alignment.CENTER,
         axes=[2],
     )
+    mount_shield_mount_screw_hole_cutter = bake(mount_shield_mount_screw_hole_cutter)
     mount_shield = mount_shield.cut(mount_shield_mount_screw_hole_cutter)
 
-    mount_plate_connector = create_filleted_box(
-        mount_plate_connector_length,
-        mount_plate_connector_depth,
-        motor_mount_plate_thickness,
-        fillet_radius=motor_mount_plate_fillet_radius,
+    mount_plate_connector = create_rounded_box(
+        params.mount_plate_connector_length,
+        params.mount_plate_connector_depth,
+        params.motor_mount_plate_thickness,
+        fillet_radius=params.motor_mount_plate_fillet_radius,
         no_fillets_at=[
             Alignment.BOTTOM,
             Alignment.TOP,
@@ -577,35 +569,43 @@ def _create_motor_stack(side, lower_axis_profile, top_axis_profile):
         ],
     )
 
-    mount_plate_connector = align(mount_plate_connector, mount_plate, Alignment.CENTER)
-    mount_plate_connector = align(mount_plate_connector, mount_plate, Alignment.FRONT)
-    mount_plate_connector = align(
+    mount_plate_connector = shared_align(
+        mount_plate_connector, mount_plate, Alignment.CENTER
+    )
+    mount_plate_connector = shared_align(
+        mount_plate_connector, mount_plate, Alignment.FRONT
+    )
+    mount_plate_connector = shared_align(
         mount_plate_connector,
         mount_plate,
         side.opposite.stack_alignment,
     )
-    mount_plate_connector = translate(
-        side.sign * motor_mount_plate_fillet_radius, 0, 0
+    mount_plate_connector = shared_translate(
+        side.sign * params.motor_mount_plate_fillet_radius, 0, 0
     )(mount_plate_connector)
+    mount_plate_connector = bake(mount_plate_connector)
 
-    mount_flange = create_filleted_box(
-        mount_plate_connector_length + motor_mount_plate_size,
-        flange_depth,
-        flange_thickness,
-        fillet_radius=mount_shield_fillet_radius,
+    mount_flange = create_rounded_box(
+        params.mount_plate_connector_length + params.motor_mount_plate_size,
+        params.flange_depth,
+        params.flange_thickness,
+        fillet_radius=params.mount_shield_fillet_radius,
         no_fillets_at=[Alignment.BOTTOM, Alignment.TOP, Alignment.FRONT],
     )
 
-    mount_flange = align(mount_flange, mount_plate_connector, Alignment.CENTER)
-    mount_flange = align(mount_flange, mount_plate, side)
-    mount_flange = align(mount_flange, mount_plate_connector, Alignment.FRONT)
-    mount_flange = align(mount_flange, profile_to_align, vertical_alignment)
+    mount_flange = shared_align(mount_flange, mount_plate_connector, Alignment.CENTER)
+    mount_flange = shared_align(mount_flange, mount_plate, side)
+    mount_flange = shared_align(mount_flange, mount_plate_connector, Alignment.FRONT)
+    mount_flange = shared_align(mount_flange, profile_to_align, vertical_alignment)
+    mount_flange = bake(mount_flange)
 
     nut_pocket_cutters = []
-    for screw_hole_alignment in (Alignment.LEFT, Alignment.RIGHT):
+    # outer hole first on both sides, so the left stack is the turned right
+    # one item by item (see create_x_axis)
+    for screw_hole_alignment in (side.opposite, side):
 
-        nut_cutter = create_hidden_nut_pocket_cutter(
-            counter_flange_mount_screw_size,
+        nut_cutter = nut_pocket_cutter(
+            params.counter_flange_mount_screw_size,
             bottom_cutter_length=3,
             top_cutter_length=100,
             slack=0.3,
@@ -617,9 +617,9 @@ def _create_motor_stack(side, lower_axis_profile, top_axis_profile):
         nut_cutter = align(nut_cutter, mount_flange, Alignment.CENTER)
         nut_cutter = align(nut_cutter, mount_plate_connector, screw_hole_alignment)
         nut_cutter = translate(
-            -screw_hole_alignment.sign * mount_flange_screw_hole_inset,
+            -screw_hole_alignment.sign * params.mount_flange_screw_hole_inset,
             0,
-            -side.sign * nut_cutter_offset_z,
+            -side.sign * params.nut_cutter_offset_z,
         )(nut_cutter)
 
         nut_pocket_cutters.append(nut_cutter)
@@ -628,32 +628,34 @@ def _create_motor_stack(side, lower_axis_profile, top_axis_profile):
     for idler_axle_cutter in idler_axle_cutters:
         mount_flange = mount_flange.cut(idler_axle_cutter)
 
-        idler_screw_spec = MScrew.from_size(idler_screw_size)
-        cylinder_head_cutter = create_cylinder(
-            idler_screw_spec.cylinder_head_diameter / 2 + idler_screw_head_clearance,
-            idler_screw_spec.cylinder_head_height + 2 * idler_screw_head_clearance,
+        cylinder_head_cutter = screw_head_cutter(
+            params.idler_screw_size, clearance=params.idler_screw_head_clearance
         )
-        cylinder_head_cutter = align(
+        cylinder_head_cutter = shared_align(
             cylinder_head_cutter, idler_axle_cutter, Alignment.CENTER
         )
-        cylinder_head_cutter = align(
+        cylinder_head_cutter = shared_align(
             cylinder_head_cutter, mount_flange, vertical_alignment
         )
+        cylinder_head_cutter = bake(cylinder_head_cutter)
         mount_flange = mount_flange.cut(cylinder_head_cutter)
+    mount_flange = simplify(mount_flange, "_create_motor_stack", "mount_flange")
 
     mount_flange_bevel = create_right_triangle(
-        bevel_depth,
-        bevel_depth,
-        thickness=mount_plate_connector_length - 2 * motor_mount_plate_fillet_radius,
+        params.bevel_depth,
+        params.bevel_depth,
+        thickness=params.mount_plate_connector_length
+        - 2 * params.motor_mount_plate_fillet_radius,
         extrusion_direction=(side.sign, 0, 0),
         a_normal=(0, 0, vertical_alignment.sign),
         b_normal=(0, -1, 0),
     )
 
-    mount_flange_bevel = align(
+    mount_flange_bevel = shared_align(
         mount_flange_bevel, mount_plate_connector, Alignment.CENTER
     )
-    mount_flange_bevel = align(mount_flange_bevel, mount_flange, Alignment.BACK)
+    mount_flange_bevel = shared_align(mount_flange_bevel, mount_flange, Alignment.BACK)
+    mount_flange_bevel = bake(mount_flange_bevel)
 
     mount_flange_bevel_flange_side = align(
         mount_flange_bevel, mount_flange, vertical_alignment.opposite.stack_alignment
@@ -664,11 +666,11 @@ def _create_motor_stack(side, lower_axis_profile, top_axis_profile):
             mount_flange_bevel_flange_side
         )
 
-    mount_flange = mount_flange.fuse(mount_flange_bevel_flange_side)
+    mount_flange = fuse_touching(mount_flange, mount_flange_bevel_flange_side)
 
-    mount_plate = mount_plate.fuse(mount_plate_connector)
-    mount_plate = mount_plate.fuse(idler_mount_bases)
-    mount_plate = mount_plate.fuse(mount_flange)
+    mount_plate = fuse_touching(
+        mount_plate, mount_plate_connector, idler_mount_bases, mount_flange
+    )
 
     # sync follower with the modified mount plate geometry
     motor.followers[motor.get_follower_index_by_name("mount_plate")] = mount_plate
@@ -679,25 +681,24 @@ def _create_motor_stack(side, lower_axis_profile, top_axis_profile):
     motor_visual.fuse(pulley)
     motor_visual.fuse(idlers)
 
-    motor_name = f"motor_{side.name.lower()}"
-
-    axis_holding_counter_flange = create_filleted_box(
-        axis_holder_width,
-        axis_holder_depth,
-        axis_holder_thickness,
-        axis_holder_fillet_radius,
+    axis_holding_counter_flange = create_rounded_box(
+        params.axis_holder_width,
+        params.axis_holder_depth,
+        params.axis_holder_thickness,
+        params.axis_holder_fillet_radius,
         no_fillets_at=[Alignment.TOP, Alignment.BOTTOM],
     )
 
-    axis_holding_counter_flange = align(
+    axis_holding_counter_flange = shared_align(
         axis_holding_counter_flange, mount_flange, side.opposite
     )
-    axis_holding_counter_flange = align(
+    axis_holding_counter_flange = shared_align(
         axis_holding_counter_flange, mount_flange, vertical_alignment.stack_alignment
     )
-    axis_holding_counter_flange = align(
+    axis_holding_counter_flange = shared_align(
         axis_holding_counter_flange, mount_flange, Alignment.BACK
     )
+    axis_holding_counter_flange = bake(axis_holding_counter_flange)
 
     axis_holding_counter_flange_screws = []
 
@@ -706,49 +707,51 @@ def _create_motor_stack(side, lower_axis_profile, top_axis_profile):
             axis_holding_counter_flange
         )
 
-        profile_mount_screw_hole_cutter = create_cylinder(
-            MScrew.from_size("M5").clearance_hole_normal / 2,
-            BIG_THING,
-        )
-        profile_mount_screw_hole_cutter = align(
+        profile_mount_screw_hole_cutter = clearance_hole_cutter("M5", BIG_THING)
+        profile_mount_screw_hole_cutter = shared_align(
             profile_mount_screw_hole_cutter,
             axis_holding_counter_flange,
             Alignment.CENTER,
         )
-        profile_mount_screw_hole_cutter = align(
+        profile_mount_screw_hole_cutter = shared_align(
             profile_mount_screw_hole_cutter, nut_cutter, Alignment.CENTER, axes=[0]
         )
-        profile_mount_screw_hole_cutter = align(
+        profile_mount_screw_hole_cutter = shared_align(
             profile_mount_screw_hole_cutter,
             profile_to_align,
             Alignment.CENTER,
             axes=[1],
         )
+        profile_mount_screw_hole_cutter = bake(profile_mount_screw_hole_cutter)
         axis_holding_counter_flange = axis_holding_counter_flange.cut(
             profile_mount_screw_hole_cutter
         )
 
-        axis_holding_counter_flange_screw = create_cylinder_screw(
-            counter_flange_mount_screw_size, length=counter_flange_mount_screw_length
+        axis_holding_counter_flange_screw = cylinder_screw(
+            params.counter_flange_mount_screw_size,
+            length=params.counter_flange_mount_screw_length,
         )
         if side == Alignment.LEFT:
             axis_holding_counter_flange_screw = rotate(180, axis=(0, 1, 0))(
                 axis_holding_counter_flange_screw
             )
-        axis_holding_counter_flange_screw = align(
+        axis_holding_counter_flange_screw = shared_align(
             axis_holding_counter_flange_screw, nut_cutter, Alignment.CENTER
         )
-        axis_holding_counter_flange_screw = align(
+        axis_holding_counter_flange_screw = shared_align(
             axis_holding_counter_flange_screw,
             axis_holding_counter_flange,
             vertical_alignment,
         )
-        axis_holding_counter_flange_screw = translate(
+        axis_holding_counter_flange_screw = shared_translate(
             0,
             0,
             vertical_alignment.sign
-            * MScrew.from_size(counter_flange_mount_screw_size).cylinder_head_height,
+            * screw_dimensions(
+                params.counter_flange_mount_screw_size
+            ).cylinder_head_height,
         )(axis_holding_counter_flange_screw)
+        axis_holding_counter_flange_screw = bake(axis_holding_counter_flange_screw)
 
         axis_holding_counter_flange_screws.append(axis_holding_counter_flange_screw)
 
@@ -757,9 +760,10 @@ def _create_motor_stack(side, lower_axis_profile, top_axis_profile):
         mount_plate_connector,
         mount_shield,
         motor_visual.part,
-        motor_name,
         axis_holding_counter_flange,
         axis_holding_counter_flange_screws,
+        idlers,
+        pulley,
     )
 
 
@@ -777,11 +781,14 @@ def create_idler_cage(
     belt_clearance=1.0,
     cage_width_override=None,
     cage_front_wall_thickness=None,
+    params: XAxisParams = DEFAULT_X_AXIS_PARAMS,
 ):
     """Create a printable idler cage with visual idler and axle screw."""
 
-    idler = create_gt2_idler(num_teeth=idler_tooth_count)
-    idler_size = get_bounding_box_size(idler)
+    idler = gt2_idler(
+        num_teeth=idler_tooth_count, bore_diameter=params.idler_bore_diameter
+    )
+    idler_size = GT2WheelSpec(IDLER, idler_tooth_count, params.idler_bore_diameter).size
 
     effective_front_wall_thickness = (
         cage_wall if cage_front_wall_thickness is None else cage_front_wall_thickness
@@ -814,17 +821,18 @@ def create_idler_cage(
     back_wall = align(back_wall, base, Alignment.LEFT)
     back_wall = align(back_wall, base, Alignment.STACK_TOP)
 
-    walls = PartCollector()
+    cage_parts = [base, back_wall]
+
     side_wall_length = max(cage_overlength, 0)
     if side_wall_length > 0:
         side_wall = create_box(side_wall_length, cage_wall, wall_height)
         side_wall = align(side_wall, base, Alignment.STACK_TOP)
         side_wall = align(side_wall, back_wall, Alignment.STACK_RIGHT)
         side_wall = align(side_wall, base, Alignment.BACK)
-        walls = walls.fuse(side_wall)
+        cage_parts.append(side_wall)
 
         side_wall_2 = align(side_wall, base, Alignment.FRONT)
-        walls = walls.fuse(side_wall_2)
+        cage_parts.append(side_wall_2)
 
     front_wall_width = idler_size[1] - 2 * belt_clearance
     if front_wall_width > 0:
@@ -837,90 +845,63 @@ def create_idler_cage(
         front_wall = align(front_wall, base, Alignment.CENTER, axes=[1])
         front_wall = align(front_wall, base, Alignment.STACK_TOP)
         front_wall = align(front_wall, base, Alignment.RIGHT)
-        walls = walls.fuse(front_wall)
+        cage_parts.append(front_wall)
 
     top_plate = create_box(base_length, base_width, base_thickness)
     top_plate = align(top_plate, idler, Alignment.CENTER)
     top_plate = translate(x_offset, 0, top_z_offset)(top_plate)
 
-    cage = PartCollector()
-    cage = cage.fuse(base)
-    cage = cage.fuse(back_wall)
-    cage = cage.fuse(walls)
-    cage = cage.fuse(top_plate)
+    # walls rise through the top plate, which is joined by a general fuse
+    cage = fuse_touching(*cage_parts, top_plate)
 
-    axle_cutter_radius = (
-        MScrew.from_size(axle_screw_size).clearance_hole_normal / 2
-        + idler_mount_axle_clearance
+    axle_cutter = clearance_hole_cutter(
+        params.axle_screw_size,
+        BIG_THING,
+        clearance=params.idler_mount_axle_clearance,
     )
-    axle_cutter = create_cylinder(axle_cutter_radius, BIG_THING)
     axle_cutter = align(axle_cutter, idler, Alignment.CENTER)
-    cage = cage.cut(axle_cutter)
 
-    head_cutter = create_cylinder(
-        MScrew.from_size(axle_screw_size).cylinder_head_diameter / 2
-        + idler_screw_head_clearance,
-        MScrew.from_size(axle_screw_size).cylinder_head_height
-        + 2 * idler_screw_head_clearance,
+    head_cutter = screw_head_cutter(
+        params.axle_screw_size, clearance=params.idler_screw_head_clearance
     )
     head_cutter = align(head_cutter, idler, Alignment.CENTER)
     head_cutter = align(head_cutter, cage, Alignment.TOP)
-    cage = cage.cut(head_cutter)
 
-    thread_inset_cutter = create_cylinder(
-        m_screws_table[axle_screw_size]["thread_inset_hole_diameter"] / 2
-        + inset_cutter_hole_slack,
-        m_screws_table[axle_screw_size]["thread_inset_length"]
-        + inset_cutter_hole_slack,
+    thread_inset_cutter = insert_pocket_cutter(
+        params.axle_screw_size, slack=params.inset_cutter_hole_slack
     )
     thread_inset_cutter = align(
         thread_inset_cutter, idler, Alignment.CENTER, axes=[0, 1]
     )
     thread_inset_cutter = align(thread_inset_cutter, cage, Alignment.BOTTOM)
-    cage = cage.cut(thread_inset_cutter)
+
+    cage_cutters = [axle_cutter, head_cutter, thread_inset_cutter]
+    cage_cutter_names = ["axle", "screw_head", "thread_inset"]
 
     if axle_screw_length is None:
         axle_screw_length = (
             idler_size[2]
             + 2 * idler_clearance
             + 2 * cage_top_bottom_thickness
-            - MScrew.from_size(axle_screw_size).cylinder_head_height
+            - screw_dimensions(params.axle_screw_size).cylinder_head_height
         )
-    axle = create_cylinder_screw(axle_screw_size, length=axle_screw_length)
+    axle = cylinder_screw(params.axle_screw_size, length=axle_screw_length)
     axle = align(axle, idler, Alignment.CENTER)
     axle = align(axle, cage, Alignment.TOP)
 
-    retval = LeaderFollowersCuttersPart(
-        leader=cage,
-    )
-    retval.add_named_non_production_part(idler, "idler")
-    retval.add_named_non_production_part(axle, "axle")
-
+    tensioner_screw = None
     if with_tensioner:
-        tensioner_clearance_radius = (
-            MScrew.from_size(tensioner_screw_size).clearance_hole_normal / 2
-        )
-        tensioner_inset_radius = (
-            m_screws_table[tensioner_screw_size]["thread_inset_hole_diameter"] / 2
-            + inset_cutter_hole_slack
-        )
-        tensioner_inset_length = min(
-            cage_back_wall,
-            m_screws_table[tensioner_screw_size]["thread_inset_length"]
-            + inset_cutter_hole_slack,
-        )
-
-        clearance_cutter = create_cylinder(
-            tensioner_clearance_radius,
-            cage_back_wall + 0.2,
+        clearance_cutter = clearance_hole_cutter(
+            tensioner_screw_size, cage_back_wall + 0.2
         )
         clearance_cutter = rotate(90, axis=(0, 1, 0))(clearance_cutter)
         clearance_cutter = align(clearance_cutter, idler, Alignment.CENTER, axes=[1, 2])
         clearance_cutter = align(clearance_cutter, back_wall, Alignment.LEFT)
 
-        inset_cutter = create_cylinder(
-            tensioner_inset_radius,
-            tensioner_inset_length,
+        inset_cutter = insert_pocket_cutter(
+            tensioner_screw_size,
+            slack=params.inset_cutter_hole_slack,
+            max_length=cage_back_wall,
         )
         inset_cutter = rotate(90, axis=(0, 1, 0))(inset_cutter)
         inset_cutter = align(
@@ -928,11 +909,10 @@ def create_idler_cage(
         )
         inset_cutter = align(inset_cutter, back_wall, Alignment.RIGHT)
 
-        cage = cage.cut(clearance_cutter)
-        cage = cage.cut(inset_cutter)
-        retval.leader = cage
+        cage_cutters += [clearance_cutter, inset_cutter]
+        cage_cutter_names += ["tensioner_clearance", "tensioner_inset"]
 
-        tensioner_screw = create_cylinder_screw(
+        tensioner_screw = cylinder_screw(
             tensioner_screw_size, length=tensioner_screw_length
         )
         tensioner_screw = rotate(90, axis=(0, 1, 0))(tensioner_screw)
@@ -945,6 +925,19 @@ def create_idler_cage(
             tensioner_screw, idler, Alignment.STACK_LEFT, stack_gap=idler_clearance
         )
 
+    # The cage keeps its cutters for preparing mating parts; its own body gets
+    # all of them in a single batched cut.
+    retval = LeaderFollowersCuttersPart(
+        leader=cage,
+        cutters=cage_cutters,
+        cutter_names=cage_cutter_names,
+    )
+    enable_batched_cutters(retval)
+    retval.leader = use_as_cutter_on(retval, cage)
+
+    retval.add_named_non_production_part(idler, "idler")
+    retval.add_named_non_production_part(axle, "axle")
+    if tensioner_screw is not None:
         retval.add_named_non_production_part(tensioner_screw, "tensioner_screw")
 
     # Place the cage on the build plate for convenient exporting
@@ -954,60 +947,71 @@ def create_idler_cage(
     return retval
 
 
-def create_idler_endcap(profile, with_tensioner: bool = False):
+def create_idler_endcap(
+    profile, with_tensioner: bool = False, params: XAxisParams = DEFAULT_X_AXIS_PARAMS
+):
     """Create an idler endcap built around the idler cage (no tensioner version for now)."""
 
     profile_size = get_bounding_box_size(profile)
 
-    idler = create_gt2_idler(num_teeth=endcap_idler_tooth_count)
-    idler_size = get_bounding_box_size(idler)
+    # the idler itself is built (and counted) by create_idler_cage
+    idler_size = GT2WheelSpec(
+        IDLER, params.endcap_idler_tooth_count, params.idler_bore_diameter
+    ).size
 
-    target_cage_length = 1.3 * (idler_size[0] + 2 * endcap_clearance)
+    target_cage_length = 1.3 * (idler_size[0] + 2 * params.endcap_clearance)
     if with_tensioner:
-        target_cage_length += endcap_tensioner_length
+        target_cage_length += params.endcap_tensioner_length
     cage_overlength = target_cage_length - idler_size[0]
 
     if with_tensioner:
         cage_bottom_top_thickness = (
-            profile_size[2] - idler_size[2] - 2 * endcap_idler_clearance
+            profile_size[2] - idler_size[2] - 2 * params.endcap_idler_clearance
         ) / 2
 
     else:
         cage_bottom_top_thickness = (
             profile_size[2]
-            + 2 * endcap_wall
-            + 2 * endcap_clearance
+            + 2 * params.endcap_wall
+            + 2 * params.endcap_clearance
             - idler_size[2]
-            - 2 * endcap_idler_clearance
+            - 2 * params.endcap_idler_clearance
         ) / 2
 
     if with_tensioner:
         cage_width_override = profile_size[1]
     else:
-        cage_width_override = profile_size[1] + 2 * endcap_wall + 2 * endcap_clearance
+        cage_width_override = (
+            profile_size[1] + 2 * params.endcap_wall + 2 * params.endcap_clearance
+        )
     cage = create_idler_cage(
         cage_back_wall=(
-            idler_cage_back_wall if not with_tensioner else 2 * idler_cage_back_wall
+            params.idler_cage_back_wall
+            if not with_tensioner
+            else 2 * params.idler_cage_back_wall
         ),
-        cage_wall=idler_cage_wall,
-        cage_front_wall_thickness=endcap_wall + endcap_profile_overlap,
+        cage_wall=params.idler_cage_wall,
+        cage_front_wall_thickness=params.endcap_wall + params.endcap_profile_overlap,
         cage_top_bottom_thickness=cage_bottom_top_thickness,
         cage_overlength=cage_overlength,
-        idler_tooth_count=endcap_idler_tooth_count,
-        idler_clearance=endcap_idler_clearance,
+        idler_tooth_count=params.endcap_idler_tooth_count,
+        idler_clearance=params.endcap_idler_clearance,
         with_tensioner=with_tensioner,
-        axle_screw_length=endcap_axle_screw_length,
-        belt_clearance=endcap_belt_clearance,
+        axle_screw_length=params.endcap_axle_screw_length,
+        belt_clearance=params.endcap_belt_clearance,
         cage_width_override=cage_width_override,
+        params=params,
     )
 
     cage = align(cage, profile, Alignment.CENTER)
-    cage = align(cage, profile, Alignment.STACK_LEFT, stack_gap=-endcap_profile_overlap)
+    cage = align(
+        cage, profile, Alignment.STACK_LEFT, stack_gap=-params.endcap_profile_overlap
+    )
 
     profile_cutter = create_box(
         BIG_THING,
-        profile_size[1] + endcap_profile_clearance,
-        profile_size[2] + endcap_profile_clearance,
+        profile_size[1] + params.endcap_profile_clearance,
+        profile_size[2] + params.endcap_profile_clearance,
     )
     profile_cutter = align(profile_cutter, profile, Alignment.CENTER)
     profile_cutter = align(profile_cutter, profile, Alignment.LEFT)
@@ -1030,7 +1034,7 @@ def create_idler_endcap(profile, with_tensioner: bool = False):
     return retval
 
 
-def create_x_axis():
+def create_x_axis(params: XAxisParams = DEFAULT_X_AXIS_PARAMS):
     """Create the x_axis assembly as a composite part.
 
     Leader: printable mount-plate assembly (including shields/link/idler bases).
@@ -1038,14 +1042,20 @@ def create_x_axis():
     """
 
     lower_axis_profile = create_alu_extrusion_profile(
-        ExtrusionProfileType.PROFILE_2020, length_mm=axis_profile_length
+        ExtrusionProfileType.PROFILE_2020, length_mm=params.axis_profile_length
     )
     lower_axis_profile = rotate(90, axis=(0, 1, 0))(lower_axis_profile)
 
-    top_axis_profile = translate(0, 0, axis_profile_pitch)(lower_axis_profile)
+    # a second profile of the same length, placed by copying the first one
+    add_bom_item(
+        bom.PROFILE,
+        f"{ExtrusionProfileType.PROFILE_2020.value} profile, "
+        f"{params.axis_profile_length:g} mm",
+    )
+    top_axis_profile = translate(0, 0, params.axis_profile_pitch)(lower_axis_profile)
     axis_profiles = lower_axis_profile.fuse(top_axis_profile)
 
-    rail = create_mgn12h_rail(length_mm=rail_length)
+    rail = create_mgn12h_rail(length_mm=params.rail_length)
 
     carriages = PartCollector()
     for i in [-1, 1]:
@@ -1081,21 +1091,41 @@ def create_x_axis():
     final_mount_plates_by_side = defaultdict(PartCollector)
     counter_flange_screws_by_side = {}
 
+    # the left stack hangs on the lower profile as the right one does on the
+    # top profile, turned by 180° about Y through the center of the profiles
+    (x0, _, z0), (x1, _, z1) = get_bounding_box(axis_profiles)
+    motor_stacks = build_symmetric_pair(
+        lambda side: _create_motor_stack(
+            side, lower_axis_profile, top_axis_profile, params
+        ),
+        canonical=Alignment.RIGHT,
+        derived=Alignment.LEFT,
+        transform=SymmetryTransform.rotation(
+            180, axis=(0, 1, 0), center=((x0 + x1) / 2, 0, (z0 + z1) / 2)
+        ),
+        verify=VERIFY_SYMMETRY,
+    )
+
     for side in (Alignment.LEFT, Alignment.RIGHT):
         (
             mount_plate,
             mount_plate_connector,
             mount_shield,
             motor_visual_part,
-            motor_name,
             axis_holding_counter_flange,
             axis_holding_counter_flange_screws,
-        ) = _create_motor_stack(side, lower_axis_profile, top_axis_profile)
+            idlers,
+            pulley,
+        ) = motor_stacks[side]
 
         mount_plate_connectors = mount_plate_connectors.fuse(mount_plate_connector)
         mount_shields = mount_shields.fuse(mount_shield)
         non_production_parts.append(motor_visual_part)
-        non_production_names.append(motor_name)
+        non_production_names.append(f"motor_{side.name.lower()}")
+        non_production_parts.append(idlers)
+        non_production_names.append(f"idlers_{side.name.lower()}")
+        non_production_parts.append(pulley)
+        non_production_names.append(f"pulley_{side.name.lower()}")
         mount_plates = mount_plates.fuse(mount_plate)
         axis_holding_counter_flanges[
             f"axis_holding_counter_flange_{side.name.lower()}"
@@ -1107,8 +1137,8 @@ def create_x_axis():
     mount_plate_connectors_size = get_bounding_box_size(mount_plate_connectors)
 
     mount_plate_link = create_box(
-        mount_plate_link_width,
-        mount_plate_connector_link_thickness,
+        params.mount_plate_link_width,
+        params.mount_plate_connector_link_thickness,
         mount_plate_connectors_size[2],
     )
 
@@ -1116,14 +1146,16 @@ def create_x_axis():
 
     mount_plate_link = align(mount_plate_link, mount_plate_connectors, Alignment.BACK)
 
-    bevel_size = (mount_plate_connectors_size[2] - 2 * motor_mount_plate_thickness) / 2
-    mount_plate_link_bevels = PartCollector()
+    bevel_size = (
+        mount_plate_connectors_size[2] - 2 * params.motor_mount_plate_thickness
+    ) / 2
+    mount_plate_link_bevels = TreeCollector()
     for m in [-1, 1]:
 
         mount_plate_link_bevel = create_right_triangle(
             bevel_size,
             bevel_size,
-            mount_plate_link_width,
+            params.mount_plate_link_width,
             extrusion_direction=(1, 0, 0),
             a_normal=(0, 0, m),
             b_normal=(0, -1, 0),
@@ -1138,17 +1170,17 @@ def create_x_axis():
             mount_plate_link_bevel,
             mount_plate_link,
             Alignment.STACK_TOP if m == 1 else Alignment.STACK_BOTTOM,
-            stack_gap=-motor_mount_plate_thickness - bevel_size,
+            stack_gap=-params.motor_mount_plate_thickness - bevel_size,
         )
 
         mount_plate_link_bevels = mount_plate_link_bevels.fuse(mount_plate_link_bevel)
 
-    mount_plate_link = mount_plate_link.fuse(mount_plate_link_bevels)
+    mount_plate_link = mount_plate_link.fuse(mount_plate_link_bevels.part)
 
-    mount_plate_link_flange = create_filleted_box(
-        mount_plate_link_width,
-        link_flange_depth,
-        2 * link_flange_thickness,
+    mount_plate_link_flange = create_rounded_box(
+        params.mount_plate_link_width,
+        params.link_flange_depth,
+        2 * params.link_flange_thickness,
         fillet_radius=1,
         no_fillets_at=[Alignment.TOP, Alignment.BOTTOM, Alignment.FRONT],
     )
@@ -1160,31 +1192,32 @@ def create_x_axis():
         mount_plate_link_flange, mount_plate_link, Alignment.STACK_BACK
     )
 
-    link_screw_hole_cutters = PartCollector()
+    link_screw_hole_cutters = TreeCollector()
     link_scrws = []
     for i, side in enumerate([Alignment.LEFT, Alignment.RIGHT]):
-        link_screw = create_cylinder_screw(link_screw_size, length=link_screw_length)
+        link_screw = cylinder_screw(
+            params.link_screw_size, length=params.link_screw_length
+        )
 
         link_screw = align(link_screw, mount_plate_link_flange, Alignment.CENTER)
         link_screw = align(link_screw, mount_plate_link_flange, Alignment.TOP)
         link_screw = translate(
-            side.sign * mount_plate_link_width / 4,
+            side.sign * params.mount_plate_link_width / 4,
             0,
-            MScrew.from_size(link_screw_size).cylinder_head_height,
+            screw_dimensions(params.link_screw_size).cylinder_head_height,
         )(link_screw)
 
         link_scrws.append(link_screw)
 
-        link_screw_hole_cutter = create_cylinder(
-            MScrew.from_size(link_screw_size).clearance_hole_normal / 2,
-            BIG_THING,
+        link_screw_hole_cutter = clearance_hole_cutter(
+            params.link_screw_size, BIG_THING
         )
         link_screw_hole_cutter = align(
             link_screw_hole_cutter, link_screw, Alignment.CENTER
         )
         link_screw_hole_cutters = link_screw_hole_cutters.fuse(link_screw_hole_cutter)
 
-    mount_plate_link_flange = mount_plate_link_flange.cut(link_screw_hole_cutters)
+    mount_plate_link_flange = mount_plate_link_flange.cut(link_screw_hole_cutters.part)
 
     mount_plate_link = mount_plate_link.fuse(mount_plate_link_flange)
 
@@ -1200,13 +1233,26 @@ def create_x_axis():
         cut_normal=(0, 0, 1),
     )
 
-    for i, side in enumerate([Alignment.LEFT, Alignment.RIGHT]):
-        current_mount_plate_link = mount_plate_link.cut(mount_plate_link_cutters[i])
-        final_mount_plates_by_side[side] = final_mount_plates_by_side[side].fuse(
-            current_mount_plate_link
+    # each plate takes the half of the link at the height of its own
+    # connector, whichever order cut_in_two returns the halves in
+    mount_plate_link_halves = sorted(
+        (mount_plate_link.cut(cutter) for cutter in mount_plate_link_cutters),
+        key=lambda half: get_bounding_box_center(half)[2],
+    )
+    sides_by_height = sorted(
+        (Alignment.LEFT, Alignment.RIGHT),
+        key=lambda side: get_bounding_box_center(motor_stacks[side][1])[2],
+    )
+    for side, current_mount_plate_link in zip(sides_by_height, mount_plate_link_halves):
+        final_mount_plates_by_side[side] = simplify(
+            final_mount_plates_by_side[side].fuse(current_mount_plate_link),
+            "create_x_axis",
+            f"mount_plate_{side.name.lower()}",
         )
 
-    mount_plates = mount_plates.fuse(mount_plate_link)
+    mount_plates = simplify(
+        mount_plates.fuse(mount_plate_link), "create_x_axis", "mount_plates"
+    )
 
     retval = LeaderFollowersCuttersPart(
         leader=mount_plates,
@@ -1222,7 +1268,13 @@ def create_x_axis():
 
     _logger.info(f"counter_flange_screws_by_side: {counter_flange_screws_by_side}")
     for side in (Alignment.LEFT, Alignment.RIGHT):
-        for i, screw in enumerate(counter_flange_screws_by_side[side]):
+        # numbered from left to right, the derived left stack lists its
+        # screws in the order of the turned right one
+        screws = sorted(
+            counter_flange_screws_by_side[side],
+            key=lambda screw: get_bounding_box_center(screw)[0],
+        )
+        for i, screw in enumerate(screws):
             retval.add_named_non_production_part(
                 screw,
                 f"axis_holding_counter_flange_screw_{i+1}_{side.name.lower()}",
@@ -1240,15 +1292,181 @@ def create_x_axis():
     return retval
 
 
-def main():
-    logging.basicConfig(level=logging.INFO)
+def solve_x_axis_belt_path(
+    x_axis, endcap, side, params: XAxisParams = DEFAULT_X_AXIS_PARAMS
+):
+    """Solve the belt loop driven by the motor on ``side``, in the XY plane.
+
+    The belt runs along the back of the motor's axis profile through the
+    omega of the two motor idlers and the pulley, around the idler of
+    ``endcap`` and of the opposite endcap (its mirror image on the other
+    profile end), and back along the front of the profile.
+
+    Returns:
+        BeltPath
+    """
+
+    profile_name = (
+        "lower_axis_profile" if side == Alignment.LEFT else "top_axis_profile"
+    )
+    profile_center = get_bounding_box_center(
+        x_axis.get_non_production_part_by_name(profile_name)
+    )
+    idlers_min, idlers_max = get_bounding_box(
+        x_axis.get_non_production_part_by_name(f"idlers_{side.name.lower()}")
+    )
+    pulley_center = get_bounding_box_center(
+        x_axis.get_non_production_part_by_name(f"pulley_{side.name.lower()}")
+    )
+    endcap_idler_center = get_bounding_box_center(
+        endcap.get_follower_part_by_name("idler")
+    )
+
+    endcap_radius = gt2_pitch_radius(params.endcap_idler_tooth_count)
+    idler_radius = gt2_pitch_radius(params.motor_idler_tooth_count)
+    idler_y = (idlers_min[1] + idlers_max[1]) / 2
+    endcap_xs = sorted(
+        [endcap_idler_center[0], 2 * profile_center[0] - endcap_idler_center[0]]
+    )
+
+    # walking in +x along the back, the motor wheels are on the left
+    wheels = [
+        BeltWheel(
+            (endcap_xs[0], endcap_idler_center[1]),
+            endcap_radius,
+            clockwise=True,
+            name="endcap_idler_left",
+        ),
+        BeltWheel(
+            (idlers_min[0] + idler_radius, idler_y), idler_radius, name="idler_1"
+        ),
+        BeltWheel(
+            tuple(pulley_center[:2]),
+            gt2_pitch_radius(params.motor_pulley_tooth_count),
+            clockwise=True,
+            name="pulley",
+        ),
+        BeltWheel(
+            (idlers_max[0] - idler_radius, idler_y), idler_radius, name="idler_2"
+        ),
+        BeltWheel(
+            (endcap_xs[1], endcap_idler_center[1]),
+            endcap_radius,
+            clockwise=True,
+            name="endcap_idler_right",
+        ),
+    ]
+    return solve_belt_path(wheels, pitch=gt2_pitch)
+
+
+def create_endcap_belt_lanes(endcap):
+    """Ribbons along both belt runs leaving the endcap idler towards the profile.
+
+    They sit in the idler's mid-plane and only model the lateral belt path,
+    which ``endcap_belt_clearance`` keeps clear of the endcap front wall.
+    """
+
+    idler = endcap.get_follower_part_by_name("idler")
+    endcap_box = endcap.get_follower_part_by_name("endcap_box")
+    idler_center = get_bounding_box_center(idler)
+    idler_size = get_bounding_box_size(idler)
+    lane_length = get_bounding_box(endcap_box)[1][0] - idler_center[0]
+
+    lanes = PartCollector()
+    for sign in (-1, 1):
+        lane = create_box(lane_length, gt2_thickness, BELT_LANE_HEIGHT)
+        lane = align(lane, idler, Alignment.CENTER)
+        lane = translate(
+            lane_length / 2,
+            sign * (idler_size[1] + gt2_thickness) / 2,
+            0,
+        )(lane)
+        lanes = lanes.fuse(lane)
+    return lanes
+
+
+def check_x_axis_clearances(
+    x_axis, endcap=None, params: XAxisParams = DEFAULT_X_AXIS_PARAMS
+):
+    """Check the intended clearances of the X-axis and its idler endcap.
+
+    Measures ``idler_gap``, ``endcap_idler_clearance`` and
+    ``endcap_belt_clearance``, and reports every interference between a
+    printed part and any other part of the assembly, except a fastener in
+    the part it fastens.
+
+    Returns:
+        ClearanceReport
+    """
+
+    parts = {
+        name: x_axis.get_non_production_part_by_name(name)
+        for name in x_axis.non_production_indices_by_name
+    }
+    printed = []
+    for name in x_axis.follower_indices_by_name:
+        parts[name] = x_axis.get_follower_part_by_name(name)
+        printed.append(name)
+
+    # (host, fastener) pairs, a fastener runs through the wall of its host or
+    # sits in it as far as its adjustment turns it in
+    fastened = set()
+
+    rules = [
+        ClearanceRule(
+            "idlers_left", "lower_axis_profile", params.idler_gap, "idler_gap"
+        ),
+        ClearanceRule(
+            "idlers_right", "top_axis_profile", params.idler_gap, "idler_gap"
+        ),
+    ]
+
+    if endcap is not None:
+        parts["endcap_box"] = endcap.get_follower_part_by_name("endcap_box")
+        parts["endcap_idler"] = endcap.get_follower_part_by_name("idler")
+        for name in endcap.non_production_indices_by_name:
+            parts[f"endcap_{name}"] = endcap.get_non_production_part_by_name(name)
+            fastened.add(("endcap_box", f"endcap_{name}"))  # axle, tensioner
+        parts["endcap_belt_lanes"] = create_endcap_belt_lanes(endcap)
+        printed.append("endcap_box")
+
+        rules += [
+            ClearanceRule(
+                "endcap_idler",
+                "endcap_box",
+                params.endcap_idler_clearance,
+                "endcap_idler_clearance",
+            ),
+            ClearanceRule(
+                "endcap_belt_lanes",
+                "endcap_box",
+                params.endcap_belt_clearance,
+                "endcap_belt_clearance",
+            ),
+        ]
+
+    interference_pairs = [
+        (name, other)
+        for index, name in enumerate(printed)
+        for other in parts
+        if other != name
+        and other not in printed[:index]
+        and (name, other) not in fastened
+    ]
+
+    return check_clearances(parts, rules, interference_pairs=interference_pairs)
+
+
+def create_parts(params: XAxisParams = DEFAULT_X_AXIS_PARAMS):
+    """The X axis parts to export, production parts and assembly context."""
+
     parts = PartList()
 
     # Create the part
-    z_axis = create_z_axis()
+    z_axis = create_z_axis(params)
     parts.add(z_axis, "z_axis", flip=False, skip_in_production=True)
 
-    x_axis = create_x_axis()
+    x_axis = create_x_axis(params)
 
     x_axis = align(x_axis, z_axis, Alignment.CENTER)
     x_axis = align(x_axis, z_axis, Alignment.STACK_BACK, stack_gap=-28)
@@ -1318,7 +1536,31 @@ def main():
 
     with_tensioner = True
 
-    endcap = create_idler_endcap(lower_axis_profile, with_tensioner=with_tensioner)
+    endcap = create_idler_endcap(
+        lower_axis_profile, with_tensioner=with_tensioner, params=params
+    )
+
+    if not is_dry_run():  # the clearance check needs real meshes
+        check_x_axis_clearances(x_axis, endcap, params).log(_logger)
+
+    for side in (Alignment.LEFT, Alignment.RIGHT):
+        belt_path = solve_x_axis_belt_path(x_axis, endcap, side, params)
+        _logger.info(f"Belt {side.name.lower()}: {belt_path.summary()}")
+
+        belt = create_gt2belt_along_path(belt_path)
+        belt = align(
+            belt,
+            x_axis.get_non_production_part_by_name(f"idlers_{side.name.lower()}"),
+            Alignment.CENTER,
+            axes=[2],
+        )
+        parts.add(
+            belt,
+            f"x_axis_belt_{side.name.lower()}",
+            flip=False,
+            skip_in_production=True,
+            color=(0.15, 0.15, 0.15),
+        )
 
     parts.add(
         endcap.get_follower_part_by_name("idler"),
@@ -1358,21 +1600,24 @@ def main():
         )
 
     # Demo: elongated idler cage with thick back wall and tensioner screw
-    idler_for_demo = create_gt2_idler(num_teeth=idler_cage_idler_tooth_count)
-    idler_for_demo_size = get_bounding_box_size(idler_for_demo)
+    idler_for_demo_size = GT2WheelSpec(
+        IDLER, params.idler_cage_idler_tooth_count, params.idler_bore_diameter
+    ).size
     long_cage_overlength = 3 * idler_for_demo_size[0]  # ≈4x idler length total
 
-    idler_cage_demo = create_idler_cage(
-        cage_back_wall=9,
-        cage_wall=idler_cage_wall,
-        cage_top_bottom_thickness=idler_cage_top_bottom_thickness,
-        cage_overlength=long_cage_overlength,
-        idler_tooth_count=idler_cage_idler_tooth_count,
-        idler_clearance=idler_cage_clearance,
-        with_tensioner=True,
-        tensioner_screw_size="M3",
-        tensioner_screw_length=30,
-    )
+    with suppress_bom():  # not part of the kit
+        idler_cage_demo = create_idler_cage(
+            cage_back_wall=9,
+            cage_wall=params.idler_cage_wall,
+            cage_top_bottom_thickness=params.idler_cage_top_bottom_thickness,
+            cage_overlength=long_cage_overlength,
+            idler_tooth_count=params.idler_cage_idler_tooth_count,
+            idler_clearance=params.idler_cage_clearance,
+            with_tensioner=True,
+            tensioner_screw_size="M3",
+            tensioner_screw_length=30,
+            params=params,
+        )
 
     idler_cage_demo = translate(150, 100, 0)(idler_cage_demo)
 
@@ -1407,13 +1652,21 @@ def main():
         color=(0.9, 0.4, 0.1),
     )
 
+    return parts
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    parts = create_parts()
+
     # Arrange and export
-    arrange_and_export(
+    arrange_and_export_incremental(
         parts.as_list(),
         script_file=__file__,
         prod=PROD,
-        process_data=PROCESS_DATA,
+        process_data=PROCESS_PROFILE,
         prod_gap=4,
+        pack_plates=os.environ.get("PACK_PLATES", "0") == "1",
     )
 
     _logger.info("x_axis created successfully!")
@@ -0,0 +1,158 @@
+"""
+X Axis Parameters
+
+All dimensions of the X-axis assembly in one immutable, hashable object, so
+variants (e.g. a different ``z_axis_guide_distance``) can be built side by side
+and their results cached by ``content_hash()``.
+
+Usage:
+    params = DEFAULT_X_AXIS_PARAMS.variant(z_axis_guide_distance=300)
+    x_axis = create_x_axis(params)
+"""
+
+import dataclasses
+from dataclasses import dataclass
+
+from mege_ender_3v3ke_idex.designs.alu_extrusion_profile_types import (
+    ExtrusionProfileType,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class XAxisParams:
+    """Dimensions of the X-axis assembly, in mm unless noted otherwise."""
+
+    motor_size: float = 42.3
+    axis_profile_length: float = 500
+    rail_length: float = 450
+    axis_profile_pitch: float = 40
+    motor_y_offset: float = 11
+
+    z_axis_guide_distance: float = 256
+
+    x_axis_motor_axle_length: float = 14
+
+    idler_gap: float = 2
+    motor_pulley_tooth_count: int = 20
+    motor_pulley_bore_diameter: float = 5
+    motor_idler_tooth_count: int = 16
+    idler_bore_diameter: float = 3  # on M3 axles
+
+    motor_mount_plate_size: float = 50
+    motor_mount_plate_thickness: float = 6
+    motor_mount_plate_fillet_radius: float = 2
+    motor_mount_axle_clearance: float = 0.3
+    motor_mount_boss_clearance: float = 0.6
+    motor_mount_boss_clearance_z: float = 4
+
+    idler_mount_diameter: float = 4
+    idler_mount_thickness: float = 1
+    idler_mount_axle_clearance: float = 0.1
+    idler_mount_axle_diameter: float = 3.4  # M3 normal clearance hole
+    axle_screw_size: str = "M3"
+    axle_screw_nut_hole_depth: float = 4
+    axle_screw_nut_slack: float = 0.4
+
+    mount_shield_width: float = 17
+    mount_shield_depth: float = 6
+    mount_shield_fillet_radius: float = 1
+    mount_shield_oversize_z: float = 0
+
+    mount_plate_connector_depth: float = 20
+    mount_plate_connector_link_thickness: float = 6
+
+    flange_thickness: float = 5
+    flange_depth: float = 15
+    idler_screw_size: str = "M3"
+    idler_screw_head_clearance: float = 0.3
+    mount_flange_screw_hole_inset: float = 10
+
+    idler_cage_back_wall: float = 4
+    idler_cage_wall: float = 2
+    idler_cage_top_bottom_thickness: float = 4
+    idler_cage_overlength: float = 6
+    idler_cage_clearance: float = 0.5
+    idler_cage_extra_screw_length: float = 6
+    idler_cage_idler_tooth_count: int = 20
+
+    axis_holder_thickness: float = 6
+    axis_holder_fillet_radius: float = 1
+    counter_flange_mount_screw_size: str = "M3"
+    counter_flange_mount_screw_length: float = 14
+
+    nut_cutter_offset_z: float = 2
+
+    link_screw_size: str = "M5"
+    link_screw_length: float = 20
+
+    link_flange_thickness: float = 7
+    link_flange_depth: float = 12
+
+    endcap_wall: float = 3
+    endcap_clearance: float = 0.8
+    endcap_holder_thickness: float = 4
+    endcap_holder_length: float = 10
+    endcap_fillet_radius: float = 2
+    endcap_idler_tooth_count: int = 20
+    endcap_profile_overlap: float = 7
+    endcap_profile_clearance: float = 0.2
+    endcap_axle_screw_length: float = 25
+    endcap_axle_screw_size: str = "M3"
+    inset_cutter_hole_slack: float = 0.3
+    endcap_tensioner_length: float = 25
+    endcap_tensioner_slit_width: float = 0.4
+    endcap_idler_clearance: float = 1.5
+    endcap_belt_clearance: float = 2.6
+
+    @property
+    def motor_x_offset(self):
+        return self.z_axis_guide_distance / 2 - 60
+
+    @property
+    def motor_mount_plate_depth(self):
+        return self.motor_size + self.motor_y_offset
+
+    @property
+    def mount_plate_connector_length(self):
+        return (
+            self.z_axis_guide_distance - 2 * self.motor_x_offset - self.motor_size + 8
+        )
+
+    @property
+    def mount_plate_link_width(self):
+        return self.mount_plate_connector_length * 0.8
+
+    @property
+    def bevel_depth(self):
+        return self.flange_depth * 0.8
+
+    @property
+    def axis_holder_width(self):
+        return self.mount_plate_connector_length
+
+    @property
+    def axis_holder_depth(self):
+        return ExtrusionProfileType.PROFILE_2020.grid_pitch_mm + self.flange_depth
+
+    def variant(self, **changes):
+        """Return a copy with the given fields replaced."""
+
+        return dataclasses.replace(self, **changes)
+
+    def as_dict(self):
+        return {
+            field.name: getattr(self, field.name) for field in dataclasses.fields(self)
+        }
+
+    def as_part_parameters(self):
+        from shellforgepy.construct.part_parameters import PartParameters
+
+        return PartParameters(self.as_dict())
+
+    def content_hash(self):
+        """Stable hash of all fields, identical across processes and sessions."""
+
+        return self.as_part_parameters().parameters_hash()
+
+
+DEFAULT_X_AXIS_PARAMS = XAxisParams()
@@ -0,0 +1,303 @@
+"""
+Belt paths around pulleys and idlers.
+
+A belt path is the ordered list of wheels (pulleys, idlers, or clamp points of
+radius zero) the belt passes, in the belt plane. ``solve_belt_path`` computes
+all tangent spans, wrap angles and the pitch line length in one vectorized
+pass over the wheels, so belt lengths and tooth counts come from the same
+centers and pitch radii the builders place parts with.
+
+Every wheel carries its wrap direction while walking along the belt: the belt
+turns counterclockwise around a wheel whose center is on its left, clockwise
+around one on its right. ``BeltPath.pitch_line`` turns a solved path into
+straight and circular pieces that can be sampled at any arc length, which
+is what belt profiles are swept along.
+
+Usage:
+    path = solve_belt_path(
+        [
+            BeltWheel((0, 0), 6.37, clockwise=True, name="idler"),
+            BeltWheel((300, 0), 6.37, clockwise=True, name="pulley"),
+        ],
+        pitch=2.0,
+    )
+    print(path.summary())
+"""
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class BeltWheel:
+    """A pulley, idler or clamp point the belt passes."""
+
+    center: tuple  # (x, y) in the belt plane
+    radius: float  # pitch radius, 0 for a clamp point
+    clockwise: bool = False  # wrap direction when walking along the belt
+    name: str = ""
+
+    @property
+    def signed_radius(self):
+        return -self.radius if self.clockwise else self.radius
+
+
+@dataclass(frozen=True)
+class BeltPath:
+    """Solved belt path, span ``i`` runs from wheel ``i`` to wheel ``i + 1``."""
+
+    wheels: tuple
+    closed: bool
+    pitch: float
+    span_starts: np.ndarray  # (k, 2) tangent point leaving wheel i
+    span_ends: np.ndarray  # (k, 2) tangent point arriving at wheel i + 1
+    span_normals: np.ndarray  # (k, 2) left normal of each span
+    wrap_angles: np.ndarray  # (n,) radians, 0 at the ends of an open path
+
+    @property
+    def span_lengths(self):
+        return np.linalg.norm(self.span_ends - self.span_starts, axis=1)
+
+    @property
+    def arc_lengths(self):
+        radii = np.array([wheel.radius for wheel in self.wheels], dtype=float)
+        return radii * self.wrap_angles
+
+    @property
+    def length(self):
+        """Length of the pitch line in mm."""
+        return float(self.span_lengths.sum() + self.arc_lengths.sum())
+
+    @property
+    def tooth_count(self):
+        """Pitch line length in teeth, not rounded."""
+        return self.length / self.pitch
+
+    def summary(self):
+        wraps = ", ".join(
+            f"{wheel.name or index} {math.degrees(angle):.1f}°"
+            for index, (wheel, angle) in enumerate(zip(self.wheels, self.wrap_angles))
+            if angle > 0
+        )
+        return (
+            f"{'closed' if self.closed else 'open'} belt {self.length:.1f} mm, "
+            f"{self.tooth_count:.1f} teeth ({math.ceil(self.tooth_count - 1e-6)} "
+            f"to cut), wraps: {wraps}"
+        )
+
+    def pitch_line(self):
+        """The pitch line as alternating wrap arcs and spans."""
+
+        radii = np.array([wheel.radius for wheel in self.wheels], dtype=float)
+        curvatures = np.divide(
+            np.where(self._clockwise, -1.0, 1.0),
+            radii,
+            out=np.zeros_like(radii),
+            where=radii > 0,
+        )
+
+        if self.closed:
+            wheels = np.arange(len(self.wheels))
+            arc_starts = np.roll(self.span_ends, 1, axis=0)
+            arc_normals = np.roll(self.span_normals, 1, axis=0)
+        else:
+            wheels = np.arange(1, len(self.wheels) - 1)
+            arc_starts, arc_normals = self.span_ends[:-1], self.span_normals[:-1]
+
+        # interleave arc i and span i, an open path starts with span 0
+        starts = np.stack([arc_starts, self.span_starts[wheels]], axis=1)
+        normals = np.stack([arc_normals, self.span_normals[wheels]], axis=1)
+        lengths = np.stack(
+            [radii[wheels] * self.wrap_angles[wheels], self.span_lengths[wheels]],
+            axis=1,
+        )
+        piece_curvatures = np.stack([curvatures[wheels], np.zeros(len(wheels))], axis=1)
+        if not self.closed:
+            starts = np.concatenate([self.span_starts[:1], starts.reshape(-1, 2)])
+            normals = np.concatenate([self.span_normals[:1], normals.reshape(-1, 2)])
+            lengths = np.concatenate([self.span_lengths[:1], lengths.ravel()])
+            piece_curvatures = np.concatenate([[0.0], piece_curvatures.ravel()])
+
+        return PitchLine(
+            starts=starts.reshape(-1, 2),
+            start_normals=normals.reshape(-1, 2),
+            lengths=lengths.ravel(),
+            curvatures=piece_curvatures.ravel(),
+            closed=self.closed,
+        )
+
+    def outline(self, offset=0.0, chord_tolerance=0.05):
+        """Polyline of the pitch line shifted by ``offset``, see ``PitchLine.outline``."""
+        return self.pitch_line().outline(offset, chord_tolerance)
+
+    @property
+    def _clockwise(self):
+        return np.array([wheel.clockwise for wheel in self.wheels])
+
+
+@dataclass(frozen=True)
+class PitchLine:
+    """A belt's pitch line as consecutive straight and circular pieces.
+
+    Piece ``i`` starts at ``starts[i]`` with left normal ``start_normals[i]``
+    and turns with signed curvature ``curvatures[i]`` (positive to the left,
+    0 for a straight piece) over ``lengths[i]``.
+    """
+
+    starts: np.ndarray  # (k, 2)
+    start_normals: np.ndarray  # (k, 2)
+    lengths: np.ndarray  # (k,)
+    curvatures: np.ndarray  # (k,)
+    closed: bool
+
+    @property
+    def length(self):
+        return float(self.lengths.sum())
+
+    def _evaluate(self, pieces, distances):
+        """Points and left normals at ``distances`` into ``pieces``."""
+
+        normals = self.start_normals[pieces]
+        tangents = np.stack([normals[:, 1], -normals[:, 0]], axis=1)
+        angles = self.curvatures[pieces] * distances
+        # sin(a) / k and (1 - cos(a)) / k, without dividing by zero curvature
+        along = distances * np.sinc(angles / np.pi)
+        across = distances * angles / 2 * np.sinc(angles / (2 * np.pi)) ** 2
+        points = (
+            self.starts[pieces] + along[:, None] * tangents + across[:, None] * normals
+        )
+        cos, sin = np.cos(angles)[:, None], np.sin(angles)[:, None]
+        turned = np.stack(
+            [
+                cos[:, 0] * normals[:, 0] - sin[:, 0] * normals[:, 1],
+                sin[:, 0] * normals[:, 0] + cos[:, 0] * normals[:, 1],
+            ],
+            axis=1,
+        )
+        return points, turned
+
+    def sample(self, positions):
+        """Points and left normals at arc length ``positions`` along the line."""
+
+        positions = np.asarray(positions, dtype=float)
+        if self.closed:
+            positions = np.mod(positions, self.length)
+        piece_starts = np.cumsum(self.lengths) - self.lengths
+        pieces = np.clip(
+            np.searchsorted(piece_starts, positions, side="right") - 1,
+            0,
+            len(self.lengths) - 1,
+        )
+        return self._evaluate(pieces, positions - piece_starts[pieces])
+
+    def outline(self, offset=0.0, chord_tolerance=0.05):
+        """Polyline of the pitch line shifted by ``offset`` towards the left normals.
+
+        Arcs are sampled so that no chord deviates more than ``chord_tolerance``
+        from the true arc. Returns an (m, 2) array, without repeating the first
+        point of a closed line.
+        """
+
+        turned = np.abs(self.curvatures) * self.lengths
+        offset_radii = np.abs(
+            np.divide(
+                1.0,
+                self.curvatures,
+                out=np.full(len(self.curvatures), np.inf),
+                where=self.curvatures != 0,
+            )
+            - offset
+        )
+        max_step = 2 * np.arccos(
+            1 - chord_tolerance / np.maximum(offset_radii, chord_tolerance)
+        )
+        counts = np.ones(len(turned), dtype=int)
+        curved = turned > 0
+        counts[curved] = np.maximum(np.ceil(turned[curved] / max_step[curved]), 1)
+
+        # every piece from its start to its end, so kinks keep both corners
+        pieces = np.repeat(np.arange(len(counts)), counts + 1)
+        steps = np.arange(len(pieces)) - np.repeat(
+            np.cumsum(counts + 1) - counts - 1, counts + 1
+        )
+        points, normals = self._evaluate(
+            pieces, self.lengths[pieces] * steps / counts[pieces]
+        )
+        points = points + offset * normals
+
+        following = np.roll(points, -1, axis=0)
+        keep = np.linalg.norm(following - points, axis=1) > 1e-9
+        if not self.closed:
+            keep[-1] = True
+        return points[keep]
+
+
+def solve_belt_path(wheels, pitch, closed=True):
+    """Tangent spans and wrap angles of a belt passing ``wheels`` in order.
+
+    Args:
+        wheels: BeltWheel sequence in belt travel order
+        pitch: Belt pitch in mm, e.g. ``gt2_pitch``
+        closed: Whether the last wheel connects back to the first one. The ends
+            of an open path are clamp points, their wrap angle is 0.
+
+    Raises:
+        ValueError: If two consecutive wheels overlap so that no tangent exists
+    """
+
+    wheels = tuple(wheels)
+    if len(wheels) < 2:
+        raise ValueError("A belt path needs at least two wheels")
+
+    centers = np.array([wheel.center for wheel in wheels], dtype=float)
+    signed_radii = np.array([wheel.signed_radius for wheel in wheels])
+    clockwise = np.array([wheel.clockwise for wheel in wheels])
+
+    following = np.roll(np.arange(len(wheels)), -1)
+    if not closed:
+        following = following[:-1]
+    leaving = np.arange(len(following))
+
+    deltas = centers[following] - centers[leaving]
+    distances = np.linalg.norm(deltas, axis=1)
+    radius_changes = signed_radii[following] - signed_radii[leaving]
+    blocked = np.abs(radius_changes) > distances - 1e-9
+    if np.any(blocked):
+        index = int(np.argmax(blocked))
+        raise ValueError(
+            f"No belt tangent from wheel {wheels[index].name or index} "
+            f"to wheel {wheels[following[index]].name or following[index]}, "
+            f"they overlap"
+        )
+
+    # the tangent point is center - signed radius * left normal
+    normal_angles = np.arctan2(deltas[:, 1], deltas[:, 0]) + np.arccos(
+        radius_changes / distances
+    )
+    normals = np.stack([np.cos(normal_angles), np.sin(normal_angles)], axis=1)
+    span_starts = centers[leaving] - signed_radii[leaving][:, None] * normals
+    span_ends = centers[following] - signed_radii[following][:, None] * normals
+
+    wrap_angles = np.zeros(len(wheels))
+    if closed:
+        normals_in, normals_out, turning = np.roll(normals, 1, axis=0), normals, leaving
+    else:
+        normals_in, normals_out = normals[:-1], normals[1:]
+        turning = np.arange(1, len(wheels) - 1)
+    turn = np.arctan2(
+        normals_in[:, 0] * normals_out[:, 1] - normals_in[:, 1] * normals_out[:, 0],
+        np.einsum("ij,ij->i", normals_in, normals_out),
+    )
+    wrap_angles[turning] = np.mod(np.where(clockwise[turning], -turn, turn), 2 * np.pi)
+
+    return BeltPath(
+        wheels=wheels,
+        closed=closed,
+        pitch=pitch,
+        span_starts=span_starts,
+        span_ends=span_ends,
+        span_normals=normals,
+        wrap_angles=wrap_angles,
+    )
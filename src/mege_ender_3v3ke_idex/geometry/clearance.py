@@ -0,0 +1,562 @@
+"""
+Mesh-based interference and clearance checks.
+
+Every part is tessellated once and gets a bounding volume hierarchy over its
+triangles. A pair of parts is pruned by its bounding boxes first, then both
+hierarchies are traversed together, one NumPy pass per tree level, down to
+the leaf pairs that are closer than the search distance. Only the triangle
+pairs of those leaves are tested exactly, again vectorized:
+
+* an edge of one triangle crossing the interior of the other is an
+  interference; faces that merely touch are a contact (distance 0), not an
+  interference
+* otherwise the distance is the minimum of all edge/edge and vertex/face
+  distances
+
+A part entirely inside another has no crossing triangles, so overlapping
+parts without crossings are additionally checked with a ray parity test.
+
+Usage:
+    report = check_clearances(
+        {"idler": idler, "cage": cage},
+        rules=[ClearanceRule("idler", "cage", 1.5)],
+    )
+    for result in report.violations:
+        print(result)
+"""
+
+import itertools
+import logging
+import math
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+from mege_ender_3v3ke_idex.geometry.mesh import (
+    DEFAULT_TESSELLATION_TOLERANCE,
+    cached_tessellation,
+)
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_SEARCH_DISTANCE = 5.0
+BVH_LEAF_SIZE = 8
+
+# triangle pairs tested per NumPy batch, bounds the memory of the narrow phase
+_NARROW_PHASE_CHUNK = 100_000
+_EPS = 1e-9
+
+# an irrational-ish direction, so parity rays do not run along mesh edges
+_RAY_DIRECTION = np.array([0.8017, 0.5112, 0.3096]) / np.linalg.norm(
+    [0.8017, 0.5112, 0.3096]
+)
+
+
+def _dot(a, b):
+    return np.einsum("...i,...i->...", a, b)
+
+
+def _box_gap(min_a, max_a, min_b, max_b):
+    """Distance between axis aligned boxes, 0 if they overlap."""
+
+    gap = np.maximum(0.0, np.maximum(min_a - max_b, min_b - max_a))
+    return np.sqrt(_dot(gap, gap))
+
+
+def _ranges(starts, counts):
+    """Concatenated ``arange(start, start + count)`` for all ranges."""
+
+    total = int(counts.sum())
+    return np.arange(total) + np.repeat(starts - (np.cumsum(counts) - counts), counts)
+
+
+def _segment_offsets(counts):
+    return np.cumsum(counts) - counts, counts
+
+
+def _segment_reduce(ufunc, values, starts, counts):
+    """``ufunc.reduce`` over ``values[start:start + count]`` for all segments."""
+
+    # every segment end becomes an index of its own, a sentinel row keeps it valid
+    padded = np.concatenate([values, values[:1]])
+    indices = np.empty(2 * len(starts), dtype=np.int64)
+    indices[0::2] = starts
+    indices[1::2] = starts + counts
+    return ufunc.reduceat(padded, indices, axis=0)[0::2]
+
+
+class TriangleBVH:
+    """Bounding volume hierarchy over the triangles of a Mesh.
+
+    Nodes are stored as flat arrays, a node is a leaf if its children are -1.
+    The triangles of a node are ``order[start:start + count]``. The tree is
+    built one level at a time, every node of a level is split at the median
+    centroid along its longest axis in the same NumPy pass.
+    """
+
+    def __init__(self, mesh, leaf_size=BVH_LEAF_SIZE):
+        self.mesh = mesh
+        corners = mesh.corners
+        triangle_count = len(corners)
+
+        triangle_min = corners.min(axis=1)
+        triangle_max = corners.max(axis=1)
+        centroids = corners.mean(axis=1)
+        order = np.arange(triangle_count)
+
+        starts = [np.zeros(1, dtype=np.int64)]
+        counts = [np.array([triangle_count])]
+        children = []
+        node_count = 1
+        while triangle_count:
+            level_starts, level_counts = starts[-1], counts[-1]
+            split = level_counts > leaf_size
+            level_children = np.full((len(level_starts), 2), -1)
+            children.append(level_children)
+            if not split.any():
+                break
+
+            split_starts, split_counts = level_starts[split], level_counts[split]
+            positions = _ranges(split_starts, split_counts)
+            segment = np.repeat(np.arange(len(split_starts)), split_counts)
+            segment_centroids = centroids[order[positions]]
+            extent = _segment_reduce(
+                np.maximum, segment_centroids, *_segment_offsets(split_counts)
+            ) - _segment_reduce(
+                np.minimum, segment_centroids, *_segment_offsets(split_counts)
+            )
+            axis = np.argmax(extent, axis=1)
+            key = segment_centroids[np.arange(len(positions)), axis[segment]]
+            order[positions] = order[positions[np.lexsort((key, segment))]]
+
+            halves = split_counts // 2
+            new_nodes = node_count + np.arange(2 * len(split_starts))
+            level_children[split] = new_nodes.reshape(-1, 2)
+            starts.append(np.stack([split_starts, split_starts + halves], 1).ravel())
+            counts.append(np.stack([halves, split_counts - halves], 1).ravel())
+            node_count += len(new_nodes)
+
+        self.order = order
+        self.starts = np.concatenate(starts)
+        self.counts = np.concatenate(counts)
+        self.children = np.concatenate(children) if children else np.zeros((0, 2), int)
+        sorted_min = triangle_min[order]
+        sorted_max = triangle_max[order]
+        self.node_min = _segment_reduce(
+            np.minimum, sorted_min, self.starts, self.counts
+        )
+        self.node_max = _segment_reduce(
+            np.maximum, sorted_max, self.starts, self.counts
+        )
+        self.triangle_min = triangle_min
+        self.triangle_max = triangle_max
+        # a point on the surface within every node, for distance upper bounds
+        self.node_point = corners[order[self.starts], 0] if triangle_count else None
+
+    @classmethod
+    def from_part(cls, part, tolerance=DEFAULT_TESSELLATION_TOLERANCE, cache_dir=None):
+        return cls(cached_tessellation(part, tolerance=tolerance, cache_dir=cache_dir))
+
+    @property
+    def is_empty(self):
+        return len(self.order) == 0
+
+    @property
+    def bounds(self):
+        return self.node_min[0], self.node_max[0]
+
+
+def _candidate_triangle_pairs(bvh_a, bvh_b, threshold):
+    """Triangle index pairs whose bounding boxes are within ``threshold``.
+
+    The threshold shrinks to the closest pair of node points seen while
+    descending, pairs farther apart than that cannot hold the minimum distance.
+    Pairs with overlapping boxes are always kept.
+
+    Returns:
+        (triangles_a, triangles_b, gaps), sorted by the gap of the boxes
+    """
+
+    pair_a = np.zeros(1, dtype=np.int64)
+    pair_b = np.zeros(1, dtype=np.int64)
+    leaves_a, leaves_b = [], []
+
+    while len(pair_a):
+        gaps = _box_gap(
+            bvh_a.node_min[pair_a],
+            bvh_a.node_max[pair_a],
+            bvh_b.node_min[pair_b],
+            bvh_b.node_max[pair_b],
+        )
+        point_offsets = bvh_a.node_point[pair_a] - bvh_b.node_point[pair_b]
+        threshold = min(
+            threshold, float(np.sqrt(_dot(point_offsets, point_offsets).min()))
+        )
+        close = gaps <= threshold + _EPS
+        pair_a, pair_b = pair_a[close], pair_b[close]
+
+        leaf_a = bvh_a.children[pair_a, 0] < 0
+        leaf_b = bvh_b.children[pair_b, 0] < 0
+        both = leaf_a & leaf_b
+        leaves_a.append(pair_a[both])
+        leaves_b.append(pair_b[both])
+
+        # descend into the larger of two inner nodes
+        extent_a = bvh_a.node_max[pair_a] - bvh_a.node_min[pair_a]
+        extent_b = bvh_b.node_max[pair_b] - bvh_b.node_min[pair_b]
+        split_a = ~leaf_a & (leaf_b | (extent_a.max(axis=1) >= extent_b.max(axis=1)))
+        split_b = ~both & ~split_a
+
+        pair_a = np.concatenate(
+            [bvh_a.children[pair_a[split_a]].ravel(), np.repeat(pair_a[split_b], 2)]
+        )
+        pair_b = np.concatenate(
+            [np.repeat(pair_b[split_a], 2), bvh_b.children[pair_b[split_b]].ravel()]
+        )
+
+    leaves_a = np.concatenate(leaves_a)
+    leaves_b = np.concatenate(leaves_b)
+
+    # all triangle combinations of every leaf pair
+    count_a = bvh_a.counts[leaves_a]
+    count_b = bvh_b.counts[leaves_b]
+    sizes = count_a * count_b
+    leaf_pair = np.repeat(np.arange(len(leaves_a)), sizes)
+    local = np.arange(int(sizes.sum())) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    triangles_a = bvh_a.order[
+        bvh_a.starts[leaves_a][leaf_pair] + local // count_b[leaf_pair]
+    ]
+    triangles_b = bvh_b.order[
+        bvh_b.starts[leaves_b][leaf_pair] + local % count_b[leaf_pair]
+    ]
+
+    gaps = _box_gap(
+        bvh_a.triangle_min[triangles_a],
+        bvh_a.triangle_max[triangles_a],
+        bvh_b.triangle_min[triangles_b],
+        bvh_b.triangle_max[triangles_b],
+    )
+    close = np.flatnonzero(gaps <= threshold + _EPS)
+    close = close[np.argsort(gaps[close], kind="stable")]
+    return triangles_a[close], triangles_b[close], gaps[close]
+
+
+def _segment_crosses_triangle(p, q, a, b, c):
+    """True where segment pq passes through the interior of triangle abc."""
+
+    direction = q - p
+    edge_1 = b - a
+    edge_2 = c - a
+    h = np.cross(direction, edge_2)
+    det = _dot(edge_1, h)
+    scale = np.linalg.norm(direction, axis=-1) * np.linalg.norm(
+        np.cross(edge_1, edge_2), axis=-1
+    )
+    valid = np.abs(det) > 1e-9 * scale
+    inv_det = 1.0 / np.where(valid, det, 1.0)
+
+    s = p - a
+    u = _dot(s, h) * inv_det
+    r = np.cross(s, edge_1)
+    v = _dot(direction, r) * inv_det
+    t = _dot(edge_2, r) * inv_det
+    return (
+        valid
+        & (u > _EPS)
+        & (v > _EPS)
+        & (u + v < 1 - _EPS)
+        & (t > _EPS)
+        & (t < 1 - _EPS)
+    )
+
+
+def _segment_distance(p1, q1, p2, q2):
+    """Distance between segments p1q1 and p2q2 (Ericson, Real-Time Collision Detection)."""
+
+    d1 = q1 - p1
+    d2 = q2 - p2
+    r = p1 - p2
+    a = np.maximum(_dot(d1, d1), _EPS)
+    e = np.maximum(_dot(d2, d2), _EPS)
+    b = _dot(d1, d2)
+    c = _dot(d1, r)
+    f = _dot(d2, r)
+
+    denominator = a * e - b * b
+    parallel = denominator <= _EPS * a * e
+    s = np.where(
+        parallel,
+        0.0,
+        np.clip((b * f - c * e) / np.where(parallel, 1.0, denominator), 0.0, 1.0),
+    )
+    t = (b * s + f) / e
+    s = np.where(
+        t < 0,
+        np.clip(-c / a, 0.0, 1.0),
+        np.where(t > 1, np.clip((b - c) / a, 0.0, 1.0), s),
+    )
+    t = np.clip(t, 0.0, 1.0)
+    return np.linalg.norm(p1 + d1 * s[:, None] - p2 - d2 * t[:, None], axis=-1)
+
+
+def _point_face_distance(p, a, b, c):
+    """Distance of p to the plane of abc where p projects into the triangle, else inf."""
+
+    ab = b - a
+    ac = c - a
+    normal = np.cross(ab, ac)
+    norm_sq = np.maximum(_dot(normal, normal), _EPS)
+    ap = p - a
+    weight_c = _dot(np.cross(ab, ap), normal) / norm_sq
+    weight_b = _dot(np.cross(ap, ac), normal) / norm_sq
+    inside = (weight_b >= 0) & (weight_c >= 0) & (weight_b + weight_c <= 1)
+    return np.where(inside, np.abs(_dot(ap, normal)) / np.sqrt(norm_sq), np.inf)
+
+
+_TRIANGLE_EDGES = ((0, 1), (1, 2), (2, 0))
+
+
+def triangle_pairs_cross(triangles_a, triangles_b):
+    """True for triangle pairs, given as two (k, 3, 3) arrays, that interpenetrate."""
+
+    crossing = np.zeros(len(triangles_a), dtype=bool)
+    for first, second in ((triangles_a, triangles_b), (triangles_b, triangles_a)):
+        for i, j in _TRIANGLE_EDGES:
+            crossing |= _segment_crosses_triangle(
+                first[:, i], first[:, j], second[:, 0], second[:, 1], second[:, 2]
+            )
+    return crossing
+
+
+def triangle_pair_distances(triangles_a, triangles_b):
+    """Distances between triangle pairs that do not cross each other."""
+
+    distances = np.full(len(triangles_a), np.inf)
+    for first, second in ((triangles_a, triangles_b), (triangles_b, triangles_a)):
+        for i in range(3):
+            distances = np.minimum(
+                distances,
+                _point_face_distance(
+                    first[:, i], second[:, 0], second[:, 1], second[:, 2]
+                ),
+            )
+
+    for (i, j), (k, m) in itertools.product(_TRIANGLE_EDGES, _TRIANGLE_EDGES):
+        distances = np.minimum(
+            distances,
+            _segment_distance(
+                triangles_a[:, i],
+                triangles_a[:, j],
+                triangles_b[:, k],
+                triangles_b[:, m],
+            ),
+        )
+    return distances
+
+
+def _interior_point(mesh):
+    """A point just inside the mesh, behind its largest triangle."""
+
+    corners = mesh.corners
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    lengths = np.linalg.norm(normals, axis=1)
+    largest = np.argmax(lengths)
+    size = np.linalg.norm(np.ptp(mesh.vertices, axis=0))
+    return corners[largest].mean(axis=0) - normals[largest] / lengths[largest] * (
+        1e-4 * size
+    )
+
+
+def contains_point(mesh, point):
+    """Ray parity test, True if ``point`` is inside the closed mesh."""
+
+    corners = mesh.corners
+    far = point + _RAY_DIRECTION * 2 * (
+        np.linalg.norm(np.ptp(mesh.vertices, axis=0))
+        + np.linalg.norm(point - mesh.vertices[0])
+    )
+    p = np.broadcast_to(point, (len(corners), 3))
+    q = np.broadcast_to(far, (len(corners), 3))
+    hits = _segment_crosses_triangle(p, q, corners[:, 0], corners[:, 1], corners[:, 2])
+    return bool(np.count_nonzero(hits) % 2)
+
+
+def mesh_distance(bvh_a, bvh_b, search_distance=DEFAULT_SEARCH_DISTANCE):
+    """Minimum distance between two meshes and whether they interfere.
+
+    Returns:
+        (distance, interferes), distance is inf if the meshes are farther
+        apart than ``search_distance``
+    """
+
+    if bvh_a.is_empty or bvh_b.is_empty:
+        return math.inf, False
+
+    if _box_gap(*bvh_a.bounds, *bvh_b.bounds) > search_distance:
+        return math.inf, False
+
+    triangles_a, triangles_b, gaps = _candidate_triangle_pairs(
+        bvh_a, bvh_b, search_distance
+    )
+    corners_a = bvh_a.mesh.corners
+    corners_b = bvh_b.mesh.corners
+
+    # only triangles with overlapping boxes can cross, an interference needs no distances
+    overlapping = int(np.searchsorted(gaps, _EPS, side="right"))
+    for start in range(0, overlapping, _NARROW_PHASE_CHUNK):
+        end = min(start + _NARROW_PHASE_CHUNK, overlapping)
+        if triangle_pairs_cross(
+            corners_a[triangles_a[start:end]], corners_b[triangles_b[start:end]]
+        ).any():
+            return 0.0, True
+
+    if _box_gap(*bvh_a.bounds, *bvh_b.bounds) == 0 and (
+        contains_point(bvh_b.mesh, _interior_point(bvh_a.mesh))
+        or contains_point(bvh_a.mesh, _interior_point(bvh_b.mesh))
+    ):
+        return 0.0, True
+
+    # branch and bound: pairs come sorted by box gap, a lower bound of their
+    # distance, so stop as soon as no remaining pair can be closer
+    distance = math.inf
+    start, chunk_size = 0, 1024
+    while start < len(gaps) and gaps[start] < distance:
+        end = min(start + chunk_size, len(gaps))
+        distances = triangle_pair_distances(
+            corners_a[triangles_a[start:end]], corners_b[triangles_b[start:end]]
+        )
+        distance = min(distance, float(distances.min()))
+        start, chunk_size = end, min(4 * chunk_size, _NARROW_PHASE_CHUNK)
+
+    return (distance if distance <= search_distance else math.inf), False
+
+
+@dataclass(frozen=True)
+class ClearanceRule:
+    """Parts ``part_a`` and ``part_b`` must be at least ``min_clearance`` apart."""
+
+    part_a: str
+    part_b: str
+    min_clearance: float
+    description: str = ""
+
+
+@dataclass(frozen=True)
+class ClearanceResult:
+    part_a: str
+    part_b: str
+    distance: float  # inf if farther apart than the search distance
+    interferes: bool
+    rule: Optional[ClearanceRule] = None
+    tolerance: float = DEFAULT_TESSELLATION_TOLERANCE
+
+    @property
+    def ok(self):
+        if self.interferes:
+            return False
+        if self.rule is None:
+            return True
+        return self.distance >= self.rule.min_clearance - self.tolerance
+
+    def __str__(self):
+        state = "OK" if self.ok else "VIOLATION"
+        text = f"{state}: {self.part_a} <-> {self.part_b} "
+        if self.interferes:
+            text += "interfere"
+        elif math.isinf(self.distance):
+            text += "beyond search distance"
+        else:
+            text += f"distance {self.distance:.2f} mm"
+        if self.rule is not None:
+            text += f", required {self.rule.min_clearance:.2f} mm"
+            if self.rule.description:
+                text += f" ({self.rule.description})"
+        return text
+
+
+@dataclass
+class ClearanceReport:
+    results: list = field(default_factory=list)
+
+    @property
+    def violations(self):
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def ok(self):
+        return not self.violations
+
+    def log(self, logger=_logger):
+        for result in self.results:
+            if result.rule is not None or not result.ok:
+                (logger.info if result.ok else logger.warning)(str(result))
+
+
+def check_clearances(
+    parts,
+    rules=(),
+    interference_pairs=None,
+    search_distance=DEFAULT_SEARCH_DISTANCE,
+    tolerance=DEFAULT_TESSELLATION_TOLERANCE,
+    cache_dir=None,
+):
+    """Check clearance rules and interferences between named parts.
+
+    Args:
+        parts: Dict of name -> part
+        rules: ClearanceRules, their pairs are measured up to
+            ``max(search_distance, min_clearance)``
+        interference_pairs: Name pairs checked for interference only, all
+            pairs of ``parts`` if None
+        search_distance: Distances beyond this are reported as inf
+        tolerance: Tessellation tolerance, also the slack granted to rules
+            since curved surfaces are approximated by chords
+        cache_dir: Mesh cache directory, see ``cached_tessellation``
+
+    Returns:
+        ClearanceReport with one result per rule, then per interference pair
+    """
+
+    names = set(parts)
+    for rule in rules:
+        missing = {rule.part_a, rule.part_b} - names
+        if missing:
+            raise KeyError(f"Clearance rule refers to unknown parts {sorted(missing)}")
+
+    bvhs = {
+        name: TriangleBVH.from_part(part, tolerance=tolerance, cache_dir=cache_dir)
+        for name, part in parts.items()
+    }
+
+    report = ClearanceReport()
+    checked = set()
+    for rule in rules:
+        distance, interferes = mesh_distance(
+            bvhs[rule.part_a],
+            bvhs[rule.part_b],
+            max(search_distance, rule.min_clearance + tolerance),
+        )
+        report.results.append(
+            ClearanceResult(
+                rule.part_a,
+                rule.part_b,
+                distance,
+                interferes,
+                rule=rule,
+                tolerance=tolerance,
+            )
+        )
+        checked.add(frozenset((rule.part_a, rule.part_b)))
+
+    if interference_pairs is None:
+        interference_pairs = itertools.combinations(parts, 2)
+    for name_a, name_b in interference_pairs:
+        if frozenset((name_a, name_b)) in checked:
+            continue
+        checked.add(frozenset((name_a, name_b)))
+        distance, interferes = mesh_distance(bvhs[name_a], bvhs[name_b], 0.0)
+        report.results.append(
+            ClearanceResult(name_a, name_b, distance, interferes, tolerance=tolerance)
+        )
+
+    return report
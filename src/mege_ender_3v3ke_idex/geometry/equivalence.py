@@ -0,0 +1,351 @@
+"""
+Geometry equivalence of build results against reference builds.
+
+Faster builders (batched cuts, extruded outlines, symmetric sides, glued
+fuses, unified faces) must not change what they build. A
+``GeometrySignature`` records what a part is without storing the part:
+volume, surface area, bounds, center of mass, face count and a few points on
+its surface. References are kept as JSON, one signature per named part of
+every build (parts of a ``PartList``, leader, followers, cutters and
+non-production parts of a composite).
+
+A build matches its reference if it has the same named parts and, per part,
+volume and area agree within a relative tolerance, bounds and center of mass
+within a length tolerance, every reference surface point lies within the
+length tolerance of the new surface, and the face count did not grow beyond
+``face_growth`` (fewer faces, e.g. after ``simplify``, are fine).
+
+``check_builds`` builds ``"module:function"`` cases in worker processes and
+compares each in its worker, so only signatures and differences travel back.
+
+Usage:
+    cases = {"cage": ("mege_ender_3v3ke_idex.designs.x_axis:create_idler_cage", {...})}
+    checks = check_builds(cases, load_references(path), max_workers=4)
+    assert not checks["cage"].differences
+    save_references(path, {case: check.signatures for case, check in checks.items()})
+"""
+
+import json
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+_logger = logging.getLogger(__name__)
+
+SAMPLE_POINTS = 32
+
+
+@dataclass(frozen=True)
+class GeometrySignature:
+    volume: float
+    area: float
+    minimum: tuple
+    maximum: tuple
+    center_of_mass: tuple
+    faces: int
+    samples: tuple  # points on the surface
+
+    def to_dict(self):
+        return {
+            key: np.round(value, 6).tolist() if key != "faces" else value
+            for key, value in asdict(self).items()
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            volume=data["volume"],
+            area=data["area"],
+            minimum=tuple(data["minimum"]),
+            maximum=tuple(data["maximum"]),
+            center_of_mass=tuple(data["center_of_mass"]),
+            faces=data["faces"],
+            samples=tuple(tuple(point) for point in data["samples"]),
+        )
+
+
+@dataclass(frozen=True)
+class EquivalenceTolerance:
+    length: float = 1e-3  # mm, bounds, center of mass and surface points
+    relative: float = 1e-5  # volume and area
+    face_growth: float = 0.0  # allowed relative growth of the face count
+
+
+@dataclass
+class BuildCheck:
+    case: str
+    signatures: dict = field(default_factory=dict)  # part name -> signature
+    differences: list = field(default_factory=list)
+    error: Optional[str] = None  # the build failed, nothing was compared
+    seconds: float = 0.0
+
+
+def _mass_properties(part):
+    """(volume, area, center of mass, face count) with the active adapter."""
+
+    if callable(getattr(part, "Volume", None)):  # cadquery
+        import cadquery as cq
+
+        center = cq.Shape.centerOfMass(part)
+        return (
+            part.Volume(),
+            part.Area(),
+            (center.x, center.y, center.z),
+            len(part.Faces()),
+        )
+    center = part.CenterOfMass
+    return part.Volume, part.Area, (center.x, center.y, center.z), len(part.Faces)
+
+
+def _largest_triangle_center(points, triangles):
+    corners = np.asarray(points, dtype=float)[np.asarray(triangles)]
+    areas = np.linalg.norm(
+        np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]),
+        axis=1,
+    )
+    return corners[areas.argmax()].mean(axis=0)
+
+
+def _interior_point(face):
+    """A point on ``face`` away from its edges.
+
+    The center of its largest mesh triangle, moved onto the surface. Points
+    on edges are avoided since classifying them against a face bounded by
+    hundreds of edges (the sides of a belt) takes about a second each.
+    """
+
+    if callable(getattr(face, "Area", None)):  # cadquery
+        from OCP.BRep import BRep_Tool
+        from OCP.GeomAPI import GeomAPI_ProjectPointOnSurf
+        from OCP.gp import gp_Pnt
+
+        vertices, triangles = face.tessellate(0.1)
+        center = _largest_triangle_center([v.toTuple() for v in vertices], triangles)
+        foot = GeomAPI_ProjectPointOnSurf(
+            gp_Pnt(*center), BRep_Tool.Surface_s(face.wrapped)
+        ).NearestPoint()
+        return foot.X(), foot.Y(), foot.Z()
+
+    import FreeCAD
+
+    vertices, triangles = face.tessellate(0.1)
+    center = _largest_triangle_center([(v.x, v.y, v.z) for v in vertices], triangles)
+    foot = face.Surface.value(*face.Surface.parameter(FreeCAD.Vector(*center)))
+    return foot.x, foot.y, foot.z
+
+
+def _cq_face_distance(point, face, classifiers):
+    import cadquery as cq
+    from OCP.BRep import BRep_Tool
+    from OCP.BRepTopAdaptor import BRepTopAdaptor_FClass2d
+    from OCP.GeomAPI import GeomAPI_ProjectPointOnSurf
+    from OCP.gp import gp_Pnt, gp_Pnt2d
+    from OCP.TopAbs import TopAbs_OUT
+
+    # the foot of the point on the face's surface, if it lies inside the
+    # face; BRepExtrema takes seconds on faces with hundreds of edges
+    projection = GeomAPI_ProjectPointOnSurf(
+        gp_Pnt(*point), BRep_Tool.Surface_s(face.wrapped)
+    )
+    if projection.NbPoints():
+        if face not in classifiers:
+            classifiers[face] = BRepTopAdaptor_FClass2d(face.wrapped, 1e-7)
+        u, v = projection.LowerDistanceParameters()
+        if classifiers[face].Perform(gp_Pnt2d(u, v)) != TopAbs_OUT:
+            return projection.LowerDistance()
+    return cq.Vertex.makeVertex(*point).distance(face)
+
+
+def surface_distances(part, points):
+    """Distance of every point to the surface (not the interior) of ``part``."""
+
+    if callable(getattr(part, "Volume", None)):  # cadquery
+        faces = part.Faces()
+        boxes = [face.BoundingBox() for face in faces]
+        classifiers = {}
+
+        def distance(point, face):
+            return _cq_face_distance(point, face, classifiers)
+
+    else:
+        import Part
+
+        faces = part.Faces
+        boxes = [face.BoundBox for face in faces]
+
+        def distance(point, face):
+            return Part.Vertex(*point).distToShape(face)[0]
+
+    lower = np.array([(b.xmin, b.ymin, b.zmin) for b in boxes])
+    upper = np.array([(b.xmax, b.ymax, b.zmax) for b in boxes])
+    distances = []
+    for point in np.asarray(points, dtype=float):
+        # faces by the distance to their bounds, a lower bound of the distance
+        # to the face: stop once no closer face can follow
+        bound_distances = np.linalg.norm(
+            np.maximum(lower - point, 0) + np.maximum(point - upper, 0), axis=1
+        )
+        nearest = np.inf
+        for i in np.argsort(bound_distances):
+            if bound_distances[i] >= nearest:
+                break
+            nearest = min(nearest, distance(point, faces[i]))
+        distances.append(nearest)
+    return np.array(distances)
+
+
+def geometry_signature(part, samples=SAMPLE_POINTS):
+    volume, area, center, faces = _mass_properties(part)
+    bounds = part.BoundingBox()
+    all_faces = part.Faces() if callable(part.Faces) else part.Faces
+    picked = np.unique(np.linspace(0, len(all_faces) - 1, samples).astype(int))
+    return GeometrySignature(
+        volume=float(volume),
+        area=float(area),
+        minimum=(float(bounds.xmin), float(bounds.ymin), float(bounds.zmin)),
+        maximum=(float(bounds.xmax), float(bounds.ymax), float(bounds.zmax)),
+        center_of_mass=tuple(float(value) for value in center),
+        faces=faces,
+        samples=tuple(tuple(map(float, _interior_point(all_faces[i]))) for i in picked),
+    )
+
+
+def part_signatures(result, name="part"):
+    """{part name: GeometrySignature} of a build result."""
+
+    from mege_ender_3v3ke_idex.construct.dry_run import named_parts
+
+    return {
+        part_name: geometry_signature(part)
+        for part_name, part in named_parts(result, name)
+    }
+
+
+def compare_part(reference, signature, part, tolerance=EquivalenceTolerance()):
+    """Differences of ``part`` (with its ``signature``) from ``reference``."""
+
+    differences = []
+    for quantity in ("volume", "area"):
+        expected, actual = getattr(reference, quantity), getattr(signature, quantity)
+        if abs(actual - expected) > tolerance.relative * max(abs(expected), 1.0):
+            differences.append(f"{quantity} {expected:.6g} -> {actual:.6g}")
+    for quantity in ("minimum", "maximum", "center_of_mass"):
+        expected = np.array(getattr(reference, quantity))
+        actual = np.array(getattr(signature, quantity))
+        if np.abs(actual - expected).max() > tolerance.length:
+            differences.append(
+                f"{quantity} {np.round(expected, 4).tolist()} -> "
+                f"{np.round(actual, 4).tolist()}"
+            )
+    if signature.faces > reference.faces * (1 + tolerance.face_growth):
+        differences.append(f"faces {reference.faces} -> {signature.faces}")
+    distances = surface_distances(part, reference.samples)
+    off_surface = int((distances > tolerance.length).sum())
+    if off_surface:
+        differences.append(
+            f"{off_surface} of {len(distances)} surface points off the surface, "
+            f"up to {distances.max():.4f} mm"
+        )
+    return differences
+
+
+def compare_build(references, result, tolerance=EquivalenceTolerance()):
+    """(signatures, differences) of a build result against its references."""
+
+    from mege_ender_3v3ke_idex.construct.dry_run import named_parts
+
+    parts = dict(named_parts(result, "part"))
+    signatures = {name: geometry_signature(part) for name, part in parts.items()}
+    differences = [
+        f"{name}: missing" for name in references if name not in signatures
+    ] + [
+        f"{name}: not in the reference" for name in signatures if name not in references
+    ]
+    for name, reference in references.items():
+        if name in parts:
+            differences += [
+                f"{name}: {difference}"
+                for difference in compare_part(
+                    reference, signatures[name], parts[name], tolerance
+                )
+            ]
+    return signatures, differences
+
+
+def check_build(case, builder_ref, builder_kwargs, references, tolerance):
+    """Build one case and compare it, None ``references`` only records it."""
+
+    from mege_ender_3v3ke_idex.produce.sweep import resolve_builder
+
+    started = time.perf_counter()
+    check = BuildCheck(case)
+    try:
+        _, builder = resolve_builder(builder_ref)
+        result = builder(**builder_kwargs)
+    except Exception as error:  # a missing dependency or resource
+        check.error = f"{type(error).__name__}: {error}"
+        _logger.warning(f"Building {case} failed, {check.error}")
+        return check
+
+    if references is None:
+        check.signatures = part_signatures(result)
+    else:
+        check.signatures, check.differences = compare_build(
+            references, result, tolerance
+        )
+    check.seconds = time.perf_counter() - started
+    return check
+
+
+def check_builds(cases, references, tolerance=EquivalenceTolerance(), max_workers=None):
+    """``BuildCheck`` of every case, built in parallel worker processes.
+
+    Args:
+        cases: {case name: ("module:function", keyword arguments)}
+        references: {case name: {part name: GeometrySignature}}, cases
+            without a reference are only recorded
+        max_workers: Number of worker processes, 1 builds in-process
+    """
+
+    arguments = [
+        (case, builder_ref, builder_kwargs, references.get(case), tolerance)
+        for case, (builder_ref, builder_kwargs) in cases.items()
+    ]
+    if max_workers == 1:
+        checks = [check_build(*case_arguments) for case_arguments in arguments]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(check_build, *case_arguments)
+                for case_arguments in arguments
+            ]
+            checks = [future.result() for future in futures]
+    return {check.case: check for check in checks}
+
+
+def load_references(path):
+    """{case: {part name: GeometrySignature}} from a reference file, {} if none."""
+
+    path = Path(path)
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text())
+    return {
+        case: {name: GeometrySignature.from_dict(s) for name, s in parts.items()}
+        for case, parts in data.items()
+    }
+
+
+def save_references(path, references):
+    path = Path(path)
+    data = {
+        case: {name: signature.to_dict() for name, signature in parts.items()}
+        for case, parts in sorted(references.items())
+    }
+    path.write_text(json.dumps(data, indent=1) + "\n")
+    return path
@@ -0,0 +1,45 @@
+"""
+Stable fingerprints of part geometry.
+
+A fingerprint hashes the BREP serialization of a shape, which is
+deterministic across processes, so it can key caches that outlive a build.
+The same serialization is used to persist shapes in those caches.
+"""
+
+import hashlib
+import io
+
+
+def brep_bytes(part):
+    if hasattr(part, "exportBrep"):  # cadquery
+        buffer = io.BytesIO()
+        part.exportBrep(buffer)
+        return buffer.getvalue()
+    if hasattr(part, "exportBrepToString"):  # FreeCAD
+        return part.exportBrepToString().encode("utf-8")
+    raise TypeError(f"Cannot compute a geometry fingerprint for {type(part)}")
+
+
+def shape_from_brep_bytes(data):
+    """Inverse of ``brep_bytes`` for the active adapter."""
+
+    from shellforgepy.simple import get_adapter_id
+
+    if get_adapter_id() == "cadquery":
+        import cadquery as cq
+
+        return cq.Shape.importBrep(io.BytesIO(data))
+
+    import Part
+
+    shape = Part.Shape()
+    shape.importBrepFromString(data.decode("utf-8"))
+    return shape
+
+
+def shape_fingerprint(part, *settings):
+    """Hash of the geometry (including placement) of ``part`` and ``settings``."""
+
+    hasher = hashlib.sha256(brep_bytes(part))
+    hasher.update("".join(f"|{setting}" for setting in settings).encode("utf-8"))
+    return hasher.hexdigest()
@@ -0,0 +1,174 @@
+"""
+Triangle meshes of parts as NumPy arrays.
+
+Parts are tessellated once into a vertex array and a triangle index array,
+everything else (volume, area, planar sections) is computed vectorized on
+those arrays. ``cached_tessellation`` keeps meshes on disk by geometry
+fingerprint, so checks that run on every build only tessellate changed parts.
+"""
+
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from mege_ender_3v3ke_idex.geometry.fingerprint import shape_fingerprint
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_TESSELLATION_TOLERANCE = 0.1
+DEFAULT_ANGULAR_TOLERANCE = 0.1
+
+MESH_CACHE_DIR_ENV_VAR = "MEGE_IDEX_MESH_CACHE_DIR"
+DEFAULT_MESH_CACHE_DIR = Path.home() / ".cache" / "mege_ender_3v3ke_idex" / "meshes"
+
+
+@dataclass(frozen=True)
+class Mesh:
+    """A closed, outward oriented triangle mesh."""
+
+    vertices: np.ndarray  # (n, 3) float
+    triangles: np.ndarray  # (m, 3) int
+
+    @property
+    def corners(self):
+        """Triangle corner coordinates as (m, 3, 3) array."""
+        return self.vertices[self.triangles]
+
+    @property
+    def bounds(self):
+        """(min, max) corner as two arrays of length 3."""
+        return self.vertices.min(axis=0), self.vertices.max(axis=0)
+
+    def volume(self):
+        a, b, c = np.moveaxis(self.corners, 1, 0)
+        return float(np.einsum("ij,ij->i", a, np.cross(b, c)).sum() / 6.0)
+
+    def surface_area(self):
+        a, b, c = np.moveaxis(self.corners, 1, 0)
+        return float(np.linalg.norm(np.cross(b - a, c - a), axis=1).sum() / 2.0)
+
+    def sections(self, z_levels):
+        """Perimeter length and enclosed area of the planar section at each z.
+
+        All (triangle, level) crossings are collected with one ``np.repeat``
+        and evaluated in a single vectorized pass.
+
+        Returns:
+            (perimeters, areas), each an array with one entry per level
+        """
+
+        z_levels = np.asarray(z_levels, dtype=float)
+        perimeters = np.zeros(len(z_levels))
+        areas = np.zeros(len(z_levels))
+        if len(z_levels) == 0 or len(self.triangles) == 0:
+            return perimeters, areas
+        if np.any(np.diff(z_levels) <= 0):
+            raise ValueError("z_levels must be strictly increasing")
+
+        corners = self.corners
+        z = corners[:, :, 2]
+
+        # levels crossing a triangle satisfy zmin < level <= zmax
+        first = np.searchsorted(z_levels, z.min(axis=1), side="right")
+        last = np.searchsorted(z_levels, z.max(axis=1), side="right")
+        counts = np.maximum(last - first, 0)
+        total = int(counts.sum())
+        if total == 0:
+            return perimeters, areas
+
+        triangle_index = np.repeat(np.arange(len(corners)), counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        level_index = np.repeat(first, counts) + offsets
+
+        tri = corners[triangle_index]  # (k, 3, 3)
+        d = tri[:, :, 2] - z_levels[level_index][:, None]  # (k, 3)
+        above = d >= 0
+
+        points = []
+        crossing = []
+        for i, j in ((0, 1), (1, 2), (2, 0)):
+            crosses = above[:, i] != above[:, j]
+            denominator = np.where(crosses, d[:, i] - d[:, j], 1.0)
+            t = (d[:, i] / denominator)[:, None]
+            points.append(tri[:, i, :2] + t * (tri[:, j, :2] - tri[:, i, :2]))
+            crossing.append(crosses)
+
+        # every crossing triangle has exactly two crossing edges
+        c0, c1, c2 = crossing
+        p = np.where(
+            (c0 & c1)[:, None], points[0], np.where(c0[:, None], points[2], points[1])
+        )
+        q = np.where(
+            (c0 & c1)[:, None], points[1], np.where(c0[:, None], points[0], points[2])
+        )
+
+        # orient segments so the solid is on their left (counterclockwise outlines)
+        normals = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+        left = np.stack([-normals[:, 1], normals[:, 0]], axis=1)
+        flip = np.einsum("ij,ij->i", q - p, left) < 0
+        p, q = np.where(flip[:, None], q, p), np.where(flip[:, None], p, q)
+
+        lengths = np.linalg.norm(q - p, axis=1)
+        signed_areas = 0.5 * (p[:, 0] * q[:, 1] - q[:, 0] * p[:, 1])
+
+        perimeters += np.bincount(level_index, lengths, minlength=len(z_levels))
+        areas += np.bincount(level_index, signed_areas, minlength=len(z_levels))
+        return perimeters, areas
+
+
+def tessellate_part(
+    part,
+    tolerance=DEFAULT_TESSELLATION_TOLERANCE,
+    angular_tolerance=DEFAULT_ANGULAR_TOLERANCE,
+):
+    """Tessellate a part (or the leader of a composite) into a Mesh."""
+
+    if hasattr(part, "get_leader_as_part"):
+        part = part.get_leader_as_part()
+
+    try:
+        vertices, triangles = part.tessellate(tolerance, angular_tolerance)
+    except TypeError:  # FreeCAD shapes only take the linear tolerance
+        vertices, triangles = part.tessellate(tolerance)
+
+    return Mesh(
+        vertices=np.array([(v.x, v.y, v.z) for v in vertices], dtype=float).reshape(
+            -1, 3
+        ),
+        triangles=np.array(triangles, dtype=np.int64).reshape(-1, 3),
+    )
+
+
+def cached_tessellation(
+    part,
+    tolerance=DEFAULT_TESSELLATION_TOLERANCE,
+    angular_tolerance=DEFAULT_ANGULAR_TOLERANCE,
+    cache_dir=None,
+):
+    """Like ``tessellate_part``, but reuses meshes of identical geometry from disk."""
+
+    if hasattr(part, "get_leader_as_part"):
+        part = part.get_leader_as_part()
+
+    if cache_dir is None:
+        cache_dir = os.environ.get(MESH_CACHE_DIR_ENV_VAR, DEFAULT_MESH_CACHE_DIR)
+    cache_dir = Path(cache_dir).expanduser()
+    cache_path = (
+        cache_dir / f"{shape_fingerprint(part, tolerance, angular_tolerance)}.npz"
+    )
+
+    if cache_path.exists():
+        with np.load(cache_path) as cached:
+            return Mesh(vertices=cached["vertices"], triangles=cached["triangles"])
+
+    mesh = tessellate_part(part, tolerance, angular_tolerance)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # write and rename, so concurrent builds never read a partial file
+    handle, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".npz")
+    with os.fdopen(handle, "wb") as temp_file:
+        np.savez(temp_file, vertices=mesh.vertices, triangles=mesh.triangles)
+    os.replace(temp_path, cache_path)
+    return mesh
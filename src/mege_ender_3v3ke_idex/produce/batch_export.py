@@ -0,0 +1,326 @@
+"""
+Batch export for printing kits on several printers.
+
+A batch manifest (JSON) lists the printers with their bed size and process
+profile, and the parts to print: design, part name, quantity and printer.
+``run_batch`` builds every design once through its ``create_parts()``, and
+fingerprints every ordered part once. Then it places the ordered number of
+copies of each part (instances of the same shape) and packs them onto the
+plates of their printer (see ``plate_packing``). It exports one STL per
+plate. A plate is linked instead of exported again when a previous batch run
+into the same directory had the same parts at the same places.
+
+Plates are queued for slicing as soon as they are written, so OrcaSlicer
+processes work on the first plates while later ones are still exported. All
+outputs are listed in ``<name>_batch_manifest.json``.
+
+Batch manifest:
+    {
+        "name": "x_axis_kits",
+        "printers": {
+            "ke_1": {"bed_width": 220, "process_profile": "PETGCF_04_HS"},
+            "ke_2": {"bed_width": 220, "bed_depth": 200,
+                     "process_profile": "PLA_08_HS", "gap": 6}
+        },
+        "parts": [
+            {"design": "x_axis", "part": "x_axis_idler_endcap_right_box",
+             "quantity": 4, "printer": "ke_1"}
+        ]
+    }
+
+``process_profile`` is the name of a profile in ``process_profiles``, a
+``"module:ATTRIBUTE"`` reference to a ProcessProfile or process data dict, or
+an inline ``{"filament": ..., "process_overrides": {...}}`` dict.
+
+Usage:
+    mege-idex batch x_axis_kits.json --slice
+"""
+
+import importlib
+import json
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from mege_ender_3v3ke_idex.construct.fuse_tree import TreeCollector
+from mege_ender_3v3ke_idex.produce import process_profiles
+from mege_ender_3v3ke_idex.produce.build_server import load_design
+from mege_ender_3v3ke_idex.produce.incremental_export import (
+    EXPORT_ANGULAR_TOLERANCE,
+    EXPORT_TOLERANCE,
+    combined_fingerprint,
+    geometry_fingerprint,
+    output_entry,
+    reuse_previous,
+    unlink_outputs,
+)
+from mege_ender_3v3ke_idex.produce.plate_packing import pack_parts_for_production
+from mege_ender_3v3ke_idex.produce.process_profiles import ProcessProfile
+from mege_ender_3v3ke_idex.produce.slice_queue import (
+    SLICED_DIR_NAME,
+    SliceJob,
+    run_slice_queue,
+)
+
+_logger = logging.getLogger(__name__)
+
+BATCH_MANIFEST_SUFFIX = "_batch_manifest.json"
+
+
+@dataclass(frozen=True)
+class PrinterSpec:
+    name: str
+    bed_width: float
+    bed_depth: Optional[float] = None  # default is a square bed
+    process_profile: object = None  # see resolve_process_profile
+    gap: float = 4.0
+    max_build_height: Optional[float] = None
+    allow_rotation: bool = True
+
+
+@dataclass(frozen=True)
+class PartOrder:
+    design: str
+    part: str
+    quantity: int
+    printer: str
+
+
+@dataclass(frozen=True)
+class Batch:
+    name: str
+    printers: dict  # name -> PrinterSpec
+    orders: tuple
+
+    @classmethod
+    def from_dict(cls, definition):
+        printers = {
+            name: PrinterSpec(name=name, **spec)
+            for name, spec in definition["printers"].items()
+        }
+        orders = tuple(PartOrder(**order) for order in definition["parts"])
+        for order in orders:
+            if order.printer not in printers:
+                raise ValueError(
+                    f"Part {order.part} ordered for unknown printer {order.printer}"
+                )
+            if order.quantity < 1:
+                raise ValueError(f"Quantity of {order.part} must be at least 1")
+        return cls(name=definition["name"], printers=printers, orders=orders)
+
+    @classmethod
+    def from_file(cls, path):
+        with Path(path).open("r", encoding="utf-8") as handle:
+            return cls.from_dict(json.load(handle))
+
+
+def resolve_process_profile(reference):
+    """ProcessProfile for the ``process_profile`` entry of a printer."""
+
+    if reference is None or isinstance(reference, ProcessProfile):
+        return reference
+    if isinstance(reference, dict):
+        return ProcessProfile.from_dict(reference)
+    if ":" in reference:
+        module_name, attribute = reference.split(":", 1)
+        value = getattr(importlib.import_module(module_name), attribute)
+        if isinstance(value, ProcessProfile):
+            return value
+        return ProcessProfile.from_base(reference)
+    profile = getattr(process_profiles, reference, None)
+    if not isinstance(profile, ProcessProfile):
+        raise ValueError(f"Unknown process profile {reference!r}")
+    return profile
+
+
+def _build_ordered_parts(orders):
+    """(design, part) -> part dict, every design is built once."""
+
+    wanted = defaultdict(set)
+    for order in orders:
+        wanted[order.design].add(order.part)
+
+    parts = {}
+    for design, part_names in wanted.items():
+        module = load_design(design)
+        if not callable(getattr(module, "create_parts", None)):
+            raise ValueError(f"Design {design!r} has no create_parts()")
+        _logger.info(f"Building {design}")
+        created = module.create_parts()
+        if hasattr(created, "as_list"):
+            created = created.as_list()
+        by_name = {str(entry["name"]): entry for entry in created}
+        for part_name in sorted(part_names):
+            entry = by_name.get(part_name)
+            if entry is None or entry.get("skip_in_production", False):
+                raise ValueError(f"{part_name} is not a production part of {design}")
+            parts[(design, part_name)] = entry
+    return parts
+
+
+def _export_plate(shapes, destinations):
+    from shellforgepy.simple import export_solid_to_stl
+
+    unlink_outputs(destinations)
+    fused_collector = TreeCollector()
+    for shape in shapes:
+        fused_collector.fuse(shape)
+    export_solid_to_stl(
+        fused_collector.part,
+        destinations[".stl"],
+        tolerance=EXPORT_TOLERANCE,
+        angular_tolerance=EXPORT_ANGULAR_TOLERANCE,
+    )
+
+
+def run_batch(
+    batch, output_dir, *, slicer_settings=None, cache_dir=None, max_workers=None
+):
+    """Export (and with ``slicer_settings`` slice) the plates of ``batch``.
+
+    Args:
+        batch: Batch
+        output_dir: Directory for plates, process data and the batch manifest
+        slicer_settings: SlicerSettings, plates are not sliced if None
+        cache_dir: Slice cache directory, see ``run_slice_queue``
+        max_workers: Concurrent slicer processes
+
+    Returns:
+        The batch manifest as dict
+    """
+
+    output_dir = Path(output_dir).expanduser()
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = output_dir / f"{batch.name}{BATCH_MANIFEST_SUFFIX}"
+    previous_plates = {}
+    if manifest_path.exists():
+        with manifest_path.open("r", encoding="utf-8") as handle:
+            for printer in json.load(handle)["printers"].values():
+                previous_plates.update(
+                    (plate["name"], plate) for plate in printer["plates"]
+                )
+
+    parts = _build_ordered_parts(batch.orders)
+    fingerprints = {key: geometry_fingerprint(e["part"]) for key, e in parts.items()}
+
+    quantities = defaultdict(int)
+    for order in batch.orders:
+        quantities[(order.printer, order.design, order.part)] += order.quantity
+
+    manifest = {
+        "name": batch.name,
+        "output_dir": str(output_dir.resolve()),
+        "parts": {},
+        "printers": {},
+    }
+    for (printer, design, part), quantity in quantities.items():
+        entry = manifest["parts"].setdefault(
+            f"{design}:{part}",
+            {"fingerprint": fingerprints[(design, part)], "quantity": 0},
+        )
+        entry["quantity"] += quantity
+
+    def plate_jobs():
+        for printer in dict.fromkeys(order.printer for order in batch.orders):
+            spec = batch.printers[printer]
+            bed_depth = spec.bed_depth or spec.bed_width
+
+            instances = []
+            instance_fingerprints = {}
+            for (order_printer, design, part), quantity in quantities.items():
+                if order_printer != printer:
+                    continue
+                entry = parts[(design, part)]
+                for number in range(1, quantity + 1):
+                    name = f"{Path(design).stem}.{part}_{number}"
+                    instances.append(dict(entry, name=name))
+                    instance_fingerprints[name] = combined_fingerprint(
+                        fingerprints[(design, part)],
+                        entry.get("flip", False),
+                        entry.get("prod_rotation_angle"),
+                        entry.get("prod_rotation_axis"),
+                    )
+
+            plates, packing = pack_parts_for_production(
+                instances,
+                gap=spec.gap,
+                bed_width=spec.bed_width,
+                bed_depth=bed_depth,
+                allow_rotation=spec.allow_rotation,
+                max_build_height=spec.max_build_height,
+            )
+            _logger.info(f"{printer}: {packing.summary()}")
+
+            process_data = None
+            profile = resolve_process_profile(spec.process_profile)
+            if profile is not None:
+                process_data = profile.resolve()
+                process_path = output_dir / f"{batch.name}_{printer}_process.json"
+                with process_path.open("w", encoding="utf-8") as handle:
+                    json.dump(process_data, handle, indent=4)
+
+            printer_entry = manifest["printers"][printer] = {
+                "bed_width": spec.bed_width,
+                "bed_depth": bed_depth,
+                "process_data_path": (
+                    str(process_path.resolve()) if process_data is not None else None
+                ),
+                "plates": [],
+            }
+            for plate, plate_parts in enumerate(plates):
+                plate_name = f"{batch.name}_{printer}_plate{plate + 1}"
+                destinations = {".stl": output_dir / f"{plate_name}.stl"}
+                # copies are placed by the packer, their fingerprints and
+                # placements identify the plate without hashing its BREP
+                fingerprint = combined_fingerprint(
+                    spec.bed_width,
+                    bed_depth,
+                    *(
+                        (instance_fingerprints[p.name], p.x, p.y, p.rotated)
+                        for p in packing.plate_placements(plate)
+                    ),
+                )
+                reused = reuse_previous(
+                    previous_plates.get(plate_name), fingerprint, destinations
+                )
+                if reused:
+                    _logger.info(f"{plate_name} unchanged")
+                else:
+                    _export_plate([e["part"] for e in plate_parts], destinations)
+                    _logger.info(f"Exported {plate_name} to {destinations['.stl']}")
+
+                plate_entry = dict(
+                    output_entry(fingerprint, destinations, reused),
+                    name=plate_name,
+                    parts=[e["name"] for e in plate_parts],
+                    utilization=round(float(packing.utilizations[plate]), 4),
+                )
+                printer_entry["plates"].append(plate_entry)
+
+                if process_data is not None:
+                    yield SliceJob(
+                        name=plate_name,
+                        model_path=destinations[".stl"],
+                        fingerprint=fingerprint,
+                        process_data=process_data,
+                        output_dir=output_dir / SLICED_DIR_NAME / plate_name,
+                    )
+
+    if slicer_settings is None:
+        for _ in plate_jobs():
+            pass
+    else:
+        results = run_slice_queue(
+            plate_jobs(), slicer_settings, cache_dir=cache_dir, max_workers=max_workers
+        )
+        sliced = {r.job.name: [str(f) for f in r.output_files] for r in results}
+        for printer_entry in manifest["printers"].values():
+            for plate_entry in printer_entry["plates"]:
+                plate_entry["sliced_files"] = sliced.get(plate_entry["name"], [])
+
+    with manifest_path.open("w", encoding="utf-8") as handle:
+        json.dump(manifest, handle, indent=2, sort_keys=True)
+    _logger.info(f"Wrote batch manifest to {manifest_path}")
+    return manifest
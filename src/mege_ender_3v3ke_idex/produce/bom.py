@@ -0,0 +1,129 @@
+"""
+Bill of materials, registered by the builders of purchased parts.
+
+Builders of parts that are bought rather than printed (screws, nuts, heat-set
+inserts, motors, pulleys, idlers, rails, carriages, profiles, belts) call
+``add_bom_item`` every time they are called, including when the geometry
+comes from a cache. ``collect_bom`` gathers the items of everything built
+inside it. Nothing depends on the geometry, so collecting inside
+``dry_run()`` gives the bill of materials of a whole assembly in
+milliseconds.
+
+A side derived by symmetry (``build_symmetric_pair``) is not built, the
+items of the canonical side are added again for it instead.
+
+Usage:
+    with collect_bom() as bom, dry_run():
+        create_x_axis(params)
+    bom.write_csv("x_axis_bom.csv")
+    mege-idex bom x_axis create_x_axis --json
+"""
+
+import contextlib
+import csv
+import io
+import json
+import logging
+from pathlib import Path
+
+_logger = logging.getLogger(__name__)
+
+SCREW = "screw"
+NUT = "nut"
+INSERT = "insert"
+MOTOR = "motor"
+PULLEY = "pulley"
+IDLER = "idler"
+RAIL = "rail"
+CARRIAGE = "carriage"
+PROFILE = "profile"
+BELT = "belt"
+
+CSV_COLUMNS = ("category", "description", "quantity")
+
+_collectors = []
+
+
+class BillOfMaterials:
+    """Quantities by (category, description), in order of first use."""
+
+    def __init__(self):
+        self.quantities = {}
+
+    def add(self, category, description, quantity=1):
+        key = (category, description)
+        self.quantities[key] = self.quantities.get(key, 0) + quantity
+
+    def __getitem__(self, description):
+        return sum(q for (_, d), q in self.quantities.items() if d == description)
+
+    def __len__(self):
+        return len(self.quantities)
+
+    def lines(self):
+        """(category, description, quantity) sorted by category and description."""
+        return [(c, d, q) for (c, d), q in sorted(self.quantities.items())]
+
+    def to_dict(self):
+        return {
+            "items": [dict(zip(CSV_COLUMNS, line)) for line in self.lines()],
+            "total": sum(self.quantities.values()),
+        }
+
+    def to_csv(self):
+        text = io.StringIO()
+        writer = csv.writer(text, lineterminator="\n")
+        writer.writerow(CSV_COLUMNS)
+        writer.writerows(self.lines())
+        return text.getvalue()
+
+    def write_csv(self, path):
+        path = Path(path)
+        path.write_text(self.to_csv())
+        return path
+
+    def write_json(self, path):
+        path = Path(path)
+        path.write_text(json.dumps(self.to_dict(), indent=2) + "\n")
+        return path
+
+    def __str__(self):
+        return "\n".join(f"{q:>4} x {d}" for _, d, q in self.lines())
+
+
+def add_bom_item(category, description, quantity=1):
+    """Count ``quantity`` of an item in every active ``collect_bom``."""
+
+    for bom in _collectors:
+        bom.add(category, description, quantity)
+
+
+@contextlib.contextmanager
+def collect_bom(bom=None):
+    """The items added inside, also counted by enclosing collectors."""
+
+    bom = BillOfMaterials() if bom is None else bom
+    _collectors.append(bom)
+    try:
+        yield bom
+    finally:
+        _collectors.remove(bom)
+
+
+@contextlib.contextmanager
+def suppress_bom():
+    """Build without counting, e.g. a check build of parts counted elsewhere."""
+
+    saved = _collectors[:]
+    _collectors.clear()
+    try:
+        yield
+    finally:
+        _collectors[:] = saved
+
+
+def add_bom(bom):
+    """Count all items of ``bom`` again in the active collectors."""
+
+    for (category, description), quantity in bom.quantities.items():
+        add_bom_item(category, description, quantity)
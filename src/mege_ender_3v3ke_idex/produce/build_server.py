@@ -0,0 +1,374 @@
+"""
+Design builds, in process or on a resident build server.
+
+``build_design`` runs a design's ``main()`` into a run directory laid out like
+``./run.sh`` does (``runs/<design>_run_<run id>`` with the shellforgepy
+workflow environment), so ``slice_queue`` and the incremental export treat
+both the same way. Designs are given by module name (``x_axis``), dotted
+module path or ``.py`` file.
+
+A fresh process spends seconds importing OCC and shellforgepy before the
+first shape is built. ``serve`` keeps one process with both loaded and
+builds designs sent to it over a UNIX socket, one at a time, with the
+client's working directory and environment. Design modules stay imported
+between requests, so their in-memory caches (GT2 catalog, resolved process
+profiles, merged cutters) are shared by all builds; when a source file of
+the package or a design file changes, the package modules are imported
+afresh before the next build.
+
+Requests and replies are single JSON lines.
+
+Usage:
+    python -m mege_ender_3v3ke_idex.cli serve &
+    python -m mege_ender_3v3ke_idex.cli build x_axis --production
+"""
+
+import contextlib
+import importlib
+import importlib.util
+import io
+import json
+import logging
+import os
+import socket
+import sys
+import time
+import traceback
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+
+_logger = logging.getLogger(__name__)
+
+PACKAGE = "mege_ender_3v3ke_idex"
+DESIGNS_PACKAGE = f"{PACKAGE}.designs"
+
+SOCKET_ENV_VAR = "MEGE_IDEX_BUILD_SOCKET"
+DEFAULT_SOCKET_PATH = Path.home() / ".cache" / "mege_ender_3v3ke_idex" / "build.sock"
+
+# environment of the shellforgepy workflow, see ``shellforgepy run``
+RUN_ID_ENV = "SHELLFORGEPY_RUN_ID"
+RUN_DIR_ENV = "SHELLFORGEPY_RUN_DIRECTORY"
+EXPORT_DIR_ENV = "SHELLFORGEPY_EXPORT_DIR"
+MANIFEST_ENV = "SHELLFORGEPY_WORKFLOW_MANIFEST"
+PRODUCTION_ENV = "SHELLFORGEPY_PRODUCTION"
+MANIFEST_FILENAME = "workflow_manifest.json"
+DEFAULT_RUNS_DIR_NAME = "runs"
+
+LOG_FORMAT = "[%(asctime)s] %(levelname)s:%(name)s:%(message)s"
+
+# modules the server itself runs on, never re-imported
+_RESIDENT_MODULES = (__name__, f"{PACKAGE}.cli")
+
+
+class BuildServerError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class BuildResult:
+    design: str
+    run_directory: str
+    seconds: float
+    reloaded: bool = False  # package modules were imported afresh for this build
+    log: str = ""
+
+
+def socket_path(override=None):
+    return Path(
+        override or os.environ.get(SOCKET_ENV_VAR, DEFAULT_SOCKET_PATH)
+    ).expanduser()
+
+
+# resolved path -> (mtime, module) of the design files loaded by path
+_loaded_design_files = {}
+# package module name -> source mtime after the last build
+_module_mtimes = {}
+
+
+def _module_file_mtimes():
+    mtimes = {}
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None)
+        if (name == PACKAGE or name.startswith(f"{PACKAGE}.")) and path:
+            with contextlib.suppress(OSError):
+                mtimes[name] = os.stat(path).st_mtime_ns
+    return mtimes
+
+
+def _refresh_changed_modules():
+    """Forget the package modules if any of their sources changed.
+
+    Returns whether modules were dropped. Modules depend on each other, so
+    all of them are imported afresh rather than reloading one at a time.
+    """
+
+    current = _module_file_mtimes()
+    changed = any(
+        current.get(name, mtime) != mtime for name, mtime in _module_mtimes.items()
+    )
+    if changed:
+        for name in current:
+            if name not in _RESIDENT_MODULES:
+                sys.modules.pop(name, None)
+        _loaded_design_files.clear()
+    return changed
+
+
+def load_design(design):
+    """The module of ``design``: a name in the designs package, a dotted
+    module path or a ``.py`` file."""
+
+    design = str(design)
+    path = Path(design).expanduser()
+    if path.suffix == ".py":
+        path = path.resolve()
+        if not path.exists():
+            raise BuildServerError(f"Design file does not exist: {path}")
+        mtime = path.stat().st_mtime_ns
+        loaded = _loaded_design_files.get(path)
+        if loaded is not None and loaded[0] == mtime:
+            return loaded[1]
+        spec = importlib.util.spec_from_file_location(f"_design_{path.stem}", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _loaded_design_files[path] = (mtime, module)
+        return module
+
+    module_name = design if "." in design else f"{DESIGNS_PACKAGE}.{design}"
+    try:
+        return importlib.import_module(module_name)
+    except ModuleNotFoundError as error:
+        if error.name != module_name:
+            raise
+        raise BuildServerError(f"Unknown design {design!r}") from error
+
+
+@contextlib.contextmanager
+def _build_environment(environment, cwd):
+    saved_environment, saved_cwd = dict(os.environ), os.getcwd()
+    try:
+        if environment is not None:
+            os.environ.clear()
+            os.environ.update(environment)
+        if cwd is not None:
+            os.chdir(cwd)
+        yield
+    finally:
+        os.chdir(saved_cwd)
+        os.environ.clear()
+        os.environ.update(saved_environment)
+
+
+def build_design(
+    design,
+    *,
+    production=None,
+    runs_dir=None,
+    run_id=None,
+    environment=None,
+    cwd=None,
+):
+    """Run the ``main()`` of ``design`` into a fresh run directory.
+
+    Args:
+        design: Design name, dotted module path or ``.py`` file
+        production: Overrides ``SHELLFORGEPY_PRODUCTION`` when not None
+        runs_dir: Parent of the run directory, default ``<cwd>/runs``
+        run_id: Default is the current UTC time, like ``./run.sh``
+        environment: Environment for the build, default the current one
+        cwd: Working directory for the build
+
+    Returns:
+        BuildResult
+    """
+
+    started = time.perf_counter()
+    reloaded = _refresh_changed_modules()
+
+    with _build_environment(environment, cwd):
+        module = load_design(design)
+        if not callable(getattr(module, "main", None)):
+            raise BuildServerError(f"Design {design!r} has no main()")
+
+        run_id = run_id or datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        stem = Path(module.__file__).stem
+        run_directory = (
+            Path(runs_dir or DEFAULT_RUNS_DIR_NAME).expanduser().resolve()
+            / f"{stem}_run_{run_id}"
+        )
+        run_directory.mkdir(parents=True, exist_ok=True)
+
+        os.environ.update(
+            {
+                RUN_ID_ENV: run_id,
+                RUN_DIR_ENV: str(run_directory),
+                EXPORT_DIR_ENV: str(run_directory),
+                MANIFEST_ENV: str(run_directory / MANIFEST_FILENAME),
+            }
+        )
+        if production is not None:
+            os.environ[PRODUCTION_ENV] = "1" if production else "0"
+        # designs read PROD once at import, a warm module must see this build's
+        if hasattr(module, "PROD"):
+            module.PROD = os.environ.get(PRODUCTION_ENV, "0") == "1"
+
+        _logger.info(f"Building {design} into {run_directory}")
+        module.main()
+
+    _module_mtimes.clear()
+    _module_mtimes.update(_module_file_mtimes())
+    return BuildResult(
+        design=str(design),
+        run_directory=str(run_directory),
+        seconds=time.perf_counter() - started,
+        reloaded=reloaded,
+    )
+
+
+@contextlib.contextmanager
+def _captured_log():
+    """Collect the log records emitted meanwhile as text, INFO and up."""
+
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    root = logging.getLogger()
+    saved_level = root.level
+    root.setLevel(min(saved_level, logging.INFO))
+    root.addHandler(handler)
+    try:
+        yield stream
+    finally:
+        root.removeHandler(handler)
+        root.setLevel(saved_level)
+
+
+def _handle(request):
+    command = request.get("command")
+    if command == "ping":
+        return {"ok": True, "pid": os.getpid()}
+    if command != "build":
+        return {"ok": False, "error": f"Unknown command {command!r}"}
+
+    with _captured_log() as log:
+        try:
+            result = build_design(
+                request["design"],
+                production=request.get("production"),
+                runs_dir=request.get("runs_dir"),
+                run_id=request.get("run_id"),
+                environment=request.get("environment"),
+                cwd=request.get("cwd"),
+            )
+        except Exception:
+            _logger.error(f"Build of {request.get('design')} failed")
+            return {
+                "ok": False,
+                "error": traceback.format_exc(),
+                "log": log.getvalue(),
+            }
+    return {"ok": True, "result": asdict(result) | {"log": log.getvalue()}}
+
+
+def _receive_line(connection):
+    chunks = []
+    while True:
+        chunk = connection.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        if chunk.endswith(b"\n"):
+            break
+    return b"".join(chunks)
+
+
+def _warm_up():
+    started = time.perf_counter()
+    import shellforgepy.simple  # noqa: F401  loads the CAD backend
+    from mege_ender_3v3ke_idex.produce import incremental_export  # noqa: F401
+
+    _module_mtimes.update(_module_file_mtimes())
+    _logger.info(f"CAD backend loaded in {time.perf_counter() - started:.1f} s")
+
+
+def serve(path=None):
+    """Build designs sent to the UNIX socket at ``path`` until stopped."""
+
+    path = socket_path(path)
+    if path.exists():
+        if ping(path) is not None:
+            raise BuildServerError(f"A build server already listens on {path}")
+        path.unlink()
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    _warm_up()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(path))
+        os.chmod(path, 0o600)
+        server.listen()
+        _logger.info(f"Build server listening on {path}")
+        try:
+            while True:
+                connection, _ = server.accept()
+                with connection:
+                    try:
+                        request = json.loads(_receive_line(connection))
+                    except json.JSONDecodeError as error:
+                        reply = {"ok": False, "error": f"Bad request: {error}"}
+                    else:
+                        if request.get("command") == "stop":
+                            connection.sendall(b'{"ok": true}\n')
+                            break
+                        reply = _handle(request)
+                    connection.sendall(json.dumps(reply).encode("utf-8") + b"\n")
+        finally:
+            path.unlink(missing_ok=True)
+            _logger.info("Build server stopped")
+
+
+def send_request(request, path=None, timeout=None):
+    """Send one request to the build server and return its reply."""
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(str(socket_path(path)))
+        client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        reply = _receive_line(client)
+    if not reply:
+        raise BuildServerError("The build server closed the connection")
+    return json.loads(reply)
+
+
+def ping(path=None):
+    """Process id of the server listening at ``path``, None if there is none."""
+
+    try:
+        return send_request({"command": "ping"}, path, timeout=5)["pid"]
+    except (OSError, ValueError):
+        return None
+
+
+def build_on_server(design, path=None, **build_kwargs):
+    """``build_design`` on the build server, with this process's environment.
+
+    Raises:
+        BuildServerError: If the build fails, with the server's traceback
+    """
+
+    reply = send_request(
+        {
+            "command": "build",
+            "design": str(design),
+            "environment": dict(os.environ),
+            "cwd": os.getcwd(),
+            **build_kwargs,
+        },
+        path,
+    )
+    if not reply["ok"]:
+        raise BuildServerError(
+            f"{reply.get('log', '')}Build of {design} failed on the server:\n"
+            f"{reply['error']}"
+        )
+    return BuildResult(**reply["result"])
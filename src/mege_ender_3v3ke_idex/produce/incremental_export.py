@@ -0,0 +1,434 @@
+"""
+Incremental export of arranged parts.
+
+Drop-in for ``arrange_and_export`` that skips re-tessellating parts whose
+geometry did not change since the previous run. Every exported part gets a
+geometry fingerprint (a hash of its BREP plus the export settings). Files of
+parts with the same fingerprint as in the previous run are hard-linked (or
+symlinked, or copied if neither is possible) from the previous run directory
+instead of being exported again. The fused assembly and the colored OBJ are
+only rebuilt when one of their parts changed.
+
+The previous run is either the export directory itself or the most recent
+``<script stem>_run_*`` sibling directory created by ``./run.sh``. Each run
+writes ``<script stem>_export_manifest.json`` listing every output with its
+fingerprint and whether it was changed or unchanged, so downstream slicing
+can skip untouched parts. When running under the shellforgepy workflow the
+workflow manifest additionally gets ``changed_part_files``,
+``unchanged_part_files`` and ``assembly_changed``.
+
+Usage:
+    arrange_and_export_incremental(
+        parts.as_list(),
+        script_file=__file__,
+        prod=PROD,
+        process_data=PROCESS_DATA,
+    )
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+
+from mege_ender_3v3ke_idex.construct.fuse_tree import TreeCollector
+from mege_ender_3v3ke_idex.geometry.fingerprint import shape_fingerprint
+from mege_ender_3v3ke_idex.produce.plate_packing import pack_parts_for_production
+from mege_ender_3v3ke_idex.produce.process_profiles import ProcessProfile
+
+_logger = logging.getLogger(__name__)
+
+EXPORT_MANIFEST_SUFFIX = "_export_manifest.json"
+
+STATUS_CHANGED = "changed"
+STATUS_UNCHANGED = "unchanged"
+
+EXPORT_TOLERANCE = 0.1
+EXPORT_ANGULAR_TOLERANCE = 0.1
+
+# distance between packed plates in the colored OBJ preview
+PLATE_PREVIEW_SPACING = 20.0
+
+
+def geometry_fingerprint(part):
+    """Return a stable hash of the geometry (including placement) of ``part``."""
+
+    return shape_fingerprint(part, EXPORT_TOLERANCE, EXPORT_ANGULAR_TOLERANCE)
+
+
+def combined_fingerprint(*items):
+    """One hash of several fingerprints (or other values), in order."""
+
+    return hashlib.sha256("|".join(str(item) for item in items).encode()).hexdigest()
+
+
+def find_previous_export_manifest(export_dir, base_name):
+    """Return the export manifest of the previous run as dict, or None."""
+
+    export_dir = Path(export_dir)
+    manifest_name = f"{base_name}{EXPORT_MANIFEST_SUFFIX}"
+
+    candidates = [export_dir / manifest_name]
+    if export_dir.parent.is_dir():
+        siblings = [
+            path / manifest_name
+            for path in export_dir.parent.glob(f"{base_name}_run_*")
+            if path.resolve() != export_dir.resolve()
+        ]
+        candidates += sorted(
+            (path for path in siblings if path.exists()),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True,
+        )
+
+    for candidate in candidates:
+        if candidate.exists():
+            try:
+                with candidate.open("r", encoding="utf-8") as handle:
+                    return json.load(handle)
+            except (OSError, json.JSONDecodeError) as exc:
+                _logger.warning(
+                    f"Ignoring unreadable export manifest {candidate}: {exc}"
+                )
+    return None
+
+
+def link_or_copy(source, destination):
+    """Hard-link ``source`` to ``destination``, falling back to a symlink or copy."""
+
+    source = Path(source).resolve()
+    destination = Path(destination)
+    if destination.exists() and destination.resolve() == source:
+        return
+    if destination.exists() or destination.is_symlink():
+        destination.unlink()
+    try:
+        os.link(source, destination)
+    except OSError:
+        try:
+            os.symlink(source, destination)
+        except OSError:
+            shutil.copy2(source, destination)
+
+
+def unlink_outputs(destinations):
+    """Remove existing files at ``destinations`` before writing new ones.
+
+    A destination may be hard-linked to the previous run, never write through it.
+    """
+
+    for destination in destinations.values():
+        if destination.exists() or destination.is_symlink():
+            destination.unlink()
+
+
+def reuse_previous(previous_entry, fingerprint, destinations):
+    """Link the previous files to ``destinations`` if the fingerprint matches."""
+
+    if previous_entry is None or previous_entry.get("fingerprint") != fingerprint:
+        return False
+
+    previous_files = previous_entry.get("files", {})
+    sources = {}
+    for key, destination in destinations.items():
+        source = previous_files.get(key)
+        if source is None or not Path(source).exists():
+            return False
+        sources[key] = source
+
+    for key, destination in destinations.items():
+        link_or_copy(sources[key], destination)
+    return True
+
+
+def output_entry(fingerprint, destinations, reused):
+    """The manifest entry of files written (or reused) at ``destinations``."""
+
+    return {
+        "fingerprint": fingerprint,
+        "files": {key: str(path.resolve()) for key, path in destinations.items()},
+        "status": STATUS_UNCHANGED if reused else STATUS_CHANGED,
+    }
+
+
+def arrange_and_export_incremental(
+    parts,
+    *,
+    prod_gap=1.0,
+    bed_width=200.0,
+    script_file=None,
+    export_directory=None,
+    prod=False,
+    process_data=None,
+    max_build_height=None,
+    verbose=False,
+    export_step=False,
+    export_obj=True,
+    bed_depth=None,
+    pack_plates=False,
+    allow_rotation=True,
+):
+    """Arrange parts like ``arrange_and_export`` and export only what changed.
+
+    Honors the same ``SHELLFORGEPY_*`` environment variables as
+    ``arrange_and_export``. ``process_data`` may also be a ProcessProfile,
+    it is resolved (and validated) here.
+
+    With ``pack_plates``, production parts are packed onto as many
+    ``bed_width`` x ``bed_depth`` plates as needed (see ``plate_packing``),
+    turned by 90° about Z where that packs better if ``allow_rotation``. The
+    first plate is exported as the assembly, further ones as
+    ``<stem>_plate<n>.stl``, and the export manifest lists them under
+    ``plates``.
+
+    Returns:
+        Path of the exported assembly STL
+    """
+
+    # imported here, so reading manifests (e.g. from slice_queue) stays CAD free
+    from shellforgepy.adapters._adapter import export_colored_parts_to_obj
+
+    # shellforgepy's own arrangement and file naming, so outputs match arrange_and_export
+    from shellforgepy.produce.arrange_and_export import (
+        DEFAULT_PART_COLORS,
+        _arrange_parts_for_production,
+        _safe_name,
+    )
+    from shellforgepy.simple import (
+        PartList,
+        export_solid_to_step,
+        export_solid_to_stl,
+        translate,
+    )
+
+    env_export_dir = os.environ.get("SHELLFORGEPY_EXPORT_DIR")
+    if env_export_dir:
+        export_directory = env_export_dir
+
+    env_prod = os.environ.get("SHELLFORGEPY_PRODUCTION")
+    if env_prod is not None:
+        prod = env_prod == "1"
+
+    viewer_base_url = os.environ.get("SHELLFORGEPY_VIEWER_BASE_URL")
+    workflow_manifest_env = os.environ.get("SHELLFORGEPY_WORKFLOW_MANIFEST")
+    workflow_manifest_path = (
+        Path(workflow_manifest_env).expanduser() if workflow_manifest_env else None
+    )
+
+    if isinstance(parts, PartList):
+        parts = parts.as_list()
+    parts_list = [dict(item) for item in parts]
+
+    if prod:
+        parts_list = [p for p in parts_list if not p.get("skip_in_production", False)]
+    if not parts_list:
+        raise ValueError("No parts provided for arrangement and export")
+
+    packing = None
+    if prod and pack_plates:
+        plates, packing = pack_parts_for_production(
+            parts_list,
+            gap=prod_gap,
+            bed_width=bed_width,
+            bed_depth=bed_depth,
+            allow_rotation=allow_rotation,
+            max_build_height=max_build_height,
+        )
+        parts_list = [
+            dict(entry, plate=plate)
+            for plate, plate_parts in enumerate(plates)
+            for entry in plate_parts
+        ]
+    elif prod:
+        parts_list = _arrange_parts_for_production(
+            parts_list,
+            gap=prod_gap,
+            bed_width=bed_width,
+            bed_depth=bed_depth,
+            max_build_height=max_build_height,
+            verbose=verbose,
+        )
+
+    names = [str(entry["name"]) for entry in parts_list]
+    shapes = [entry["part"] for entry in parts_list]
+    plate_of = [entry.get("plate", 0) for entry in parts_list]
+    colors = [
+        tuple(entry.get("color") or DEFAULT_PART_COLORS[i % len(DEFAULT_PART_COLORS)])
+        for i, entry in enumerate(parts_list)
+    ]
+
+    export_dir = Path(export_directory) if export_directory is not None else Path.home()
+    export_dir = export_dir.expanduser()
+    export_dir.mkdir(parents=True, exist_ok=True)
+
+    base_name = Path(script_file or "cadquery_parts").stem or "cadquery_parts"
+    previous = find_previous_export_manifest(export_dir, base_name) or {}
+    previous_parts = previous.get("parts", {})
+
+    manifest = {
+        "script_file": str(script_file),
+        "export_dir": str(export_dir.resolve()),
+        "parts": {},
+    }
+
+    fingerprints = []
+    for name, shape in zip(names, shapes):
+        fingerprint = geometry_fingerprint(shape)
+        fingerprints.append(fingerprint)
+
+        destinations = {".stl": export_dir / f"{base_name}_{_safe_name(name)}.stl"}
+        if export_step:
+            destinations[".step"] = destinations[".stl"].with_suffix(".step")
+
+        reused = reuse_previous(previous_parts.get(name), fingerprint, destinations)
+        if reused:
+            _logger.info(f"{name} unchanged, linked {destinations['.stl']}")
+        else:
+            _logger.info(f"Exporting {name} to {destinations['.stl']}")
+            unlink_outputs(destinations)
+            export_solid_to_stl(
+                shape,
+                destinations[".stl"],
+                tolerance=EXPORT_TOLERANCE,
+                angular_tolerance=EXPORT_ANGULAR_TOLERANCE,
+            )
+            if export_step:
+                export_solid_to_step(shape, destinations[".step"])
+
+        manifest["parts"][name] = output_entry(fingerprint, destinations, reused)
+
+    assembly_path = export_dir / f"{base_name}.stl"
+    previous_plates = {plate["name"]: plate for plate in previous.get("plates", [])}
+    plate_entries = []
+    for plate in range(max(plate_of) + 1):
+        members = [i for i, p in enumerate(plate_of) if p == plate]
+        plate_name = base_name if plate == 0 else f"{base_name}_plate{plate + 1}"
+        plate_path = export_dir / f"{plate_name}.stl"
+        plate_destinations = {".stl": plate_path}
+        if export_step:
+            plate_destinations[".step"] = plate_path.with_suffix(".step")
+        plate_fingerprint = combined_fingerprint(*(fingerprints[i] for i in members))
+
+        previous_plate = (
+            previous.get("assembly") if plate == 0 else previous_plates.get(plate_name)
+        )
+        plate_reused = reuse_previous(
+            previous_plate, plate_fingerprint, plate_destinations
+        )
+        if plate_reused:
+            _logger.info(f"{plate_name} unchanged, linked {plate_path}")
+        else:
+            unlink_outputs(plate_destinations)
+            fused_collector = TreeCollector()
+            for i in members:
+                fused_collector.fuse(shapes[i])
+            export_solid_to_stl(
+                fused_collector.part,
+                plate_path,
+                tolerance=EXPORT_TOLERANCE,
+                angular_tolerance=EXPORT_ANGULAR_TOLERANCE,
+            )
+            if export_step:
+                export_solid_to_step(fused_collector.part, plate_destinations[".step"])
+            _logger.info(f"Exported {plate_name} to {plate_path}")
+        entry = output_entry(plate_fingerprint, plate_destinations, plate_reused)
+        if plate == 0:
+            manifest["assembly"] = entry
+            assembly_reused = plate_reused
+        plate_entries.append(
+            dict(entry, name=plate_name, parts=[names[i] for i in members])
+        )
+
+    if packing is not None:
+        for entry, utilization in zip(plate_entries, packing.utilizations):
+            entry["utilization"] = round(float(utilization), 4)
+        manifest["plates"] = plate_entries
+
+    if export_obj:
+        obj_path = export_dir / f"{base_name}.obj"
+        obj_destinations = {".obj": obj_path, ".mtl": obj_path.with_suffix(".mtl")}
+        obj_fingerprint = combined_fingerprint(
+            *zip(fingerprints, names, colors, plate_of)
+        )
+
+        obj_reused = reuse_previous(
+            previous.get("obj"), obj_fingerprint, obj_destinations
+        )
+        if obj_reused:
+            _logger.info(f"Colored OBJ unchanged, linked {obj_path}")
+        else:
+            unlink_outputs(obj_destinations)
+            # packed plates side by side along x
+            preview_shapes = [
+                (
+                    translate(plate * (bed_width + PLATE_PREVIEW_SPACING), 0, 0)(shape)
+                    if plate
+                    else shape
+                )
+                for shape, plate in zip(shapes, plate_of)
+            ]
+            export_colored_parts_to_obj(
+                list(zip(preview_shapes, names, colors)),
+                str(obj_path),
+                tolerance=EXPORT_TOLERANCE,
+                angular_tolerance=EXPORT_ANGULAR_TOLERANCE,
+            )
+            _logger.info(f"Exported colored OBJ to {obj_path}")
+        manifest["obj"] = output_entry(obj_fingerprint, obj_destinations, obj_reused)
+
+    process_filename = None
+    if isinstance(process_data, ProcessProfile):
+        process_data = process_data.resolve()
+    if process_data is not None:
+        process_data["part_file"] = assembly_path.resolve().as_posix()
+        process_filename = assembly_path.with_name(f"{assembly_path.stem}_process.json")
+        with process_filename.open("w", encoding="utf-8") as handle:
+            json.dump(process_data, handle, indent=4)
+        _logger.info(f"Exported process data to {process_filename}")
+
+    changed = [n for n, e in manifest["parts"].items() if e["status"] == STATUS_CHANGED]
+    _logger.info(
+        f"{len(changed)} of {len(names)} parts changed"
+        + (f": {', '.join(changed)}" if changed else "")
+    )
+
+    export_manifest_path = export_dir / f"{base_name}{EXPORT_MANIFEST_SUFFIX}"
+    with export_manifest_path.open("w", encoding="utf-8") as handle:
+        json.dump(manifest, handle, indent=2, sort_keys=True)
+
+    if workflow_manifest_path is not None:
+        workflow_manifest = {
+            "run_id": os.environ.get("SHELLFORGEPY_RUN_ID"),
+            "script_file": str(script_file),
+            "parts": [],
+            "export_dir": str(export_dir.resolve()),
+            "part_files": [],
+            "changed_part_files": [],
+            "unchanged_part_files": [],
+            "assembly_path": str(assembly_path.resolve()),
+            "assembly_changed": not assembly_reused,
+            "plate_paths": [entry["files"][".stl"] for entry in plate_entries],
+            "export_manifest_path": str(export_manifest_path.resolve()),
+        }
+        for entry in manifest["parts"].values():
+            part_file = entry["files"][".stl"]
+            workflow_manifest["part_files"].append(part_file)
+            workflow_manifest[f"{entry['status']}_part_files"].append(part_file)
+        if export_obj:
+            workflow_manifest["obj_path"] = manifest["obj"]["files"][".obj"]
+            workflow_manifest["mtl_path"] = manifest["obj"]["files"][".mtl"]
+            if viewer_base_url:
+                workflow_manifest["viewer_url"] = (
+                    f"{viewer_base_url.rstrip('/')}/?file={obj_path.name}"
+                )
+        if process_filename is not None:
+            workflow_manifest["process_data_path"] = str(process_filename.resolve())
+
+        workflow_manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        with workflow_manifest_path.open("w", encoding="utf-8") as handle:
+            json.dump(workflow_manifest, handle, indent=2, sort_keys=True)
+        _logger.info(f"Wrote workflow manifest to {workflow_manifest_path}")
+
+    return assembly_path
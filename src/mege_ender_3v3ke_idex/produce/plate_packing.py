@@ -0,0 +1,265 @@
+"""
+Packing production parts onto as few plates as possible.
+
+shellforgepy's production arrangement puts parts into shelf rows on a single
+bed. For print farm runs ``pack_parts_for_production`` instead packs the 2D
+footprints of the parts, taken after their flip and
+``prod_rotation_angle``/``prod_rotation_axis`` rotations, with a maximal
+rectangles bin packer: every plate keeps the list of maximal free rectangles,
+a part goes to the first plate where it fits, into the free rectangle that
+leaves the shortest side over (optionally also turned by 90° about Z), and a
+new plate is started when no plate has room. The free rectangles of a plate
+are numpy arrays, so splitting and pruning them stays fast for hundreds of
+parts.
+
+``pack_rectangles`` is the packer on plain footprints, it does not need a
+CAD backend.
+
+Usage:
+    plates, packing = pack_parts_for_production(
+        parts.as_list(), gap=4, bed_width=220, bed_depth=220
+    )
+    _logger.info(packing.summary())
+"""
+
+import logging
+from dataclasses import dataclass
+
+import numpy as np
+
+_logger = logging.getLogger(__name__)
+
+_EPSILON = 1e-9
+
+
+@dataclass(frozen=True)
+class Footprint:
+    """Bed footprint of a part, dimensions in mm."""
+
+    name: str
+    width: float  # along x
+    depth: float  # along y
+
+
+@dataclass(frozen=True)
+class Placement:
+    """Where a footprint went, ``x``/``y`` is its lower left corner."""
+
+    name: str
+    plate: int
+    x: float
+    y: float
+    width: float  # as placed, i.e. after a rotation
+    depth: float
+    rotated: bool  # turned by 90° about Z
+
+
+@dataclass(frozen=True)
+class PackingResult:
+    placements: tuple
+    plate_count: int
+    bed_width: float
+    bed_depth: float
+
+    @property
+    def utilizations(self):
+        """Fraction of each plate's area covered by part footprints."""
+
+        used = np.zeros(self.plate_count)
+        for placement in self.placements:
+            used[placement.plate] += placement.width * placement.depth
+        return used / (self.bed_width * self.bed_depth)
+
+    def plate_placements(self, plate):
+        return [p for p in self.placements if p.plate == plate]
+
+    def summary(self):
+        utilizations = ", ".join(f"{u:.0%}" for u in self.utilizations)
+        return (
+            f"{len(self.placements)} parts on {self.plate_count} plates of "
+            f"{self.bed_width:g} x {self.bed_depth:g} mm, utilization {utilizations}"
+        )
+
+
+def _split_free_rectangles(free, x, y, width, depth):
+    """Free rectangles (k, 4) as x, y, width, depth after occupying a rectangle."""
+
+    fx, fy, fw, fd = free.T
+    hit = (x < fx + fw) & (x + width > fx) & (y < fy + fd) & (y + depth > fy)
+    # the parts of every overlapped rectangle left, right, in front and behind
+    fx, fy, fw, fd = free[hit].T
+    pieces = np.concatenate(
+        [
+            np.column_stack([fx, fy, x - fx, fd]),
+            np.column_stack([np.full_like(fx, x + width), fy, fx + fw - x - width, fd]),
+            np.column_stack([fx, fy, fw, y - fy]),
+            np.column_stack([fx, np.full_like(fy, y + depth), fw, fy + fd - y - depth]),
+        ]
+    )
+    pieces = pieces[(pieces[:, 2] > _EPSILON) & (pieces[:, 3] > _EPSILON)]
+    free = np.concatenate([free[~hit], pieces])
+
+    # drop rectangles inside another one, of equal ones keep the first
+    x0, y0 = free[:, 0], free[:, 1]
+    x1, y1 = x0 + free[:, 2], y0 + free[:, 3]
+    contains = (
+        (x0[:, None] <= x0[None] + _EPSILON)
+        & (y0[:, None] <= y0[None] + _EPSILON)
+        & (x1[:, None] >= x1[None] - _EPSILON)
+        & (y1[:, None] >= y1[None] - _EPSILON)
+    )
+    np.fill_diagonal(contains, False)
+    contains &= ~(contains.T & np.triu(np.ones_like(contains), 1).T)
+    return free[~contains.any(axis=0)]
+
+
+def _best_fit(free, width, depth):
+    """(short side left over, long side left over, index) of the best rectangle."""
+
+    short = np.minimum(free[:, 2] - width, free[:, 3] - depth)
+    long = np.maximum(free[:, 2] - width, free[:, 3] - depth)
+    fits = short >= -_EPSILON
+    if not fits.any():
+        return None
+    candidates = np.flatnonzero(fits)
+    index = candidates[np.lexsort((long[candidates], short[candidates]))[0]]
+    return short[index], long[index], index
+
+
+def pack_rectangles(footprints, bed_width, bed_depth, gap=0.0, allow_rotation=True):
+    """Pack footprints onto as few ``bed_width`` x ``bed_depth`` plates as possible.
+
+    Args:
+        footprints: Footprint sequence
+        gap: Minimal distance between parts on a plate
+        allow_rotation: Whether parts may be turned by 90° about Z
+
+    Raises:
+        ValueError: If a footprint does not fit onto an empty plate
+    """
+
+    # a gap on the far side of every part, the bed grows by one gap to match
+    bed = (bed_width + gap, bed_depth + gap)
+    plates = []
+    placements = []
+
+    for footprint in sorted(
+        footprints, key=lambda f: (-f.width * f.depth, -max(f.width, f.depth))
+    ):
+        orientations = [(footprint.width, footprint.depth, False)]
+        if allow_rotation and abs(footprint.width - footprint.depth) > _EPSILON:
+            orientations.append((footprint.depth, footprint.width, True))
+        if not any(
+            w <= bed_width + _EPSILON and d <= bed_depth + _EPSILON
+            for w, d, _ in orientations
+        ):
+            raise ValueError(
+                f"Part '{footprint.name}' ({footprint.width:.1f} x "
+                f"{footprint.depth:.1f} mm) does not fit onto a "
+                f"{bed_width:g} x {bed_depth:g} mm plate"
+            )
+
+        for plate, free in enumerate(plates + [np.array([[0.0, 0.0, *bed]])]):
+            fits = [
+                (fit, width, depth, rotated)
+                for width, depth, rotated in orientations
+                if (fit := _best_fit(free, width + gap, depth + gap)) is not None
+            ]
+            if fits:
+                break
+        (_, _, index), width, depth, rotated = min(fits, key=lambda f: f[0][:2])
+        x, y = free[index, :2]
+        if plate == len(plates):
+            plates.append(free)
+        plates[plate] = _split_free_rectangles(
+            plates[plate], x, y, width + gap, depth + gap
+        )
+        placements.append(
+            Placement(footprint.name, plate, float(x), float(y), width, depth, rotated)
+        )
+
+    return PackingResult(
+        placements=tuple(placements),
+        plate_count=len(plates),
+        bed_width=bed_width,
+        bed_depth=bed_depth,
+    )
+
+
+def pack_parts_for_production(
+    parts_list,
+    *,
+    gap,
+    bed_width,
+    bed_depth=None,
+    allow_rotation=True,
+    max_build_height=None,
+):
+    """Pack production parts onto plates.
+
+    Args:
+        parts_list: Part dicts as in ``PartList.as_list()``
+        gap: Minimal distance between parts
+        bed_depth: Default is a square bed
+        allow_rotation: Whether parts may be turned by 90° about Z
+        max_build_height: Raise if a part is higher after its rotations
+
+    Returns:
+        (plates, PackingResult): ``plates`` holds one list of
+        ``{"name", "part", "color"}`` dicts per plate, the parts centered on
+        the bed like shellforgepy's arrangement does
+    """
+
+    from shellforgepy.construct.alignment_operations import rotate_part, translate
+    from shellforgepy.simple import get_bounding_box
+
+    bed_depth = bed_depth or bed_width
+    entries = {}
+    footprints = []
+    for entry in parts_list:
+        shape = entry["part"]
+        if entry.get("flip", False):
+            shape = rotate_part(shape, angle=180, axis=(0, 1, 0))
+        if (
+            entry.get("prod_rotation_angle") is not None
+            and entry.get("prod_rotation_axis") is not None
+        ):
+            shape = rotate_part(
+                shape,
+                angle=entry["prod_rotation_angle"],
+                axis=entry["prod_rotation_axis"],
+            )
+        (x0, y0, z0), (x1, y1, z1) = get_bounding_box(shape)
+        if max_build_height is not None and z1 - z0 > max_build_height:
+            raise ValueError(
+                f"Part {entry['name']} exceeds max_build_height "
+                f"({max_build_height} mm)"
+            )
+        name = str(entry["name"])
+        if name in entries:
+            raise ValueError(f"Duplicate part name {name}")
+        entries[name] = (translate(-x0, -y0, -z0)(shape), entry.get("color"))
+        footprints.append(Footprint(name, x1 - x0, y1 - y0))
+
+    packing = pack_rectangles(footprints, bed_width, bed_depth, gap, allow_rotation)
+
+    plates = []
+    for plate in range(packing.plate_count):
+        placements = packing.plate_placements(plate)
+        used_width = max(p.x + p.width for p in placements)
+        used_depth = max(p.y + p.depth for p in placements)
+        offset_x = (bed_width - used_width) / 2
+        offset_y = (bed_depth - used_depth) / 2
+
+        arranged = []
+        for placement in placements:
+            shape, color = entries[placement.name]
+            if placement.rotated:
+                # turn about the Z axis and back into the first quadrant
+                shape = translate(placement.width, 0, 0)(rotate_part(shape, 90))
+            shape = translate(placement.x + offset_x, placement.y + offset_y, 0)(shape)
+            arranged.append({"name": placement.name, "part": shape, "color": color})
+        plates.append(arranged)
+
+    _logger.info(packing.summary())
+    return plates, packing
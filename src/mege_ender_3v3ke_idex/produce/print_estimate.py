@@ -0,0 +1,271 @@
+"""
+Print time and material estimates.
+
+Estimates how long a part takes to print and how much filament it needs from
+its tessellated mesh and the process data, without running the slicer. The
+mesh is sectioned at the center of every layer in one vectorized pass (see
+``Mesh.sections``), which gives the wall length and the enclosed area of each
+layer. Walls, solid skins and sparse infill are derived from those, and every
+feature is printed at its configured speed, capped by
+``filament_max_volumetric_speed``.
+
+The model ignores travel moves, acceleration and cooling slowdowns beyond a
+flat ``travel_overhead`` factor, so expect the slicer to differ by 10-20 %.
+It is meant for comparing variants and profiles, e.g. in a parameter sweep.
+
+Usage:
+    estimate = estimate_print(mount_plate, PROCESS_DATA)
+    print(estimate.summary())
+"""
+
+import logging
+import math
+from dataclasses import dataclass
+
+import numpy as np
+from mege_ender_3v3ke_idex.geometry.mesh import tessellate_part
+from mege_ender_3v3ke_idex.produce.process_profiles import ProcessProfile
+
+_logger = logging.getLogger(__name__)
+
+FILAMENT_DIAMETER = 1.75
+
+# substring of the filament name -> density in g/cm³, first match wins
+FILAMENT_DENSITIES = (
+    ("PETGCF", 1.30),
+    ("PETG-CF", 1.30),
+    ("PETG", 1.27),
+    ("ASA", 1.07),
+    ("ABS", 1.04),
+    ("TPU", 1.21),
+    ("PLA", 1.24),
+)
+DEFAULT_FILAMENT_DENSITY = 1.24
+
+# process override defaults for keys a profile does not set (OrcaSlicer-like)
+DEFAULT_PROCESS_VALUES = {
+    "nozzle_diameter": 0.4,
+    "layer_height": 0.2,
+    "wall_loops": 2,
+    "top_shell_layers": 4,
+    "bottom_shell_layers": 3,
+    "sparse_infill_density": 15,
+    "outer_wall_speed": 60,
+    "inner_wall_speed": 100,
+    "sparse_infill_speed": 150,
+    "solid_infill_speed": 120,
+    "initial_layer_speed": 30,
+}
+
+
+@dataclass(frozen=True)
+class PrintEstimate:
+    """Geometry, material and time estimate of one or more parts."""
+
+    volume: float  # mm³ of the solid
+    surface_area: float  # mm²
+    layer_count: int
+    perimeter_lengths: np.ndarray  # mm of outline per layer
+    extruded_volume: float  # mm³ of plastic, walls plus skins plus infill
+    print_time: float  # seconds
+    filament_density: float  # g/cm³
+
+    @property
+    def filament_length(self):
+        """Filament length in mm."""
+        return self.extruded_volume / (math.pi * (FILAMENT_DIAMETER / 2) ** 2)
+
+    @property
+    def filament_mass(self):
+        """Filament mass in g."""
+        return self.extruded_volume / 1000 * self.filament_density
+
+    def __add__(self, other):
+        return PrintEstimate(
+            volume=self.volume + other.volume,
+            surface_area=self.surface_area + other.surface_area,
+            layer_count=max(self.layer_count, other.layer_count),
+            perimeter_lengths=_padded_sum(
+                self.perimeter_lengths, other.perimeter_lengths
+            ),
+            extruded_volume=self.extruded_volume + other.extruded_volume,
+            print_time=self.print_time + other.print_time,
+            filament_density=self.filament_density,
+        )
+
+    def summary(self):
+        hours, rest = divmod(int(round(self.print_time)), 3600)
+        return (
+            f"{self.layer_count} layers, {hours}h{rest // 60:02d}m, "
+            f"{self.filament_mass:.1f} g / {self.filament_length / 1000:.2f} m filament "
+            f"(volume {self.volume / 1000:.1f} cm³, area {self.surface_area / 100:.1f} cm²)"
+        )
+
+
+def _padded_sum(a, b):
+    result = np.zeros(max(len(a), len(b)))
+    result[: len(a)] += a
+    result[: len(b)] += b
+    return result
+
+
+def _process_value(overrides, key, fallback_key=None):
+    value = overrides.get(key)
+    if value is None and fallback_key is not None:
+        value = overrides.get(fallback_key)
+    if value is None:
+        value = DEFAULT_PROCESS_VALUES[fallback_key or key]
+    if isinstance(value, str):
+        value = value.strip().rstrip("%")
+    return float(value)
+
+
+def filament_density(filament_name):
+    name = (filament_name or "").upper()
+    for marker, density in FILAMENT_DENSITIES:
+        if marker in name:
+            return density
+    return DEFAULT_FILAMENT_DENSITY
+
+
+def _sliding_min(values, window, pad_before):
+    """Minimum of the ``window`` neighbours above (or below) each entry."""
+
+    if window <= 0:
+        return np.full(len(values), np.inf)
+    padded = np.zeros(len(values) + window)
+    if pad_before:
+        padded[window:] = values
+        return np.lib.stride_tricks.sliding_window_view(padded, window)[:-1].min(axis=1)
+    padded[:-window] = values
+    return np.lib.stride_tricks.sliding_window_view(padded, window)[1:].min(axis=1)
+
+
+def estimate_print(part, process_data, travel_overhead=0.1):
+    """Estimate print time and filament use of a part.
+
+    Args:
+        part: A shape, or a LeaderFollowersCuttersPart (its leader is estimated)
+        process_data: Process data dict or ProcessProfile
+        travel_overhead: Fraction of extrusion time added for travel moves
+    """
+
+    if isinstance(process_data, ProcessProfile):
+        process_data = process_data.resolve()
+    overrides = process_data.get("process_overrides", {})
+
+    nozzle = _process_value(overrides, "nozzle_diameter")
+    layer_height = _process_value(overrides, "layer_height")
+    line_width = float(overrides.get("line_width", nozzle * 1.125))
+    outer_width = float(overrides.get("outer_wall_line_width", line_width))
+    inner_width = float(overrides.get("inner_wall_line_width", line_width))
+    wall_loops = int(_process_value(overrides, "wall_loops"))
+    top_layers = int(_process_value(overrides, "top_shell_layers"))
+    bottom_layers = int(_process_value(overrides, "bottom_shell_layers"))
+    infill_density = _process_value(overrides, "sparse_infill_density") / 100
+
+    max_flow = float(overrides.get("filament_max_volumetric_speed", math.inf))
+
+    def speed(key, fallback_key=None, width=line_width):
+        return min(
+            _process_value(overrides, key, fallback_key),
+            max_flow / (width * layer_height),
+        )
+
+    outer_speed = speed("outer_wall_speed", width=outer_width)
+    inner_speed = speed("inner_wall_speed", width=inner_width)
+    sparse_speed = speed("sparse_infill_speed")
+    solid_speed = speed("internal_solid_infill_speed", "solid_infill_speed")
+    initial_speed = speed("initial_layer_speed")
+
+    mesh = tessellate_part(part)
+    z_min, z_max = mesh.bounds[0][2], mesh.bounds[1][2]
+    layer_count = max(int(math.ceil((z_max - z_min) / layer_height - 1e-6)), 0)
+    z_levels = z_min + (np.arange(layer_count) + 0.5) * layer_height
+    perimeters, areas = mesh.sections(z_levels)
+
+    # walls are stacked inwards, but never more than fit into the section
+    full_wall_band = outer_width + (wall_loops - 1) * inner_width if wall_loops else 0
+    wall_band = np.minimum(
+        full_wall_band,
+        np.divide(areas, perimeters, out=np.zeros_like(areas), where=perimeters > 0),
+    )
+    fitted_loops = wall_band / full_wall_band * wall_loops if wall_loops else wall_band
+    outer_length = perimeters * np.minimum(fitted_loops, 1)
+    inner_length = perimeters * np.maximum(fitted_loops - 1, 0)
+    interior = np.maximum(areas - perimeters * wall_band, 0)
+
+    # skins: interior area not covered by all top (or bottom) shell layers
+    exposed_top = np.maximum(interior - _sliding_min(interior, top_layers, False), 0)
+    exposed_bottom = np.maximum(
+        interior - _sliding_min(interior, bottom_layers, True), 0
+    )
+    solid = np.minimum(interior, exposed_top + exposed_bottom)
+    sparse = interior - solid
+
+    solid_length = solid / line_width
+    sparse_length = sparse * infill_density / line_width
+
+    layer_times = (
+        outer_length / outer_speed
+        + inner_length / inner_speed
+        + solid_length / solid_speed
+        + sparse_length / sparse_speed
+    )
+    if layer_count:
+        first_layer_length = (
+            outer_length[0] + inner_length[0] + solid_length[0] + sparse_length[0]
+        )
+        layer_times[0] = first_layer_length / initial_speed
+
+    extruded_volume = layer_height * float(
+        np.sum(
+            outer_length * outer_width
+            + inner_length * inner_width
+            + (solid_length + sparse_length) * line_width
+        )
+    )
+
+    return PrintEstimate(
+        volume=mesh.volume(),
+        surface_area=mesh.surface_area(),
+        layer_count=layer_count,
+        perimeter_lengths=perimeters,
+        extruded_volume=extruded_volume,
+        print_time=float(layer_times.sum()) * (1 + travel_overhead),
+        filament_density=filament_density(process_data.get("filament")),
+    )
+
+
+def estimate_plate(parts, process_data, travel_overhead=0.1):
+    """Summed estimate of all parts of a plate.
+
+    Parts are estimated in the orientation they are given in, pass the
+    arranged production parts to estimate flipped or rotated parts.
+
+    Args:
+        parts: Shapes, a PartList, or dicts with a ``"part"`` key
+    """
+
+    if isinstance(process_data, ProcessProfile):
+        process_data = process_data.resolve()
+
+    shapes = []
+    for entry in parts:
+        if isinstance(entry, dict):
+            if not entry.get("skip_in_production", False):
+                shapes.append(entry["part"])
+        elif hasattr(entry, "skip_in_production"):
+            if not entry.skip_in_production:
+                shapes.append(entry.part)
+        else:
+            shapes.append(entry)
+    if not shapes:
+        raise ValueError("No parts to estimate")
+
+    total = None
+    for shape in shapes:
+        estimate = estimate_print(shape, process_data, travel_overhead=travel_overhead)
+        total = estimate if total is None else total + estimate
+    _logger.info(f"Plate estimate: {total.summary()}")
+    return total
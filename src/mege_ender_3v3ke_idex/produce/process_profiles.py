@@ -0,0 +1,353 @@
+"""
+Process profiles for slicing.
+
+A ProcessProfile describes process data (filament plus OrcaSlicer process
+overrides) as a base profile and a stack of layers on top of it: plain
+override dicts, or transforms such as ``augment_with_layer_height``. Profiles
+are immutable and cheap to define at import time. The base is only imported
+and the layers are only applied on ``resolve()``. Resolved dicts are memoized
+by the profile's content hash and validated once: override values must have
+sane types and numeric ranges, and unknown keys are reported since the
+settings generator silently drops keys the master settings do not have.
+
+``volumetric_flows()`` derives line width x layer height x speed for every
+extrusion feature and compares it with ``filament_max_volumetric_speed``, so
+a speed the hotend cannot melt for is flagged when the profile is resolved.
+
+Usage:
+    SINGLE_WALL = PLA_08_HS.with_overrides({"wall_loops": "1"}).with_transform(
+        "mege_3devops.process_data.mender3.process_data_utils:augment_with_layer_height",
+        layer_height_factor=0.9,
+    )
+    arrange_and_export_incremental(..., process_data=SINGLE_WALL)
+"""
+
+import copy
+import dataclasses
+import difflib
+import hashlib
+import importlib
+import json
+import logging
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+_logger = logging.getLogger(__name__)
+
+# content hash -> resolved process data
+_resolved_profiles = {}
+
+# Numeric process override keys and their plausible (min, max) range
+PROCESS_OVERRIDE_RANGES = {
+    "nozzle_diameter": (0.1, 2.0),
+    "layer_height": (0.04, 1.2),
+    "min_layer_height": (0.04, 1.2),
+    "max_layer_height": (0.04, 1.2),
+    "initial_layer_print_height": (0.04, 1.2),
+    "line_width": (0.1, 2.5),
+    "outer_wall_line_width": (0.1, 2.5),
+    "inner_wall_line_width": (0.1, 2.5),
+    "thin_wall_line_width": (0.1, 2.5),
+    "top_surface_line_width": (0.1, 2.5),
+    "gap_fill_line_width": (0.1, 2.5),
+    "initial_layer_line_width": (0.1, 2.5),
+    "sparse_infill_line_width": (0.1, 2.5),
+    "internal_solid_infill_line_width": (0.1, 2.5),
+    "wall_loops": (0, 100),
+    "bottom_shell_layers": (0, 100),
+    "top_shell_layers": (0, 100),
+    "adaptive_layer_height": (0, 1),
+    "outer_wall_speed": (1, 1000),
+    "external_perimeter_speed": (1, 1000),
+    "inner_wall_speed": (1, 1000),
+    "solid_infill_speed": (1, 1000),
+    "internal_solid_infill_speed": (1, 1000),
+    "sparse_infill_speed": (1, 1000),
+    "top_surface_speed": (1, 1000),
+    "gap_fill_speed": (1, 1000),
+    "gap_infill_speed": (1, 1000),
+    "initial_layer_speed": (1, 1000),
+    "initial_layer_infill_speed": (1, 1000),
+    "bridge_speed": (1, 1000),
+    "overhang_1_4_speed": (0, 1000),
+    "overhang_2_4_speed": (0, 1000),
+    "overhang_3_4_speed": (0, 1000),
+    "overhang_4_4_speed": (0, 1000),
+    "outer_wall_acceleration": (0, 50000),
+    "outer_wall_jerk": (0, 100),
+    "filament_max_volumetric_speed": (0.5, 100),
+    "nozzle_temperature": (150, 350),
+    "nozzle_temperature_initial_layer": (150, 350),
+    "fan_min_speed": (0, 100),
+    "fan_max_speed": (0, 100),
+    "overhang_fan_speed": (0, 100),
+    "fan_cooling_layer_time": (0, 1000),
+    "min_layer_time": (0, 1000),
+    "slow_down_for_layer_cooling": (0, 1),
+    "brim_width": (0, 50),
+    "elefant_foot_compensation": (0, 2),
+    "filament_retraction_length": (0, 15),
+    "filament_retraction_speed": (1, 200),
+    "filament_deretraction_speed": (0, 200),
+    "enable_pressure_advance": (0, 1),
+    "pressure_advance": (0, 2),
+    "enable_support": (0, 1),
+    "support_threshold_angle": (0, 90),
+}
+
+# Non-numeric process override keys used in this repo
+KNOWN_PROCESS_OVERRIDE_KEYS = set(PROCESS_OVERRIDE_RANGES) | {
+    "brim_type",
+    "sparse_infill_density",
+}
+
+# extrusion feature -> (speed key, line width key, layer height key)
+VOLUMETRIC_FLOW_FEATURES = {
+    "outer_wall": ("outer_wall_speed", "outer_wall_line_width", "layer_height"),
+    "inner_wall": ("inner_wall_speed", "inner_wall_line_width", "layer_height"),
+    "sparse_infill": (
+        "sparse_infill_speed",
+        "sparse_infill_line_width",
+        "layer_height",
+    ),
+    "solid_infill": (
+        "solid_infill_speed",
+        "internal_solid_infill_line_width",
+        "layer_height",
+    ),
+    "top_surface": ("top_surface_speed", "top_surface_line_width", "layer_height"),
+    "gap_fill": ("gap_fill_speed", "gap_fill_line_width", "layer_height"),
+    "initial_layer": (
+        "initial_layer_speed",
+        "initial_layer_line_width",
+        "initial_layer_print_height",
+    ),
+}
+
+
+class ProcessProfileError(ValueError):
+    """Raised when a resolved process profile fails validation."""
+
+
+def _resolve_reference(reference):
+    module_name, sep, attribute = reference.partition(":")
+    if not sep or not attribute:
+        raise ValueError(f"Reference '{reference}' must have the form 'module:name'")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def _as_float(value):
+    if isinstance(value, bool):
+        return float(value)
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
+@dataclass(frozen=True)
+class OverrideLayer:
+    """Process overrides applied on top of the layers below."""
+
+    overrides: Tuple[Tuple[str, str], ...]
+
+    def apply(self, process_data):
+        process_data["process_overrides"].update(dict(self.overrides))
+        return process_data
+
+
+@dataclass(frozen=True)
+class TransformLayer:
+    """A ``"module:function"`` applied as ``function(process_data, **kwargs)``."""
+
+    function_ref: str
+    kwargs: Tuple[Tuple[str, object], ...] = ()
+
+    def apply(self, process_data):
+        return _resolve_reference(self.function_ref)(process_data, **dict(self.kwargs))
+
+
+@dataclass(frozen=True)
+class VolumetricFlow:
+    feature: str
+    line_width: float
+    layer_height: float
+    speed: float
+    limit: Optional[float]
+
+    @property
+    def flow(self):
+        """Volumetric flow in mm³/s."""
+        return self.line_width * self.layer_height * self.speed
+
+    @property
+    def exceeds_limit(self):
+        return self.limit is not None and self.flow > self.limit
+
+
+@dataclass(frozen=True)
+class ProcessProfile:
+    """Immutable, lazily resolved process data."""
+
+    base_ref: Optional[str] = None
+    filament: Optional[str] = None
+    layers: Tuple[object, ...] = ()
+
+    @classmethod
+    def from_base(cls, base_ref):
+        """Profile based on a ``"module:PROCESS_DATA_..."`` reference."""
+        return cls(base_ref=base_ref)
+
+    @classmethod
+    def from_dict(cls, process_data):
+        """Profile for an inline process data dict."""
+        unexpected = set(process_data) - {"filament", "process_overrides"}
+        if unexpected:
+            raise ValueError(f"Unexpected process data keys: {sorted(unexpected)}")
+        return cls(filament=process_data.get("filament")).with_overrides(
+            process_data.get("process_overrides", {})
+        )
+
+    def with_overrides(self, overrides=None, **kwargs):
+        merged = dict(overrides or {}, **kwargs)
+        layer = OverrideLayer(overrides=tuple(sorted(merged.items())))
+        return dataclasses.replace(self, layers=self.layers + (layer,))
+
+    def with_transform(self, function_ref, **kwargs):
+        layer = TransformLayer(function_ref=function_ref, kwargs=tuple(kwargs.items()))
+        return dataclasses.replace(self, layers=self.layers + (layer,))
+
+    def with_filament(self, filament):
+        return dataclasses.replace(self, filament=filament)
+
+    def content_hash(self):
+        definition = dataclasses.asdict(self)
+        definition["layer_types"] = [type(layer).__name__ for layer in self.layers]
+        return hashlib.sha256(
+            json.dumps(definition, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
+    def resolve(self):
+        """Return the validated process data as a new dict.
+
+        The result is memoized, callers get a copy they may modify.
+        """
+
+        key = self.content_hash()
+        if key not in _resolved_profiles:
+            _resolved_profiles[key] = self._build()
+        return copy.deepcopy(_resolved_profiles[key])
+
+    def _build(self):
+        if self.base_ref is not None:
+            process_data = copy.deepcopy(_resolve_reference(self.base_ref))
+        else:
+            process_data = {}
+        process_data.setdefault("process_overrides", {})
+
+        for layer in self.layers:
+            process_data = layer.apply(process_data)
+        if self.filament is not None:
+            process_data["filament"] = self.filament
+
+        layer_keys = {
+            key
+            for layer in self.layers
+            if isinstance(layer, OverrideLayer)
+            for key, _ in layer.overrides
+        }
+        validate_process_data(process_data, check_keys=layer_keys)
+        for flow in volumetric_flows(process_data):
+            if flow.exceeds_limit:
+                _logger.warning(
+                    f"{flow.feature} needs {flow.flow:.1f} mm³/s "
+                    f"({flow.line_width} x {flow.layer_height} x {flow.speed} mm/s), "
+                    f"more than filament_max_volumetric_speed {flow.limit}; "
+                    "the slicer will print it slower"
+                )
+        return process_data
+
+
+def validate_process_data(process_data, check_keys=None):
+    """Check filament, override value types and numeric ranges.
+
+    Unknown override keys are only reported if they are in ``check_keys``
+    (all keys if None), so keys of a trusted base profile are not flagged.
+
+    Raises:
+        ProcessProfileError: If the process data is unusable
+    """
+
+    errors = []
+    if not process_data.get("filament"):
+        errors.append("no filament set")
+
+    overrides = process_data.get("process_overrides", {})
+    for key, value in overrides.items():
+        if not isinstance(value, (str, int, float, bool)):
+            errors.append(f"{key}: unsupported value type {type(value).__name__}")
+            continue
+
+        if key in PROCESS_OVERRIDE_RANGES:
+            if isinstance(value, str) and value.endswith("%"):
+                continue
+            number = _as_float(value)
+            low, high = PROCESS_OVERRIDE_RANGES[key]
+            if number is None:
+                errors.append(f"{key}: '{value}' is not a number")
+            elif not low <= number <= high:
+                errors.append(f"{key}: {value} outside of [{low}, {high}]")
+        elif key not in KNOWN_PROCESS_OVERRIDE_KEYS and (
+            check_keys is None or key in check_keys
+        ):
+            suggestions = difflib.get_close_matches(key, KNOWN_PROCESS_OVERRIDE_KEYS)
+            _logger.warning(
+                f"Unknown process override '{key}', it is dropped unless the master "
+                "settings define it"
+                + (f" (did you mean {', '.join(suggestions)}?)" if suggestions else "")
+            )
+
+    if errors:
+        raise ProcessProfileError(
+            "Invalid process data:\n" + "\n".join(f"  {e}" for e in errors)
+        )
+
+
+def volumetric_flows(process_data):
+    """Return the VolumetricFlow of every feature the overrides fully specify.
+
+    Missing feature line widths fall back to ``line_width``.
+    """
+
+    overrides = process_data.get("process_overrides", {})
+    limit = _as_float(overrides.get("filament_max_volumetric_speed"))
+
+    flows = []
+    for feature, (speed_key, width_key, height_key) in VOLUMETRIC_FLOW_FEATURES.items():
+        speed = _as_float(overrides.get(speed_key))
+        line_width = _as_float(overrides.get(width_key, overrides.get("line_width")))
+        layer_height = _as_float(overrides.get(height_key))
+        if not speed or not line_width or not layer_height:
+            continue
+        flows.append(
+            VolumetricFlow(
+                feature=feature,
+                line_width=line_width,
+                layer_height=layer_height,
+                speed=speed,
+                limit=limit,
+            )
+        )
+    return flows
+
+
+PETGCF_04_HS = ProcessProfile.from_base(
+    "mege_3devops.process_data.mender3.process_data_04_high_speed:PROCESS_DATA_PETGCF_04_HS"
+)
+PLA_08_HS = ProcessProfile.from_base(
+    "mege_3devops.process_data.mender3.process_data_08_high_speed:PROCESS_DATA_PLA_08_HS"
+)
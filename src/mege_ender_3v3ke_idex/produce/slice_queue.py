@@ -0,0 +1,355 @@
+"""
+Slicer job queue with result caching.
+
+Slices the plates of an export run with OrcaSlicer, but only those whose
+inputs changed. Every job is keyed by the geometry fingerprint from the
+export manifest (see ``incremental_export.py``), a hash of the process data,
+the filament, the master settings and the slicer executable. G-code and 3MF
+results are stored per key in a cache directory; jobs with a cached result
+are not sliced again, their outputs are linked into the run directory.
+Changed jobs are sliced concurrently in a bounded pool of slicer processes.
+
+By default one job slices the whole plate (the assembly STL). With
+``per_part=True`` every production part is sliced on its own, so a change to
+one flange only re-slices that flange.
+
+Usage:
+    python -m mege_ender_3v3ke_idex.produce.slice_queue runs/x_axis_run_<id>
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from mege_ender_3v3ke_idex.produce.incremental_export import (
+    EXPORT_MANIFEST_SUFFIX,
+    link_or_copy,
+)
+
+_logger = logging.getLogger(__name__)
+
+SLICE_CACHE_DIR_ENV_VAR = "MEGE_IDEX_SLICE_CACHE_DIR"
+DEFAULT_SLICE_CACHE_DIR = Path.home() / ".cache" / "mege_ender_3v3ke_idex" / "slices"
+
+SLICED_DIR_NAME = "sliced"
+SLICE_RESULT_SUFFIXES = (".gcode", ".3mf")
+
+# keys of the process data that do not influence the sliced result
+_VOLATILE_PROCESS_DATA_KEYS = ("part_file",)
+
+
+@dataclass(frozen=True)
+class SlicerSettings:
+    """Where to find OrcaSlicer and its master settings."""
+
+    orca_executable: Path
+    master_settings_dir: Path
+    debug_level: str = "1"
+    env: tuple = ()
+
+    @classmethod
+    def from_workflow_config(cls, config_path=None):
+        """Read the ``orca`` section of the shellforgepy workflow config."""
+
+        # the shellforgepy workflow and slicing modules need Python >= 3.12
+        from shellforgepy.workflow.workflow import get_config_path, load_config
+
+        config = load_config(get_config_path(config_path))
+        orca = config.get("orca", {})
+        if not orca.get("executable") or not orca.get("master_settings_dir"):
+            raise ValueError(
+                "OrcaSlicer not configured, set 'orca.executable' and "
+                "'orca.master_settings_dir' in the shellforgepy config"
+            )
+        return cls(
+            orca_executable=Path(orca["executable"]).expanduser(),
+            master_settings_dir=Path(orca["master_settings_dir"]).expanduser(),
+            debug_level=str(orca.get("debug_level", 1)),
+            env=tuple(
+                sorted(
+                    (str(k), str(v))
+                    for k, v in (orca.get("env") or {}).items()
+                    if v is not None
+                )
+            ),
+        )
+
+    def content_hash(self):
+        hasher = hashlib.sha256(str(self.orca_executable.resolve()).encode("utf-8"))
+        for yaml_file in sorted(self.master_settings_dir.glob("*.yaml")):
+            hasher.update(yaml_file.name.encode("utf-8"))
+            hasher.update(yaml_file.read_bytes())
+        return hasher.hexdigest()
+
+
+@dataclass(frozen=True)
+class SliceJob:
+    """One model to slice with one set of process data."""
+
+    name: str
+    model_path: Path
+    fingerprint: str
+    process_data: dict
+    output_dir: Path
+
+    @property
+    def filament(self):
+        return self.process_data["filament"]
+
+
+@dataclass
+class SliceResult:
+    job: SliceJob
+    output_files: list
+    from_cache: bool
+
+
+def process_data_hash(process_data):
+    """Stable hash of the process data, ignoring run-specific paths."""
+
+    relevant = {
+        key: value
+        for key, value in process_data.items()
+        if key not in _VOLATILE_PROCESS_DATA_KEYS
+    }
+    return hashlib.sha256(
+        json.dumps(relevant, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def slice_cache_key(job, settings_hash):
+    return hashlib.sha256(
+        "|".join(
+            [
+                job.fingerprint,
+                process_data_hash(job.process_data),
+                str(job.filament),
+                settings_hash,
+            ]
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+def jobs_from_run_directory(run_dir, process_data=None, per_part=False):
+    """Create slice jobs for an export run directory.
+
+    Args:
+        run_dir: Directory containing ``<stem>_export_manifest.json``
+        process_data: Process data dict, defaults to the run's ``*_process.json``
+        per_part: One job per part instead of one job per plate
+    """
+
+    run_dir = Path(run_dir)
+    manifests = sorted(run_dir.glob(f"*{EXPORT_MANIFEST_SUFFIX}"))
+    if len(manifests) != 1:
+        raise ValueError(
+            f"Expected exactly one export manifest in {run_dir}, found {len(manifests)}"
+        )
+    manifest_path = manifests[0]
+    base_name = manifest_path.name[: -len(EXPORT_MANIFEST_SUFFIX)]
+
+    with manifest_path.open("r", encoding="utf-8") as handle:
+        manifest = json.load(handle)
+
+    if process_data is None:
+        process_path = run_dir / f"{base_name}_process.json"
+        if not process_path.exists():
+            raise FileNotFoundError(f"No process data found at {process_path}")
+        with process_path.open("r", encoding="utf-8") as handle:
+            process_data = json.load(handle)
+
+    if per_part:
+        entries = [
+            (f"{base_name}_{name}", entry) for name, entry in manifest["parts"].items()
+        ]
+    elif "plates" in manifest:
+        entries = [(plate["name"], plate) for plate in manifest["plates"]]
+    else:
+        entries = [(base_name, manifest["assembly"])]
+
+    return [
+        SliceJob(
+            name=name,
+            model_path=Path(entry["files"][".stl"]),
+            fingerprint=entry["fingerprint"],
+            process_data=process_data,
+            output_dir=run_dir / SLICED_DIR_NAME / name,
+        )
+        for name, entry in entries
+    ]
+
+
+def _run_slicer(job, settings, work_dir):
+    from shellforgepy.slicing.orca_slicer_settings_generator import generate_settings
+
+    process_data = dict(job.process_data)
+    process_data["part_file"] = job.model_path.resolve().as_posix()
+    process_path = work_dir / f"{job.name}_process.json"
+    with process_path.open("w", encoding="utf-8") as handle:
+        json.dump(process_data, handle, indent=4)
+
+    generate_settings(
+        process_data_file=process_path,
+        output_dir=work_dir,
+        master_settings_dir=settings.master_settings_dir,
+    )
+
+    settings_files = sorted(
+        path
+        for path in work_dir.glob("*.json")
+        if not path.name.endswith("_process.json")
+    )
+    filament_files = sorted((work_dir / "filaments").glob("*.json"))
+
+    slicer_cmd = [
+        str(settings.orca_executable),
+        "--debug",
+        settings.debug_level,
+        "--slice",
+        "0",
+        "--arrange",
+        "0",
+        "--outputdir",
+        str(work_dir),
+        "--export-3mf",
+        f"{job.name}.3mf",
+        "--load-settings",
+        ";".join(str(path) for path in settings_files),
+    ]
+    if filament_files:
+        slicer_cmd += ["--load-filaments", ";".join(str(p) for p in filament_files)]
+    slicer_cmd.append(str(work_dir / job.model_path.name))
+
+    env = dict(os.environ)
+    env.setdefault("QT_OPENGL", "legacy")
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    env.update(settings.env)
+
+    _logger.info(f"Slicing {job.name}")
+    completed = subprocess.run(slicer_cmd, env=env, capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(
+            f"Slicing {job.name} failed with exit code {completed.returncode}:\n"
+            f"{completed.stderr or completed.stdout}"
+        )
+
+    results = [
+        path for path in work_dir.iterdir() if path.suffix in SLICE_RESULT_SUFFIXES
+    ]
+    if not results:
+        raise RuntimeError(f"Slicing {job.name} produced no G-code or 3MF output")
+    return results
+
+
+def _slice_job(job, settings, settings_hash, cache_dir):
+    cache_entry = Path(cache_dir) / slice_cache_key(job, settings_hash)
+    from_cache = cache_entry.is_dir()
+
+    if from_cache:
+        _logger.info(f"{job.name} unchanged, using cached slice {cache_entry}")
+    else:
+        with tempfile.TemporaryDirectory(dir=cache_dir) as work_dir:
+            work_dir = Path(work_dir)
+            staged = work_dir / "result"
+            staged.mkdir()
+            for path in _run_slicer(job, settings, work_dir):
+                shutil.move(path, staged / path.name)
+            try:
+                # rename so concurrent or interrupted runs never see partial entries
+                staged.rename(cache_entry)
+            except OSError:
+                if not cache_entry.is_dir():
+                    raise
+
+    job.output_dir.mkdir(parents=True, exist_ok=True)
+    output_files = []
+    for cached_file in sorted(cache_entry.iterdir()):
+        destination = job.output_dir / cached_file.name
+        link_or_copy(cached_file, destination)
+        output_files.append(destination)
+
+    return SliceResult(job=job, output_files=output_files, from_cache=from_cache)
+
+
+def run_slice_queue(jobs, settings, *, cache_dir=None, max_workers=None):
+    """Slice all ``jobs`` that have no cached result, at most ``max_workers`` at once.
+
+    ``jobs`` may be a generator, every job is queued as soon as it is yielded,
+    so slicing overlaps with producing the remaining jobs.
+
+    Returns:
+        SliceResults in the order of ``jobs``
+    """
+
+    if cache_dir is None:
+        cache_dir = os.environ.get(SLICE_CACHE_DIR_ENV_VAR, DEFAULT_SLICE_CACHE_DIR)
+    cache_dir = Path(cache_dir).expanduser()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    if max_workers is None:
+        # OrcaSlicer is multi-threaded itself, leave room for it
+        max_workers = max(1, (os.cpu_count() or 2) // 2)
+
+    settings_hash = settings.content_hash()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_slice_job, job, settings, settings_hash, cache_dir)
+            for job in jobs
+        ]
+        results = [future.result() for future in futures]
+
+    _logger.info(
+        f"Slicing done: {sum(not r.from_cache for r in results)} sliced, "
+        f"{sum(r.from_cache for r in results)} unchanged"
+    )
+    return results
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(
+        description="Slice the plates of an export run, skipping unchanged ones"
+    )
+    parser.add_argument("run_dir", type=Path, help="Export run directory")
+    parser.add_argument(
+        "--per-part",
+        action="store_true",
+        help="Slice every part on its own instead of the whole plate",
+    )
+    parser.add_argument(
+        "--max-workers", type=int, default=None, help="Concurrent slicer processes"
+    )
+    parser.add_argument("--config", default=None, help="shellforgepy config file")
+    return parser.parse_args(args)
+
+
+def main(args):
+    args = parse_args(args)
+    logging.basicConfig(level=logging.INFO)
+
+    jobs = jobs_from_run_directory(args.run_dir, per_part=args.per_part)
+    results = run_slice_queue(
+        jobs,
+        SlicerSettings.from_workflow_config(args.config),
+        max_workers=args.max_workers,
+    )
+    for result in results:
+        for output_file in result.output_files:
+            print(output_file)
+
+
+def run():
+    main(sys.argv[1:])
+
+
+if __name__ == "__main__":
+    run()
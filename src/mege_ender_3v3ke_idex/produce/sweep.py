@@ -0,0 +1,434 @@
+"""
+Parameter sweeps for fit-test coupons.
+
+A sweep builds one variant of a builder for every point of a parameter grid,
+in parallel worker processes, labels each variant with its parameter values
+and adds all of them to one PartList so they end up on a single plate.
+
+Builders are referenced as ``"module:function"`` so worker processes can
+import them. Grid keys that are keyword arguments of the builder are passed
+as such. Keys that are fields of the builder's ``params`` dataclass (e.g.
+``inset_cutter_hole_slack`` of ``XAxisParams``) replace those fields. All
+other keys must be module-level globals of the builder's module; they are
+patched for the duration of the build and restored afterwards. Only globals
+read at build time are affected, values derived from them at import time are
+not.
+
+Built variants are stored as STEP files in a cache directory keyed by the
+builder, the sources of its package, the shellforgepy version and the
+parameters, so unchanged variants are not rebuilt by the next sweep. Sub-builders listed in ``memoize`` (e.g.
+``gt2_idler``) are cached inside each worker and shared between the
+variants that worker builds.
+
+Usage:
+    results = run_sweep(
+        "mege_ender_3v3ke_idex.designs.x_axis:create_idler_cage",
+        {"inset_cutter_hole_slack": [0.2, 0.3, 0.4]},
+        builder_kwargs={...},
+        memoize=("gt2_idler",),
+    )
+    add_sweep_to_parts(parts, results, "idler_cage")
+"""
+
+import contextlib
+import dataclasses
+import functools
+import hashlib
+import importlib
+import importlib.metadata
+import inspect
+import itertools
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any, Tuple
+
+from shellforgepy.simple import (
+    Alignment,
+    LeaderFollowersCuttersPart,
+    align,
+    create_box,
+    create_text_object,
+    export_solid_to_step,
+    get_bounding_box,
+    get_bounding_box_size,
+    import_solid_from_step,
+    rotate,
+    translate,
+)
+
+_logger = logging.getLogger(__name__)
+
+SWEEP_CACHE_DIR_ENV_VAR = "MEGE_IDEX_SWEEP_CACHE_DIR"
+DEFAULT_SWEEP_CACHE_DIR = Path.home() / ".cache" / "mege_ender_3v3ke_idex" / "sweeps"
+
+LABEL_TEXT_SIZE = 4.0
+LABEL_TEXT_HEIGHT = 0.6
+LABEL_TAB_THICKNESS = 1.2
+LABEL_TAB_MARGIN = 1.5
+LABEL_TAB_OVERLAP = 0.5
+
+# (module name, function name) -> {call key: part}, per worker process
+_memoized_results = {}
+
+
+def _format_value(value):
+    if hasattr(value, "content_hash"):
+        return value.content_hash()
+    if isinstance(value, Enum):
+        return str(value.value)
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
+
+
+@dataclass(frozen=True)
+class SweepVariant:
+    """One point of a parameter grid."""
+
+    parameters: Tuple[Tuple[str, Any], ...]
+
+    @property
+    def name(self):
+        return "_".join(
+            f"{key}_{_format_value(value)}" for key, value in self.parameters
+        )
+
+    @property
+    def label(self):
+        return "/".join(_format_value(value) for _, value in self.parameters)
+
+    def as_dict(self):
+        return dict(self.parameters)
+
+
+@dataclass
+class SweepResult:
+    """A built and (optionally) cached sweep variant."""
+
+    variant: SweepVariant
+    part: Any
+    step_path: Path
+    from_cache: bool
+
+
+def expand_parameter_grid(parameter_grid):
+    """Return the cartesian product of ``{name: [values]}`` as SweepVariants."""
+
+    if not parameter_grid:
+        return [SweepVariant(parameters=())]
+
+    names = list(parameter_grid.keys())
+    for name in names:
+        if len(parameter_grid[name]) == 0:
+            raise ValueError(f"Sweep parameter '{name}' has no values")
+
+    return [
+        SweepVariant(parameters=tuple(zip(names, values)))
+        for values in itertools.product(*(parameter_grid[name] for name in names))
+    ]
+
+
+def resolve_builder(builder_ref):
+    """Import a ``"module:function"`` reference and return (module, function)."""
+
+    module_name, sep, function_name = builder_ref.partition(":")
+    if not sep or not function_name:
+        raise ValueError(
+            f"Builder reference '{builder_ref}' must have the form 'module:function'"
+        )
+    module = importlib.import_module(module_name)
+    return module, getattr(module, function_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _package_source_hash(package_name):
+    """Hash of the sources of all modules of a package (or a single module).
+
+    Builders read dimensions, hardware and catalogs from all over the package,
+    many of them through imports inside functions, so the whole package is
+    hashed rather than the modules a builder happens to import at the top.
+    """
+
+    package = importlib.import_module(package_name)
+    if hasattr(package, "__path__"):
+        sources = sorted(
+            (str(path.relative_to(directory)), path)
+            for directory in map(Path, package.__path__)
+            for path in directory.rglob("*.py")
+        )
+    else:
+        sources = [(package_name, Path(package.__file__))]
+
+    digest = hashlib.sha256()
+    for name, path in sources:
+        digest.update(name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _backend_version():
+    try:
+        return importlib.metadata.version("shellforgepy")
+    except importlib.metadata.PackageNotFoundError:
+        return ""
+
+
+def _variant_cache_key(builder_ref, module, variant, builder_kwargs):
+    hash_input = "|".join(
+        [
+            builder_ref,
+            _package_source_hash(module.__name__.partition(".")[0]),
+            _backend_version(),
+        ]
+        + [f"{key}={_format_value(value)}" for key, value in variant.parameters]
+        + [
+            f"kwarg:{key}={_format_value(value)}"
+            for key, value in sorted(builder_kwargs.items())
+        ]
+    )
+    return hashlib.sha256(hash_input.encode("utf-8")).hexdigest()
+
+
+def _memoized(module, function_name):
+    func = getattr(module, function_name)
+    cache = _memoized_results.setdefault((module.__name__, function_name), {})
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return func(*args, **kwargs)
+        if key not in cache:
+            cache[key] = func(*args, **kwargs)
+        return cache[key]
+
+    return wrapper
+
+
+@contextlib.contextmanager
+def _patched_module(module, module_overrides, memoize):
+    originals = {}
+    try:
+        for name in memoize:
+            originals[name] = getattr(module, name)
+            setattr(module, name, _memoized(module, name))
+        for name, value in module_overrides.items():
+            originals.setdefault(name, getattr(module, name))
+            setattr(module, name, value)
+        yield
+    finally:
+        for name, value in originals.items():
+            setattr(module, name, value)
+
+
+def build_variant(builder_ref, variant, builder_kwargs, cache_dir, memoize=()):
+    """Build a single variant and store it as STEP file in ``cache_dir``.
+
+    Runs in the worker processes. Returns (step_path, from_cache).
+    """
+
+    module, builder = resolve_builder(builder_ref)
+    cache_key = _variant_cache_key(builder_ref, module, variant, builder_kwargs)
+    step_path = Path(cache_dir) / f"{cache_key}.step"
+
+    if step_path.exists():
+        _logger.info(f"Using cached sweep variant {variant.name}: {step_path}")
+        return step_path, True
+
+    builder_parameters = inspect.signature(builder).parameters
+    kwargs = dict(builder_kwargs)
+
+    params = None
+    if "params" in builder_parameters:
+        params = kwargs.get("params", builder_parameters["params"].default)
+    params_fields = (
+        {field.name for field in dataclasses.fields(params)}
+        if dataclasses.is_dataclass(params)
+        else set()
+    )
+
+    module_overrides = {}
+    params_overrides = {}
+    for key, value in variant.parameters:
+        if key in builder_parameters:
+            kwargs[key] = value
+        elif key in params_fields:
+            params_overrides[key] = value
+        elif hasattr(module, key):
+            module_overrides[key] = value
+        else:
+            raise ValueError(
+                f"Sweep parameter '{key}' is neither an argument or params field "
+                f"of {builder_ref} nor a global of {module.__name__}"
+            )
+    if params_overrides:
+        kwargs["params"] = dataclasses.replace(params, **params_overrides)
+
+    _logger.info(f"Building sweep variant {variant.name}")
+    with _patched_module(module, module_overrides, memoize):
+        part = builder(**kwargs)
+
+    if isinstance(part, LeaderFollowersCuttersPart):
+        part = part.get_leader_as_part()
+
+    # write to a temporary name first so an interrupted export never poisons the cache
+    tmp_path = step_path.with_suffix(f".{os.getpid()}.tmp.step")
+    export_solid_to_step(part, tmp_path)
+    os.replace(tmp_path, step_path)
+
+    return step_path, False
+
+
+def run_sweep(
+    builder_ref,
+    parameter_grid,
+    *,
+    builder_kwargs=None,
+    memoize=(),
+    cache_dir=None,
+    max_workers=None,
+):
+    """Build all variants of ``parameter_grid`` and return them as SweepResults.
+
+    Args:
+        builder_ref: Builder as ``"module:function"``
+        parameter_grid: Dict mapping parameter names to lists of values
+        builder_kwargs: Fixed keyword arguments for every variant
+        memoize: Names of sub-builders in the builder's module to cache per worker
+        cache_dir: Directory for cached variants, defaults to
+            ``$MEGE_IDEX_SWEEP_CACHE_DIR`` or ``~/.cache/mege_ender_3v3ke_idex/sweeps``
+        max_workers: Number of worker processes, 1 builds in-process
+    """
+
+    builder_kwargs = dict(builder_kwargs or {})
+    variants = expand_parameter_grid(parameter_grid)
+
+    if cache_dir is None:
+        cache_dir = os.environ.get(SWEEP_CACHE_DIR_ENV_VAR, DEFAULT_SWEEP_CACHE_DIR)
+    cache_dir = Path(cache_dir).expanduser()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    _logger.info(f"Sweeping {builder_ref} over {len(variants)} variants")
+
+    if max_workers == 1:
+        built = [
+            build_variant(builder_ref, variant, builder_kwargs, cache_dir, memoize)
+            for variant in variants
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    build_variant,
+                    builder_ref,
+                    variant,
+                    builder_kwargs,
+                    cache_dir,
+                    memoize,
+                )
+                for variant in variants
+            ]
+            built = [future.result() for future in futures]
+
+    results = []
+    for variant, (step_path, from_cache) in zip(variants, built):
+        results.append(
+            SweepResult(
+                variant=variant,
+                part=import_solid_from_step(str(step_path)),
+                step_path=step_path,
+                from_cache=from_cache,
+            )
+        )
+
+    _logger.info(
+        f"Sweep done: {sum(not r.from_cache for r in results)} built, "
+        f"{sum(r.from_cache for r in results)} from cache"
+    )
+    return results
+
+
+def create_coupon_label(text, min_width=0.0):
+    """Create a flat tab with raised ``text`` for labelling a coupon."""
+
+    label_text = create_text_object(text, LABEL_TEXT_SIZE, LABEL_TEXT_HEIGHT)
+    text_size = get_bounding_box_size(label_text)
+
+    tab = create_box(
+        max(min_width, text_size[0] + 2 * LABEL_TAB_MARGIN),
+        text_size[1] + 2 * LABEL_TAB_MARGIN,
+        LABEL_TAB_THICKNESS,
+    )
+    label_text = align(label_text, tab, Alignment.CENTER)
+    label_text = align(label_text, tab, Alignment.STACK_TOP)
+
+    return tab.fuse(label_text)
+
+
+def label_coupon(part, text, prod_rotation_angle=None, prod_rotation_axis=None):
+    """Rotate ``part`` into print orientation and attach a label tab in front."""
+
+    if prod_rotation_angle is not None and prod_rotation_axis is not None:
+        part = rotate(prod_rotation_angle, axis=prod_rotation_axis)(part)
+    part = translate(0, 0, -get_bounding_box(part)[0][2])(part)
+
+    label = create_coupon_label(text)
+    label = align(label, part, Alignment.CENTER, axes=[0])
+    label = align(label, part, Alignment.BOTTOM)
+    label = align(label, part, Alignment.STACK_FRONT, stack_gap=-LABEL_TAB_OVERLAP)
+
+    return part.fuse(label)
+
+
+def add_sweep_to_parts(
+    parts,
+    results,
+    name_prefix,
+    *,
+    origin=(0.0, 0.0),
+    gap=5.0,
+    prod_rotation_angle=None,
+    prod_rotation_axis=None,
+    color=None,
+):
+    """Label sweep results and add them to ``parts`` in a row starting at ``origin``.
+
+    The coupons are rotated into print orientation here, so they are added
+    without production rotation and can be packed onto one plate.
+
+    Returns:
+        The labelled coupons in the order they were added
+    """
+
+    coupons = []
+    for result in results:
+        coupon = label_coupon(
+            result.part,
+            result.variant.label,
+            prod_rotation_angle=prod_rotation_angle,
+            prod_rotation_axis=prod_rotation_axis,
+        )
+        coupon_min = get_bounding_box(coupon)[0]
+        if coupons:
+            coupon = align(coupon, coupons[-1], Alignment.STACK_RIGHT, stack_gap=gap)
+            coupon = align(coupon, coupons[-1], Alignment.FRONT)
+        else:
+            coupon = translate(origin[0] - coupon_min[0], origin[1] - coupon_min[1], 0)(
+                coupon
+            )
+        coupons.append(coupon)
+
+        parts.add(
+            coupon,
+            f"{name_prefix}_{result.variant.name}",
+            flip=False,
+            color=color,
+        )
+
+    return coupons
@@ -7,4 +7,62 @@
     - https://docs.pytest.org/en/stable/writing_plugins.html
 """
 
-# import pytest
+import pytest
+from shellforgepy.simple import *
+
+
+def _hidden_nut_pocket_cutter(
+    size, bottom_cutter_length=3, top_cutter_length=100, slack=0.3
+):
+    """A nut prism on a screw hole running ``top_cutter_length`` up,
+    ``bottom_cutter_length`` down."""
+
+    screw = MScrew.from_size(size)
+    nut = create_nut(size, height=screw.nut_thickness, slack=slack)
+    hole = create_cylinder(
+        screw.clearance_hole_normal / 2, bottom_cutter_length + top_cutter_length
+    )
+    hole = align(hole, nut, Alignment.CENTER, axes=[0, 1])
+    hole = translate(0, 0, -bottom_cutter_length)(hole)
+    cutter = nut.fuse(hole)
+    return LeaderFollowersCuttersPart(leader=cutter, cutters=[cutter])
+
+
+def _cut_in_two(part, cut_point, cut_normal):
+    """The parts of ``part`` on the side an axis-aligned ``cut_normal`` points
+    to and on the other side of the plane through ``cut_point``."""
+
+    axis = max(range(3), key=lambda i: abs(cut_normal[i]))
+    (x0, y0, z0), (x1, y1, z1) = get_bounding_box(part)
+    minimum, maximum = [x0 - 1, y0 - 1, z0 - 1], [x1 + 1, y1 + 1, z1 + 1]
+    if cut_normal[axis] > 0:
+        minimum[axis] = cut_point[axis]
+    else:
+        maximum[axis] = cut_point[axis]
+    front = create_box(*(high - low for low, high in zip(minimum, maximum)))
+    front = translate(*minimum)(front)
+    return [part.intersect(front), part.cut(front)]
+
+
+@pytest.fixture(scope="session")
+def shellforgepy_stand_ins():
+    """``create_hidden_nut_pocket_cutter`` and ``cut_in_two`` for create_x_axis.
+
+    No released shellforgepy has them yet. The stand-ins replace them even
+    where it does, so the x axis builds the same everywhere. Worker processes
+    forked inside the fixture inherit them.
+    """
+
+    import shellforgepy.simple
+    from mege_ender_3v3ke_idex.designs import x_axis
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(
+            shellforgepy.simple,
+            "create_hidden_nut_pocket_cutter",
+            _hidden_nut_pocket_cutter,
+            raising=False,
+        )
+        for module in (shellforgepy.simple, x_axis):
+            patch.setattr(module, "cut_in_two", _cut_in_two, raising=False)
+        yield
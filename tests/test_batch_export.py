@@ -0,0 +1,117 @@
+import json
+
+import pytest
+from mege_ender_3v3ke_idex.cli import main
+from mege_ender_3v3ke_idex.produce.batch_export import Batch, run_batch
+
+DESIGN = """
+from pathlib import Path
+
+from shellforgepy.simple import *
+
+with Path(__file__).with_suffix(".builds").open("a") as builds:
+    builds.write("built\\n")
+
+
+def create_parts():
+    parts = PartList()
+    parts.add(create_box(60, 40, 10), "bracket")
+    parts.add(
+        create_box(20, 10, 90),
+        "post",
+        prod_rotation_angle=90,
+        prod_rotation_axis=(1, 0, 0),
+    )
+    parts.add(create_box(200, 200, 200), "frame", skip_in_production=True)
+    return parts
+"""
+
+
+def _batch_definition(design):
+    return {
+        "name": "kits",
+        "printers": {
+            "petg": {
+                "bed_width": 100,
+                "process_profile": {"filament": "PETG"},
+            },
+            "pla": {
+                "bed_width": 120,
+                "bed_depth": 80,
+                "gap": 5,
+                "process_profile": {
+                    "filament": "PLA",
+                    "process_overrides": {"layer_height": "0.3"},
+                },
+            },
+        },
+        "parts": [
+            {
+                "design": str(design),
+                "part": "bracket",
+                "quantity": 5,
+                "printer": "petg",
+            },
+            {"design": str(design), "part": "post", "quantity": 6, "printer": "pla"},
+            {"design": str(design), "part": "bracket", "quantity": 1, "printer": "pla"},
+        ],
+    }
+
+
+def test_batch_builds_once_and_packs_copies_per_printer(tmp_path):
+    design = tmp_path / "kit_design.py"
+    design.write_text(DESIGN)
+    batch = Batch.from_dict(_batch_definition(design))
+
+    manifest = run_batch(batch, tmp_path / "out")
+
+    assert len(design.with_suffix(".builds").read_text().splitlines()) == 1
+    assert manifest["parts"][f"{design}:bracket"]["quantity"] == 6
+
+    petg_plates = manifest["printers"]["petg"]["plates"]
+    assert sum(len(plate["parts"]) for plate in petg_plates) == 5
+    assert len(petg_plates) == 3  # two 60 x 40 brackets per 100 x 100 plate
+    pla_plates = manifest["printers"]["pla"]["plates"]
+    assert sorted(name for p in pla_plates for name in p["parts"]) == sorted(
+        ["kit_design.bracket_1"] + [f"kit_design.post_{i}" for i in range(1, 7)]
+    )
+    for plate in petg_plates + pla_plates:
+        assert plate["status"] == "changed"
+        assert (tmp_path / "out" / f"{plate['name']}.stl").exists()
+
+    process = json.loads((tmp_path / "out" / "kits_pla_process.json").read_text())
+    assert process["process_overrides"] == {"layer_height": "0.3"}
+
+    # same parts again: every plate is reused
+    again = run_batch(batch, tmp_path / "out")
+    assert all(
+        plate["status"] == "unchanged"
+        for printer in again["printers"].values()
+        for plate in printer["plates"]
+    )
+
+
+def test_batch_rejects_unknown_parts_and_printers(tmp_path):
+    design = tmp_path / "kit_design.py"
+    design.write_text(DESIGN)
+    definition = _batch_definition(design)
+
+    definition["parts"][0]["printer"] = "prusa"
+    with pytest.raises(ValueError, match="unknown printer prusa"):
+        Batch.from_dict(definition)
+
+    definition["parts"][0].update(printer="petg", part="frame")
+    with pytest.raises(ValueError, match="frame is not a production part"):
+        run_batch(Batch.from_dict(definition), tmp_path / "out")
+
+
+def test_batch_command(tmp_path, capsys):
+    design = tmp_path / "kit_design.py"
+    design.write_text(DESIGN)
+    batch_file = tmp_path / "kits.json"
+    batch_file.write_text(json.dumps(_batch_definition(design)))
+
+    assert main(["batch", str(batch_file), "--output-dir", str(tmp_path)]) == 0
+    printed = capsys.readouterr().out.split()
+    assert printed[0].endswith("kits_petg_plate1.stl")
+    assert (tmp_path / "kits_batch_manifest.json").exists()
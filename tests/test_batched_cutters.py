@@ -0,0 +1,44 @@
+from mege_ender_3v3ke_idex.construct.batched_cutters import (
+    get_cutter_indices_overlapping,
+    get_merged_cutter,
+    use_as_cutter_on,
+    uses_batched_cutters,
+)
+from mege_ender_3v3ke_idex.designs.nema_motors import create_nema_composite
+from shellforgepy.simple import *
+
+
+def _create_plate(motor):
+    plate = create_box(60, 60, 6)
+    plate = align(plate, motor.get_leader_as_part(), Alignment.CENTER)
+    return align(plate, motor.get_leader_as_part(), Alignment.STACK_TOP)
+
+
+def test_batched_cut_matches_sequential_cut():
+    motor = create_nema_composite(axle_clearance=0.3, boss_clearance=0.6)
+    assert uses_batched_cutters(motor)
+
+    plate = _create_plate(motor)
+
+    batched = use_as_cutter_on(motor, plate)
+    sequential = motor.use_as_cutter_on(plate)
+
+    assert abs(get_volume(batched) - get_volume(sequential)) < 1e-3
+    assert get_volume(batched) < get_volume(plate)
+
+
+def test_cutters_outside_target_are_skipped():
+    motor = create_nema_composite()
+    far_away_plate = translate(500, 0, 0)(_create_plate(motor))
+
+    assert get_cutter_indices_overlapping(motor, far_away_plate) == []
+    assert use_as_cutter_on(motor, far_away_plate) is far_away_plate
+
+
+def test_merged_cutter_is_cached_per_composite():
+    motor = create_nema_composite()
+
+    assert get_merged_cutter(motor) is get_merged_cutter(motor)
+
+    moved_motor = translate(0, 0, 10)(motor)
+    assert get_merged_cutter(moved_motor) is not get_merged_cutter(motor)
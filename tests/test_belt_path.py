@@ -0,0 +1,140 @@
+import math
+
+import numpy as np
+import pytest
+from mege_ender_3v3ke_idex.designs.gt2belt import (
+    create_gt2belt,
+    create_gt2belt_along_path,
+    create_gt2belt_loop,
+    gt2_pitch,
+    gt2_pitch_radius,
+    gt2_teeth_thickness,
+    gt2_thickness,
+    gt2_tooth_radius,
+    gt2_width,
+)
+from mege_ender_3v3ke_idex.geometry.belt_path import BeltWheel, solve_belt_path
+from shellforgepy.simple import *
+
+OMEGA_WHEELS = [
+    BeltWheel((-260, 0), gt2_pitch_radius(20), clockwise=True, name="endcap"),
+    BeltWheel((-84, 17), gt2_pitch_radius(16), name="idler_1"),
+    BeltWheel((-68, 42), gt2_pitch_radius(20), clockwise=True, name="pulley"),
+    BeltWheel((-52, 17), gt2_pitch_radius(16), name="idler_2"),
+    BeltWheel((260, 0), gt2_pitch_radius(20), clockwise=True, name="far_endcap"),
+]
+
+
+def test_loop_around_two_pulleys():
+    radius = gt2_pitch_radius(20)
+    path = solve_belt_path(
+        [BeltWheel((0, 0), radius, True), BeltWheel((100, 0), radius, True)],
+        pitch=gt2_pitch,
+    )
+
+    assert path.wrap_angles == pytest.approx([math.pi, math.pi])
+    assert path.length == pytest.approx(200 + 20 * gt2_pitch)
+    assert path.tooth_count == pytest.approx(120)
+
+
+def test_omega_drive_spans_are_tangent():
+    path = solve_belt_path(OMEGA_WHEELS, pitch=gt2_pitch)
+
+    centers = np.array([wheel.center for wheel in OMEGA_WHEELS])
+    radii = np.array([wheel.radius for wheel in OMEGA_WHEELS])
+    following = np.roll(np.arange(len(OMEGA_WHEELS)), -1)
+    directions = path.span_ends - path.span_starts
+
+    assert np.linalg.norm(path.span_starts - centers, axis=1) == pytest.approx(radii)
+    assert np.linalg.norm(path.span_ends - centers[following], axis=1) == (
+        pytest.approx(radii[following])
+    )
+    assert np.einsum("ij,ij->i", directions, path.span_normals) == pytest.approx(
+        np.zeros(len(OMEGA_WHEELS)), abs=1e-9
+    )
+    # a closed loop turns once: clockwise wraps minus counterclockwise ones
+    signs = np.where([wheel.clockwise for wheel in OMEGA_WHEELS], 1, -1)
+    assert np.sum(signs * path.wrap_angles) == pytest.approx(2 * math.pi)
+
+    outline = path.outline(chord_tolerance=0.01)
+    distances = np.linalg.norm(outline[:, None] - centers[None], axis=2)
+    assert np.min(distances - radii, axis=1).min() == pytest.approx(0, abs=1e-6)
+    closed_outline = np.roll(outline, -1, axis=0) - outline
+    assert np.linalg.norm(closed_outline, axis=1).sum() == pytest.approx(
+        path.length, rel=1e-4
+    )
+
+
+def test_open_path_and_overlapping_wheels():
+    path = solve_belt_path(
+        [
+            BeltWheel((0, 0), 0, name="clamp"),
+            BeltWheel((50, -10), 5),
+            BeltWheel((100, 0), 0, name="clamp"),
+        ],
+        pitch=gt2_pitch,
+        closed=False,
+    )
+    assert path.wrap_angles[[0, 2]] == pytest.approx([0, 0])
+    assert path.wrap_angles[1] == pytest.approx(
+        2 * (math.atan2(10, 50) + math.asin(5 / math.hypot(50, 10)))
+    )
+
+    with pytest.raises(ValueError, match="overlap"):
+        solve_belt_path(
+            [BeltWheel((0, 0), 5), BeltWheel((3, 0), 5, clockwise=True)],
+            pitch=gt2_pitch,
+        )
+
+
+def test_belt_is_swept_along_the_pitch_line():
+    path = solve_belt_path(OMEGA_WHEELS, pitch=gt2_pitch)
+
+    belt = create_gt2belt_along_path(path, with_teeth=False)
+
+    assert get_volume(belt) == pytest.approx(
+        path.length * gt2_thickness * gt2_width, rel=1e-3
+    )
+    size = get_bounding_box_size(belt)
+    assert size[2] == pytest.approx(gt2_width)
+
+
+def _tooth_area():
+    # tooth disk below the land
+    cap_height = 2 * gt2_tooth_radius - gt2_teeth_thickness
+    cap_area = gt2_tooth_radius**2 * math.acos(
+        (gt2_tooth_radius - cap_height) / gt2_tooth_radius
+    ) - (gt2_tooth_radius - cap_height) * math.sqrt(
+        2 * gt2_tooth_radius * cap_height - cap_height**2
+    )
+    return math.pi * gt2_tooth_radius**2 - cap_area
+
+
+def test_straight_belt_has_one_tooth_per_pitch():
+    belt = create_gt2belt(num_teeth=10)
+
+    body = (gt2_thickness - gt2_teeth_thickness) * 10 * gt2_pitch
+    assert get_volume(belt) == pytest.approx(
+        (body + 10 * _tooth_area()) * gt2_width, rel=5e-3
+    )
+    assert get_bounding_box(belt)[0] == pytest.approx((0, 0, 0), abs=1e-9)
+    assert get_bounding_box(belt)[1] == pytest.approx(
+        (10 * gt2_pitch, gt2_thickness, gt2_width)
+    )
+
+
+def test_bent_section_and_loop_hold_whole_teeth():
+    section = create_gt2belt_loop(num_teeth=20, angle=180)
+    pitch_radius = 20 * gt2_pitch / math.pi
+    (x_min, y_min, _), (x_max, y_max, _) = get_bounding_box(section)
+    assert x_max == pytest.approx(pitch_radius + gt2_thickness / 2)
+    assert y_min == pytest.approx(-x_max, abs=0.05)
+    assert y_max == pytest.approx(0, abs=1e-9)
+
+    path = solve_belt_path(OMEGA_WHEELS, pitch=gt2_pitch)
+    loop = create_gt2belt_along_path(path)
+    teeth = round(path.tooth_count)
+    body = (gt2_thickness - gt2_teeth_thickness) * path.length
+    assert get_volume(loop) == pytest.approx(
+        (body + teeth * _tooth_area()) * gt2_width, rel=5e-3
+    )
@@ -0,0 +1,95 @@
+import json
+
+from mege_ender_3v3ke_idex.cli import main
+from mege_ender_3v3ke_idex.construct.hardware import (
+    cylinder_screw,
+    insert_pocket_cutter,
+    nut,
+)
+from mege_ender_3v3ke_idex.construct.symmetry import (
+    SymmetryTransform,
+    build_symmetric_pair,
+)
+from mege_ender_3v3ke_idex.produce.bom import (
+    MOTOR,
+    SCREW,
+    add_bom_item,
+    collect_bom,
+    suppress_bom,
+)
+from shellforgepy.simple import Alignment
+
+DESIGN = """
+from mege_ender_3v3ke_idex.construct.hardware import cylinder_screw, nut
+from mege_ender_3v3ke_idex.designs.nema_motors import create_nema_composite
+from mege_ender_3v3ke_idex.designs.nema_sizes import NemaSizes
+from shellforgepy.simple import *
+
+
+def create_parts():
+    parts = PartList()
+    parts.add(create_nema_composite(NemaSizes.NEMA17).leader, "motor")
+    for i in range(4):
+        parts.add(translate(10 * i, 0, 0)(cylinder_screw("M3", 25)), f"screw_{i}")
+    parts.add(nut("M3"), "nut")
+    return parts
+"""
+
+
+def test_collectors_nest_and_export(tmp_path):
+    add_bom_item(SCREW, "M3x8 cylinder screw")  # no collector, not counted
+
+    with collect_bom() as outer:
+        add_bom_item(MOTOR, "NEMA17 42.3 mm stepper motor")
+        with collect_bom() as inner:
+            add_bom_item(SCREW, "M3x8 cylinder screw", 4)
+            with suppress_bom():
+                add_bom_item(SCREW, "M3x8 cylinder screw")
+
+    assert inner.lines() == [("screw", "M3x8 cylinder screw", 4)]
+    assert outer["M3x8 cylinder screw"] == 4
+    assert outer["NEMA17 42.3 mm stepper motor"] == 1
+    assert outer.to_csv().splitlines() == [
+        "category,description,quantity",
+        "motor,NEMA17 42.3 mm stepper motor,1",
+        "screw,M3x8 cylinder screw,4",
+    ]
+    assert json.loads(outer.write_json(tmp_path / "bom.json").read_text())["total"] == 5
+
+
+def test_hardware_and_symmetric_sides_are_counted():
+    def build_side(side):
+        return [cylinder_screw("M3", 12), nut("M3"), insert_pocket_cutter("M3")]
+
+    with collect_bom() as bom:
+        build_symmetric_pair(
+            build_side,
+            canonical=Alignment.RIGHT,
+            derived=Alignment.LEFT,
+            transform=SymmetryTransform.rotation(180, axis=(0, 0, 1)),
+            verify=True,
+        )
+
+    # the derived side counts once although verify builds it a second time
+    assert bom["M3x12 cylinder screw"] == 2
+    assert bom["M3 hex nut"] == 2
+    assert bom["M3 heat-set insert"] == 2
+
+
+def test_bom_command(tmp_path, capsys):
+    design_file = tmp_path / "screws_design.py"
+    design_file.write_text(DESIGN)
+    csv_file = tmp_path / "bom.csv"
+
+    assert main(["bom", str(design_file), "--json", "--csv", str(csv_file)]) == 0
+
+    items = {
+        item["description"]: item["quantity"]
+        for item in json.loads(capsys.readouterr().out)["items"]
+    }
+    assert items == {
+        "M3 hex nut": 1,
+        "M3x25 cylinder screw": 4,
+        "NEMA17 42.3 mm stepper motor": 1,
+    }
+    assert csv_file.read_text().count("\n") == 4
@@ -0,0 +1,96 @@
+import json
+import os
+import threading
+
+import pytest
+from mege_ender_3v3ke_idex.cli import main
+from mege_ender_3v3ke_idex.produce.build_server import (
+    BuildServerError,
+    build_design,
+    build_on_server,
+    ping,
+    send_request,
+    serve,
+)
+
+DESIGN = """
+from pathlib import Path
+
+from mege_ender_3v3ke_idex.produce.incremental_export import (
+    arrange_and_export_incremental,
+)
+from shellforgepy.simple import *
+
+PROD = False
+BOX_SIZE = {size}
+
+with Path(__file__).with_suffix(".imports").open("a") as imports:
+    imports.write("imported\\n")
+
+
+def main():
+    parts = PartList()
+    parts.add(create_box(BOX_SIZE, 10, 5), "box", flip=False)
+    arrange_and_export_incremental(
+        parts.as_list(), script_file=__file__, prod=PROD, export_obj=False
+    )
+"""
+
+
+@pytest.fixture
+def design(tmp_path):
+    path = tmp_path / "box_design.py"
+    path.write_text(DESIGN.format(size=10))
+    return path
+
+
+def _imports(design):
+    return len(design.with_suffix(".imports").read_text().splitlines())
+
+
+def test_build_writes_a_workflow_run_directory(design, tmp_path, capsys):
+    result = build_design(design, runs_dir=tmp_path / "runs", run_id="first")
+
+    run_directory = tmp_path / "runs" / "box_design_run_first"
+    assert result.run_directory == str(run_directory)
+    manifest = json.loads((run_directory / "workflow_manifest.json").read_text())
+    assert manifest["assembly_path"]
+    assert list(run_directory.glob("*box.stl"))
+
+    assert main(["build", str(design), "--local", "--runs-dir", str(tmp_path)]) == 0
+    assert "box_design_run_" in capsys.readouterr().out
+
+    with pytest.raises(BuildServerError, match="Unknown design"):
+        build_design("no_such_design")
+
+
+def test_server_keeps_designs_loaded_until_they_change(design, tmp_path):
+    socket = tmp_path / "build.sock"
+    assert ping(socket) is None
+
+    server = threading.Thread(target=serve, args=(socket,), daemon=True)
+    server.start()
+    for _ in range(600):
+        if ping(socket) is not None:
+            break
+        server.join(0.1)
+    assert ping(socket) == os.getpid()
+
+    try:
+        for run_id in ("a", "b"):
+            build_on_server(design, socket, runs_dir=str(tmp_path), run_id=run_id)
+        assert _imports(design) == 1
+
+        design.write_text(DESIGN.format(size=20))
+        os.utime(design, ns=(0, design.stat().st_mtime_ns + 10**9))
+        result = build_on_server(design, socket, runs_dir=str(tmp_path), run_id="c")
+        assert _imports(design) == 2
+        assert "Building" in result.log
+
+        with pytest.raises(BuildServerError, match="no_such_design"):
+            build_on_server("no_such_design", socket)
+    finally:
+        send_request({"command": "stop"}, socket)
+        server.join(10)
+
+    assert not socket.exists()
@@ -0,0 +1,130 @@
+import math
+
+import numpy as np
+import pytest
+from mege_ender_3v3ke_idex.geometry.clearance import (
+    ClearanceRule,
+    TriangleBVH,
+    check_clearances,
+    mesh_distance,
+)
+from mege_ender_3v3ke_idex.geometry.mesh import cached_tessellation
+from shellforgepy.simple import *
+
+
+@pytest.fixture(autouse=True)
+def mesh_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("MEGE_IDEX_MESH_CACHE_DIR", str(tmp_path / "meshes"))
+    return tmp_path / "meshes"
+
+
+def _bvh(part):
+    return TriangleBVH.from_part(part)
+
+
+def test_bvh_leaves_partition_all_triangles():
+    bvh = _bvh(create_cylinder(5, 10))
+
+    leaves = bvh.children[:, 0] < 0
+    covered = np.concatenate(
+        [
+            bvh.order[start : start + count]
+            for start, count in zip(bvh.starts[leaves], bvh.counts[leaves])
+        ]
+    )
+    assert sorted(covered) == list(range(len(bvh.mesh.triangles)))
+    assert np.all(bvh.node_min[0] <= bvh.mesh.vertices.min(axis=0))
+
+
+def test_distance_contact_and_interference():
+    box = _bvh(create_box(10, 10, 10))
+
+    assert mesh_distance(box, _bvh(translate(13, 0, 0)(create_box(5, 5, 5)))) == (
+        pytest.approx(3.0),
+        False,
+    )
+    assert mesh_distance(box, _bvh(translate(10, 0, 0)(create_box(5, 5, 5)))) == (
+        0.0,
+        False,
+    )
+    assert mesh_distance(box, _bvh(translate(8, 2, 2)(create_box(5, 5, 5)))) == (
+        0.0,
+        True,
+    )
+    # fully enclosed, no triangles cross
+    assert mesh_distance(box, _bvh(translate(4, 4, 4)(create_box(2, 2, 2)))) == (
+        0.0,
+        True,
+    )
+    assert mesh_distance(box, _bvh(translate(30, 0, 0)(create_box(5, 5, 5)))) == (
+        math.inf,
+        False,
+    )
+
+
+def test_check_clearances_reports_rules_and_interferences():
+    plate = create_box(40, 40, 5).cut(translate(20, 20, 0)(create_cylinder(4, 5)))
+    parts = {
+        "plate": plate,
+        "axle": translate(20, 20, -5)(create_cylinder(3, 15)),
+        "idler": translate(0, 0, 7)(create_cylinder(10, 8)),
+        "screw": translate(35, 35, 2)(create_cylinder(1.5, 10)),
+    }
+
+    report = check_clearances(
+        parts,
+        rules=[
+            ClearanceRule("idler", "plate", 1.5, "idler_gap"),
+            ClearanceRule("axle", "plate", 1.5),
+        ],
+    )
+
+    by_pair = {(r.part_a, r.part_b): r for r in report.results}
+    assert by_pair["idler", "plate"].ok
+    assert by_pair["idler", "plate"].distance == pytest.approx(2.0)
+    assert not by_pair["axle", "plate"].ok
+    assert by_pair["axle", "plate"].distance == pytest.approx(1.0, abs=0.1)
+    assert {(r.part_a, r.part_b) for r in report.violations} == {
+        ("axle", "plate"),
+        ("plate", "screw"),
+    }
+
+    with pytest.raises(KeyError):
+        check_clearances(parts, rules=[ClearanceRule("idler", "cage", 1.0)])
+
+
+def test_meshes_are_cached_by_geometry(mesh_cache):
+    box = create_box(10, 10, 10)
+
+    first = cached_tessellation(box)
+    second = cached_tessellation(create_box(10, 10, 10))
+    cached_tessellation(translate(1, 0, 0)(box))
+
+    assert len(list(mesh_cache.glob("*.npz"))) == 2
+    np.testing.assert_array_equal(first.vertices, second.vertices)
+
+
+def test_default_x_axis_has_no_violations(shellforgepy_stand_ins):
+    from mege_ender_3v3ke_idex.designs.x_axis import (
+        check_x_axis_clearances,
+        create_idler_endcap,
+        create_x_axis,
+    )
+
+    x_axis = create_x_axis()
+    endcap = create_idler_endcap(
+        x_axis.get_non_production_part_by_name("lower_axis_profile"),
+        with_tensioner=True,
+    )
+
+    report = check_x_axis_clearances(x_axis, endcap)
+
+    assert report.violations == []
+    assert {r.rule.description for r in report.results if r.rule} == {
+        "idler_gap",
+        "endcap_idler_clearance",
+        "endcap_belt_clearance",
+    }
+    assert ("endcap_box", "endcap_tensioner_screw") not in {
+        (r.part_a, r.part_b) for r in report.results
+    }
@@ -0,0 +1,71 @@
+import json
+
+import numpy as np
+import shellforgepy.simple
+from mege_ender_3v3ke_idex.cli import main
+from mege_ender_3v3ke_idex.construct.dry_run import ProxyShape, dry_run, layout_report
+from mege_ender_3v3ke_idex.produce.build_server import load_design
+
+DESIGN = """
+from shellforgepy.simple import *
+
+
+def create_bracket():
+    base = create_box(40, 20, 5)
+    post = create_cylinder(4, 30)
+    post = rotate(90, axis=(1, 0, 0))(post)
+    post = align(post, base, Alignment.CENTER)
+    post = align(post, base, Alignment.STACK_TOP)
+    bracket = base.fuse(post)
+    trim = create_box(100, 100, 100)
+    trim = align(trim, bracket, Alignment.CENTER, axes=[0, 1])
+    trim = translate(0, 0, 8)(trim)
+    bracket = bracket.cut(trim).cut(create_cylinder(1, 100))
+    nut = create_extruded_polygon([(0, 0), (6, 0), (3, 5)], 3)
+    nut = translate(50, 0, 0)(nut)
+
+    parts = PartList()
+    parts.add(bracket, "bracket")
+    parts.add(nut, "nut")
+    parts.add(rotate(30, axis=(0, 1, 0))(bracket), "tilted")
+    return parts
+"""
+
+
+def test_dry_run_bounds_match_the_real_build(tmp_path):
+    design_file = tmp_path / "bracket_design.py"
+    design_file.write_text(DESIGN)
+    design = load_design(design_file)
+
+    with dry_run(design):
+        dry = design.create_bracket()
+    real = design.create_bracket()
+
+    assert all(isinstance(info.part, ProxyShape) for info in dry.parts)
+    assert not isinstance(shellforgepy.simple.create_box(1, 1, 1), ProxyShape)
+
+    dry_report, real_report = layout_report(dry), layout_report(real)
+    for name in ("bracket", "nut"):
+        assert np.allclose(dry_report[name].minimum, real_report[name].minimum)
+        assert np.allclose(dry_report[name].maximum, real_report[name].maximum)
+    # a rotated cylinder is a 16-gon, its bounds are off by less than 2 %
+    assert np.allclose(dry_report["tilted"].size, real_report["tilted"].size, rtol=0.02)
+    assert dry_report["bracket"].size[2] == 8  # trimmed by the box cutter
+    assert not dry_report["bracket"].overlaps(dry_report["nut"])
+    assert dry_report["bracket"].overlaps(dry_report["nut"], gap=11)
+
+
+def test_layout_command(tmp_path, capsys):
+    design_file = tmp_path / "bracket_design.py"
+    design_file.write_text(DESIGN)
+    preview = tmp_path / "bracket.stl"
+
+    command = ["layout", str(design_file), "create_bracket", "--json"]
+    assert main(command + ["--preview", str(preview)]) == 0
+
+    report = json.loads(capsys.readouterr().out)
+    assert report["nut"] == {"min": [50, 0, 0], "max": [56, 5, 3]}
+    triangles = int.from_bytes(preview.read_bytes()[80:84], "little")
+    assert preview.stat().st_size == 84 + 50 * triangles > 84
+
+    assert main(["layout", str(design_file), "create_axle"]) == 1
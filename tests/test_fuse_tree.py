@@ -0,0 +1,66 @@
+import time
+
+import pytest
+from mege_ender_3v3ke_idex.construct import fuse_tree
+from mege_ender_3v3ke_idex.construct.fuse_tree import TreeCollector, fuse_all
+from mege_ender_3v3ke_idex.construct.symmetry import shapes_match
+from shellforgepy.simple import *
+
+
+def _pins(count):
+    """Overlapping cylinders in rows of 8, like a row of screw holes."""
+
+    return [
+        translate((i % 8) * 3, (i // 8) * 5, 0)(create_cylinder(2, 10))
+        for i in range(count)
+    ]
+
+
+def _chain(parts):
+    collector = PartCollector()
+    for part in parts:
+        collector = collector.fuse(part)
+    return collector
+
+
+def test_tree_collector_matches_part_collector():
+    pins = _pins(11)
+
+    collector = TreeCollector()
+    for pin in pins:
+        collector = collector.fuse(pin)
+
+    assert shapes_match(collector.part, _chain(pins))
+    assert collector.part is collector.part  # fused once
+    assert TreeCollector().part is None
+    assert fuse_all([pins[0]]) is pins[0]
+
+    cut = collector.cut(translate(-50, -50, 0)(create_box(100, 100, 5)))
+    assert get_bounding_box(cut)[0][2] == pytest.approx(5)
+    with pytest.raises(ValueError):
+        TreeCollector().cut(pins[0])
+
+
+def test_fuse_all_in_processes(monkeypatch):
+    monkeypatch.setattr(fuse_tree, "MIN_PARTS_PER_PROCESS", 2)
+    pins = _pins(8)
+
+    assert shapes_match(fuse_all(pins, processes=2), _chain(pins))
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("count", [4, 16, 64])
+def test_tree_reduction_benchmark(count):
+    pins = _pins(count)
+
+    started = time.perf_counter()
+    chain = _chain(pins)
+    chained = time.perf_counter() - started
+    started = time.perf_counter()
+    tree = fuse_all(pins)
+    reduced = time.perf_counter() - started
+
+    print(f"{count} parts: chain {chained * 1e3:.0f} ms, tree {reduced * 1e3:.0f} ms")
+    assert tree.Volume() == pytest.approx(chain.Volume())
+    if count == 64:
+        assert reduced < chained
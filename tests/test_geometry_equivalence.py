@@ -0,0 +1,172 @@
+import os
+from pathlib import Path
+
+import pytest
+from mege_ender_3v3ke_idex.construct.glue_fuse import fuse_touching
+from mege_ender_3v3ke_idex.construct.rounded_box import create_rounded_box
+from mege_ender_3v3ke_idex.designs.alu_extrusion_profile_types import (
+    ExtrusionProfileType,
+)
+from mege_ender_3v3ke_idex.designs.extruder import EXTUDER_STEP_PATH
+from mege_ender_3v3ke_idex.designs.nema_sizes import NemaSizes
+from mege_ender_3v3ke_idex.geometry.equivalence import (
+    check_builds,
+    compare_build,
+    geometry_signature,
+    load_references,
+    part_signatures,
+    save_references,
+)
+from shellforgepy.simple import *
+
+REFERENCE_PATH = Path(__file__).parent / "reference_geometry.json"
+
+# MEGE_IDEX_RECORD_GEOMETRY=1 pytest tests/test_geometry_equivalence.py
+# records the cases that have no reference yet, =all records every case
+RECORD = os.environ.get("MEGE_IDEX_RECORD_GEOMETRY", "")
+
+DESIGNS = "mege_ender_3v3ke_idex.designs"
+
+CASES = {
+    "alu_2020": (
+        f"{DESIGNS}.alu_extrusion_profile:create_alu_extrusion_profile",
+        {"extrusion_profile_type": ExtrusionProfileType.PROFILE_2020, "length_mm": 100},
+    ),
+    "alu_4040": (
+        f"{DESIGNS}.alu_extrusion_profile:create_alu_extrusion_profile",
+        {"extrusion_profile_type": ExtrusionProfileType.PROFILE_4040, "length_mm": 100},
+    ),
+    "alu_4040_2slot": (
+        f"{DESIGNS}.alu_extrusion_profile:create_alu_extrusion_profile",
+        {
+            "extrusion_profile_type": ExtrusionProfileType.PROFILE_4040_2SLOT,
+            "length_mm": 100,
+        },
+    ),
+    "t_slot_cutter": (
+        f"{DESIGNS}.alu_extrusion_profile:create_t_slot_cutter",
+        {"extrusion_profile_type": ExtrusionProfileType.PROFILE_2020, "length_mm": 50},
+    ),
+    "gt2_pulley": (f"{DESIGNS}.gt2belt:create_gt2_pulley", {"bore_diameter": 5}),
+    "gt2_idler": (f"{DESIGNS}.gt2belt:create_gt2_idler", {}),
+    "gt2belt": (f"{DESIGNS}.gt2belt:create_gt2belt", {"num_teeth": 40}),
+    "gt2belt_loop": (f"{DESIGNS}.gt2belt:create_gt2belt_loop", {}),
+    "nema17_motor": (
+        f"{DESIGNS}.nema_motors:create_nema_motor",
+        {"nema": NemaSizes.NEMA17},
+    ),
+    "nema17_composite": (
+        f"{DESIGNS}.nema_motors:create_nema_composite",
+        {"nema": NemaSizes.NEMA17},
+    ),
+    "nema17_screw_holes": (
+        f"{DESIGNS}.nema_motors:create_nema_screw_holes",
+        {"nema": NemaSizes.NEMA17},
+    ),
+    "jury_rigged_z_carriage": (
+        f"{DESIGNS}.jury_rigged_z_carriage:create_jury_rigged_z_carriage",
+        {},
+    ),
+    "extruder": (f"{DESIGNS}.extruder:create_extruder", {}),
+    "z_axis": (f"{DESIGNS}.x_axis:create_z_axis", {}),
+    "mgn12h_carriage": (f"{DESIGNS}.x_axis:create_mgn12h_carriage", {}),
+    "mgn12h_rail": (f"{DESIGNS}.x_axis:create_mgn12h_rail", {"length_mm": 450}),
+    "motor_with_mount": (f"{DESIGNS}.x_axis:create_motor_with_mount", {}),
+    "idler_cage": (
+        f"{DESIGNS}.x_axis:create_idler_cage",
+        {
+            "cage_back_wall": 9,
+            "cage_wall": 2,
+            "cage_top_bottom_thickness": 4,
+            "cage_overlength": 30,
+            "idler_tooth_count": 20,
+            "idler_clearance": 0.5,
+            "with_tensioner": True,
+        },
+    ),
+    # built with the create_hidden_nut_pocket_cutter and cut_in_two stand-ins
+    # of conftest.py; the references are create_x_axis and the parts of
+    # x_axis.py's main() from before the symmetric motor stacks, shared
+    # placements, glued fuses and simplified plates, only the idlers, pulleys
+    # and belts named since then are recorded from the current builders
+    "x_axis": (f"{DESIGNS}.x_axis:create_x_axis", {}),
+    "x_axis_parts": (f"{DESIGNS}.x_axis:create_parts", {}),
+}
+
+# case -> why it cannot be built in this environment, None if it can
+ENVIRONMENT_GAPS = {
+    "extruder": (
+        None if EXTUDER_STEP_PATH.exists() else f"{EXTUDER_STEP_PATH} is missing"
+    ),
+}
+
+
+@pytest.fixture(scope="session")
+def build_checks(shellforgepy_stand_ins):
+    """Every case built and compared once, in parallel worker processes."""
+
+    references = load_references(REFERENCE_PATH)
+    compared = {} if RECORD == "all" else references
+    checks = check_builds(CASES, compared)
+    if RECORD:
+        recorded = {
+            case: check.signatures
+            for case, check in checks.items()
+            if check.error is None and (RECORD == "all" or case not in references)
+        }
+        references = {**references, **recorded}
+        save_references(REFERENCE_PATH, references)
+    return checks, references
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_build_matches_reference(build_checks, case):
+    checks, references = build_checks
+    check = checks[case]
+
+    if ENVIRONMENT_GAPS.get(case):
+        pytest.skip(f"{case} cannot be built here: {ENVIRONMENT_GAPS[case]}")
+    assert check.error is None  # a builder that raises is a regression
+    assert case in references, f"no reference geometry for {case}, record it"
+    assert check.differences == []
+
+
+def _plate_with_hole(x):
+    plate = create_box(40, 20, 4)
+    return plate.cut(translate(x, 10, 0)(create_cylinder(3, 4)))
+
+
+def test_changed_geometry_is_detected():
+    reference = {"part": geometry_signature(_plate_with_hole(10))}
+
+    assert compare_build(reference, _plate_with_hole(10))[1] == []
+
+    # same volume, area and face count, only the hole moved
+    _, differences = compare_build(reference, _plate_with_hole(10.5))
+    assert any("center_of_mass" in difference for difference in differences)
+    assert any("surface points" in difference for difference in differences)
+
+    _, differences = compare_build(
+        reference, translate(0, 0, 0.5)(create_box(40, 20, 4))
+    )
+    assert any(difference.startswith("part: volume") for difference in differences)
+    assert compare_build(reference, [_plate_with_hole(10)])[1] == [
+        "part: missing",
+        "part[0]: not in the reference",
+    ]
+
+
+def test_equivalent_constructions_match():
+    # a filleted box against the box extruded from a rounded outline
+    arguments = (30, 20, 10, 3, None, [Alignment.TOP, Alignment.BOTTOM])
+    filleted = create_filleted_box(*arguments)
+    rounded = create_rounded_box(*arguments)
+    assert compare_build(part_signatures(filleted), rounded)[1] == []
+
+    # glued and unified against a general fuse, with fewer faces
+    base = create_box(30, 20, 2)
+    wall = translate(0, 0, 2)(create_box(4, 20, 12))
+    general = base.fuse(wall)
+    glued = fuse_touching(base, wall)
+    assert len(glued.Faces()) < len(general.Faces())
+    assert compare_build(part_signatures(general), glued)[1] == []
@@ -0,0 +1,92 @@
+import timeit
+
+import pytest
+from mege_ender_3v3ke_idex.construct import glue_fuse
+from mege_ender_3v3ke_idex.construct.fuse_tree import fuse_all
+from mege_ender_3v3ke_idex.construct.glue_fuse import (
+    bounds_only_touch,
+    contact_groups,
+    fuse_touching,
+)
+from mege_ender_3v3ke_idex.construct.symmetry import shapes_match
+from shellforgepy.simple import *
+
+
+def _cage_boxes():
+    """Base, back wall, two side walls and a top plate the walls rise through."""
+
+    base = create_box(30, 20, 2)
+    back_wall = align(create_box(4, 20, 12), base, Alignment.LEFT)
+    back_wall = align(back_wall, base, Alignment.STACK_TOP)
+    side_walls = []
+    for alignment in (Alignment.FRONT, Alignment.BACK):
+        side_wall = align(create_box(10, 2, 12), base, alignment)
+        side_wall = align(side_wall, back_wall, Alignment.STACK_RIGHT)
+        side_walls.append(align(side_wall, base, Alignment.STACK_TOP))
+    top_plate = translate(0, 0, 12)(create_box(30, 20, 2))
+    return [base, back_wall, *side_walls, top_plate]
+
+
+def test_parts_are_grouped_by_contact():
+    unit = ((0, 0, 0), (1, 1, 1))
+    assert bounds_only_touch(unit, ((1, 0, 0), (2, 1, 1)))
+    assert bounds_only_touch(unit, ((5, 5, 5), (6, 6, 6)))
+    assert not bounds_only_touch(unit, ((0.5, 0, 0), (2, 1, 1)))
+
+    bounds = [get_bounding_box(box) for box in _cage_boxes()]
+    assert contact_groups(bounds) == [[0, 1, 2, 3], [4]]
+
+
+def test_fuse_touching_matches_general_fuse():
+    boxes = _cage_boxes()
+
+    general = fuse_all(boxes)
+    glued = fuse_touching(*boxes)
+
+    assert glued.isValid()
+    assert shapes_match(glued, general)
+    assert len(glued.Faces()) < len(general.Faces())
+    assert len(fuse_touching(*boxes, unify=False).Faces()) == len(general.Faces())
+    assert fuse_touching(boxes[0]) is boxes[0]
+
+
+def _tiles():
+    """A plate tiled from 4x4 touching boxes, like plates built from slabs."""
+
+    return [
+        translate(10 * i, 10 * j, 0)(create_box(10, 10, 2))
+        for i in range(4)
+        for j in range(4)
+    ]
+
+
+def test_tiled_plate_is_glued_into_one_box(monkeypatch):
+    tiles = _tiles()
+    general = fuse_all(tiles)
+
+    def general_fuse(parts):
+        raise AssertionError("touching tiles fell back to the general fuse")
+
+    monkeypatch.setattr(glue_fuse, "fuse_all", general_fuse)
+    assert contact_groups([get_bounding_box(tile) for tile in tiles]) == [
+        list(range(16))
+    ]
+    glued = fuse_touching(*tiles)
+
+    assert glued.isValid()
+    assert len(glued.Faces()) == 6
+    assert len(general.Faces()) > 6
+    assert shapes_match(glued, general)
+
+
+@pytest.mark.benchmark
+def test_glue_fuse_benchmark():
+    tiles = _tiles()
+
+    general = min(timeit.repeat(lambda: fuse_all(tiles), number=3, repeat=3))
+    glued = min(timeit.repeat(lambda: fuse_touching(*tiles), number=3, repeat=3))
+    print(
+        f"general fuse {general / 3 * 1e3:.1f} ms, "
+        f"glued and unified {glued / 3 * 1e3:.1f} ms"
+    )
+    assert glued < general
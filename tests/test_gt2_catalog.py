@@ -0,0 +1,69 @@
+import math
+
+import pytest
+from mege_ender_3v3ke_idex.construct import gt2_catalog
+from mege_ender_3v3ke_idex.construct.gt2_catalog import (
+    IDLER,
+    PULLEY,
+    GT2WheelSpec,
+    clear_memory_cache,
+    get_gt2_wheel,
+    gt2_idler,
+    gt2_pulley,
+)
+from mege_ender_3v3ke_idex.designs.gt2belt import gt2_pitch, gt2_pitch_radius
+from shellforgepy.simple import *
+
+
+@pytest.fixture(autouse=True)
+def catalog_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("MEGE_IDEX_GT2_CATALOG_DIR", str(tmp_path / "gt2"))
+    clear_memory_cache()
+    yield tmp_path / "gt2"
+    clear_memory_cache()
+
+
+def test_analytic_dimensions_match_the_built_parts():
+    for spec in (GT2WheelSpec(PULLEY, 20, 5), GT2WheelSpec(IDLER, 16, 3)):
+        assert spec.pitch_diameter == pytest.approx(
+            spec.num_teeth * gt2_pitch / math.pi, rel=1e-6
+        )
+        assert spec.pitch_radius == pytest.approx(gt2_pitch_radius(spec.num_teeth))
+
+        part = get_gt2_wheel(spec)
+        (x0, y0, z0), (x1, y1, z1) = get_bounding_box(part)
+        assert (x0, y0, z0, x1, y1, z1) == pytest.approx(
+            (*spec.bounding_box[0], *spec.bounding_box[1]), abs=1e-3
+        )
+        assert get_bounding_box_size(part) == pytest.approx(spec.size, abs=1e-3)
+
+    with pytest.raises(ValueError, match="bore"):
+        GT2WheelSpec(IDLER, 16)
+    with pytest.raises(ValueError):
+        GT2WheelSpec("sprocket", 16, 3)
+
+
+def test_variants_are_persisted_and_reloaded(catalog_dir, monkeypatch):
+    first = gt2_idler(16)
+    files = list(catalog_dir.glob("*.brep"))
+    assert [path.name for path in files] == [GT2WheelSpec(IDLER, 16, 3).file_name]
+
+    clear_memory_cache()
+
+    def fail():
+        raise AssertionError("rebuilt a persisted variant")
+
+    monkeypatch.setattr(GT2WheelSpec, "build", lambda self: fail())
+    second = gt2_idler(16)
+    assert get_volume(second) == pytest.approx(get_volume(first))
+
+
+def test_callers_get_independent_copies():
+    first = gt2_pulley(20, bore_diameter=5)
+    moved = translate(100, 0, 0)(gt2_pulley(20, bore_diameter=5))
+
+    assert get_bounding_box(first)[0][0] == pytest.approx(
+        -GT2WheelSpec(PULLEY, 20, 5).flange_diameter / 2, abs=1e-3
+    )
+    assert get_bounding_box(moved)[0][0] > 0
+    assert len(gt2_catalog._catalog) == 1
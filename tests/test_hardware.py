@@ -0,0 +1,104 @@
+import math
+
+import pytest
+import shellforgepy.simple
+from mege_ender_3v3ke_idex.construct.hardware import (
+    clear_hardware_cache,
+    clearance_hole_cutter,
+    cylinder_screw,
+    heat_set_insert,
+    insert_dimensions,
+    insert_pocket_cutter,
+    nut,
+    nut_pocket_cutter,
+    screw_dimensions,
+    screw_head_cutter,
+)
+from mege_ender_3v3ke_idex.construct.symmetry import shapes_match
+from shellforgepy.simple import *
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_hardware_cache()
+    yield
+    clear_hardware_cache()
+
+
+def test_items_are_built_once_and_instanced(monkeypatch):
+    builds = []
+    original = shellforgepy.simple.create_cylinder_screw
+
+    def counting(*args, **kwargs):
+        builds.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(shellforgepy.simple, "create_cylinder_screw", counting)
+
+    first = cylinder_screw("M3", length=12)
+    second = translate(10, 0, 0)(cylinder_screw("M3", 12))
+    cylinder_screw("M3", length=16)
+
+    assert len(builds) == 2
+    assert first.wrapped.TShape() == cylinder_screw("M3", 12).wrapped.TShape()
+    assert shapes_match(first, create_cylinder_screw("M3", length=12))
+    assert get_bounding_box(second)[0][0] == pytest.approx(
+        get_bounding_box(first)[0][0] + 10
+    )
+
+
+def test_cutters_match_the_screw_table():
+    m3 = screw_dimensions("M3")
+    assert m3 is screw_dimensions("M3")
+
+    (x0, _, z0), (x1, _, z1) = get_bounding_box(clearance_hole_cutter("M3", 20, 0.2))
+    assert (x1 - x0, z1 - z0) == pytest.approx((m3.clearance_hole_normal + 0.4, 20))
+
+    (x0, _, z0), (x1, _, z1) = get_bounding_box(screw_head_cutter("M3", 0.5))
+    assert (x1 - x0, z1 - z0) == pytest.approx(
+        (m3.cylinder_head_diameter + 1, m3.cylinder_head_height + 1)
+    )
+
+    diameter, length = insert_dimensions("M3")
+    (_, _, z0), (_, _, z1) = get_bounding_box(insert_pocket_cutter("M3", 0.2, 2))
+    assert z1 - z0 == pytest.approx(min(2, length + 0.2))
+    assert (
+        get_volume(heat_set_insert("M3"))
+        < get_volume(insert_pocket_cutter("M3"))
+        == pytest.approx(math.pi * diameter**2 / 4 * length)
+    )
+
+    assert shapes_match(nut("M3", slack=0.3), create_nut("M3", slack=0.3))
+
+
+def test_nut_pocket_cutters_are_copied(monkeypatch):
+    def pocket_cutter(size, bottom_cutter_length, top_cutter_length, slack):
+        cutter = create_nut(size, height=bottom_cutter_length, slack=slack)
+        return LeaderFollowersCuttersPart(leader=cutter, cutters=[cutter])
+
+    monkeypatch.setattr(
+        shellforgepy.simple,
+        "create_hidden_nut_pocket_cutter",
+        pocket_cutter,
+        raising=False,
+    )
+
+    pocket = nut_pocket_cutter("M4")
+    pocket.translate((5, 0, 0))  # in place
+    assert get_bounding_box(nut_pocket_cutter("M4").leader)[1][0] < 5
+
+
+def test_cached_nuts_share_their_geometry():
+    clear_hardware_cache()
+    first = nut("M3", slack=0.3)
+    second = nut("M3", slack=0.3)
+
+    assert first is not second
+    assert first.wrapped.TShape() == second.wrapped.TShape()
+    assert nut("M3").wrapped.TShape() != first.wrapped.TShape()
+
+    moved = translate(5, 0, 0)(first)
+    assert get_bounding_box(nut("M3", slack=0.3)) == get_bounding_box(second)
+    assert get_bounding_box(moved)[0][0] == pytest.approx(
+        get_bounding_box(second)[0][0] + 5
+    )
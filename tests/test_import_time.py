@@ -0,0 +1,59 @@
+import subprocess
+import sys
+
+import pytest
+
+# importing any of these pulls in OCC or the process data tables
+HEAVY_MODULES = ("cadquery", "OCP", "FreeCAD", "scipy", "vtk", "mege_3devops")
+
+# cumulative import time in microseconds, a CAD backend alone takes seconds
+IMPORT_TIME_BUDGET_US = 1_000_000
+
+LIGHT_MODULES = (
+    "mege_ender_3v3ke_idex.designs.alu_extrusion_profile_types",
+    "mege_ender_3v3ke_idex.designs.nema_sizes",
+    "mege_ender_3v3ke_idex.designs.gt2_dimensions",
+    "mege_ender_3v3ke_idex.designs.x_axis_params",
+    "mege_ender_3v3ke_idex.construct.dry_run",
+    "mege_ender_3v3ke_idex.construct.fuse_tree",
+    "mege_ender_3v3ke_idex.construct.glue_fuse",
+    "mege_ender_3v3ke_idex.construct.gt2_catalog",
+    "mege_ender_3v3ke_idex.construct.hardware",
+    "mege_ender_3v3ke_idex.construct.rounded_box",
+    "mege_ender_3v3ke_idex.construct.shared_placement",
+    "mege_ender_3v3ke_idex.construct.simplify",
+    "mege_ender_3v3ke_idex.geometry.belt_path",
+    "mege_ender_3v3ke_idex.geometry.clearance",
+    "mege_ender_3v3ke_idex.geometry.equivalence",
+    "mege_ender_3v3ke_idex.produce.bom",
+    "mege_ender_3v3ke_idex.produce.print_estimate",
+    "mege_ender_3v3ke_idex.produce.process_profiles",
+    "mege_ender_3v3ke_idex.produce.slice_queue",
+)
+
+
+def _import_times(module):
+    """(module name, cumulative microseconds) of a cold ``import module``."""
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize("module", LIGHT_MODULES)
+def test_catalog_and_planning_modules_import_without_cad_backend(module):
+    times = _import_times(module)
+
+    heavy = sorted(name for name in times if name.split(".")[0] in HEAVY_MODULES)
+    assert heavy == []
+    assert times[module] < IMPORT_TIME_BUDGET_US
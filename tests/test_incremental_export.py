@@ -0,0 +1,63 @@
+import json
+import os
+
+from mege_ender_3v3ke_idex.produce.incremental_export import (
+    arrange_and_export_incremental,
+    geometry_fingerprint,
+)
+from shellforgepy.simple import *
+
+
+def _create_parts(hole_radius):
+    parts = PartList()
+    parts.add(create_box(10, 10, 10), "block")
+    parts.add(
+        translate(20, 0, 0)(create_box(10, 10, 4).cut(create_cylinder(hole_radius, 4))),
+        "plate",
+    )
+    return parts
+
+
+def _export(parts, export_dir):
+    arrange_and_export_incremental(
+        parts.as_list(), script_file="demo.py", export_directory=export_dir
+    )
+    with (export_dir / "demo_export_manifest.json").open() as handle:
+        return json.load(handle)
+
+
+def test_geometry_fingerprint_is_stable_and_placement_sensitive():
+    box = create_box(10, 10, 10)
+
+    assert geometry_fingerprint(box) == geometry_fingerprint(create_box(10, 10, 10))
+    assert geometry_fingerprint(box) != geometry_fingerprint(translate(1, 0, 0)(box))
+
+
+def test_unchanged_parts_are_linked_from_previous_run(tmp_path, monkeypatch):
+    monkeypatch.delenv("SHELLFORGEPY_EXPORT_DIR", raising=False)
+    monkeypatch.delenv("SHELLFORGEPY_PRODUCTION", raising=False)
+    monkeypatch.delenv("SHELLFORGEPY_WORKFLOW_MANIFEST", raising=False)
+
+    first = _export(_create_parts(2), tmp_path / "demo_run_1")
+    assert {e["status"] for e in first["parts"].values()} == {"changed"}
+
+    second = _export(_create_parts(3), tmp_path / "demo_run_2")
+
+    assert second["parts"]["block"]["status"] == "unchanged"
+    assert second["parts"]["plate"]["status"] == "changed"
+    assert second["assembly"]["status"] == "changed"
+    assert os.path.samefile(
+        tmp_path / "demo_run_1" / "demo_block.stl",
+        tmp_path / "demo_run_2" / "demo_block.stl",
+    )
+    assert not os.path.samefile(
+        tmp_path / "demo_run_1" / "demo_plate.stl",
+        tmp_path / "demo_run_2" / "demo_plate.stl",
+    )
+
+    third = _export(_create_parts(3), tmp_path / "demo_run_3")
+
+    assert {e["status"] for e in third["parts"].values()} == {"unchanged"}
+    assert third["assembly"]["status"] == "unchanged"
+    assert third["obj"]["status"] == "unchanged"
+    assert (tmp_path / "demo_run_3" / "demo.mtl").exists()
@@ -0,0 +1,19 @@
+import numpy as np
+import pytest
+from mege_ender_3v3ke_idex.construct.planar_extrusion import extrude_outline
+from shellforgepy.simple import *
+
+
+def _circle(radius, count=2000):
+    angles = np.linspace(0, 2 * np.pi, count, endpoint=False)
+    return np.column_stack([radius * np.cos(angles), radius * np.sin(angles)])
+
+
+def test_outline_with_hole_in_any_orientation():
+    square = [(0, 0), (0, 40), (40, 40), (40, 0)]  # clockwise
+    hole = _circle(10) + 20
+
+    solid = extrude_outline(square, 5, holes=[hole])
+
+    assert get_volume(solid) == pytest.approx((1600 - np.pi * 100) * 5, rel=1e-4)
+    assert get_bounding_box(solid)[1] == pytest.approx((40, 40, 5))
@@ -0,0 +1,107 @@
+import json
+import time
+
+import numpy as np
+import pytest
+from mege_ender_3v3ke_idex.produce.incremental_export import (
+    arrange_and_export_incremental,
+)
+from mege_ender_3v3ke_idex.produce.plate_packing import (
+    Footprint,
+    pack_parts_for_production,
+    pack_rectangles,
+)
+from mege_ender_3v3ke_idex.produce.slice_queue import jobs_from_run_directory
+from shellforgepy.simple import *
+
+
+def _assert_disjoint(packing, gap):
+    for plate in range(packing.plate_count):
+        placements = packing.plate_placements(plate)
+        for i, a in enumerate(placements):
+            assert a.x >= 0 and a.x + a.width <= packing.bed_width + 1e-9
+            assert a.y >= 0 and a.y + a.depth <= packing.bed_depth + 1e-9
+            for b in placements[i + 1 :]:
+                assert (
+                    a.x + a.width + gap <= b.x + 1e-9
+                    or b.x + b.width + gap <= a.x + 1e-9
+                    or a.y + a.depth + gap <= b.y + 1e-9
+                    or b.y + b.depth + gap <= a.y + 1e-9
+                )
+
+
+def test_many_parts_are_packed_without_overlap():
+    rng = np.random.default_rng(7)
+    footprints = [Footprint(f"part_{i}", *rng.uniform(10, 80, 2)) for i in range(150)]
+
+    started = time.perf_counter()
+    packing = pack_rectangles(footprints, 220, 220, gap=4)
+    assert time.perf_counter() - started < 5
+
+    _assert_disjoint(packing, gap=4)
+    assert len(packing.placements) == 150
+    area = sum(f.width * f.depth for f in footprints)
+    assert packing.plate_count <= np.ceil(area / 220**2 / 0.7)
+    assert packing.utilizations[:-1].min() > 0.7
+    assert "150 parts on" in packing.summary()
+
+
+def test_rotation_and_oversized_parts():
+    long_parts = [Footprint(f"rail_{i}", 180, 40) for i in range(4)]
+
+    packing = pack_rectangles(long_parts, 100, 200, gap=2)
+    assert packing.plate_count == 2
+    assert all(p.rotated and p.width == 40 for p in packing.placements)
+    _assert_disjoint(packing, gap=2)
+
+    with pytest.raises(ValueError, match="does not fit"):
+        pack_rectangles(long_parts, 100, 200, allow_rotation=False)
+
+
+def test_parts_are_packed_after_their_production_rotation(tmp_path, monkeypatch):
+    monkeypatch.delenv("SHELLFORGEPY_EXPORT_DIR", raising=False)
+    monkeypatch.delenv("SHELLFORGEPY_WORKFLOW_MANIFEST", raising=False)
+    monkeypatch.delenv("SHELLFORGEPY_PRODUCTION", raising=False)
+
+    parts = PartList()
+    for i in range(5):
+        # stands 90 mm high, printed lying down
+        parts.add(
+            create_box(20, 10, 90),
+            f"post_{i}",
+            prod_rotation_angle=90,
+            prod_rotation_axis=(1, 0, 0),
+        )
+
+    plates, packing = pack_parts_for_production(
+        parts.as_list(), gap=5, bed_width=100, max_build_height=20
+    )
+    assert [len(plate) for plate in plates] == [4, 1]
+    for plate in plates:
+        for entry in plate:
+            (x0, y0, z0), (x1, y1, z1) = get_bounding_box(entry["part"])
+            assert z0 == pytest.approx(0) and z1 == pytest.approx(10)
+            assert x0 >= -1e-6 and y0 >= -1e-6 and max(x1, y1) <= 100 + 1e-6
+
+    arrange_and_export_incremental(
+        parts.as_list(),
+        script_file="posts.py",
+        export_directory=tmp_path,
+        prod=True,
+        prod_gap=5,
+        bed_width=100,
+        pack_plates=True,
+        export_obj=False,
+        process_data={"filament": "FilamentPLAMegeMaster"},
+    )
+    manifest = json.loads((tmp_path / "posts_export_manifest.json").read_text())
+    assert [plate["name"] for plate in manifest["plates"]] == [
+        "posts",
+        "posts_plate2",
+    ]
+    assert manifest["plates"][0]["files"] == manifest["assembly"]["files"]
+    assert (tmp_path / "posts_plate2.stl").exists()
+    assert [job.name for job in jobs_from_run_directory(tmp_path)] == [
+        "posts",
+        "posts_plate2",
+    ]
@@ -0,0 +1,78 @@
+import math
+
+import numpy as np
+import pytest
+from mege_ender_3v3ke_idex.geometry.mesh import tessellate_part
+from mege_ender_3v3ke_idex.produce.print_estimate import estimate_plate, estimate_print
+from mege_ender_3v3ke_idex.produce.process_profiles import ProcessProfile
+from shellforgepy.simple import *
+
+PROCESS_DATA = {
+    "filament": "FilamentPLAMegeMaster",
+    "process_overrides": {
+        "nozzle_diameter": "0.4",
+        "layer_height": "0.2",
+        "sparse_infill_density": "15%",
+    },
+}
+
+
+def _ring_plate():
+    return create_box(20, 10, 5).cut(translate(10, 5, 0)(create_cylinder(3, 5)))
+
+
+def test_mesh_volume_area_and_sections():
+    mesh = tessellate_part(_ring_plate())
+
+    assert mesh.volume() == pytest.approx(1000 - math.pi * 9 * 5, rel=1e-3)
+    expected_area = 2 * (1000 / 5 - math.pi * 9) + 5 * (60 + 2 * math.pi * 3)
+    assert mesh.surface_area() == pytest.approx(expected_area, rel=1e-3)
+
+    z_levels = np.arange(0.1, 5, 0.2)
+    perimeters, areas = mesh.sections(z_levels)
+    assert perimeters == pytest.approx(60 + 2 * math.pi * 3, rel=1e-3)
+    assert areas == pytest.approx(200 - math.pi * 9, rel=1e-3)
+    assert mesh.sections([-1.0, 6.0])[0] == pytest.approx([0, 0])
+
+
+def test_denser_infill_costs_time_and_material():
+    sparse = estimate_print(create_box(40, 40, 10), PROCESS_DATA)
+    dense_data = ProcessProfile.from_dict(PROCESS_DATA).with_overrides(
+        sparse_infill_density="60%"
+    )
+    dense = estimate_print(create_box(40, 40, 10), dense_data)
+
+    assert sparse.layer_count == dense.layer_count == 50
+    assert sparse.volume == pytest.approx(16000, rel=1e-6)
+    assert 0 < sparse.extruded_volume < dense.extruded_volume < sparse.volume
+    assert sparse.print_time < dense.print_time
+    assert sparse.filament_mass == pytest.approx(sparse.extruded_volume / 1000 * 1.24)
+
+
+def test_volumetric_flow_limit_slows_down():
+    data = {
+        "filament": "FilamentPETGCF",
+        "process_overrides": dict(
+            PROCESS_DATA["process_overrides"], filament_max_volumetric_speed="2"
+        ),
+    }
+
+    limited = estimate_print(_ring_plate(), data)
+    unlimited = estimate_print(_ring_plate(), PROCESS_DATA)
+
+    assert limited.extruded_volume == pytest.approx(unlimited.extruded_volume)
+    assert limited.print_time > 2 * unlimited.print_time
+    assert limited.filament_density == 1.30
+
+
+def test_plate_estimate_sums_parts_and_skips_non_production_parts():
+    parts = PartList()
+    parts.add(_ring_plate(), "a")
+    parts.add(translate(30, 0, 0)(_ring_plate()), "b")
+    parts.add(create_box(50, 50, 50), "reference", skip_in_production=True)
+
+    single = estimate_print(_ring_plate(), PROCESS_DATA)
+    plate = estimate_plate(parts, PROCESS_DATA)
+
+    assert plate.print_time == pytest.approx(2 * single.print_time)
+    assert plate.perimeter_lengths == pytest.approx(2 * single.perimeter_lengths)
@@ -0,0 +1,70 @@
+import logging
+
+import pytest
+from mege_ender_3v3ke_idex.produce.process_profiles import (
+    ProcessProfile,
+    ProcessProfileError,
+    volumetric_flows,
+)
+
+BASE = ProcessProfile.from_dict(
+    {
+        "filament": "FilamentPLAMegeMaster",
+        "process_overrides": {"nozzle_diameter": "0.6", "layer_height": "0.2"},
+    }
+)
+
+
+def test_profiles_are_lazy_and_hashed_by_definition():
+    missing = ProcessProfile.from_base("no_such_module:PROCESS_DATA")
+    with pytest.raises(ModuleNotFoundError):
+        missing.resolve()
+
+    assert BASE.with_overrides(wall_loops="2").content_hash() == (
+        BASE.with_overrides({"wall_loops": "2"}).content_hash()
+    )
+    assert BASE.with_overrides(wall_loops="3").content_hash() != (
+        BASE.with_overrides(wall_loops="2").content_hash()
+    )
+
+
+def test_resolve_applies_layers_in_order_and_returns_copies():
+    profile = BASE.with_overrides(layer_height="0.3").with_transform("copy:deepcopy")
+
+    resolved = profile.resolve()
+    assert resolved["process_overrides"]["layer_height"] == "0.3"
+    assert resolved["filament"] == "FilamentPLAMegeMaster"
+
+    resolved["part_file"] = "/tmp/plate.stl"
+    assert "part_file" not in profile.resolve()
+    # the base is not touched by layers on top of it
+    assert BASE.resolve()["process_overrides"]["layer_height"] == "0.2"
+
+
+def test_validation_rejects_out_of_range_values():
+    with pytest.raises(ProcessProfileError, match="layer_height"):
+        BASE.with_overrides(layer_height="2.5").resolve()
+
+    with pytest.raises(ProcessProfileError, match="filament"):
+        ProcessProfile().with_overrides(layer_height="0.2").resolve()
+
+
+def test_volumetric_flow_above_filament_limit_is_reported(caplog):
+    profile = BASE.with_overrides(
+        line_width="0.90",
+        layer_height="0.42",
+        outer_wall_speed="70",
+        inner_wall_speed="150",
+        filament_max_volumetric_speed="30",
+    )
+
+    flows = {f.feature: f for f in volumetric_flows(profile.resolve())}
+
+    assert flows["outer_wall"].flow == pytest.approx(0.9 * 0.42 * 70)
+    assert not flows["outer_wall"].exceeds_limit
+    assert flows["inner_wall"].exceeds_limit
+
+    caplog.clear()
+    with caplog.at_level(logging.WARNING):
+        profile.with_overrides(inner_wall_speed="151").resolve()
+    assert "inner_wall" in caplog.text
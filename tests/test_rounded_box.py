@@ -0,0 +1,64 @@
+import pytest
+from mege_ender_3v3ke_idex.construct import rounded_box
+from mege_ender_3v3ke_idex.construct.rounded_box import (
+    clear_rounded_box_cache,
+    create_rounded_box,
+)
+from mege_ender_3v3ke_idex.construct.symmetry import shapes_match
+from shellforgepy.simple import *
+
+# the fillet selections of x_axis.py and alu_extrusion_profile.py
+SELECTIONS = {
+    "mount plate": (None, [Alignment.BOTTOM, Alignment.TOP]),
+    "mount shield": (None, [Alignment.FRONT, Alignment.TOP, Alignment.BOTTOM]),
+    "left connector": (None, [Alignment.BOTTOM, Alignment.TOP, Alignment.LEFT]),
+    "right connector": (None, [Alignment.BOTTOM, Alignment.TOP, Alignment.RIGHT]),
+    "flange": (None, [Alignment.BOTTOM, Alignment.TOP, Alignment.FRONT]),
+    "profile body": (
+        [Alignment.LEFT, Alignment.RIGHT, Alignment.FRONT, Alignment.BACK],
+        [Alignment.TOP, Alignment.BOTTOM],
+    ),
+}
+
+
+@pytest.mark.parametrize("name", SELECTIONS)
+def test_rounded_box_matches_filleted_box(name):
+    fillets_at, no_fillets_at = SELECTIONS[name]
+    arguments = (42, 20, 6, 2, fillets_at, no_fillets_at)
+
+    rounded = create_rounded_box(*arguments)
+
+    assert shapes_match(rounded, create_filleted_box(*arguments))
+    assert len(rounded.Faces()) == len(create_filleted_box(*arguments).Faces())
+
+
+def test_horizontal_fillets_fall_back_and_boxes_are_cached():
+    arguments = (20, 20, 10, 1.5, None, [Alignment.TOP])
+    assert shapes_match(create_rounded_box(*arguments), create_filleted_box(*arguments))
+
+    first = create_rounded_box(10, 10, 10, 1, no_fillets_at=[Alignment.TOP])
+    second = translate(5, 0, 0)(
+        create_rounded_box(10, 10, 10, 1, no_fillets_at=[Alignment.TOP])
+    )
+    assert get_bounding_box(first)[0] == pytest.approx((0, 0, 0))
+    assert get_bounding_box(second)[0] == pytest.approx((5, 0, 0))
+
+
+def test_rounded_boxes_are_built_once(monkeypatch):
+    arguments = (42, 20, 6, 2, None, [Alignment.BOTTOM, Alignment.TOP])
+    builds = []
+    build = rounded_box._build
+    monkeypatch.setattr(
+        rounded_box, "_build", lambda *spec: builds.append(spec) or build(*spec)
+    )
+    clear_rounded_box_cache()
+
+    first = create_rounded_box(*arguments)
+    second = create_rounded_box(*arguments)
+    assert len(builds) == 1
+    assert first is not second
+    assert shapes_match(first, second)
+
+    clear_rounded_box_cache()
+    create_rounded_box(*arguments)
+    assert len(builds) == 2
@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+from mege_ender_3v3ke_idex.construct.shared_placement import (
+    Placement,
+    alignment_translation,
+    bake,
+    shared_align,
+    shared_rotate,
+    shared_translate,
+)
+from mege_ender_3v3ke_idex.construct.symmetry import shapes_match
+from mege_ender_3v3ke_idex.designs.alu_extrusion_profile import (
+    create_alu_extrusion_profile,
+)
+from mege_ender_3v3ke_idex.designs.alu_extrusion_profile_types import (
+    ExtrusionProfileType,
+)
+from shellforgepy.simple import *
+
+
+@pytest.fixture(scope="module")
+def profile():
+    return create_alu_extrusion_profile(
+        ExtrusionProfileType.PROFILE_2020, length_mm=300
+    )
+
+
+TARGET = translate(40, 10, 5)(create_box(30, 30, 30))
+
+
+def _copy_chain(part):
+    part = align(part, TARGET, Alignment.CENTER)
+    part = align(part, TARGET, Alignment.STACK_TOP)
+    part = rotate(90, center=(5, 0, 0), axis=(0, 1, 1))(part)
+    return translate(1, 2, -3)(part)
+
+
+def _shared_chain(part):
+    part = shared_align(part, TARGET, Alignment.CENTER)
+    part = shared_align(part, TARGET, Alignment.STACK_TOP)
+    part = shared_rotate(90, center=(5, 0, 0), axis=(0, 1, 1))(part)
+    return bake(shared_translate(1, 2, -3)(part))
+
+
+def test_shared_placements_match_copying_transforms(profile):
+    placed = shared_align(profile, TARGET, Alignment.CENTER)
+    assert placed.wrapped.TShape() == profile.wrapped.TShape()
+
+    baked = _shared_chain(profile)
+    assert baked.wrapped.Location().IsIdentity()
+    assert shapes_match(baked, _copy_chain(profile))
+
+    turn_and_lift = shared_rotate(90, axis=(1, 0, 0)).then(shared_translate(0, 0, 5))
+    assert np.allclose(turn_and_lift.apply_to_points([[0, 1, 0]]), [[0, 0, 6]])
+    assert np.allclose(
+        turn_and_lift.matrix,
+        shared_translate(0, 0, 5).matrix @ shared_rotate(90, axis=(1, 0, 0)).matrix,
+    )
+    assert np.allclose(
+        Placement.identity().then(turn_and_lift).matrix, turn_and_lift.matrix
+    )
+
+    # composites fall back to the copying transforms
+    composite = LeaderFollowersCuttersPart(leader=create_box(10, 10, 10))
+    moved = shared_align(composite, TARGET, Alignment.CENTER)
+    assert np.allclose(
+        get_bounding_box(moved.leader),
+        get_bounding_box(align(composite, TARGET, Alignment.CENTER).leader),
+    )
+
+
+def test_alignment_translation_matches_align():
+    part = translate(-3, 7, 2)(create_box(4, 6, 8))
+    for alignment in Alignment:
+        for axes, stack_gap in ((None, 0), ([0, 2], 1.5)):
+            expected = np.subtract(
+                get_bounding_box(align(part, TARGET, alignment, axes, stack_gap))[0],
+                get_bounding_box(part)[0],
+            )
+            assert np.allclose(
+                alignment_translation(part, TARGET, alignment, axes, stack_gap),
+                expected,
+            ), alignment
+
+    assert np.allclose(
+        alignment_translation(part, None, Alignment.CENTER), (1, -10, -6)
+    )
+
+
+def test_shared_chain_shares_the_shape(profile):
+    placed = shared_align(profile, TARGET, Alignment.STACK_TOP, stack_gap=2)
+    placed = shared_rotate(90, axis=(0, 1, 1))(placed)
+
+    assert placed.wrapped.TShape() == profile.wrapped.TShape()
+    assert not placed.wrapped.Location().IsIdentity()
+    assert bake(placed).wrapped.TShape() != profile.wrapped.TShape()
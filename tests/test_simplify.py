@@ -0,0 +1,77 @@
+import pytest
+from mege_ender_3v3ke_idex.construct.fuse_tree import fuse_all
+from mege_ender_3v3ke_idex.construct.simplify import (
+    SimplifyPolicy,
+    clear_simplify_policies,
+    clear_simplify_report,
+    set_simplify_policy,
+    simplify,
+    simplify_report,
+)
+from mege_ender_3v3ke_idex.construct.symmetry import shapes_match
+from shellforgepy.simple import *
+
+
+@pytest.fixture(autouse=True)
+def _fresh_policies_and_report():
+    clear_simplify_policies()
+    clear_simplify_report()
+    yield
+    clear_simplify_policies()
+    clear_simplify_report()
+
+
+def _tiled_plate(count=8):
+    """A plate fused from count x count tiles, its faces split at every seam."""
+
+    return fuse_all(
+        translate(10 * i, 10 * j, 0)(create_box(10, 10, 3))
+        for i in range(count)
+        for j in range(count)
+    )
+
+
+def test_policy_decides_and_report_counts():
+    small, large = _tiled_plate(2), _tiled_plate(6)
+
+    assert simplify(small, "create_small") is small  # 16 faces
+    simplified = simplify(large, "create_large", "plate")
+    assert shapes_match(simplified, large)
+
+    set_simplify_policy("create_small", SimplifyPolicy(min_faces=8))
+    set_simplify_policy("create_large", SimplifyPolicy(enabled=False))
+    assert simplify(large, "create_large") is large
+    simplify(small, "create_small")
+
+    report = simplify_report()
+    assert [(r.builder, r.faces_before, r.faces_after) for r in report.records] == [
+        ("create_large", 96, 6),
+        ("create_small", 16, 6),
+    ]
+    assert report.faces_removed == 100
+    assert "create_large plate: faces 96 -> 6" in str(report)
+
+    composite = LeaderFollowersCuttersPart(leader=large)
+    assert simplify(composite, "create_large") is composite
+
+
+def test_simplified_plate_cuts_to_fewer_faces():
+    plate = _tiled_plate()
+    simplified = simplify(plate, "create_plate")
+    holes = fuse_all(
+        translate(7 + 13 * i, 7 + 13 * j, -1)(create_cylinder(2, 5))
+        for i in range(5)
+        for j in range(5)
+    )
+
+    (record,) = simplify_report().records
+    assert (record.faces_before, record.faces_after) == (160, 6)
+    assert (record.edges_before, record.edges_after) == (
+        len(plate.Edges()),
+        len(simplified.Edges()),
+    )
+    assert record.edges_after == 12
+
+    split, unified = plate.cut(holes), simplified.cut(holes)
+    assert shapes_match(unified, split)
+    assert len(unified.Faces()) < len(split.Faces())
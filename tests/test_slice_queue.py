@@ -0,0 +1,113 @@
+import sys
+
+import pytest
+from mege_ender_3v3ke_idex.produce.incremental_export import (
+    arrange_and_export_incremental,
+)
+from mege_ender_3v3ke_idex.produce.slice_queue import (
+    SlicerSettings,
+    jobs_from_run_directory,
+    run_slice_queue,
+)
+from shellforgepy.simple import *
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < (3, 12),
+    reason="shellforgepy's OrcaSlicer settings generator needs Python 3.12",
+)
+
+FAKE_ORCA = """\
+#!{python}
+import sys
+from pathlib import Path
+
+args = sys.argv[1:]
+output_dir = Path(args[args.index("--outputdir") + 1])
+project = args[args.index("--export-3mf") + 1]
+(output_dir / project).write_text("3mf")
+(output_dir / "plate_1.gcode").write_text("; sliced " + args[-1])
+with open({log!r}, "a") as handle:
+    handle.write(Path(args[-1]).name + "\\n")
+"""
+
+
+def _slicer_settings(tmp_path):
+    settings_dir = tmp_path / "settings"
+    settings_dir.mkdir()
+    (settings_dir / "petg.yaml").write_text("name: PETG\ntype: filament\n")
+    (settings_dir / "process.yaml").write_text(
+        "name: process\ntype: process\nlayer_height: '0.2'\n"
+    )
+
+    orca = tmp_path / "fake_orca.py"
+    orca.write_text(
+        FAKE_ORCA.format(python=sys.executable, log=str(tmp_path / "orca.log"))
+    )
+    orca.chmod(0o755)
+
+    return SlicerSettings(orca_executable=orca, master_settings_dir=settings_dir)
+
+
+def _export(run_dir, block_height):
+    parts = PartList()
+    parts.add(create_box(10, 10, block_height), "block")
+    parts.add(translate(20, 0, 0)(create_box(10, 10, 4)), "plate")
+    arrange_and_export_incremental(
+        parts.as_list(),
+        script_file="demo.py",
+        export_directory=run_dir,
+        process_data={"filament": "PETG", "process_overrides": {"layer_height": 0.3}},
+    )
+
+
+def _sliced_models(tmp_path):
+    return (tmp_path / "orca.log").read_text().split()
+
+
+def test_only_changed_parts_are_sliced_again(tmp_path, monkeypatch):
+    for name in ("EXPORT_DIR", "PRODUCTION", "WORKFLOW_MANIFEST"):
+        monkeypatch.delenv(f"SHELLFORGEPY_{name}", raising=False)
+    settings = _slicer_settings(tmp_path)
+    cache_dir = tmp_path / "cache"
+
+    _export(tmp_path / "demo_run_1", block_height=10)
+    jobs = jobs_from_run_directory(tmp_path / "demo_run_1", per_part=True)
+    results = run_slice_queue(jobs, settings, cache_dir=cache_dir, max_workers=2)
+
+    assert [r.from_cache for r in results] == [False, False]
+    assert sorted(_sliced_models(tmp_path)) == ["demo_block.stl", "demo_plate.stl"]
+    assert (
+        tmp_path / "demo_run_1" / "sliced" / "demo_block" / "plate_1.gcode"
+    ).exists()
+
+    _export(tmp_path / "demo_run_2", block_height=12)
+    jobs = jobs_from_run_directory(tmp_path / "demo_run_2", per_part=True)
+    results = run_slice_queue(jobs, settings, cache_dir=cache_dir, max_workers=2)
+
+    assert [r.from_cache for r in results] == [False, True]
+    assert sorted(_sliced_models(tmp_path)) == [
+        "demo_block.stl",
+        "demo_block.stl",
+        "demo_plate.stl",
+    ]
+    assert (
+        tmp_path / "demo_run_2" / "sliced" / "demo_plate" / "demo_plate.3mf"
+    ).exists()
+
+
+def test_changed_process_data_invalidates_plate(tmp_path, monkeypatch):
+    for name in ("EXPORT_DIR", "PRODUCTION", "WORKFLOW_MANIFEST"):
+        monkeypatch.delenv(f"SHELLFORGEPY_{name}", raising=False)
+    settings = _slicer_settings(tmp_path)
+    cache_dir = tmp_path / "cache"
+    _export(tmp_path / "demo_run_1", block_height=10)
+
+    [job] = jobs_from_run_directory(tmp_path / "demo_run_1")
+    assert job.name == "demo"
+
+    assert not run_slice_queue([job], settings, cache_dir=cache_dir)[0].from_cache
+    assert run_slice_queue([job], settings, cache_dir=cache_dir)[0].from_cache
+
+    other_process = dict(job.process_data, process_overrides={"layer_height": 0.2})
+    [job] = jobs_from_run_directory(tmp_path / "demo_run_1", process_data=other_process)
+    assert not run_slice_queue([job], settings, cache_dir=cache_dir)[0].from_cache
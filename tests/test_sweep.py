@@ -0,0 +1,91 @@
+import pytest
+from mege_ender_3v3ke_idex.designs import gt2belt
+from mege_ender_3v3ke_idex.designs.fit_test_coupons import COUPON_SWEEPS
+from mege_ender_3v3ke_idex.produce import sweep
+from mege_ender_3v3ke_idex.produce.sweep import (
+    SweepVariant,
+    _variant_cache_key,
+    add_sweep_to_parts,
+    expand_parameter_grid,
+    resolve_builder,
+    run_sweep,
+)
+from shellforgepy.simple import *
+
+IDLER_BUILDER = "mege_ender_3v3ke_idex.designs.gt2belt:create_gt2_idler"
+
+
+def test_expand_parameter_grid():
+    variants = expand_parameter_grid({"a": [1, 2], "b": [0.25]})
+
+    assert [v.as_dict() for v in variants] == [
+        {"a": 1, "b": 0.25},
+        {"a": 2, "b": 0.25},
+    ]
+    assert variants[0].name == "a_1_b_0.25"
+    assert variants[0].label == "1/0.25"
+
+    with pytest.raises(ValueError):
+        expand_parameter_grid({"a": []})
+
+
+def test_sweep_builds_variants_and_reuses_cache(tmp_path):
+    grid = {"num_teeth": [16, 20], "gt2_thickness": [1.0]}
+
+    results = run_sweep(IDLER_BUILDER, grid, cache_dir=tmp_path, max_workers=1)
+
+    assert [r.from_cache for r in results] == [False, False]
+    assert get_volume(results[0].part) < get_volume(results[1].part)
+    # module globals are restored after the sweep
+    assert gt2belt.gt2_thickness == 1.38
+
+    cached = run_sweep(IDLER_BUILDER, grid, cache_dir=tmp_path, max_workers=1)
+    assert [r.from_cache for r in cached] == [True, True]
+
+
+def test_sweep_rejects_unknown_parameters(tmp_path):
+    with pytest.raises(ValueError):
+        run_sweep(
+            IDLER_BUILDER, {"no_such_thing": [1]}, cache_dir=tmp_path, max_workers=1
+        )
+
+
+def test_add_sweep_to_parts_labels_coupons_in_a_row(tmp_path):
+    results = run_sweep(
+        IDLER_BUILDER, {"num_teeth": [16, 20]}, cache_dir=tmp_path, max_workers=1
+    )
+    parts = PartList()
+
+    coupons = add_sweep_to_parts(parts, results, "idler")
+
+    assert [p.name for p in parts] == ["idler_num_teeth_16", "idler_num_teeth_20"]
+    # the label tab adds material in front of the coupon
+    assert get_volume(coupons[0]) > get_volume(results[0].part)
+    assert get_bounding_box(coupons[0])[1][0] < get_bounding_box(coupons[1])[0][0]
+
+
+def test_cache_key_tracks_package_sources_and_exact_values(monkeypatch):
+    module, _ = resolve_builder(IDLER_BUILDER)
+
+    def key(value):
+        variant = SweepVariant(parameters=(("gt2_thickness", value),))
+        return _variant_cache_key(IDLER_BUILDER, module, variant, {})
+
+    assert key(1.2345671) != key(1.2345672)
+    unchanged = key(1.0)
+    # e.g. edited defaults in x_axis_params.py or hardware.py
+    monkeypatch.setattr(sweep, "_package_source_hash", lambda package: "edited")
+    assert key(1.0) != unchanged
+
+
+def test_axle_nut_coupons_widen_the_pocket(tmp_path):
+    coupon_sweep = COUPON_SWEEPS["axle_nut"]
+
+    results = run_sweep(
+        coupon_sweep["builder_ref"],
+        {"axle_screw_nut_slack": [0.2, 0.5]},
+        cache_dir=tmp_path,
+        max_workers=1,
+    )
+
+    assert get_volume(results[1].part) < get_volume(results[0].part)
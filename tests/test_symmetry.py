@@ -0,0 +1,62 @@
+import pytest
+from mege_ender_3v3ke_idex.construct.symmetry import (
+    SymmetryError,
+    SymmetryTransform,
+    build_symmetric_pair,
+    shapes_match,
+)
+from shellforgepy.simple import *
+
+TURN_ABOUT_Y = SymmetryTransform.rotation(180, axis=(0, 1, 0), center=(0, 0, 10))
+
+
+def _bracket(side, hole_offset=5):
+    """A plate right of (left of) x = 0 at the top (bottom) with a hole and a pin."""
+
+    vertical = Alignment.TOP if side == Alignment.RIGHT else Alignment.BOTTOM
+    plate = translate(side.sign * 20 - 10, 0, 0)(create_box(20, 10, 4))
+    frame = translate(-30, 0, 0)(create_box(60, 10, 20))
+    plate = align(plate, frame, vertical)
+    hole = create_cylinder(1.5, 50)
+    hole = align(hole, plate, Alignment.CENTER)
+    hole = translate(side.sign * hole_offset, 0, 0)(hole)
+    pin = create_cylinder(1, 6)
+    if side == Alignment.LEFT:
+        pin = rotate(180, axis=(0, 1, 0))(pin)
+    pin = align(pin, plate, Alignment.CENTER, axes=[0, 1])
+    pin = align(pin, plate, vertical.stack_alignment)
+    return {"plate": plate.cut(hole), "pins": [pin], "name": "bracket"}
+
+
+def test_derived_side_matches_direct_build():
+    pair = build_symmetric_pair(
+        _bracket, Alignment.RIGHT, Alignment.LEFT, TURN_ABOUT_Y, verify=True
+    )
+
+    assert pair[Alignment.LEFT]["name"] == "bracket"
+    assert shapes_match(
+        pair[Alignment.LEFT]["plate"], _bracket(Alignment.LEFT)["plate"]
+    )
+    assert not shapes_match(
+        pair[Alignment.LEFT]["plate"], _bracket(Alignment.RIGHT)["plate"]
+    )
+
+    mirrored = build_symmetric_pair(
+        _bracket,
+        Alignment.RIGHT,
+        Alignment.LEFT,
+        SymmetryTransform.mirror(normal=(1, 0, 0)),
+    )
+    (x0, _, z0), (x1, _, z1) = get_bounding_box(mirrored[Alignment.LEFT]["plate"])
+    assert (x0, x1) == pytest.approx((-30, -10))
+    assert z1 == pytest.approx(20)  # a mirror keeps the plate at the top
+
+
+def test_asymmetric_builder_is_detected():
+    def builder(side):
+        return _bracket(side, hole_offset=5 if side == Alignment.RIGHT else 3)
+
+    with pytest.raises(SymmetryError, match=r"\['plate'\]"):
+        build_symmetric_pair(
+            builder, Alignment.RIGHT, Alignment.LEFT, TURN_ABOUT_Y, verify=True
+        )
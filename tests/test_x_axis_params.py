@@ -0,0 +1,40 @@
+import pytest
+from mege_ender_3v3ke_idex.construct.hardware import screw_dimensions
+from mege_ender_3v3ke_idex.designs.x_axis_params import (
+    DEFAULT_X_AXIS_PARAMS,
+    XAxisParams,
+)
+
+
+def test_params_are_frozen_and_hashable():
+    with pytest.raises(AttributeError):
+        DEFAULT_X_AXIS_PARAMS.motor_size = 40
+
+    variants = {
+        DEFAULT_X_AXIS_PARAMS: "default",
+        XAxisParams(): "same",
+        DEFAULT_X_AXIS_PARAMS.variant(z_axis_guide_distance=300): "wide",
+    }
+    assert len(variants) == 2
+    assert not hasattr(DEFAULT_X_AXIS_PARAMS, "__dict__")
+
+
+def test_content_hash_is_stable_and_tracks_changes():
+    wide = DEFAULT_X_AXIS_PARAMS.variant(z_axis_guide_distance=300)
+
+    assert XAxisParams().content_hash() == DEFAULT_X_AXIS_PARAMS.content_hash()
+    assert wide.content_hash() != DEFAULT_X_AXIS_PARAMS.content_hash()
+
+
+def test_derived_dimensions_follow_base_fields():
+    wide = DEFAULT_X_AXIS_PARAMS.variant(z_axis_guide_distance=300)
+
+    assert DEFAULT_X_AXIS_PARAMS.motor_x_offset == 68
+    assert wide.motor_x_offset == 90
+    assert wide.axis_holder_width == wide.mount_plate_connector_length
+
+
+def test_idler_mount_axle_diameter_is_the_axle_clearance_hole():
+    axle = screw_dimensions(DEFAULT_X_AXIS_PARAMS.axle_screw_size)
+
+    assert DEFAULT_X_AXIS_PARAMS.idler_mount_axle_diameter == axle.clearance_hole_normal